@@ -0,0 +1,165 @@
+"""
+Benchmark fixed-size and adaptive resumable uploads against a local stand-in for Google Storage resumable sessions.
+
+The stand-in server can add latency to every request, drop a share of the chunk requests halfway through their body,
+and cap the bandwidth of each connection (as a TCP window does on a distant link) and of the whole link. Files whose
+upload fails are resumed from the last acknowledged byte, as a rerun of `upload_model_files_to_artifact` would.
+
+    python examples/benchmark_adaptive_upload.py --files 4 --file-size-mb 64 --latency-ms 80 --loss 0.02
+"""
+import os
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# To allow this script to be executed from other directories
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gmicloud import UploadScheduler
+from gmicloud._internal._token_bucket import TokenBucket
+from gmicloud._internal._exceptions import UploadFileError
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+
+MiB = 1024 * 1024
+
+
+class LossyResumableServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency_s, loss_rate, connection_bps, link_bps):
+        super().__init__(("127.0.0.1", 0), LossyResumableHandler)
+        self.latency_s = latency_s
+        self.loss_rate = loss_rate
+        self.connection_bps = connection_bps
+        self.link = TokenBucket(link_bps, link_bps * 0.05) if link_bps else None
+        self.sessions = {}  # session name -> bytes received in order
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.dropped = 0
+
+    def session_url(self, name):
+        return f"http://127.0.0.1:{self.server_address[1]}/session/{name}"
+
+
+class LossyResumableHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        time.sleep(server.latency_s / 2)
+        length = int(self.headers.get("Content-Length", 0))
+        byte_range, total = self.headers["Content-Range"][len("bytes "):].split("/")
+        drop = length > 0 and random.random() < server.loss_rate
+        connection = TokenBucket(server.connection_bps, server.connection_bps * 0.05) \
+            if server.connection_bps else None
+
+        received = 0
+        while received < length:
+            if drop and received >= length // 2:
+                with server.lock:
+                    server.dropped += 1
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            block = self.rfile.read(min(64 * 1024, length - received))
+            received += len(block)
+            for bucket in (connection, server.link):
+                if bucket is not None:
+                    bucket.consume(len(block))
+
+        time.sleep(server.latency_s / 2)
+        name = self.path.rsplit("/", 1)[-1]
+        with server.lock:
+            size = server.sessions.setdefault(name, 0)
+            if byte_range != "*":
+                start, end = (int(b) for b in byte_range.split("-"))
+                if start != size or end - start + 1 != length:
+                    self._reply(400)
+                    return
+                server.sessions[name] = size = end + 1
+        if size == int(total):
+            self._reply(200)
+        else:
+            self._reply(308, {"Range": f"bytes=0-{size - 1}"} if size else None)
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label, server, file_paths, scheduler, chunk_size):
+    server.sessions.clear()
+    server.requests = server.dropped = 0
+    run_id = re.sub(r"\W", "-", label)
+    resumes = 0
+
+    def upload(file_path):
+        nonlocal resumes
+        url = server.session_url(f"{run_id}-{os.path.basename(file_path)}")
+        with scheduler.file_slot():
+            while True:
+                try:
+                    FileUploadClient.upload_large_file(url, file_path, chunk_size=chunk_size, scheduler=scheduler)
+                    return
+                except UploadFileError:
+                    resumes += 1
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=scheduler.max_concurrency) as executor:
+        list(executor.map(upload, scheduler.order_largest_first(file_paths)))
+    elapsed = time.monotonic() - started
+    total = sum(os.path.getsize(file_path) for file_path in file_paths)
+    print(f"{label:<28} {elapsed:8.2f} s {total / elapsed / MiB:9.1f} MiB/s {server.requests:9} requests "
+          f"{server.dropped:6} dropped {resumes:6} resumes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--file-size-mb", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=50, help="round-trip time added to every request")
+    parser.add_argument("--loss", type=float, default=0.0, help="share of chunk requests dropped halfway")
+    parser.add_argument("--connection-mbps", type=float, default=200, help="bandwidth cap of each connection")
+    parser.add_argument("--link-mbps", type=float, default=800, help="bandwidth cap of the whole link")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--buffer-mb", type=int, default=256, help="chunk buffer budget of the upload scheduler")
+    args = parser.parse_args()
+    logging.getLogger("gmicloud").setLevel(logging.WARNING)
+
+    server = LossyResumableServer(args.latency_ms / 1000, args.loss, args.connection_mbps * MiB / 8,
+                                  args.link_mbps * MiB / 8)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for i in range(args.files):
+            file_paths.append(os.path.join(tmp_dir, f"shard-{i}.bin"))
+            with open(file_paths[-1], "wb") as f:
+                for _ in range(args.file_size_mb):
+                    f.write(os.urandom(MiB))
+
+        print(f"{args.files} x {args.file_size_mb} MiB, {args.latency_ms:g} ms RTT, {args.loss:.1%} loss, "
+              f"{args.connection_mbps:g} Mbit/s per connection, {args.link_mbps:g} Mbit/s link")
+        for label, adaptive in (("fixed 10 MiB chunks", False), ("adaptive", True)):
+            scheduler = UploadScheduler(max_concurrency=args.concurrency, buffer_budget_bytes=args.buffer_mb * MiB,
+                                        adaptive=adaptive)
+            run(label, server, file_paths, scheduler, FileUploadClient.CHUNK_SIZE)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -65,6 +65,8 @@ print(f"Created artifact {artifact_id} with recommended resources: {recommended_
 
 # Alternatively, Upload a custom model checkpoint to artifact
 # cli.artifact_manager.upload_model_files_to_artifact(artifact_id, model_checkpoint_save_dir)
+# Or upload the checkpoint straight from the Hugging Face Hub, without downloading it to disk first
+# cli.artifact_manager.upload_hub_model_to_artifact(artifact_id, model_name)
 
 # Maybe Wait 10 minutes for the artifact to be ready
 # time.sleep(10 * 60)
@@ -1,31 +1,83 @@
-import logging
 import os
+import logging
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the modules defining them. They are imported on first access, so that `import gmicloud` stays
+# cheap and pulls in neither the HTTP stack nor the pydantic models until they are needed.
+_LAZY_ATTRIBUTES = {
+    "Client": ".client",
+    "AsyncClient": ".async_client",
+    "RetryPolicy": "._internal._client._retry",
+    "PollPolicy": "._internal._poll_policy",
+    "UploadScheduler": "._internal._upload_scheduler",
+    "Deadline": "._internal._deadline",
+    "DeadlineExceededError": "._internal._exceptions",
+    "ArtifactBuildError": "._internal._exceptions",
+    "Artifact": "._internal._models",
+    "ArtifactData": "._internal._models",
+    "ArtifactMetadata": "._internal._models",
+    "Task": "._internal._models",
+    "TaskOwner": "._internal._models",
+    "TaskConfig": "._internal._models",
+    "EndpointInfo": "._internal._models",
+    "RayTaskConfig": "._internal._models",
+    "TaskScheduling": "._internal._models",
+    "ReplicaResource": "._internal._models",
+    "OneOffScheduling": "._internal._models",
+    "DailyScheduling": "._internal._models",
+    "DailyTrigger": "._internal._models",
+    "Template": "._internal._models",
+    "ModelSyncPlan": "._internal._models",
+    "UploadProgress": "._internal._models",
+    "BuildStatus": "._internal._enums",
+    "TaskEndpointStatus": "._internal._enums",
+    "TaskStatus": "._internal._enums",
+    "UploadProgressEvent": "._internal._enums",
+}
 
-from ._internal._models import (
-    Artifact,
-    ArtifactData,
-    ArtifactMetadata,
-    Task,
-    TaskOwner,
-    TaskConfig,
-    EndpointInfo,
-    RayTaskConfig,
-    TaskScheduling,
-    ReplicaResource,
-    OneOffScheduling,
-    DailyScheduling,
-    DailyTrigger,
-    Template,
-)
-from ._internal._enums import (
-    BuildStatus,
-    TaskEndpointStatus,
-    TaskStatus
-)
-from .client import Client
+if TYPE_CHECKING:
+    from ._internal._models import (
+        Artifact,
+        ArtifactData,
+        ArtifactMetadata,
+        Task,
+        TaskOwner,
+        TaskConfig,
+        EndpointInfo,
+        RayTaskConfig,
+        TaskScheduling,
+        ReplicaResource,
+        OneOffScheduling,
+        DailyScheduling,
+        DailyTrigger,
+        Template,
+        ModelSyncPlan,
+        UploadProgress,
+    )
+    from ._internal._enums import (
+        BuildStatus,
+        TaskEndpointStatus,
+        TaskStatus,
+        UploadProgressEvent,
+    )
+    from ._internal._client._retry import RetryPolicy
+    from ._internal._poll_policy import PollPolicy
+    from ._internal._upload_scheduler import UploadScheduler
+    from ._internal._deadline import Deadline
+    from ._internal._exceptions import DeadlineExceededError, ArtifactBuildError
+    from .client import Client
+    from .async_client import AsyncClient
 
 __all__ = [
     "Client",
+    "AsyncClient",
+    "RetryPolicy",
+    "PollPolicy",
+    "UploadScheduler",
+    "Deadline",
+    "DeadlineExceededError",
+    "ArtifactBuildError",
     "Artifact",
     "ArtifactData",
     "ArtifactMetadata",
@@ -40,13 +92,43 @@ __all__ = [
     "DailyScheduling",
     "DailyTrigger",
     "Template",
+    "ModelSyncPlan",
+    "UploadProgress",
     "BuildStatus",
     "TaskEndpointStatus",
+    "UploadProgressEvent",
 ]
 
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache the attribute so that later lookups bypass this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class _DefaultLogHandler(logging.StreamHandler):
+    """
+    Prints gmicloud logs until the application configures logging itself, without touching the root logger.
+    """
+
+    def emit(self, record):
+        if not logging.getLogger().handlers:
+            super().emit(record)
+
+
 # Configure logging
 log_level = os.getenv("GMI_CLOUD_LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=log_level,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_logger = logging.getLogger(__name__)
+_logger.setLevel(log_level)
+if not any(isinstance(handler, _DefaultLogHandler) for handler in _logger.handlers):
+    _handler = _DefaultLogHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _logger.addHandler(_handler)
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from ._constants import RESUMABLE_CHUNK_ALIGNMENT, MIN_ADAPTIVE_CHUNK_SIZE, MAX_ADAPTIVE_CHUNK_SIZE
+
+
+class AdaptiveChunkSizer:
+    """
+    Picks the size of the next chunk of a resumable upload from the throughput and round-trip time measured on the
+    previous chunks.
+
+    Every chunk costs a round trip on top of its transfer time, so a chunk is sized to take at least `RTT_MULTIPLE`
+    round trips and at least `TARGET_CHUNK_DURATION_S` to send, which keeps that overhead small on fast, distant
+    links. It is also kept under `MAX_CHUNK_DURATION_S` of transfer, which bounds what a failed chunk costs to send
+    again on a flaky link. Sizes are multiples of `RESUMABLE_CHUNK_ALIGNMENT` and change at most twofold per chunk.
+    """
+
+    TARGET_CHUNK_DURATION_S = 2.0
+    MAX_CHUNK_DURATION_S = 10.0
+    RTT_MULTIPLE = 20
+    # Weight of the latest chunk in the throughput estimate
+    SMOOTHING = 0.5
+
+    def __init__(self, initial_chunk_size: int, min_chunk_size: int = MIN_ADAPTIVE_CHUNK_SIZE,
+                 max_chunk_size: int = MAX_ADAPTIVE_CHUNK_SIZE):
+        """
+        Initialize the chunk sizer.
+
+        :param initial_chunk_size: The size of the first chunk, before anything is measured.
+        :param min_chunk_size: The smallest chunk size, rounded up to the alignment.
+        :param max_chunk_size: The largest chunk size, rounded down to the alignment.
+        :raises ValueError: If the bounds leave no aligned chunk size.
+        """
+        self.min_chunk_size = -(-min_chunk_size // RESUMABLE_CHUNK_ALIGNMENT) * RESUMABLE_CHUNK_ALIGNMENT
+        self.max_chunk_size = max_chunk_size // RESUMABLE_CHUNK_ALIGNMENT * RESUMABLE_CHUNK_ALIGNMENT
+        if self.min_chunk_size < RESUMABLE_CHUNK_ALIGNMENT or self.min_chunk_size > self.max_chunk_size:
+            raise ValueError(f"Chunk size bounds must allow a multiple of {RESUMABLE_CHUNK_ALIGNMENT} bytes.")
+        self.chunk_size = self._clamp(initial_chunk_size)
+        self.throughput_bps: Optional[float] = None
+        self.rtt_s: Optional[float] = None
+
+    def record_rtt(self, rtt_s: float) -> None:
+        """
+        Record the duration of a request without a body, such as an upload status check.
+        The shortest one seen is taken as the round-trip time.
+
+        :param rtt_s: The duration in seconds.
+        """
+        self.rtt_s = rtt_s if self.rtt_s is None else min(self.rtt_s, rtt_s)
+
+    def record_chunk(self, nbytes: int, elapsed_s: float) -> None:
+        """
+        Record a chunk sent successfully and size the next one.
+
+        :param nbytes: The size of the chunk.
+        :param elapsed_s: The time from sending the chunk to receiving the response, in seconds.
+        """
+        if elapsed_s <= 0:
+            return
+        sample = nbytes / elapsed_s
+        self.throughput_bps = sample if self.throughput_bps is None else \
+            self.SMOOTHING * sample + (1 - self.SMOOTHING) * self.throughput_bps
+        duration = min(max(self.TARGET_CHUNK_DURATION_S, self.RTT_MULTIPLE * (self.rtt_s or 0)),
+                       self.MAX_CHUNK_DURATION_S)
+        target = min(max(self.throughput_bps * duration, self.chunk_size / 2), self.chunk_size * 2)
+        self.chunk_size = self._clamp(int(target))
+
+    def record_failure(self) -> None:
+        """
+        Record a chunk that failed, halving the size of the next one so that less is sent again on a flaky link.
+        """
+        self.chunk_size = self._clamp(self.chunk_size // 2)
+
+    def _clamp(self, chunk_size: int) -> int:
+        chunk_size = chunk_size // RESUMABLE_CHUNK_ALIGNMENT * RESUMABLE_CHUNK_ALIGNMENT
+        return min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
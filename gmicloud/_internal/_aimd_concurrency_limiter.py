@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Optional
+
+
+class AimdConcurrencyLimiter:
+    """
+    Limits the number of chunk requests in flight, tuning the limit with additive increase and multiplicative
+    decrease (AIMD), like TCP congestion control.
+
+    The limit grows by one for every `limit` chunks sent successfully, and is multiplied by `decrease_factor` when a
+    chunk fails or takes more than `LATENCY_TOLERANCE` times the lowest time per byte seen. The time per byte of a
+    chunk stays flat while more requests add throughput, and rises once they slow each other down on a congested link.
+    At most one decrease applies per `limit` chunks, so a burst of slow chunks sent at the same time does not collapse
+    the limit. Chunks much shorter than usual, such as the last chunk of a file, are better not recorded, as the round
+    trip dominates their time per byte.
+
+    Slots can be taken from threads with `slot` and from coroutines with `async_slot`.
+    """
+
+    LATENCY_TOLERANCE = 2.0
+
+    def __init__(self, max_limit: int, initial_limit: Optional[int] = None, min_limit: int = 1,
+                 decrease_factor: float = 0.5):
+        """
+        Initialize the limiter.
+
+        :param max_limit: The highest limit.
+        :param initial_limit: The limit before any chunk is measured, half of `max_limit` by default.
+        :param min_limit: The lowest limit.
+        :param decrease_factor: The factor applied to the limit on congestion, between 0 and 1.
+        :raises ValueError: If the limits are inconsistent.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min_limit <= max_limit.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1.")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit or max_limit // 2, min_limit), max_limit))
+        self._active = 0
+        self._min_cost: Optional[float] = None  # Lowest time per byte seen
+        self._completed_since_decrease = self.limit
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[asyncio.Future] = []
+
+    @property
+    def limit(self) -> int:
+        """The number of chunk requests currently allowed in flight."""
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold a slot while sending a chunk, waiting for one if needed.
+        Report the outcome with `record_success` or `record_failure` before leaving the block.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """
+        Hold a slot while sending a chunk from a coroutine, waiting for one without blocking the event loop.
+        Report the outcome with `record_success` or `record_failure` before leaving the block.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._active < self.limit:
+                    self._active += 1
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def record_success(self, nbytes: int, elapsed_s: float) -> None:
+        """
+        Record a chunk sent successfully while holding a slot.
+
+        :param nbytes: The size of the chunk.
+        :param elapsed_s: The time from sending the chunk to receiving the response, in seconds.
+        """
+        if nbytes <= 0 or elapsed_s <= 0:
+            return
+        with self._lock:
+            cost = elapsed_s / nbytes
+            self._completed_since_decrease += 1
+            if self._min_cost is not None and cost > self.LATENCY_TOLERANCE * self._min_cost:
+                self._decrease()
+            else:
+                self._min_cost = cost if self._min_cost is None else min(self._min_cost, cost)
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            self._wake()
+
+    def record_failure(self) -> None:
+        """
+        Record a chunk that failed while holding a slot.
+        """
+        with self._lock:
+            self._completed_since_decrease += 1
+            self._decrease()
+
+    def _decrease(self) -> None:
+        """Apply a multiplicative decrease. Must be called with the lock held."""
+        if self._completed_since_decrease < self.limit:
+            return
+        self._limit = max(self._limit * self.decrease_factor, self.min_limit)
+        self._completed_since_decrease = 0
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Wake the waiters that may take a slot. Must be called with the lock held."""
+        self._condition.notify_all()
+        for waiter in self._async_waiters[:max(self.limit - self._active, 0)]:
+            waiter.get_loop().call_soon_threadsafe(AimdConcurrencyLimiter._set_waiter_result, waiter)
+
+    @staticmethod
+    def _set_waiter_result(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
@@ -24,7 +24,8 @@ class ArtifactClient:
         Initializes the ArtifactClient with an HTTPClient configured
         to communicate with the Artifact Service base URL.
         """
-        self.client = HTTPClient(ARTIFACT_SERVICE_BASE_URL)
+        self.client = HTTPClient(ARTIFACT_SERVICE_BASE_URL, iam_client.get_session(),
+                                 iam_client.get_retry_policy(), iam_client.get_timeout())
         self.iam_client = iam_client
 
     @handle_refresh_token
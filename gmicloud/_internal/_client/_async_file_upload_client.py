@@ -0,0 +1,436 @@
+import os
+import time
+import httpx
+import asyncio
+import logging
+from collections import deque
+from contextlib import aclosing, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional, Tuple, Union
+
+from ._retry import RetryPolicy
+from .._constants import HTTP_METHOD_PUT, RETRY_AFTER_HEADER, RANGE_HEADER
+from .._deadline import Timeout, apply_current_deadline, get_current_deadline
+from .._exceptions import UploadFileError, UploadIntegrityError, DeadlineExceededError
+from .._upload_scheduler import UploadScheduler
+from .._adaptive_chunk_sizer import AdaptiveChunkSizer
+from .._upload_checksum import UploadChecksum
+from .._hub_file import HubFile
+from .._tar_bundle import TarBundle, open_upload_file, get_upload_file_size
+from .._zip_stream import ZipStream
+from ._file_upload_client import FileUploadClient
+from ._async_http_client import to_httpx_timeout
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFileUploadClient:
+    """
+    An asyncio file upload client supporting small files and resumable uploads, mirroring `FileUploadClient`.
+    """
+
+    def __init__(self, session: httpx.AsyncClient):
+        """
+        Initialize the async upload client.
+
+        :param session: The async session used to send the upload requests.
+        """
+        self.session = session
+
+    async def upload_small_file(self, upload_url: str, file_path: str,
+                                content_type: str = "application/zip", timeout: Timeout = FileUploadClient.TIMEOUT,
+                                retry_policy: RetryPolicy = FileUploadClient.RETRY_POLICY,
+                                scheduler: UploadScheduler = None):
+        """
+        Uploads a small file directly to a signed Google Storage upload URL.
+
+        The body is streamed from the file in small blocks, so memory use does not grow with the file size.
+        A signed URL accepts the file in a single request only, so an upload failing partway through is sent
+        again from the start of the file, as allowed by `retry_policy`.
+
+        :param upload_url: Signed upload URL for small files.
+        :param file_path: The local path to the file to upload.
+        :param content_type: MIME type of the file.
+        :param timeout: The (connect, read) timeout of the upload request, capped by the current deadline.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
+        """
+        try:
+            file_size = os.path.getsize(file_path)
+            headers = {"Content-Type": content_type, "Content-Length": str(file_size)}
+            with open(file_path, "rb") as file:
+                response = await self._put_with_retry(upload_url, headers,
+                                                      lambda: self._stream_file(file, 0, file_size, scheduler),
+                                                      timeout, retry_policy, f"uploading {file_path}")
+
+            if response.status_code not in [200, 201]:
+                raise UploadFileError(f"Failed to upload file, code:{response.status_code} ,message: {response.text}")
+
+        except httpx.HTTPError as e:
+            raise UploadFileError(f"Failed to upload file: {str(e)}")
+
+    async def upload_zip_stream(self, upload_url: str, zip_stream: ZipStream,
+                                timeout: Timeout = FileUploadClient.TIMEOUT,
+                                retry_policy: RetryPolicy = FileUploadClient.RETRY_POLICY,
+                                scheduler: UploadScheduler = None):
+        """
+        Uploads a zip archive to a signed Google Storage upload URL while the archive is being built, with chunked
+        transfer encoding. See `FileUploadClient.upload_zip_stream`.
+
+        :param upload_url: Signed upload URL for small files.
+        :param zip_stream: The zip archive to build and upload.
+        :param timeout: The (connect, read) timeout of the upload request, capped by the current deadline.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
+        """
+        try:
+            response = await self._put_with_retry(upload_url, {"Content-Type": "application/zip"},
+                                                  lambda: self._stream_zip(zip_stream, scheduler),
+                                                  timeout, retry_policy, f"uploading {zip_stream}")
+            if response.status_code not in [200, 201]:
+                raise UploadFileError(f"Failed to upload file, code:{response.status_code} ,message: {response.text}")
+
+        except httpx.HTTPError as e:
+            raise UploadFileError(f"Failed to upload file: {str(e)}")
+
+    async def upload_large_file(self, upload_url: str, file_path: Union[str, TarBundle, HubFile],
+                                chunk_size: int = FileUploadClient.CHUNK_SIZE,
+                                timeout: Timeout = FileUploadClient.TIMEOUT,
+                                read_ahead: int = FileUploadClient.READ_AHEAD_CHUNKS,
+                                on_chunk_uploaded: Callable[[int], None] = None,
+                                scheduler: UploadScheduler = None,
+                                retry_policy: RetryPolicy = FileUploadClient.CHUNK_RETRY_POLICY,
+                                on_retry: Callable[[], None] = None):
+        """
+        Performs resumable (chunked) file uploads to a signed Google Storage URL.
+
+        A resumable session accepts chunks in order only, so the chunks are sent one after another while the next
+        `read_ahead` chunks are read from disk in the background. See `FileUploadClient.upload_large_file` for how
+        failed chunks are retried, how the stored object is verified and how an adaptive scheduler sizes the chunks
+        and limits the requests in flight.
+
+        :param upload_url: Signed resumable upload URL.
+        :param file_path: The local path to the file to upload, a `TarBundle` of files, or a `HubFile` read from
+                          the hub.
+        :param chunk_size: Chunk size in bytes (default: 10MB).
+        :param timeout: The (connect, read) timeout of each chunk request, capped by the current deadline.
+        :param read_ahead: The number of chunks read ahead of the one being sent.
+        :param on_chunk_uploaded: Called with the number of bytes confirmed by the storage service after each chunk.
+        :param scheduler: The upload scheduler whose limits apply (optional).
+        :param retry_policy: The policy for retrying failed chunks and status checks.
+        :param on_retry: Called before a failed chunk is sent again.
+        :raises UploadIntegrityError: If the stored object does not match the file. The session is complete, so the
+                                      file must be uploaded again with a new one.
+        :raises UploadFileError: If the upload fails.
+        """
+        try:
+            file_size = get_upload_file_size(file_path)
+            logger.info(f"File {file_path} size: {file_size} bytes")
+            chunk_sizer = AdaptiveChunkSizer(chunk_size) if scheduler is not None and scheduler.adaptive else None
+            limiter = scheduler.concurrency_limiter if scheduler is not None else None
+            checksum = UploadChecksum()
+            deadline = get_current_deadline()
+
+            checked_at = time.monotonic()
+            start_byte, response = await self._check_file_status(upload_url, file_size, timeout, retry_policy)
+            if chunk_sizer is not None:
+                chunk_sizer.record_rtt(time.monotonic() - checked_at)
+            if start_byte and response is None:
+                logger.info(f"Resuming uploading {file_path} from {start_byte} bytes")
+
+            attempt = 1
+            with scheduler.chunked_upload() if scheduler is not None else nullcontext():
+                # The final response, once the storage service has the whole file
+                while response is None:
+                    if start_byte >= file_size:
+                        raise UploadFileError("The storage service received the whole file but did not complete "
+                                              "the upload")
+                    await asyncio.to_thread(checksum.update_from_file, file_path, start_byte)
+                    with open_upload_file(file_path) as file:
+                        async with aclosing(self._read_chunks(
+                                file, start_byte, file_size,
+                                FileUploadClient._chunk_size_getter(chunk_size, chunk_sizer, read_ahead, scheduler),
+                                read_ahead, scheduler)) as chunks:
+                            async for chunk_start, chunk_data in chunks:
+                                end_byte = chunk_start + len(chunk_data) - 1
+
+                                # Set the Content-Range and headers
+                                content_range = f"bytes {chunk_start}-{end_byte}/{file_size}"
+                                headers = {
+                                    "Content-Length": str(len(chunk_data)),
+                                    "Content-Range": content_range
+                                }
+
+                                # Upload the chunk
+                                body = chunk_data
+                                if scheduler is not None and scheduler.max_bandwidth_bps:
+                                    body = self._stream_bytes(chunk_data, scheduler)
+                                resp, error = None, None
+                                async with limiter.async_slot() if limiter is not None else nullcontext():
+                                    sent_at = time.monotonic()
+                                    try:
+                                        resp = await self.session.put(
+                                            upload_url, headers=headers, content=body,
+                                            timeout=to_httpx_timeout(apply_current_deadline(
+                                                timeout, f"uploading {file_path}")))
+                                    except (httpx.TransportError, httpx.TimeoutException) as e:
+                                        error = repr(e)
+                                    elapsed = time.monotonic() - sent_at
+                                    if limiter is not None:
+                                        FileUploadClient._record_chunk_outcome(
+                                            limiter, resp.status_code if resp is not None else None,
+                                            len(chunk_data), elapsed, end_byte + 1 == file_size)
+
+                                if resp is not None and resp.status_code in (200, 201):
+                                    response, start_byte = resp, file_size
+                                elif resp is not None and resp.status_code == 308:
+                                    start_byte = FileUploadClient._parse_range(resp.headers.get(RANGE_HEADER))
+                                    if start_byte <= chunk_start:
+                                        error = f"no progress acknowledged for bytes {chunk_start}-{end_byte}"
+                                elif resp is not None and resp.status_code not in retry_policy.retry_status_codes:
+                                    raise UploadFileError(f"Failed to upload file {file_path}, "
+                                                          f"code:{resp.status_code} ,message: {resp.text}")
+                                else:
+                                    error = error or f"status {resp.status_code}"
+
+                                if error is not None:
+                                    if not retry_policy.can_retry(HTTP_METHOD_PUT, attempt):
+                                        raise UploadFileError(f"Failed to upload file {file_path} after {attempt} "
+                                                              f"attempts: {error}")
+                                    delay = retry_policy.get_delay(
+                                        attempt, resp.headers.get(RETRY_AFTER_HEADER) if resp is not None else None)
+                                    logger.warning(f"Uploading bytes {chunk_start:,}-{end_byte:,} of {file_path} "
+                                                   f"failed with {error}, retrying in {delay:.2f}s "
+                                                   f"(attempt {attempt}/{retry_policy.max_attempts})")
+                                    if chunk_sizer is not None:
+                                        chunk_sizer.record_failure()
+                                    if on_retry is not None:
+                                        on_retry()
+                                    if deadline is not None:
+                                        delay = min(delay, deadline.remaining())
+                                    await asyncio.sleep(delay)
+                                    attempt += 1
+                                    # The chunk may have been stored in full, in part or not at all
+                                    start_byte, response = await self._check_file_status(upload_url, file_size,
+                                                                                         timeout, retry_policy)
+                                    break
+
+                                attempt = 1
+                                if checksum.offset == chunk_start:
+                                    await asyncio.to_thread(checksum.update,
+                                                            memoryview(chunk_data)[:start_byte - chunk_start])
+                                if chunk_sizer is not None and end_byte + 1 < file_size:
+                                    chunk_sizer.record_chunk(len(chunk_data), elapsed)
+                                if on_chunk_uploaded is not None:
+                                    on_chunk_uploaded(start_byte)
+                                percentage = (start_byte / file_size) * 100
+                                logger.debug(f"File {file_path} uploaded {start_byte:,}/{file_size:,} bytes "
+                                            f"({percentage:.2f}%)")
+                                if start_byte != end_byte + 1:
+                                    # Only part of the chunk was stored, read again from where the service stopped
+                                    break
+
+            await asyncio.to_thread(FileUploadClient._verify_upload, file_path, file_size, checksum, response)
+            logger.info(f"File {file_path} uploaded successfully.")
+        except (DeadlineExceededError, UploadIntegrityError):
+            raise
+        except Exception as e:
+            raise UploadFileError(f"Failed to upload file {file_path}, got error: {str(e)}")
+
+    @staticmethod
+    async def _read_chunks(file, start_byte: int, file_size: int, next_chunk_size: Callable[[], int],
+                           read_ahead: int,
+                           scheduler: UploadScheduler = None) -> AsyncIterator[Tuple[int, bytes]]:
+        """
+        Read a file chunk by chunk, keeping up to `read_ahead` further chunks being read by a background thread.
+        See `FileUploadClient._read_chunks` for how the buffer budget applies. Close the iterator when done.
+
+        :param file: The file opened in binary mode.
+        :param start_byte: The position of the first chunk.
+        :param file_size: The size of the file.
+        :param next_chunk_size: Returns the size of the next chunk to read, in bytes.
+        :param read_ahead: The number of chunks read ahead of the one returned.
+        :param scheduler: The upload scheduler whose buffer budget applies (optional).
+        """
+        def read_chunk(offset, length):
+            # Waiting for the budget blocks the reader thread, not the event loop
+            reserved = scheduler.acquire_buffer(length) if scheduler is not None else 0
+            try:
+                # A single reader thread, so seeking does not race
+                file.seek(offset)
+                chunk_data = file.read(length)
+                if not chunk_data:
+                    raise UploadFileError(f"File {file.name} was truncated during upload")
+                return chunk_data, reserved
+            except BaseException:
+                if reserved:
+                    scheduler.release_buffer(reserved)
+                raise
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = deque()
+            next_offset = start_byte
+            reserved = 0
+            try:
+                while pending or next_offset < file_size:
+                    while next_offset < file_size and len(pending) <= read_ahead:
+                        length = min(next_chunk_size(), file_size - next_offset)
+                        pending.append((next_offset, loop.run_in_executor(reader, read_chunk, next_offset, length)))
+                        next_offset += length
+                    offset, chunk_future = pending.popleft()
+                    chunk_data, reserved = await chunk_future
+                    yield offset, chunk_data
+                    if reserved:
+                        scheduler.release_buffer(reserved)
+                    reserved = 0
+            finally:
+                if reserved:
+                    scheduler.release_buffer(reserved)
+                # Return the budget held by chunks read ahead but never sent. Cancelling an executor future does not
+                # stop a read already running, so wait for every read instead.
+                for _, chunk_future in pending:
+                    try:
+                        _, reserved = await chunk_future
+                    except Exception:
+                        continue
+                    if reserved:
+                        scheduler.release_buffer(reserved)
+
+    @staticmethod
+    async def _stream_bytes(data: bytes, scheduler: UploadScheduler) -> AsyncIterator[bytes]:
+        """
+        Stream a request body in blocks, throttled to the bandwidth cap of an upload scheduler.
+
+        :param data: The request body.
+        :param scheduler: The upload scheduler whose bandwidth cap applies.
+        """
+        view = memoryview(data)
+        for offset in range(0, len(view), FileUploadClient.STREAM_BLOCK_SIZE):
+            block = view[offset:offset + FileUploadClient.STREAM_BLOCK_SIZE]
+            delay = scheduler.reserve_bandwidth(len(block))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield bytes(block)
+
+    async def _check_file_status(self, upload_url: str, file_size: int,
+                                 timeout: Timeout = FileUploadClient.TIMEOUT,
+                                 retry_policy: RetryPolicy = FileUploadClient.CHUNK_RETRY_POLICY
+                                 ) -> Tuple[int, Optional[httpx.Response]]:
+        """
+        Check the status of a resumable upload, retrying transient failures.
+
+        :param upload_url: The resumable upload URL.
+        :param file_size: Total file size in bytes.
+        :param timeout: The (connect, read) timeout of the status request, capped by the current deadline.
+        :param retry_policy: The policy for retrying failed status checks.
+        :return: The number of bytes stored by the service, and the final response if the upload is complete.
+        """
+        headers = {
+            "Content-Length": "0",  # No payload for status check
+            "Content-Range": f"bytes */{file_size}"  # Asking server where the upload left off
+        }
+
+        try:
+            resp = await self._put_with_retry(upload_url, headers, lambda: None, timeout, retry_policy,
+                                              "checking upload status")
+
+            # If upload is incomplete (HTTP 308: Resume Incomplete), retrieve the "Range" header
+            if resp.status_code == 308:
+                range_header = resp.headers.get(RANGE_HEADER)
+                if range_header:
+                    logger.info(f"Server reports partial upload range: {range_header}")
+                return FileUploadClient._parse_range(range_header), None
+
+            if resp.status_code in (200, 201):
+                return file_size, resp
+
+            resp.raise_for_status()
+            raise UploadFileError(f"Unexpected upload status: {resp.status_code}")
+        except httpx.HTTPError as e:
+            raise UploadFileError(f"Failed to check file status: {str(e)}") from e
+
+    @staticmethod
+    async def _stream_file(file, offset: int, length: int,
+                           scheduler: UploadScheduler = None) -> AsyncIterator[bytes]:
+        """
+        Read `length` bytes of a file from `offset` in blocks, without blocking the event loop.
+
+        :param file: The file opened in binary mode.
+        :param offset: The position of the first byte to read.
+        :param length: The number of bytes to read.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
+        """
+        file.seek(offset)
+        while length > 0:
+            block = await asyncio.to_thread(file.read, min(FileUploadClient.STREAM_BLOCK_SIZE, length))
+            if not block:
+                raise UploadFileError(f"File {file.name} was truncated during upload")
+            length -= len(block)
+            delay = scheduler.reserve_bandwidth(len(block)) if scheduler is not None else 0
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield block
+
+    @staticmethod
+    async def _stream_zip(zip_stream: ZipStream, scheduler: UploadScheduler = None) -> AsyncIterator[bytes]:
+        """
+        Build a zip archive block by block, without blocking the event loop.
+
+        :param zip_stream: The zip archive to build.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
+        """
+        blocks = iter(zip_stream)
+        try:
+            while True:
+                block = await asyncio.to_thread(next, blocks, None)
+                if block is None:
+                    return
+                delay = scheduler.reserve_bandwidth(len(block)) if scheduler is not None else 0
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield block
+        finally:
+            await asyncio.to_thread(blocks.close)
+
+    async def _put_with_retry(self, upload_url: str, headers: dict, get_body: Callable[[], AsyncIterator[bytes]],
+                              timeout: Timeout, retry_policy: RetryPolicy, description: str) -> httpx.Response:
+        """
+        Send a PUT request, retrying connection errors and transient statuses according to the retry policy.
+        Every attempt is capped by the current deadline, if any.
+
+        :param upload_url: The upload URL.
+        :param headers: The request headers.
+        :param get_body: Returns a new request body stream for each attempt, or None for no body.
+        :param timeout: The (connect, read) timeout of each attempt.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param description: A description of the upload, used in log and error messages.
+        :return: The last response received.
+        :raises httpx.HTTPError: If the last attempt could not be sent.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
+        """
+        deadline = get_current_deadline()
+        attempt = 1
+        while True:
+            try:
+                response = await self.session.put(
+                    upload_url, headers=headers, content=get_body(),
+                    timeout=to_httpx_timeout(apply_current_deadline(timeout, description)))
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if not retry_policy.can_retry(HTTP_METHOD_PUT, attempt):
+                    raise
+                delay = retry_policy.get_delay(attempt)
+                logger.warning(f"{description} failed with {e!r}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{retry_policy.max_attempts})")
+            else:
+                if not retry_policy.should_retry_status(HTTP_METHOD_PUT, response.status_code, attempt):
+                    return response
+                delay = retry_policy.get_delay(attempt, response.headers.get(RETRY_AFTER_HEADER))
+                if deadline is not None and delay >= deadline.remaining():
+                    return response
+                logger.warning(f"{description} returned {response.status_code}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{retry_policy.max_attempts})")
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+            await asyncio.sleep(delay)
+            attempt += 1
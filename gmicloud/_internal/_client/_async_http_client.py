@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+from ._retry import RetryPolicy
+from .._deadline import Timeout, get_current_deadline
+from .._exceptions import APIError
+from .._exceptions import UnauthorizedError
+from .._constants import *
+
+logger = logging.getLogger(__name__)
+
+
+def create_async_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> httpx.AsyncClient:
+    """
+    Create an `httpx.AsyncClient` with a keep-alive connection pool.
+
+    :param pool_maxsize: The maximum number of connections kept open by the pool.
+    :return: The configured async session.
+    """
+    limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+    # Timeouts are applied per request by AsyncHTTPClient and AsyncFileUploadClient
+    return httpx.AsyncClient(limits=limits, timeout=None)
+
+
+def to_httpx_timeout(timeout: Optional[Timeout]) -> httpx.Timeout:
+    """
+    Convert a `requests`-style timeout into an `httpx.Timeout`.
+
+    :param timeout: A timeout in seconds, a (connect, read) tuple, or None for no timeout.
+    :return: The equivalent `httpx.Timeout`.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncHTTPClient:
+    """
+    An asyncio HTTP API client for interacting with REST APIs, mirroring `HTTPClient`.
+    """
+
+    def __init__(self, base_url, session: httpx.AsyncClient = None, retry_policy: RetryPolicy = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S)):
+        """
+        Initialize the async HTTP client.
+
+        :param base_url: The base URL of the REST API (e.g., https://api.example.com)
+        :param session: The pooled async session used to send requests (optional).
+        :param retry_policy: The policy for retrying transient failures (optional, defaults to `RetryPolicy()`).
+        :param timeout: The default timeout of every request, in seconds or as a (connect, read) tuple.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.session = session if session is not None else create_async_session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
+
+    def _prepare_url(self, endpoint):
+        """
+        Helper method to prepare the full URL.
+
+        :param endpoint: The API endpoint to append to the base URL.
+        :return: The full API URL as a string.
+        """
+        return f"{self.base_url}{endpoint}"
+
+    async def _send_request(self, method, endpoint, custom_headers=None, data=None, params=None, timeout=None):
+        """
+        Internal method for sending HTTP requests.
+
+        :param method: The HTTP method (e.g., 'GET', 'POST', 'PUT', 'PATCH', 'DELETE').
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param data: The request payload for POST/PUT/PATCH requests (optional).
+        :param params: The query parameters for GET/DELETE requests (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        :raises APIError: If the request fails or the response is invalid.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
+        """
+        url = self._prepare_url(endpoint)
+        headers = {
+            ACCEPT_HEADER: JSON_CONTENT_TYPE,
+            CONTENT_TYPE_HEADER: JSON_CONTENT_TYPE,
+        }
+
+        # Add custom headers if provided
+        if custom_headers:
+            headers.update(custom_headers)
+
+        response = await self._request_with_retry(method, url, timeout if timeout is not None else self.timeout,
+                                                  params=params, json=data, headers=headers)
+        try:
+            logger.debug(response.text)
+            if response.status_code == 401:
+                raise UnauthorizedError(f"Unauthorized Error : {response.status_code} - Access token expired or invalid.")
+            elif response.status_code != 200 and response.status_code != 201:
+                if url.find("ie/artifact") != -1 or url.find("ie/task") != -1 or url.find("ie/requestqueue") != -1:
+                    error_message = response.json().get('error', 'Unknown error')
+                else:
+                    error_message = response.json().get('message', 'Unknown error')
+                raise APIError(f"HTTP Request failed: {response.status_code} - {error_message}")
+        except httpx.HTTPError as e:
+            raise APIError(f"HTTP Request failed: {response.status_code} - {str(e)}")
+        except ValueError as e:
+            # Fallback if response JSON is invalid
+            raise APIError(f"Failed to parse JSON response: {response.status_code} - {response.text}")
+
+        content_type = response.headers.get(CONTENT_TYPE_HEADER, "")
+        if content_type.find(JSON_CONTENT_TYPE) != -1:
+            return response.json()
+        elif content_type.find(TEXT_CONTENT_TYPE) != -1:
+            raise APIError(f"Got text response: {response.status_code} - {response.text}")
+        else:
+            raise APIError(f"Unsupported content type: {response.status_code} - {content_type}")
+
+    async def _request_with_retry(self, method, url, timeout, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying connection errors and transient statuses according to the retry policy.
+        Every attempt is capped by the current deadline, if any.
+
+        :param method: The HTTP method.
+        :param url: The full request URL.
+        :param timeout: The timeout of each attempt.
+        :param kwargs: Extra arguments passed to `httpx.AsyncClient.request`.
+        :return: The last response received.
+        :raises APIError: If the request could not be sent.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
+        """
+        deadline = get_current_deadline()
+        attempt = 1
+        while True:
+            if deadline is not None:
+                deadline.check(f"{method} {url}")
+            attempt_timeout = to_httpx_timeout(deadline.cap(timeout) if deadline else timeout)
+            try:
+                response = await self.session.request(method, url, timeout=attempt_timeout, **kwargs)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise APIError(f"HTTP Request failed: 0 - {str(e)}")
+                delay = self.retry_policy.get_delay(attempt)
+                logger.warning(f"{method} {url} failed with {e!r}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{self.retry_policy.max_attempts})")
+            except httpx.HTTPError as e:
+                raise APIError(f"HTTP Request failed: 0 - {str(e)}")
+            else:
+                if not self.retry_policy.should_retry_status(method, response.status_code, attempt):
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.headers.get(RETRY_AFTER_HEADER))
+                if deadline is not None and delay >= deadline.remaining():
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{self.retry_policy.max_attempts})")
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def post(self, endpoint, custom_headers=None, data=None, timeout=None):
+        """
+        Send a POST request to the given API endpoint.
+
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        """
+        return await self._send_request(method=HTTP_METHOD_POST, endpoint=endpoint, custom_headers=custom_headers,
+                                        data=data, timeout=timeout)
+
+    async def get(self, endpoint, custom_headers=None, params=None, timeout=None):
+        """
+        Send a GET request to the given API endpoint.
+
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param params: Query parameters as a dictionary (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        """
+        return await self._send_request(method=HTTP_METHOD_GET, endpoint=endpoint, custom_headers=custom_headers,
+                                        params=params, timeout=timeout)
+
+    async def put(self, endpoint, custom_headers=None, data=None, timeout=None):
+        """
+        Send a PUT request to the given API endpoint.
+
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        """
+        return await self._send_request(method=HTTP_METHOD_PUT, endpoint=endpoint, custom_headers=custom_headers,
+                                        data=data, timeout=timeout)
+
+    async def patch(self, endpoint, custom_headers=None, data=None, timeout=None):
+        """
+        Send a PATCH request to the given API endpoint.
+
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        """
+        return await self._send_request(method=HTTP_METHOD_PATCH, endpoint=endpoint, custom_headers=custom_headers,
+                                        data=data, timeout=timeout)
+
+    async def delete(self, endpoint, custom_headers=None, params=None, timeout=None):
+        """
+        Send a DELETE request to the given API endpoint.
+
+        :param endpoint: The API endpoint.
+        :param custom_headers: The request headers (optional).
+        :param params: Query parameters as a dictionary (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
+        :return: The JSON response parsed as a Python dictionary.
+        """
+        return await self._send_request(method=HTTP_METHOD_DELETE, endpoint=endpoint, custom_headers=custom_headers,
+                                        params=params, timeout=timeout)
@@ -0,0 +1,439 @@
+import time
+import asyncio
+import logging
+import httpx
+
+from ._async_http_client import AsyncHTTPClient, create_async_session
+from ._retry import RetryPolicy
+from .._config import IAM_SERVICE_BASE_URL
+from .._exceptions import APIError
+from .._models import *
+from .._constants import (
+    CLIENT_ID_HEADER, AUTHORIZATION_HEADER, DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S,
+    DEFAULT_TOKEN_REFRESH_MARGIN_S, TOKEN_RENEWAL_RETRY_INTERVAL_S, DEFAULT_PROFILE_CACHE_TTL_S
+)
+from .._deadline import Timeout
+from ._auth_config import (
+    get_user_refresh_token_from_system_config,
+    write_user_refresh_token_to_system_config,
+    clear_user_refresh_token_from_system_config,
+    write_user_profile_to_system_config,
+    get_user_profile_from_system_config,
+    is_refresh_token_expired,
+    get_token_expiry
+)
+logger = logging.getLogger(__name__)
+
+
+class AsyncIAMClient:
+    """
+    Asyncio client for interacting with the IAM Service API, mirroring `IAMClient`.
+    """
+
+    def __init__(self, client_id: str, email: str, password: str, session: Optional[httpx.AsyncClient] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S),
+                 token_refresh_margin_s: Optional[float] = DEFAULT_TOKEN_REFRESH_MARGIN_S,
+                 profile_cache_ttl_s: Optional[float] = DEFAULT_PROFILE_CACHE_TTL_S,
+                 api_key: Optional[str] = None):
+        """
+        Initialize AsyncIAMClient with client credentials.
+
+        :param client_id: Client ID for login.
+        :param email: Email for login.
+        :param password: Password for login.
+        :param session: The pooled async session shared by every service client (optional).
+        :param retry_policy: The retry policy shared by every service client (optional).
+        :param timeout: The default request timeout shared by every service client, in seconds or as a
+                        (connect, read) tuple.
+        :param token_refresh_margin_s: Refresh the access token once its remaining lifetime drops below this many
+                                       seconds, instead of waiting for a 401. None disables proactive renewal.
+        :param profile_cache_ttl_s: How long the user and organization IDs are cached in the config file, saving
+                                    the profile request on login. None disables the cache.
+        :param api_key: An organization API key. If given, it is sent on every request instead of a session
+                        token, and login, token refresh and the config file are skipped entirely.
+        """
+        self._client_id = client_id
+        self._email = email
+        self._password = password
+        self._access_token = ""
+        self._refresh_token = ""
+        self._user_id = ""
+        self._organization_id = ""
+        self._api_key = api_key
+        self._session = session if session is not None else create_async_session()
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._timeout = timeout
+        # The refresh in progress, awaited by every concurrent caller
+        self._refresh_task = None
+        self._token_refresh_margin_s = token_refresh_margin_s
+        self._profile_cache_ttl_s = profile_cache_ttl_s
+        # Serializes logins triggered by the first API calls of a lazily logged in client
+        self._login_lock = asyncio.Lock()
+        # The last parsed access token and its expiry, so that the JWT is decoded once per token
+        self._access_token_expiry = ("", None)
+        self._failed_renewal_token = None
+        self._renewal_task = None
+        self.client = AsyncHTTPClient(IAM_SERVICE_BASE_URL, self._session, self._retry_policy, self._timeout)
+
+    async def login(self) -> bool:
+        """
+        Logs in a user with the given email and password.
+        Returns True if login is successful, otherwise False.
+        """
+        # An API key needs no session
+        if self._api_key:
+            return True
+        try:
+            # Check config refresh token is available and is not expired, if yes ,refresh it
+            temp_refresh_token = get_user_refresh_token_from_system_config(self._email)
+            refreshed = False
+            if temp_refresh_token and not is_refresh_token_expired(temp_refresh_token):
+                self._refresh_token = temp_refresh_token
+                refreshed = await self.refresh_token()
+            # Fall back to a password login if the stored refresh token was rejected
+            if not refreshed:
+                custom_headers = {CLIENT_ID_HEADER: self._client_id}
+                req = AuthTokenRequest(email=self._email, password=self._password)
+                auth_tokens_result = await self.client.post("/me/auth-tokens", custom_headers, req.model_dump())
+
+                if not auth_tokens_result:
+                    logger.error("Login failed: Received empty response from auth-tokens endpoint")
+                    return False
+
+                auth_tokens_resp = AuthTokenResponse.model_validate(auth_tokens_result)
+
+                # Handle 2FA
+                if auth_tokens_resp.is2FARequired:
+                    for attempt in range(3):
+                        code = input(f"Attempt {attempt + 1}/3: Please enter the 2FA code: ")
+                        create_session_req = CreateSessionRequest(
+                            type="native", authToken=auth_tokens_resp.authToken, otpCode=code
+                        )
+                        try:
+                            session_result = await self.client.post("/me/sessions", custom_headers,
+                                                                    create_session_req.model_dump())
+                            if session_result:
+                                break
+                        except APIError:
+                            logger.warning("Invalid 2FA code, please try again.")
+                            if attempt == 2:
+                                logger.error("Failed to create session after 3 incorrect 2FA attempts.")
+                                return False
+                else:
+                    create_session_req = CreateSessionRequest(type="native", authToken=auth_tokens_resp.authToken,
+                                                              otpCode=None)
+                    session_result = await self.client.post("/me/sessions", custom_headers,
+                                                            create_session_req.model_dump())
+
+                create_session_resp = CreateSessionResponse.model_validate(session_result)
+
+                self._access_token = create_session_resp.accessToken
+                self._refresh_token = create_session_resp.refreshToken
+                # first login write refresh token to system config
+                write_user_refresh_token_to_system_config(self._email, self._refresh_token)
+            self._user_id = self.parse_user_id()
+
+            # Reuse the organization ID cached by a previous login of the same user
+            cached_profile = get_user_profile_from_system_config(self._email) \
+                if self._profile_cache_ttl_s is not None else None
+            if cached_profile and cached_profile["user_id"] == self._user_id:
+                self._organization_id = cached_profile["organization_id"]
+                return True
+
+            # Fetch profile to get organization ID
+            profile_result = await self.client.get("/me/profile", self.get_custom_headers())
+            if not profile_result:
+                logger.error("Failed to fetch user profile data.")
+                return False
+
+            profile_resp = ProfileResponse.model_validate(profile_result)
+            self._organization_id = profile_resp.organization.id
+            if self._profile_cache_ttl_s is not None:
+                write_user_profile_to_system_config(self._email, self._user_id, self._organization_id,
+                                                    self._profile_cache_ttl_s)
+
+            return True
+        except (httpx.HTTPError, APIError, ValueError, KeyError) as e:
+            logger.error(f"Login failed due to exception: {e}")
+            return False
+
+    async def ensure_logged_in(self) -> bool:
+        """
+        Logs in on first use when the client was created without logging in. Concurrent callers share one login.
+
+        :return: True if a session is available, otherwise False.
+        """
+        if self._api_key or self._access_token:
+            return True
+        async with self._login_lock:
+            if self._access_token:
+                return True
+            return await self.login()
+
+    async def ensure_profile(self) -> bool:
+        """
+        Makes sure the user and organization IDs are known, logging in first if needed. An API key skips the login,
+        so its IDs are fetched from the profile once, on first use.
+
+        :return: True if the IDs are known, otherwise False.
+        """
+        if not await self.ensure_logged_in():
+            return False
+        # A login resolves the IDs
+        if not self._api_key:
+            return True
+        if not self._organization_id:
+            async with self._login_lock:
+                if not self._organization_id:
+                    try:
+                        profile_result = await self.client.get("/me/profile", self.get_custom_headers())
+                        if profile_result:
+                            profile_resp = ProfileResponse.model_validate(profile_result)
+                            self._user_id = profile_resp.user.id
+                            self._organization_id = profile_resp.organization.id
+                    except (httpx.HTTPError, APIError, ValueError) as e:
+                        logger.error(f"Failed to fetch the profile of the API key: {e}")
+        return bool(self._user_id and self._organization_id)
+
+    async def refresh_token(self, stale_access_token: Optional[str] = None) -> bool:
+        """
+        Refreshes the access token. Returns True on success, False otherwise.
+
+        Refreshing is single-flight: while a refresh is in progress, concurrent callers await it and share its
+        result instead of rotating the refresh token again.
+
+        :param stale_access_token: The access token the caller found expired. If it has already been replaced,
+                                   the new token is reused and no refresh is sent.
+        """
+        # An API key cannot be refreshed; a 401 means it is invalid or revoked
+        if self._api_key:
+            return False
+        if stale_access_token is not None and stale_access_token != self._access_token:
+            return True
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._send_refresh_token())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+        # Shield the shared refresh so that one cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._refresh_task)
+
+    def _clear_refresh_task(self, task: asyncio.Future) -> None:
+        """
+        Forgets the finished refresh so that the next expiry starts a new one.
+        """
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def renew_token_if_expiring(self) -> str:
+        """
+        Refreshes the access token ahead of time once its remaining lifetime drops below the refresh margin.
+
+        :return: The access token to send the next request with.
+        """
+        if self._api_key:
+            return self._api_key
+        access_token = self._access_token
+        if self._token_refresh_margin_s is None or not self._refresh_token:
+            return access_token
+        expiry = self.get_access_token_expiry()
+        if expiry is None or expiry - time.time() > self._token_refresh_margin_s:
+            return access_token
+        # Do not retry a failed renewal on every request; the 401 path takes over from here
+        if access_token == self._failed_renewal_token:
+            return access_token
+        if not await self.refresh_token(access_token):
+            self._failed_renewal_token = access_token
+        return self._access_token
+
+    def start_token_renewal(self) -> None:
+        """
+        Starts a background task on the running event loop that refreshes the access token shortly before it
+        expires, so that requests never wait for a refresh.
+        """
+        if self._api_key:
+            return
+        if self._renewal_task is not None and not self._renewal_task.done():
+            return
+        self._renewal_task = asyncio.ensure_future(self._renew_token_periodically())
+
+    async def stop_token_renewal(self) -> None:
+        """
+        Stops the background token renewal task, if running.
+        """
+        if self._renewal_task is None:
+            return
+        self._renewal_task.cancel()
+        try:
+            await self._renewal_task
+        except asyncio.CancelledError:
+            pass
+        self._renewal_task = None
+
+    async def _renew_token_periodically(self) -> None:
+        """
+        Body of the renewal task: sleeps until the refresh margin is reached, then refreshes the token.
+        """
+        margin_s = self._token_refresh_margin_s if self._token_refresh_margin_s is not None \
+            else DEFAULT_TOKEN_REFRESH_MARGIN_S
+        while True:
+            access_token = self._access_token
+            expiry = self.get_access_token_expiry()
+            if expiry is None:
+                wait_s = TOKEN_RENEWAL_RETRY_INTERVAL_S
+            else:
+                lifetime_s = expiry - time.time()
+                # Tokens living shorter than the margin are renewed at half their lifetime instead of back to back
+                wait_s = max(0.0, lifetime_s - margin_s, lifetime_s / 2)
+            await asyncio.sleep(wait_s)
+            if expiry is not None and not await self.refresh_token(access_token):
+                logger.warning(f"Background token renewal failed, retrying in {TOKEN_RENEWAL_RETRY_INTERVAL_S}s")
+                await asyncio.sleep(TOKEN_RENEWAL_RETRY_INTERVAL_S)
+
+    async def _send_refresh_token(self, adopt_shared_token: bool = True) -> bool:
+        """
+        Sends the refresh request and stores the rotated tokens. Returns True on success, False otherwise.
+
+        :param adopt_shared_token: Whether to retry once with the refresh token found in the config file if it was
+                                   rotated by another process sharing it.
+        """
+        try:
+            custom_headers = {CLIENT_ID_HEADER: self._client_id}
+            refresh_token = self._refresh_token
+            try:
+                result = await self.client.patch("/me/sessions", custom_headers, {"refreshToken": refresh_token})
+            except Exception as err:
+                # Another process sharing the config file may have rotated the refresh token first
+                shared_refresh_token = get_user_refresh_token_from_system_config(self._email)
+                if adopt_shared_token and shared_refresh_token and shared_refresh_token != refresh_token:
+                    logger.info("Refresh token was rotated by another process, retrying with the shared one.")
+                    self._refresh_token = shared_refresh_token
+                    return await self._send_refresh_token(adopt_shared_token=False)
+                logger.error(f"{str(err)}, please re-login.")
+                clear_user_refresh_token_from_system_config(self._email, refresh_token)
+                return False
+
+            if not result:
+                logger.error("Failed to refresh token: Empty response received")
+                return False
+
+            resp = CreateSessionResponse.model_validate(result)
+            self._access_token = resp.accessToken
+            self._refresh_token = resp.refreshToken
+            write_user_refresh_token_to_system_config(self._email, self._refresh_token)
+            return True
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Token refresh failed: {e}")
+            return False
+
+    async def create_org_api_key(self, request: CreateAPIKeyRequest) -> Optional[str]:
+        """
+        Creates a new API key for the current user.
+        """
+        if not await self.ensure_profile():
+            logger.error("Failed to create API key: the organization ID is unknown")
+            return None
+        try:
+            result = await self.client.post(f"/organizations/{self.get_organization_id()}/api-keys",
+                                            self.get_custom_headers(), request.model_dump())
+
+            return CreateAPIKeyResponse.model_validate(result).key if result else None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Failed to create API key: {e}")
+            return None
+
+    async def get_org_api_keys(self) -> Optional[GetAPIKeysResponse]:
+        """
+        Fetches all API keys for the current user.
+        """
+        if not await self.ensure_profile():
+            logger.error("Failed to retrieve organization API keys: the organization ID is unknown")
+            return None
+        try:
+            result = await self.client.get(f"/organizations/{self.get_organization_id()}/api-keys",
+                                           self.get_custom_headers())
+
+            return GetAPIKeysResponse.model_validate(result) if result else None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Failed to retrieve organization API keys: {e}")
+            return None
+
+    def parse_user_id(self) -> str:
+        """
+        Parses the current access token and returns the user ID.
+        """
+        return self.parse_token()["userId"]
+
+    def parse_token(self) -> dict:
+        """
+        Parses the current access token and returns the payload as a dictionary.
+        """
+        import jwt
+        return jwt.decode(self._access_token, options={"verify_signature": False})
+
+    def get_access_token_expiry(self) -> Optional[float]:
+        """
+        Gets the expiry time of the current access token as a UNIX timestamp, or None if it cannot be parsed.
+        """
+        access_token = self._access_token
+        parsed_token, expiry = self._access_token_expiry
+        if access_token != parsed_token:
+            expiry = get_token_expiry(access_token)
+            self._access_token_expiry = (access_token, expiry)
+        return expiry
+
+    def get_access_token(self) -> str:
+        """
+        Gets the current access token.
+        """
+        return self._access_token
+
+    def get_refresh_token(self) -> str:
+        """
+        Gets the current refresh token.
+        """
+        return self._refresh_token
+
+    def get_user_id(self) -> str:
+        """
+        Gets the current user ID.
+        """
+        return self._user_id
+
+    def get_client_id(self) -> str:
+        """
+        Gets the current client ID.
+        """
+        return self._client_id
+
+    def get_organization_id(self) -> str:
+        """
+        Gets the current organization ID.
+        """
+        return self._organization_id
+
+    def get_session(self) -> httpx.AsyncClient:
+        """
+        Gets the pooled async session shared by the service clients.
+        """
+        return self._session
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+        Gets the retry policy shared by the service clients.
+        """
+        return self._retry_policy
+
+    def get_timeout(self) -> Timeout:
+        """
+        Gets the default request timeout shared by the service clients.
+        """
+        return self._timeout
+
+    def get_custom_headers(self) -> dict:
+        """
+        Gets the custom headers for the IAM client.
+        """
+        return {
+            AUTHORIZATION_HEADER: f'Bearer {self._api_key or self._access_token}',
+            CLIENT_ID_HEADER: self._client_id
+        }
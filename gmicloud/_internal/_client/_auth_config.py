@@ -1,70 +1,162 @@
 import os
-import jwt
+import copy
 import time
 import json
 import logging
+import tempfile
 import threading
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE_NAME = ".gmicloud.config.json"
+LOCK_FILE_SUFFIX = ".lock"
 
-# create the thread lock object56
+# Serializes writers within this process; the lock file below serializes them across processes
 lock = threading.Lock()
 
+# The last config read from disk, keyed by the file's identity and modification time
+_config_cache = None
+
+
+def _get_config_file_path()->str:
+    """Get the path of the config file."""
+    return os.path.join(Path.home(), CONFIG_FILE_NAME)
+
+
+@contextmanager
+def _config_file_lock(config_file_path:str):
+    """Hold an exclusive lock on the config file, across threads and processes."""
+    with lock:
+        with open(config_file_path + LOCK_FILE_SUFFIX, "a+") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 def _read_config_file()->dict|None:
-    """Read the config file."""
-    base_dir = Path.home()
-    config_file_path =os.path.join(base_dir,CONFIG_FILE_NAME)
-    if not os.path.exists(config_file_path):
+    """
+    Read the config file.
+    The file is only replaced atomically, so no lock is needed; the parsed content is cached until its mtime changes.
+    """
+    global _config_cache
+    config_file_path = _get_config_file_path()
+    try:
+        stat = os.stat(config_file_path)
+    except FileNotFoundError:
         return None
-    with lock:
-        # open the config file, read mode with lock
+    cache_key = (config_file_path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache
+    if cached is not None and cached[0] == cache_key:
+        return copy.deepcopy(cached[1])
+
+    try:
         with open(config_file_path,"r") as fr:
-            return json.loads(fr.read())
+            config_dic = json.loads(fr.read())
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        logger.warning(f"Ignoring unreadable config file {config_file_path}: {e}")
+        return None
+    _config_cache = (cache_key, config_dic)
+    return copy.deepcopy(config_dic)
 
 
 def _write_config_file(config_file_path:str,config_dic:dict)->None:
-    """Write the config file."""
-    with lock:
-        # open the config file, write mode with lock
-        with open(config_file_path,"w") as fw:
+    """Write the config file atomically: write a temporary file next to it, then rename it over the original."""
+    global _config_cache
+    fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(config_file_path), prefix=CONFIG_FILE_NAME + ".")
+    try:
+        with os.fdopen(fd, "w") as fw:
             # transform the config dictionary to JSON format and write it to the file
             fw.write(json.dumps(config_dic))
+            fw.flush()
+            os.fsync(fw.fileno())
+        os.replace(temp_file_path, config_file_path)
+    except BaseException:
+        os.unlink(temp_file_path)
+        raise
+    # Remember what we just wrote so that the next read in this process skips the disk
+    stat = os.stat(config_file_path)
+    _config_cache = ((config_file_path, stat.st_ino, stat.st_mtime_ns, stat.st_size), copy.deepcopy(config_dic))
 
 
-def write_user_refresh_token_to_system_config(email:str,refresh_token:str)->bool:
-    """Write the user refresh token to the system config file."""
-    base_dir = Path.home()
-    config_file_path = os.path.join(base_dir,CONFIG_FILE_NAME)
+def _update_user_config(email:str,update)->bool:
+    """Read, update and write back the config entry of a user while holding the config file lock."""
+    config_file_path = _get_config_file_path()
     try:
-        # check the config file is exists. if not, create it, if yes, update the refresh token
-        if not os.path.exists(config_file_path):
-            config_dic = { email : {"refresh_token": refresh_token} }
-            _write_config_file(config_file_path,config_dic)
-        else:
-            config_dic = _read_config_file()
-            if not config_dic.get(email):
-                config_dic[email] = dict()
-            config_dic[email] = {"refresh_token": refresh_token}
+        with _config_file_lock(config_file_path):
+            config_dic = _read_config_file() or dict()
+            config_dic[email] = update(config_dic.get(email) or dict())
             _write_config_file(config_file_path,config_dic)
     except Exception as e:
-        logger.error("write file wrong :", e)
+        logger.error(f"write file wrong : {e}")
         return False
     return True
 
 
+def write_user_refresh_token_to_system_config(email:str,refresh_token:str)->bool:
+    """Write the user refresh token to the system config file."""
+    return _update_user_config(email, lambda user_config: dict(user_config, refresh_token=refresh_token))
+
+
+def write_user_profile_to_system_config(email:str,user_id:str,organization_id:str,ttl_s:float)->bool:
+    """Write the user id and organization id to the system config file, valid for `ttl_s` seconds."""
+    return _update_user_config(
+        email,
+        lambda user_config: dict(user_config, user_id=user_id, organization_id=organization_id,
+                                 profile_expires_at=time.time() + ttl_s))
+
+
+def get_user_profile_from_system_config(email:str)->dict|None:
+    """Get the cached user id and organization id from the system config file, or None if missing or expired."""
+    config_dic = _read_config_file()
+    if not config_dic or not config_dic.get(email):
+        return None
+    user_config = config_dic[email]
+    if not user_config.get("organization_id") or user_config.get("profile_expires_at", 0) < time.time():
+        return None
+    return {"user_id": user_config.get("user_id"), "organization_id": user_config["organization_id"]}
+
+
+def clear_user_refresh_token_from_system_config(email:str,refresh_token:str)->bool:
+    """
+    Clear the user refresh token from the system config file, unless another process has already replaced it.
+    """
+    return _update_user_config(
+        email,
+        lambda user_config: dict(user_config, refresh_token="") if user_config.get("refresh_token") == refresh_token
+        else user_config)
+
+
 def get_user_refresh_token_from_system_config(email:str)->str|None:
     """Get the user refresh token from the system config file."""
     config_dic = _read_config_file()
     if not config_dic or not config_dic.get(email):
         return None
-    return config_dic[email]["refresh_token"]
+    return config_dic[email].get("refresh_token")
 
 
 def _parese_refresh_token(refresh_token:str)->dict:
     """Parse the refresh token."""
+    import jwt
     return jwt.decode(refresh_token, options={"verify_signature": False})
 
 
@@ -75,4 +167,13 @@ def is_refresh_token_expired(refresh_token:str)->bool:
     except Exception as e:
         logger.error("parse refresh token wrong :", e)
         return True
-    return refresh_token_time < time.time()
\ No newline at end of file
+    return refresh_token_time < time.time()
+
+
+def get_token_expiry(token:str)->float|None:
+    """Get the expiry time of a JWT as a UNIX timestamp, or None if the token has no readable `exp` claim."""
+    import jwt
+    try:
+        return float(jwt.decode(token, options={"verify_signature": False})['exp'])
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+        return None
@@ -10,13 +10,40 @@ def handle_refresh_token(method):
 
     @wraps(method)
     def wrapper(self, *args, **kwargs):
+        # Log in on first use, renew an expiring token up front, and remember the token this call is sent with,
+        # so that a refresh already done by another thread is reused
+        self.iam_client.ensure_logged_in()
+        access_token = self.iam_client.renew_token_if_expiring()
         try:
             # First attempt to call the original method
             return method(self, *args, **kwargs)
         except UnauthorizedError:  # Assume ArtifactClient raises this for 401 errors
-            # Refresh the token using the IAMClient
-            self.iam_client.refresh_token()
+            # Refresh the token using the IAMClient; retrying is pointless if that failed, e.g. for an API key
+            if not self.iam_client.refresh_token(access_token):
+                raise
             # Retry the original method
             return method(self, *args, **kwargs)
 
     return wrapper
+
+
+def handle_refresh_token_async(method):
+    """
+    Decorator to handle automatic token refresh on 401 Unauthorized errors for coroutine methods.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        await self.iam_client.ensure_logged_in()
+        access_token = await self.iam_client.renew_token_if_expiring()
+        try:
+            # First attempt to call the original method
+            return await method(self, *args, **kwargs)
+        except UnauthorizedError:
+            # Refresh the token using the AsyncIAMClient
+            if not await self.iam_client.refresh_token(access_token):
+                raise
+            # Retry the original method
+            return await method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,295 @@
+import os
+import json
+import contextlib
+import mmap
+import time
+import logging
+import tempfile
+import threading
+import concurrent.futures
+from typing import Callable, Optional, Tuple
+
+import requests
+
+from ._http_client import HTTPClient, create_session
+from ._retry import RetryPolicy
+from .._constants import *
+from .._deadline import Timeout
+from .._exceptions import APIError, DownloadFileError, DownloadIntegrityError
+from .._upload_checksum import UploadChecksum
+
+logger = logging.getLogger(__name__)
+
+PART_FILE_SUFFIX = ".part"
+PART_STATE_SUFFIX = ".part.json"
+
+
+class FileDownloadClient:
+    """
+    Downloads files over HTTP with parallel range requests, such as the big files of an artifact from Google Storage.
+    """
+
+    def __init__(self, session: requests.Session = None, retry_policy: RetryPolicy = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S)):
+        """
+        Initialize the download client.
+
+        :param session: The pooled session used to send requests (optional).
+        :param retry_policy: The policy for retrying failed requests and interrupted parts (optional, defaults to
+                             `RetryPolicy()`).
+        :param timeout: The (connect, read) timeout of every request.
+        """
+        self.client = HTTPClient("", session if session is not None else
+                                 create_session(pool_maxsize=DEFAULT_DOWNLOAD_CONNECTIONS), retry_policy, timeout)
+
+    def get_file_info(self, url: str, headers: Optional[dict] = None) -> Tuple[int, Optional[str], Optional[str], bool]:
+        """
+        Get the size, version and hashes of a remote file.
+
+        :param url: The URL of the file.
+        :param headers: Extra request headers, e.g. for authorization (optional).
+        :return: The size in bytes, the ETag, the `x-goog-hash` header, and whether range requests are supported.
+        :raises DownloadFileError: If the file cannot be found.
+        """
+        try:
+            response = self.client._request_with_retry("HEAD", url, self.client.timeout, headers=headers or {},
+                                                       allow_redirects=True)
+        except APIError as e:
+            raise DownloadFileError(f"Failed to get the size of {url}: {e}")
+        with response:
+            if response.status_code != 200 or "Content-Length" not in response.headers:
+                raise DownloadFileError(f"Failed to get the size of {url}, code:{response.status_code}")
+            return (int(response.headers["Content-Length"]), response.headers.get("ETag"),
+                    response.headers.get(GOOG_HASH_HEADER), response.headers.get("Accept-Ranges") == "bytes")
+
+    def download_file(self, url: str, file_path: str, headers: Optional[dict] = None,
+                      max_connections: int = DEFAULT_DOWNLOAD_CONNECTIONS, part_size: int = DOWNLOAD_PART_SIZE,
+                      verify: bool = True, use_mmap: bool = False,
+                      on_bytes_downloaded: Callable[[int], None] = None) -> None:
+        """
+        Download a file in parts of `part_size` bytes, fetched by up to `max_connections` range requests at a time.
+
+        Parts are written as they arrive into `<file_path>.part`, preallocated to the size of the file, either with
+        positioned writes or through a memory map of it. Each connection holds one block of `DOWNLOAD_BLOCK_SIZE`
+        bytes at a time, so memory use does not grow with the file size. Completed parts are recorded in
+        `<file_path>.part.json`: a later call for the same unchanged file (same size and ETag) only downloads the
+        missing parts. An interrupted part is resumed from its last byte received, as allowed by the retry policy.
+
+        Once complete, the file is compared with the MD5 (and CRC32C, with the optional `google-crc32c` package)
+        reported by Google Storage in `x-goog-hash`, if any, and renamed to `file_path`.
+
+        :param url: The URL of the file.
+        :param file_path: The local path to write the file to.
+        :param headers: Extra request headers, e.g. for authorization (optional).
+        :param max_connections: The maximum number of parts downloaded at the same time.
+        :param part_size: The size of the parts in bytes.
+        :param verify: Whether to check the hashes of the file, if the server reports them.
+        :param use_mmap: Whether to write the parts through a memory map of the file instead of positioned writes.
+        :param on_bytes_downloaded: Called with the number of bytes of the file downloaded so far, including the parts
+                                    of an earlier call (optional).
+        :raises DownloadIntegrityError: If the file does not match the hashes reported by the server. The partial
+                                        file is deleted, so the next call downloads it afresh.
+        :raises DownloadFileError: If the download fails; the parts completed are kept for the next call.
+        """
+        if max_connections < 1 or part_size < 1:
+            raise ValueError("Download connections and part size must be positive.")
+        # Ranges apply to the stored bytes, so they must not be compressed on the way
+        headers = {**(headers or {}), "Accept-Encoding": "identity"}
+        file_size, etag, goog_hash, ranged = self.get_file_info(url, headers)
+        part_path, state_path = file_path + PART_FILE_SUFFIX, file_path + PART_STATE_SUFFIX
+        if not ranged:
+            part_size = max(file_size, 1)
+        parts = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+        state = {"url": url, "size": file_size, "etag": etag, "part_size": part_size, "completed": []}
+        completed = self._load_completed_parts(state_path, part_path, state)
+        state["completed"] = sorted(completed)
+        logger.info(f"Downloading {url} ({file_size:,} bytes) to {file_path} in {len(parts)} parts"
+                    + (f", {len(completed)} already downloaded" if completed else ""))
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        self._preallocate(part_path, file_size, resume=bool(completed))
+        state_lock = threading.Lock()
+        downloaded = [sum(parts[index][1] - parts[index][0] + 1 for index in completed)]
+        if on_bytes_downloaded is not None:
+            on_bytes_downloaded(downloaded[0])
+
+        def record_bytes(nbytes):
+            with state_lock:
+                downloaded[0] += nbytes
+                total = downloaded[0]
+            if on_bytes_downloaded is not None:
+                on_bytes_downloaded(total)
+
+        def download_part(index, memory_map):
+            start, end = parts[index]
+            if memory_map is not None:
+                def write(position, block):
+                    memory_map[position:position + len(block)] = block
+
+                self._download_range(url, headers, start, end, file_size, ranged, write, record_bytes)
+            else:
+                with open(part_path, "r+b") as part_file:
+                    def write(position, block):
+                        part_file.seek(position)
+                        part_file.write(block)
+
+                    self._download_range(url, headers, start, end, file_size, ranged, write, record_bytes)
+            with state_lock:
+                state["completed"].append(index)
+                self._save_state(state_path, state)
+
+        missing = [index for index in range(len(parts)) if index not in completed]
+        with open(part_path, "r+b") as part_file, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_connections) as executor:
+            memory_map = mmap.mmap(part_file.fileno(), file_size) if use_mmap and file_size else None
+            try:
+                futures = [executor.submit(download_part, index, memory_map) for index in missing]
+                errors = []
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append(e)
+                if errors:
+                    raise DownloadFileError(f"Failed to download {url}: {len(errors)}/{len(missing)} parts failed, "
+                                            f"first error: {errors[0]}")
+            finally:
+                if memory_map is not None:
+                    memory_map.flush()
+                    memory_map.close()
+
+        if verify:
+            self._verify_download(url, part_path, state_path, file_size, goog_hash)
+        os.replace(part_path, file_path)
+        # No state is saved for a file without parts, e.g. an empty one
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(state_path)
+        logger.info(f"File {file_path} downloaded successfully.")
+
+    def _download_range(self, url: str, headers: dict, start: int, end: int, file_size: int, ranged: bool,
+                        write: Callable[[int, bytes], None], record_bytes: Callable[[int], None]) -> None:
+        """
+        Download the bytes `start` to `end` of a file, resuming from the last byte received when the connection fails.
+
+        :param url: The URL of the file.
+        :param headers: Extra request headers.
+        :param start: The offset of the first byte.
+        :param end: The offset of the last byte.
+        :param file_size: The size of the file.
+        :param ranged: Whether the server supports range requests; if not, a failed download starts over.
+        :param write: Writes a block at an offset of the file.
+        :param record_bytes: Called with the size of every block written.
+        :raises DownloadFileError: If the range cannot be downloaded.
+        """
+        retry_policy = self.client.retry_policy
+        position, attempt = start, 1
+        while position <= end:
+            request_headers = dict(headers)
+            if position or end < file_size - 1:
+                request_headers[RANGE_HEADER] = f"bytes={position}-{end}"
+            try:
+                response = self.client._request_with_retry(HTTP_METHOD_GET, url, self.client.timeout,
+                                                           headers=request_headers, stream=True)
+            except APIError as e:
+                raise DownloadFileError(f"Failed to download bytes {position:,}-{end:,} of {url}: {e}")
+            try:
+                expected_status = 206 if RANGE_HEADER in request_headers else 200
+                if response.status_code != expected_status:
+                    raise DownloadFileError(f"Failed to download bytes {position:,}-{end:,} of {url}, "
+                                            f"code:{response.status_code}")
+                for block in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+                    block = block[:end + 1 - position]
+                    write(position, block)
+                    position += len(block)
+                    record_bytes(len(block))
+                    attempt = 1
+                if position <= end:
+                    raise requests.exceptions.ConnectionError(f"the response ended at byte {position:,}")
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                if not retry_policy.can_retry(HTTP_METHOD_GET, attempt):
+                    raise DownloadFileError(f"Failed to download bytes {position:,}-{end:,} of {url} after "
+                                            f"{attempt} attempts: {e}")
+                delay = retry_policy.get_delay(attempt)
+                logger.warning(f"Downloading bytes {position:,}-{end:,} of {url} failed with {e!r}, resuming in "
+                               f"{delay:.2f}s (attempt {attempt}/{retry_policy.max_attempts})")
+                if not ranged:
+                    record_bytes(start - position)
+                    position = start
+                time.sleep(delay)
+                attempt += 1
+            finally:
+                response.close()
+
+    @staticmethod
+    def _load_completed_parts(state_path: str, part_path: str, state: dict) -> set:
+        """
+        Get the parts completed by an earlier download of the same file, if its partial file is still there.
+
+        :param state_path: The path of the state of the download.
+        :param part_path: The path of the partial file.
+        :param state: The state of this download, whose size, ETag and part size must match.
+        :return: The indexes of the completed parts.
+        """
+        try:
+            with open(state_path, "r") as f:
+                saved = json.load(f)
+            if os.path.getsize(part_path) == state["size"] and \
+                    all(saved.get(key) == state[key] for key in ("size", "etag", "part_size")):
+                return set(saved.get("completed", []))
+            logger.info(f"The file changed since its partial download {part_path}, starting over")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable download state {state_path}: {e}")
+        return set()
+
+    @staticmethod
+    def _save_state(state_path: str, state: dict) -> None:
+        """Write the state of a download atomically."""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(state_path)),
+                                         prefix=os.path.basename(state_path) + ".")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(temp_path, state_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _preallocate(part_path: str, file_size: int, resume: bool) -> None:
+        """
+        Create the partial file at its full size, reserving the disk space where the file system supports it.
+
+        :param part_path: The path of the partial file.
+        :param file_size: The size of the file.
+        :param resume: Whether to keep the parts already written.
+        """
+        with open(part_path, "r+b" if resume else "wb") as f:
+            if hasattr(os, "posix_fallocate") and file_size:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, file_size)
+                    return
+                except OSError:
+                    pass
+            f.truncate(file_size)
+
+    @staticmethod
+    def _verify_download(url: str, part_path: str, state_path: str, file_size: int, goog_hash: Optional[str]) -> None:
+        """
+        Compare the hashes of a downloaded file with those reported by the server.
+
+        :raises DownloadIntegrityError: If the hashes do not match, after deleting the partial file and its state.
+        """
+        checksum = UploadChecksum()
+        checksum.update_from_file(part_path, file_size)
+        verified = checksum.verify(goog_hash)
+        if verified is False:
+            for path in (part_path, state_path):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+            raise DownloadIntegrityError(f"File {url} was downloaded corrupted: the server reports {goog_hash}, "
+                                         f"the download has {checksum.digests()}")
+        if verified is None:
+            logger.warning(f"The server reported no hash for {url}, the download was not verified")
@@ -1,35 +1,112 @@
+import io
 import os
+import time
 import requests
 import logging
+from collections import deque
+from contextlib import closing, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Iterator, Optional, Tuple, Union
 
-from .._exceptions import UploadFileError
+from ._retry import RetryPolicy, RETRYABLE_STATUS_CODES
+from ._throttled_reader import ThrottledReader
+from .._constants import DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_UPLOAD_READ_TIMEOUT_S, HTTP_METHOD_PUT, \
+    RETRY_AFTER_HEADER, RANGE_HEADER, GOOG_HASH_HEADER
+from .._deadline import Timeout, apply_current_deadline, get_current_deadline
+from .._exceptions import UploadFileError, UploadIntegrityError, DeadlineExceededError
+from .._upload_scheduler import UploadScheduler
+from .._adaptive_chunk_sizer import AdaptiveChunkSizer
+from .._aimd_concurrency_limiter import AimdConcurrencyLimiter
+from .._upload_checksum import UploadChecksum
+from .._hub_file import HubFile
+from .._tar_bundle import TarBundle, open_upload_file, get_upload_file_size
+from .._zip_stream import ZipStream
 
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
 class FileUploadClient:
     CHUNK_SIZE = 10 * 1024 * 1024  # 10MB Default Chunk Size
+    TIMEOUT = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_UPLOAD_READ_TIMEOUT_S)  # Default (connect, read) timeout
+    RETRY_POLICY = RetryPolicy()  # Default retry policy of upload requests
+    # Default retry policy of resumable upload chunks, including the statuses Google Storage documents as transient
+    CHUNK_RETRY_POLICY = RetryPolicy(max_attempts=5, retry_status_codes=RETRYABLE_STATUS_CODES | {408, 500})
+    STREAM_BLOCK_SIZE = 1024 * 1024  # Size of the blocks read from disk while streaming a request body
+    READ_AHEAD_CHUNKS = 2  # Chunks of a large file read from disk while the current one is being sent
 
     """
     A file upload client supporting small files and resumable uploads (chunked uploads).
     """
 
     @staticmethod
-    def upload_small_file(upload_url: str, file_path: str,
-                          content_type: str = "application/zip"):
+    def upload_small_file(upload_url: str, file_path: str, content_type: str = "application/zip",
+                          timeout: Timeout = TIMEOUT, retry_policy: RetryPolicy = RETRY_POLICY,
+                          scheduler: UploadScheduler = None):
         """
         Uploads a small file directly to a signed Google Storage upload URL.
 
+        The body is streamed from the file in small blocks, so memory use does not grow with the file size.
+        A signed URL accepts the file in a single request only, so an upload failing partway through is sent
+        again from the start of the file, as allowed by `retry_policy`.
+
         :param upload_url: Signed upload URL for small files.
         :param file_path: The local path to the file to upload.
         :param content_type: MIME type of the file.
+        :param timeout: The (connect, read) timeout of the upload request, capped by the current deadline.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
         """
         try:
+            file_size = os.path.getsize(file_path)
+            headers = {"Content-Type": content_type, "Content-Length": str(file_size)}
             with open(file_path, "rb") as file:
-                file_data = file.read()
+                def rewind_file():
+                    file.seek(0)
+                    # requests would switch an empty stream to chunked transfer encoding
+                    if not file_size:
+                        return b""
+                    if scheduler is not None and scheduler.max_bandwidth_bps:
+                        return ThrottledReader(file, file_size, scheduler)
+                    return file
+
+                response = FileUploadClient._put_with_retry(upload_url, headers, rewind_file, timeout, retry_policy,
+                                                            f"uploading {file_path}")
+
+            if response.status_code not in [200, 201]:
+                raise UploadFileError(f"Failed to upload file, code:{response.status_code} ,message: {response.text}")
+
+        except requests.exceptions.RequestException as e:
+            raise UploadFileError(f"Failed to upload file: {str(e)}")
+
+    @staticmethod
+    def upload_zip_stream(upload_url: str, zip_stream: ZipStream, timeout: Timeout = TIMEOUT,
+                          retry_policy: RetryPolicy = RETRY_POLICY, scheduler: UploadScheduler = None):
+        """
+        Uploads a zip archive to a signed Google Storage upload URL while the archive is being built.
+
+        The size of the archive is not known until it is complete, so it is sent with chunked transfer encoding.
+        A signed URL accepts the file in a single request only, so an upload failing partway through builds and sends
+        the archive again from the start, as allowed by `retry_policy`.
+
+        :param upload_url: Signed upload URL for small files.
+        :param zip_stream: The zip archive to build and upload.
+        :param timeout: The (connect, read) timeout of the upload request, capped by the current deadline.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param scheduler: The upload scheduler whose bandwidth cap applies (optional).
+        """
+        def throttle(blocks):
+            for block in blocks:
+                scheduler.throttle(len(block))
+                yield block
 
-            headers = {"Content-Type": content_type}
-            response = requests.put(upload_url, headers=headers, data=file_data)
+        def build_archive():
+            if scheduler is not None and scheduler.max_bandwidth_bps:
+                return throttle(iter(zip_stream))
+            return iter(zip_stream)
 
+        try:
+            response = FileUploadClient._put_with_retry(upload_url, {"Content-Type": "application/zip"},
+                                                        build_archive, timeout, retry_policy,
+                                                        f"uploading {zip_stream}")
             if response.status_code not in [200, 201]:
                 raise UploadFileError(f"Failed to upload file, code:{response.status_code} ,message: {response.text}")
 
@@ -37,63 +114,257 @@ class FileUploadClient:
             raise UploadFileError(f"Failed to upload file: {str(e)}")
 
     @staticmethod
-    def upload_large_file(upload_url: str, file_path: str, chunk_size: int = CHUNK_SIZE):
+    def upload_large_file(upload_url: str, file_path: Union[str, TarBundle, HubFile], chunk_size: int = CHUNK_SIZE,
+                          timeout: Timeout = TIMEOUT,
+                          read_ahead: int = READ_AHEAD_CHUNKS, on_chunk_uploaded: Callable[[int], None] = None,
+                          scheduler: UploadScheduler = None, retry_policy: RetryPolicy = CHUNK_RETRY_POLICY,
+                          on_retry: Callable[[], None] = None):
         """
         Performs resumable (chunked) file uploads to a signed Google Storage URL.
 
+        A resumable session accepts chunks in order only, so the chunks are sent one after another over a single
+        keep-alive connection while the next `read_ahead` chunks are read from disk in the background.
+
+        A chunk failing with a connection error or a transient status is sent again with backoff, as allowed by
+        `retry_policy`, counting attempts since the last chunk acknowledged. The storage service may have stored part
+        of a failed chunk, so the upload resumes from the offset it reports.
+
+        The MD5 of the file (and its CRC32C, with the optional `google-crc32c` package) is computed from the chunks
+        acknowledged and compared with the hashes reported by the storage service once the upload completes.
+
+        With an adaptive scheduler, `chunk_size` is only the size of the first chunk: later chunks are sized from the
+        measured throughput and round-trip time, and every chunk request waits for a slot of the scheduler's
+        concurrency limiter.
+
         :param upload_url: Signed resumable upload URL.
-        :param file_path: The local path to the file to upload.
+        :param file_path: The local path to the file to upload, a `TarBundle` of files, or a `HubFile` read from
+                          the hub.
         :param chunk_size: Chunk size in bytes (default: 10MB).
+        :param timeout: The (connect, read) timeout of each chunk request, capped by the current deadline.
+        :param read_ahead: The number of chunks read ahead of the one being sent.
+        :param on_chunk_uploaded: Called with the number of bytes confirmed by the storage service after each chunk.
+        :param scheduler: The upload scheduler whose limits apply (optional).
+        :param retry_policy: The policy for retrying failed chunks and status checks.
+        :param on_retry: Called before a failed chunk is sent again.
+        :raises UploadIntegrityError: If the stored object does not match the file. The session is complete, so the
+                                      file must be uploaded again with a new one.
+        :raises UploadFileError: If the upload fails.
         """
         try:
-            file_size = os.path.getsize(file_path)
+            file_size = get_upload_file_size(file_path)
             logger.info(f"File {file_path} size: {file_size} bytes")
+            chunk_sizer = AdaptiveChunkSizer(chunk_size) if scheduler is not None and scheduler.adaptive else None
+            limiter = scheduler.concurrency_limiter if scheduler is not None else None
+            checksum = UploadChecksum()
+            deadline = get_current_deadline()
 
-            start_byte = 0
-            uploaded_range = FileUploadClient._check_file_status(upload_url, file_size)
-            if uploaded_range:
-                start_byte = int(uploaded_range.split("-")[1]) + 1
-                logger.info(f"Resuming uploading {file_path} from {start_byte} bytes")
+            with requests.Session() as session, \
+                    scheduler.chunked_upload() if scheduler is not None else nullcontext():
+                checked_at = time.monotonic()
+                start_byte, response = FileUploadClient._check_file_status(upload_url, file_size, timeout, session,
+                                                                           retry_policy)
+                if chunk_sizer is not None:
+                    chunk_sizer.record_rtt(time.monotonic() - checked_at)
+                if start_byte and response is None:
+                    logger.info(f"Resuming uploading {file_path} from {start_byte} bytes")
 
-            with open(file_path, "rb") as file:
-                while start_byte < file_size:
-                    # Calculate end byte and adjust chunk to not exceed file size
-                    end_byte = min(start_byte + chunk_size - 1, file_size - 1)
-
-                    # Seek to the current position in the file and read the chunk
-                    file.seek(start_byte)
-                    chunk_data = file.read(chunk_size)
-
-                    # Set the Content-Range and headers
-                    content_range = f"bytes {start_byte}-{end_byte}/{file_size}"
-                    headers = {
-                        "Content-Length": str(len(chunk_data)),
-                        "Content-Range": content_range
-                    }
-
-                    # Upload the chunk
-                    resp = requests.put(upload_url, headers=headers, data=chunk_data)
-                    # Ensure upload is successful for this chunk
-                    if resp.status_code not in (200, 201, 308):
-                        raise UploadFileError(
-                            f"Failed to upload file {file_path}, code:{resp.status_code} ,message: {resp.text}")
-
-                    start_byte = end_byte + 1
-                    percentage = (start_byte / file_size) * 100
-                    logger.info(f"File {file_path} uploaded {end_byte + 1:,}/{file_size:,} bytes ({percentage:.2f}%)")
+                attempt = 1
+                # The final response, once the storage service has the whole file
+                while response is None:
+                    if start_byte >= file_size:
+                        raise UploadFileError("The storage service received the whole file but did not complete "
+                                              "the upload")
+                    checksum.update_from_file(file_path, start_byte)
+                    with open_upload_file(file_path) as file, \
+                            closing(FileUploadClient._read_chunks(
+                                file, start_byte, file_size,
+                                FileUploadClient._chunk_size_getter(chunk_size, chunk_sizer, read_ahead, scheduler),
+                                read_ahead, scheduler)) as chunks:
+                        for chunk_start, chunk_data in chunks:
+                            end_byte = chunk_start + len(chunk_data) - 1
+
+                            # Set the Content-Range and headers
+                            content_range = f"bytes {chunk_start}-{end_byte}/{file_size}"
+                            headers = {
+                                "Content-Length": str(len(chunk_data)),
+                                "Content-Range": content_range
+                            }
+
+                            # Upload the chunk
+                            body = chunk_data
+                            if scheduler is not None and scheduler.max_bandwidth_bps:
+                                body = ThrottledReader(io.BytesIO(chunk_data), len(chunk_data), scheduler)
+                            resp, error = None, None
+                            with limiter.slot() if limiter is not None else nullcontext():
+                                sent_at = time.monotonic()
+                                try:
+                                    resp = session.put(upload_url, headers=headers, data=body,
+                                                       timeout=apply_current_deadline(timeout,
+                                                                                      f"uploading {file_path}"))
+                                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                                    error = repr(e)
+                                elapsed = time.monotonic() - sent_at
+                                if limiter is not None:
+                                    FileUploadClient._record_chunk_outcome(
+                                        limiter, resp.status_code if resp is not None else None, len(chunk_data),
+                                        elapsed, end_byte + 1 == file_size)
+
+                            if resp is not None and resp.status_code in (200, 201):
+                                response, start_byte = resp, file_size
+                            elif resp is not None and resp.status_code == 308:
+                                start_byte = FileUploadClient._parse_range(resp.headers.get(RANGE_HEADER))
+                                if start_byte <= chunk_start:
+                                    error = f"no progress acknowledged for bytes {chunk_start}-{end_byte}"
+                            elif resp is not None and resp.status_code not in retry_policy.retry_status_codes:
+                                raise UploadFileError(f"Failed to upload file {file_path}, code:{resp.status_code} "
+                                                      f",message: {resp.text}")
+                            else:
+                                error = error or f"status {resp.status_code}"
 
+                            if error is not None:
+                                if not retry_policy.can_retry(HTTP_METHOD_PUT, attempt):
+                                    raise UploadFileError(f"Failed to upload file {file_path} after {attempt} "
+                                                          f"attempts: {error}")
+                                delay = retry_policy.get_delay(
+                                    attempt, resp.headers.get(RETRY_AFTER_HEADER) if resp is not None else None)
+                                logger.warning(f"Uploading bytes {chunk_start:,}-{end_byte:,} of {file_path} failed "
+                                               f"with {error}, retrying in {delay:.2f}s "
+                                               f"(attempt {attempt}/{retry_policy.max_attempts})")
+                                if resp is not None:
+                                    resp.close()
+                                if chunk_sizer is not None:
+                                    chunk_sizer.record_failure()
+                                if on_retry is not None:
+                                    on_retry()
+                                if deadline is not None:
+                                    delay = min(delay, deadline.remaining())
+                                time.sleep(delay)
+                                attempt += 1
+                                # The chunk may have been stored in full, in part or not at all
+                                start_byte, response = FileUploadClient._check_file_status(
+                                    upload_url, file_size, timeout, session, retry_policy)
+                                break
+
+                            attempt = 1
+                            if checksum.offset == chunk_start:
+                                checksum.update(memoryview(chunk_data)[:start_byte - chunk_start])
+                            if chunk_sizer is not None and end_byte + 1 < file_size:
+                                chunk_sizer.record_chunk(len(chunk_data), elapsed)
+                            if on_chunk_uploaded is not None:
+                                on_chunk_uploaded(start_byte)
+                            percentage = (start_byte / file_size) * 100
+                            logger.debug(
+                                f"File {file_path} uploaded {start_byte:,}/{file_size:,} bytes ({percentage:.2f}%)")
+                            if start_byte != end_byte + 1:
+                                # Only part of the chunk was stored, read again from where the service stopped
+                                break
+
+                FileUploadClient._verify_upload(file_path, file_size, checksum, response)
                 logger.info(f"File {file_path} uploaded successfully.")
+        except (DeadlineExceededError, UploadIntegrityError):
+            raise
         except Exception as e:
             raise UploadFileError(f"Failed to upload file {file_path}, got error: {str(e)}")
 
     @staticmethod
-    def _check_file_status(upload_url: str, file_size: int) -> str:
+    def _read_chunks(file, start_byte: int, file_size: int, next_chunk_size: Callable[[], int], read_ahead: int,
+                     scheduler: UploadScheduler = None) -> Iterator[Tuple[int, bytes]]:
+        """
+        Read a file chunk by chunk, keeping up to `read_ahead` further chunks being read by a background thread.
+
+        With a scheduler, every chunk is counted against its buffer budget from the moment it is read until the
+        caller asks for the next one, so read-ahead waits while the budget is used up. Close the iterator when done.
+
+        :param file: The file opened in binary mode.
+        :param start_byte: The position of the first chunk.
+        :param file_size: The size of the file.
+        :param next_chunk_size: Returns the size of the next chunk to read, in bytes.
+        :param read_ahead: The number of chunks read ahead of the one returned.
+        :param scheduler: The upload scheduler whose buffer budget applies (optional).
+        :return: An iterator of (offset, chunk data) pairs.
+        """
+        def read_chunk(offset, length):
+            reserved = scheduler.acquire_buffer(length) if scheduler is not None else 0
+            try:
+                # A single reader thread, so seeking does not race
+                file.seek(offset)
+                chunk_data = file.read(length)
+                if not chunk_data:
+                    raise UploadFileError(f"File {file.name} was truncated during upload")
+                return chunk_data, reserved
+            except BaseException:
+                if reserved:
+                    scheduler.release_buffer(reserved)
+                raise
+
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = deque()
+            next_offset = start_byte
+            reserved = 0
+            try:
+                while pending or next_offset < file_size:
+                    while next_offset < file_size and len(pending) <= read_ahead:
+                        length = min(next_chunk_size(), file_size - next_offset)
+                        pending.append((next_offset, reader.submit(read_chunk, next_offset, length)))
+                        next_offset += length
+                    offset, chunk_future = pending.popleft()
+                    chunk_data, reserved = chunk_future.result()
+                    yield offset, chunk_data
+                    if reserved:
+                        scheduler.release_buffer(reserved)
+                    reserved = 0
+            finally:
+                if reserved:
+                    scheduler.release_buffer(reserved)
+                # Return the budget held by chunks read ahead but never sent
+                for _, chunk_future in pending:
+                    if not chunk_future.cancel() and chunk_future.exception() is None:
+                        _, reserved = chunk_future.result()
+                        if reserved:
+                            scheduler.release_buffer(reserved)
+
+    @staticmethod
+    def _chunk_size_getter(chunk_size: int, chunk_sizer: AdaptiveChunkSizer, read_ahead: int,
+                           scheduler: UploadScheduler) -> Callable[[], int]:
+        """
+        Get a function returning the size of the next chunk to read: the fixed `chunk_size`, or the size picked by
+        the adaptive chunk sizer within the scheduler's chunk size limit.
+        """
+        if chunk_sizer is None:
+            return lambda: chunk_size
+        return lambda: min(chunk_sizer.chunk_size, scheduler.chunk_size_limit(read_ahead))
+
+    @staticmethod
+    def _record_chunk_outcome(limiter: AimdConcurrencyLimiter, status_code: Optional[int], nbytes: int,
+                              elapsed_s: float, last_chunk: bool) -> None:
+        """
+        Report a chunk response to the concurrency limiter. Connection errors, throttling and server errors count as
+        congestion. The last chunk of a file is usually short, so its timing says little and is not recorded.
+
+        :param limiter: The concurrency limiter whose slot was held while sending the chunk.
+        :param status_code: The status code of the response, or None if the request failed.
+        :param nbytes: The size of the chunk.
+        :param elapsed_s: The time from sending the chunk to receiving the response, in seconds.
+        :param last_chunk: Whether the chunk ends the file.
+        """
+        if status_code is None or status_code == 429 or status_code >= 500:
+            limiter.record_failure()
+        elif status_code in (200, 201, 308) and not last_chunk:
+            limiter.record_success(nbytes, elapsed_s)
+
+    @staticmethod
+    def _check_file_status(upload_url: str, file_size: int, timeout: Timeout = TIMEOUT,
+                           session: requests.Session = None,
+                           retry_policy: RetryPolicy = CHUNK_RETRY_POLICY) -> Tuple[int, Optional[requests.Response]]:
         """
-        Check the status of a resumable upload.
+        Check the status of a resumable upload, retrying transient failures.
 
         :param upload_url: The resumable upload URL.
         :param file_size: Total file size in bytes.
-        :return: The status of the upload (e.g., 'bytes=0-10485759') or None if no partial upload.
+        :param timeout: The (connect, read) timeout of the status request, capped by the current deadline.
+        :param session: The session to send the request with (optional).
+        :param retry_policy: The policy for retrying failed status checks.
+        :return: The number of bytes stored by the service, and the final response if the upload is complete.
         """
         headers = {
             "Content-Length": "0",  # No payload for status check
@@ -101,18 +372,96 @@ class FileUploadClient:
         }
 
         try:
-            resp = requests.put(upload_url, headers=headers)
+            resp = FileUploadClient._put_with_retry(upload_url, headers, lambda: None, timeout, retry_policy,
+                                                    "checking upload status", session)
 
             # If upload is incomplete (HTTP 308: Resume Incomplete), retrieve the "Range" header
             if resp.status_code == 308:
-                range_header = resp.headers.get("Range")
+                range_header = resp.headers.get(RANGE_HEADER)
                 if range_header:
                     logger.info(f"Server reports partial upload range: {range_header}")
-                return range_header
+                return FileUploadClient._parse_range(range_header), None
 
             if resp.status_code in (200, 201):
-                return None
+                return file_size, resp
 
             resp.raise_for_status()
+            raise UploadFileError(f"Unexpected upload status: {resp.status_code}")
         except requests.RequestException as e:
             raise UploadFileError(f"Failed to check file status: {str(e)}") from e
+
+    @staticmethod
+    def _parse_range(range_header: Optional[str]) -> int:
+        """
+        Get the number of bytes stored by the service from the `Range` header of a 308 response.
+
+        :param range_header: The header value (e.g., 'bytes=0-10485759'), or None if nothing is stored.
+        :return: The number of bytes stored.
+        """
+        return int(range_header.split("-")[1]) + 1 if range_header else 0
+
+    @staticmethod
+    def _verify_upload(file_path: Union[str, TarBundle, HubFile], file_size: int, checksum: UploadChecksum,
+                       response) -> None:
+        """
+        Compare the hashes of a file with those the storage service reports for the object stored from it.
+
+        :param file_path: The path of the uploaded file, or the uploaded bundle or hub file.
+        :param file_size: The size of the file.
+        :param checksum: The hashes of the bytes acknowledged by the service; the rest of the file is hashed here.
+        :param response: The final response of the upload.
+        :raises UploadIntegrityError: If the hashes do not match.
+        """
+        checksum.update_from_file(file_path, file_size)
+        goog_hash = response.headers.get(GOOG_HASH_HEADER)
+        verified = checksum.verify(goog_hash)
+        if verified is False:
+            raise UploadIntegrityError(f"File {file_path} was stored corrupted: the storage service reports "
+                                       f"{goog_hash}, the file has {checksum.digests()}")
+        if verified is None:
+            logger.warning(f"The storage service reported no hash for {file_path}, its content was not verified")
+
+    @staticmethod
+    def _put_with_retry(upload_url: str, headers: dict, get_body: Callable[[], Any], timeout: Timeout,
+                        retry_policy: RetryPolicy, description: str,
+                        session: requests.Session = None) -> requests.Response:
+        """
+        Send a PUT request, retrying connection errors and transient statuses according to the retry policy.
+        Every attempt is capped by the current deadline, if any.
+
+        :param upload_url: The upload URL.
+        :param headers: The request headers.
+        :param get_body: Returns the request body for each attempt, e.g. a file rewound to where the body starts.
+        :param timeout: The (connect, read) timeout of each attempt.
+        :param retry_policy: The policy for retrying failed attempts.
+        :param description: A description of the upload, used in log and error messages.
+        :param session: The session to send the request with (optional).
+        :return: The last response received.
+        :raises requests.exceptions.RequestException: If the last attempt could not be sent.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
+        """
+        deadline = get_current_deadline()
+        attempt = 1
+        while True:
+            try:
+                response = (session or requests).put(upload_url, headers=headers, data=get_body(),
+                                                     timeout=apply_current_deadline(timeout, description))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retry_policy.can_retry(HTTP_METHOD_PUT, attempt):
+                    raise
+                delay = retry_policy.get_delay(attempt)
+                logger.warning(f"{description} failed with {e!r}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{retry_policy.max_attempts})")
+            else:
+                if not retry_policy.should_retry_status(HTTP_METHOD_PUT, response.status_code, attempt):
+                    return response
+                delay = retry_policy.get_delay(attempt, response.headers.get(RETRY_AFTER_HEADER))
+                if deadline is not None and delay >= deadline.remaining():
+                    return response
+                logger.warning(f"{description} returned {response.status_code}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{retry_policy.max_attempts})")
+                response.close()
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+            time.sleep(delay)
+            attempt += 1
@@ -1,6 +1,10 @@
+import time
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from ._retry import RetryPolicy
+from .._deadline import Timeout, get_current_deadline
 from .._exceptions import APIError
 from .._exceptions import UnauthorizedError
 from .._constants import *
@@ -8,18 +12,42 @@ from .._constants import *
 logger = logging.getLogger(__name__)
 
 
+def create_session(pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                   pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a `requests.Session` with a keep-alive connection pool.
+
+    :param pool_connections: The number of per-host connection pools to cache.
+    :param pool_maxsize: The maximum number of connections kept alive per host.
+    :return: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class HTTPClient:
     """
     A simple HTTP API client for interacting with REST APIs.
     """
 
-    def __init__(self, base_url):
+    def __init__(self, base_url, session: requests.Session = None, retry_policy: RetryPolicy = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S)):
         """
         Initialize the HTTP client.
 
         :param base_url: The base URL of the REST API (e.g., https://api.example.com)
+        :param session: The pooled session used to send requests (optional). Clients talking to the
+                        same host should share one session so they reuse its keep-alive connections.
+        :param retry_policy: The policy for retrying transient failures (optional, defaults to `RetryPolicy()`).
+        :param timeout: The default timeout of every request, in seconds or as a (connect, read) tuple.
         """
         self.base_url = base_url.rstrip('/')
+        self.session = session if session is not None else create_session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
 
     def _prepare_url(self, endpoint):
         """
@@ -30,7 +58,7 @@ class HTTPClient:
         """
         return f"{self.base_url}{endpoint}"
 
-    def _send_request(self, method, endpoint, custom_headers=None, data=None, params=None):
+    def _send_request(self, method, endpoint, custom_headers=None, data=None, params=None, timeout=None):
         """
         Internal method for sending HTTP requests.
 
@@ -39,8 +67,10 @@ class HTTPClient:
         :param custom_headers: The request headers (optional).
         :param data: The request payload for POST/PUT/PATCH requests (optional).
         :param params: The query parameters for GET/DELETE requests (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         :raises APIError: If the request fails or the response is invalid.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
         """
         url = self._prepare_url(endpoint)
         headers = {
@@ -52,9 +82,9 @@ class HTTPClient:
         if custom_headers:
             headers.update(custom_headers)
 
-        response = None
+        response = self._request_with_retry(method, url, timeout if timeout is not None else self.timeout,
+                                            params=params, json=data, headers=headers)
         try:
-            response = requests.request(method, url, params=params, json=data, headers=headers)
             logger.debug(response.text)
             if response.status_code == 401:
                 raise UnauthorizedError(f"Unauthorized Error : {response.status_code} - Access token expired or invalid.")
@@ -80,59 +110,110 @@ class HTTPClient:
         else:
             raise APIError(f"Unsupported content type: {response.status_code} - {response.headers.get(CONTENT_TYPE_HEADER)}")
 
-    def post(self, endpoint, custom_headers=None, data=None):
+    def _request_with_retry(self, method, url, timeout, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying connection errors and transient statuses according to the retry policy.
+        Every attempt is capped by the current deadline, if any.
+
+        :param method: The HTTP method.
+        :param url: The full request URL.
+        :param timeout: The timeout of each attempt.
+        :param kwargs: Extra arguments passed to `requests.Session.request`.
+        :return: The last response received.
+        :raises APIError: If the request could not be sent.
+        :raises DeadlineExceededError: If the current deadline expires before a response is received.
+        """
+        deadline = get_current_deadline()
+        attempt = 1
+        while True:
+            if deadline is not None:
+                deadline.check(f"{method} {url}")
+            try:
+                response = self.session.request(method, url, timeout=deadline.cap(timeout) if deadline else timeout,
+                                                **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise APIError(f"HTTP Request failed: 0 - {str(e)}")
+                delay = self.retry_policy.get_delay(attempt)
+                logger.warning(f"{method} {url} failed with {e}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{self.retry_policy.max_attempts})")
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"HTTP Request failed: 0 - {str(e)}")
+            else:
+                if not self.retry_policy.should_retry_status(method, response.status_code, attempt):
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.headers.get(RETRY_AFTER_HEADER))
+                if deadline is not None and delay >= deadline.remaining():
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{self.retry_policy.max_attempts})")
+                response.close()
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+            time.sleep(delay)
+            attempt += 1
+
+    def post(self, endpoint, custom_headers=None, data=None, timeout=None):
         """
         Send a POST request to the given API endpoint.
 
         :param endpoint: The API endpoint.
         :param custom_headers: The request headers (optional).
         :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         """
-        return self._send_request(method=HTTP_METHOD_POST, endpoint=endpoint, custom_headers=custom_headers, data=data)
+        return self._send_request(method=HTTP_METHOD_POST, endpoint=endpoint, custom_headers=custom_headers, data=data,
+                                  timeout=timeout)
 
-    def get(self, endpoint, custom_headers=None, params=None):
+    def get(self, endpoint, custom_headers=None, params=None, timeout=None):
         """
         Send a GET request to the given API endpoint.
 
         :param endpoint: The API endpoint.
         :param custom_headers: The request headers (optional).
         :param params: Query parameters as a dictionary (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         """
         return self._send_request(method=HTTP_METHOD_GET, endpoint=endpoint, custom_headers=custom_headers,
-                                  params=params)
+                                  params=params, timeout=timeout)
 
-    def put(self, endpoint, custom_headers=None, data=None):
+    def put(self, endpoint, custom_headers=None, data=None, timeout=None):
         """
         Send a PUT request to the given API endpoint.
 
         :param endpoint: The API endpoint.
         :param custom_headers: The request headers (optional).
         :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         """
-        return self._send_request(method=HTTP_METHOD_PUT, endpoint=endpoint, custom_headers=custom_headers, data=data)
+        return self._send_request(method=HTTP_METHOD_PUT, endpoint=endpoint, custom_headers=custom_headers, data=data,
+                                  timeout=timeout)
 
-    def patch(self, endpoint, custom_headers=None, data=None):
+    def patch(self, endpoint, custom_headers=None, data=None, timeout=None):
         """
         Send a PATCH request to the given API endpoint.
 
         :param endpoint: The API endpoint.
         :param custom_headers: The request headers (optional).
         :param data: The request payload as a dictionary.
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         """
-        return self._send_request(method=HTTP_METHOD_PATCH, endpoint=endpoint, custom_headers=custom_headers, data=data)
+        return self._send_request(method=HTTP_METHOD_PATCH, endpoint=endpoint, custom_headers=custom_headers, data=data,
+                                  timeout=timeout)
 
-    def delete(self, endpoint, custom_headers=None, params=None):
+    def delete(self, endpoint, custom_headers=None, params=None, timeout=None):
         """
         Send a DELETE request to the given API endpoint.
 
         :param endpoint: The API endpoint.
         :param custom_headers: The request headers (optional).
         :param params: Query parameters as a dictionary (optional).
+        :param timeout: The timeout of this request, overriding the client default (optional).
         :return: The JSON response parsed as a Python dictionary.
         """
         return self._send_request(method=HTTP_METHOD_DELETE, endpoint=endpoint, custom_headers=custom_headers,
-                                  params=params)
+                                  params=params, timeout=timeout)
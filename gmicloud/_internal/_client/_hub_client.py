@@ -0,0 +1,113 @@
+import os
+import fnmatch
+import logging
+from typing import List, Optional
+from urllib.parse import quote
+
+import requests
+
+from ._http_client import HTTPClient
+from ._retry import RetryPolicy
+from .._constants import *
+from .._deadline import Timeout
+from .._exceptions import APIError, UploadFileError
+from .._hub_file import HubFile
+
+logger = logging.getLogger(__name__)
+
+
+class HubClient:
+    """
+    Client for reading model repositories from the Hugging Face Hub, or from any server implementing its API.
+    """
+
+    def __init__(self, endpoint: Optional[str] = None, token: Optional[str] = None,
+                 session: requests.Session = None, retry_policy: RetryPolicy = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S)):
+        """
+        Initialize the hub client.
+
+        :param endpoint: The URL of the hub, defaults to the `HF_ENDPOINT` environment variable or the Hugging Face Hub.
+        :param token: The access token for private and gated repositories, defaults to the `HF_TOKEN` environment
+                      variable.
+        :param session: The pooled session used to send requests (optional).
+        :param retry_policy: The policy for retrying transient failures (optional, defaults to `RetryPolicy()`).
+        :param timeout: The timeout of every request, in seconds or as a (connect, read) tuple.
+        """
+        self.endpoint = (endpoint or os.environ.get("HF_ENDPOINT") or DEFAULT_HUB_ENDPOINT).rstrip("/")
+        self.token = token if token is not None else os.environ.get("HF_TOKEN")
+        self.client = HTTPClient(self.endpoint, session, retry_policy, timeout)
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.client.retry_policy
+
+    def get_repo_files(self, repo_id: str, revision: str = "main", allow_patterns: Optional[List[str]] = None,
+                       ignore_patterns: Optional[List[str]] = None) -> Optional[List[HubFile]]:
+        """
+        List the files of a model repository at a revision. Files holding the same blob share one download.
+
+        :param repo_id: The ID of the repository, e.g. `deepseek-ai/DeepSeek-R1-Distill-Qwen-1.5B`.
+        :param revision: The branch, tag or commit to read.
+        :param allow_patterns: Only files whose path matches one of these glob patterns are listed (optional).
+        :param ignore_patterns: Files whose path matches one of these glob patterns are not listed (optional).
+        :return: The files, pinned to the commit the revision resolved to, or None if an error occurs.
+        """
+        try:
+            response = self.client.get(f"/api/models/{repo_id}/revision/{quote(revision, safe='')}",
+                                       self._get_headers(), {"blobs": "true"})
+            commit = response.get("sha") or revision
+            hub_files = []
+            for sibling in response["siblings"]:
+                path = sibling["rfilename"]
+                if allow_patterns and not any(fnmatch.fnmatch(path, pattern) for pattern in allow_patterns):
+                    continue
+                if ignore_patterns and any(fnmatch.fnmatch(path, pattern) for pattern in ignore_patterns):
+                    continue
+                lfs = sibling.get("lfs") or {}
+                hub_files.append(HubFile(self, repo_id, commit, path, lfs.get("size", sibling.get("size")),
+                                         lfs.get("sha256") or sibling["blobId"]))
+        except (APIError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Failed to list the files of {repo_id} at {revision}: {e}")
+            return None
+
+        HubFile.share_downloads(hub_files)
+        return hub_files
+
+    def get_file_url(self, repo_id: str, revision: str, path: str) -> str:
+        """
+        Get the download URL of a file of a repository.
+
+        :param repo_id: The ID of the repository.
+        :param revision: The commit of the repository.
+        :param path: The path of the file in the repository.
+        :return: The URL.
+        """
+        return f"{self.endpoint}/{repo_id}/resolve/{quote(revision, safe='')}/{quote(path)}"
+
+    def open_file(self, url: str, start: int = 0) -> requests.Response:
+        """
+        Start downloading a file from an offset. The hub redirects files stored with LFS to a CDN, and the token is
+        not sent on redirects to another host.
+
+        :param url: The download URL of the file.
+        :param start: The offset to download from.
+        :return: The streaming response, to be closed after use.
+        :raises UploadFileError: If the request could not be sent or the hub refuses it.
+        """
+        # Ranges apply to the stored bytes, so they must not be compressed on the way
+        headers = {**self._get_headers(), "Accept-Encoding": "identity"}
+        if start:
+            headers[RANGE_HEADER] = f"bytes={start}-"
+        try:
+            response = self.client._request_with_retry(HTTP_METHOD_GET, url, self.client.timeout, headers=headers,
+                                                       stream=True)
+        except APIError as e:
+            raise UploadFileError(f"Failed to download {url} from byte {start:,}: {e}")
+        if response.status_code != (206 if start else 200):
+            response.close()
+            raise UploadFileError(f"Failed to download {url} from byte {start:,}, code:{response.status_code}")
+        return response
+
+    def _get_headers(self) -> dict:
+        return {AUTHORIZATION_HEADER: f"Bearer {self.token}"} if self.token else {}
@@ -1,15 +1,28 @@
-import jwt
+import time
 import logging
+import threading
+import requests
+from concurrent.futures import Future
 from requests.exceptions import RequestException
 
-from ._http_client import HTTPClient
+from ._http_client import HTTPClient, create_session
+from ._retry import RetryPolicy
 from .._config import IAM_SERVICE_BASE_URL
+from .._exceptions import APIError
 from .._models import *
-from .._constants import CLIENT_ID_HEADER, AUTHORIZATION_HEADER
+from .._constants import (
+    CLIENT_ID_HEADER, AUTHORIZATION_HEADER, DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S,
+    DEFAULT_TOKEN_REFRESH_MARGIN_S, TOKEN_RENEWAL_RETRY_INTERVAL_S, DEFAULT_PROFILE_CACHE_TTL_S
+)
+from .._deadline import Timeout
 from ._auth_config import (
     get_user_refresh_token_from_system_config,
     write_user_refresh_token_to_system_config,
-    is_refresh_token_expired
+    clear_user_refresh_token_from_system_config,
+    write_user_profile_to_system_config,
+    get_user_profile_from_system_config,
+    is_refresh_token_expired,
+    get_token_expiry
 )
 logger = logging.getLogger(__name__)
 
@@ -19,13 +32,28 @@ class IAMClient:
     Client for interacting with the IAM Service API.
     """
 
-    def __init__(self, client_id: str, email: str, password: str):
+    def __init__(self, client_id: str, email: str, password: str, session: Optional[requests.Session] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S),
+                 token_refresh_margin_s: Optional[float] = DEFAULT_TOKEN_REFRESH_MARGIN_S,
+                 profile_cache_ttl_s: Optional[float] = DEFAULT_PROFILE_CACHE_TTL_S,
+                 api_key: Optional[str] = None):
         """
         Initialize IAMClient with client credentials and an IAMClient instance.
 
         :param client_id: Client ID for login.
         :param email: Email for login.
         :param password: Password for login.
+        :param session: The pooled session shared by every service client (optional).
+        :param retry_policy: The retry policy shared by every service client (optional).
+        :param timeout: The default request timeout shared by every service client, in seconds or as a
+                        (connect, read) tuple.
+        :param token_refresh_margin_s: Refresh the access token once its remaining lifetime drops below this many
+                                       seconds, instead of waiting for a 401. None disables proactive renewal.
+        :param profile_cache_ttl_s: How long the user and organization IDs are cached in the config file, saving
+                                    the profile request on login. None disables the cache.
+        :param api_key: An organization API key. If given, it is sent on every request instead of a session
+                        token, and login, token refresh and the config file are skipped entirely.
         """
         self._client_id = client_id
         self._email = email
@@ -34,20 +62,41 @@ class IAMClient:
         self._refresh_token = ""
         self._user_id = ""
         self._organization_id = ""
-        self.client = HTTPClient(IAM_SERVICE_BASE_URL)
+        self._api_key = api_key
+        self._session = session if session is not None else create_session()
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._timeout = timeout
+        # Guards `_refresh_future`, the refresh in progress shared by concurrent callers
+        self._refresh_lock = threading.Lock()
+        self._refresh_future = None
+        self._token_refresh_margin_s = token_refresh_margin_s
+        self._profile_cache_ttl_s = profile_cache_ttl_s
+        # Serializes logins triggered by the first API calls of a lazily logged in client
+        self._login_lock = threading.Lock()
+        # The last parsed access token and its expiry, so that the JWT is decoded once per token
+        self._access_token_expiry = ("", None)
+        self._failed_renewal_token = None
+        self._renewal_thread = None
+        self._renewal_stop = threading.Event()
+        self.client = HTTPClient(IAM_SERVICE_BASE_URL, self._session, self._retry_policy, self._timeout)
 
     def login(self) -> bool:
         """
         Logs in a user with the given email and password.
         Returns True if login is successful, otherwise False.
         """
+        # An API key needs no session
+        if self._api_key:
+            return True
         try:
             # Check config refresh token is available and is not expired, if yes ,refresh it
             temp_refresh_token = get_user_refresh_token_from_system_config(self._email)
+            refreshed = False
             if temp_refresh_token and not is_refresh_token_expired(temp_refresh_token):
                 self._refresh_token = temp_refresh_token
-                self.refresh_token()
-            else:
+                refreshed = self.refresh_token()
+            # Fall back to a password login if the stored refresh token was rejected
+            if not refreshed:
                 custom_headers = {CLIENT_ID_HEADER: self._client_id}
                 req = AuthTokenRequest(email=self._email, password=self._password)
                 auth_tokens_result = self.client.post("/me/auth-tokens", custom_headers, req.model_dump())
@@ -88,6 +137,13 @@ class IAMClient:
                 write_user_refresh_token_to_system_config(self._email,self._refresh_token)
             self._user_id = self.parse_user_id()
 
+            # Reuse the organization ID cached by a previous login of the same user
+            cached_profile = get_user_profile_from_system_config(self._email) \
+                if self._profile_cache_ttl_s is not None else None
+            if cached_profile and cached_profile["user_id"] == self._user_id:
+                self._organization_id = cached_profile["organization_id"]
+                return True
+
             # Fetch profile to get organization ID
             profile_result = self.client.get("/me/profile", self.get_custom_headers())
             if not profile_result:
@@ -96,23 +152,175 @@ class IAMClient:
 
             profile_resp = ProfileResponse.model_validate(profile_result)
             self._organization_id = profile_resp.organization.id
+            if self._profile_cache_ttl_s is not None:
+                write_user_profile_to_system_config(self._email, self._user_id, self._organization_id,
+                                                    self._profile_cache_ttl_s)
 
             return True
         except (RequestException, ValueError, KeyError) as e:
             logger.error(f"Login failed due to exception: {e}")
             return False
 
-    def refresh_token(self) -> bool:
+    def ensure_logged_in(self) -> bool:
+        """
+        Logs in on first use when the client was created without logging in. Concurrent callers share one login.
+
+        :return: True if a session is available, otherwise False.
+        """
+        if self._api_key or self._access_token:
+            return True
+        with self._login_lock:
+            if self._access_token:
+                return True
+            return self.login()
+
+    def ensure_profile(self) -> bool:
+        """
+        Makes sure the user and organization IDs are known, logging in first if needed. An API key skips the login,
+        so its IDs are fetched from the profile once, on first use.
+
+        :return: True if the IDs are known, otherwise False.
+        """
+        if not self.ensure_logged_in():
+            return False
+        # A login resolves the IDs
+        if not self._api_key:
+            return True
+        if not self._organization_id:
+            with self._login_lock:
+                if not self._organization_id:
+                    try:
+                        profile_result = self.client.get("/me/profile", self.get_custom_headers())
+                        if profile_result:
+                            profile_resp = ProfileResponse.model_validate(profile_result)
+                            self._user_id = profile_resp.user.id
+                            self._organization_id = profile_resp.organization.id
+                    except (RequestException, APIError, ValueError) as e:
+                        logger.error(f"Failed to fetch the profile of the API key: {e}")
+        return bool(self._user_id and self._organization_id)
+
+    def refresh_token(self, stale_access_token: Optional[str] = None) -> bool:
         """
         Refreshes the access token. Returns True on success, False otherwise.
+
+        Refreshing is single-flight: while a refresh is in progress, concurrent callers wait for it and share its
+        result instead of rotating the refresh token again.
+
+        :param stale_access_token: The access token the caller found expired. If it has already been replaced,
+                                   the new token is reused and no refresh is sent.
+        """
+        # An API key cannot be refreshed; a 401 means it is invalid or revoked
+        if self._api_key:
+            return False
+        with self._refresh_lock:
+            if stale_access_token is not None and stale_access_token != self._access_token:
+                return True
+            future = self._refresh_future
+            is_leader = future is None
+            if is_leader:
+                future = self._refresh_future = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = self._send_refresh_token()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_future = None
+
+    def renew_token_if_expiring(self) -> str:
+        """
+        Refreshes the access token ahead of time once its remaining lifetime drops below the refresh margin.
+
+        :return: The access token to send the next request with.
+        """
+        if self._api_key:
+            return self._api_key
+        access_token = self._access_token
+        if self._token_refresh_margin_s is None or not self._refresh_token:
+            return access_token
+        expiry = self.get_access_token_expiry()
+        if expiry is None or expiry - time.time() > self._token_refresh_margin_s:
+            return access_token
+        # Do not retry a failed renewal on every request; the 401 path takes over from here
+        if access_token == self._failed_renewal_token:
+            return access_token
+        if not self.refresh_token(access_token):
+            self._failed_renewal_token = access_token
+        return self._access_token
+
+    def start_token_renewal(self) -> None:
+        """
+        Starts a daemon thread that refreshes the access token shortly before it expires, so that requests never
+        wait for a refresh.
+        """
+        if self._api_key:
+            return
+        if self._renewal_thread is not None and self._renewal_thread.is_alive():
+            return
+        self._renewal_stop.clear()
+        self._renewal_thread = threading.Thread(target=self._renew_token_periodically,
+                                                name="gmicloud-token-renewal", daemon=True)
+        self._renewal_thread.start()
+
+    def stop_token_renewal(self) -> None:
+        """
+        Stops the background token renewal thread, if running.
+        """
+        self._renewal_stop.set()
+        if self._renewal_thread is not None:
+            self._renewal_thread.join()
+            self._renewal_thread = None
+
+    def _renew_token_periodically(self) -> None:
+        """
+        Body of the renewal thread: sleeps until the refresh margin is reached, then refreshes the token.
+        """
+        margin_s = self._token_refresh_margin_s if self._token_refresh_margin_s is not None \
+            else DEFAULT_TOKEN_REFRESH_MARGIN_S
+        while True:
+            access_token = self._access_token
+            expiry = self.get_access_token_expiry()
+            if expiry is None:
+                wait_s = TOKEN_RENEWAL_RETRY_INTERVAL_S
+            else:
+                lifetime_s = expiry - time.time()
+                # Tokens living shorter than the margin are renewed at half their lifetime instead of back to back
+                wait_s = max(0.0, lifetime_s - margin_s, lifetime_s / 2)
+            if self._renewal_stop.wait(wait_s):
+                return
+            if expiry is not None and not self.refresh_token(access_token):
+                logger.warning(f"Background token renewal failed, retrying in {TOKEN_RENEWAL_RETRY_INTERVAL_S}s")
+                if self._renewal_stop.wait(TOKEN_RENEWAL_RETRY_INTERVAL_S):
+                    return
+
+    def _send_refresh_token(self, adopt_shared_token: bool = True) -> bool:
+        """
+        Sends the refresh request and stores the rotated tokens. Returns True on success, False otherwise.
+
+        :param adopt_shared_token: Whether to retry once with the refresh token found in the config file if it was
+                                   rotated by another process sharing it.
         """
         try:
             custom_headers = {CLIENT_ID_HEADER: self._client_id}
+            refresh_token = self._refresh_token
             try:
-                result = self.client.patch("/me/sessions", custom_headers, {"refreshToken": self._refresh_token})
+                result = self.client.patch("/me/sessions", custom_headers, {"refreshToken": refresh_token})
             except Exception as err:
+                # Another process sharing the config file may have rotated the refresh token first
+                shared_refresh_token = get_user_refresh_token_from_system_config(self._email)
+                if adopt_shared_token and shared_refresh_token and shared_refresh_token != refresh_token:
+                    logger.info("Refresh token was rotated by another process, retrying with the shared one.")
+                    self._refresh_token = shared_refresh_token
+                    return self._send_refresh_token(adopt_shared_token=False)
                 logger.error(f"{str(err)}, please re-login.")
-                write_user_refresh_token_to_system_config(self._email,"")
+                clear_user_refresh_token_from_system_config(self._email,refresh_token)
                 return False
 
             if not result:
@@ -134,6 +342,9 @@ class IAMClient:
         """
         Creates a new API key for the current user.
         """
+        if not self.ensure_profile():
+            logger.error("Failed to create API key: the organization ID is unknown")
+            return None
         try:
             result = self.client.post(f"/organizations/{self.get_organization_id()}/api-keys",
                                       self.get_custom_headers(), request.model_dump())
@@ -147,6 +358,9 @@ class IAMClient:
         """
         Fetches all API keys for the current user.
         """
+        if not self.ensure_profile():
+            logger.error("Failed to retrieve organization API keys: the organization ID is unknown")
+            return None
         try:
             result = self.client.get(f"/organizations/{self.get_organization_id()}/api-keys",
                                      self.get_custom_headers())
@@ -166,8 +380,20 @@ class IAMClient:
         """
         Parses the current access token and returns the payload as a dictionary.
         """
+        import jwt
         return jwt.decode(self._access_token, options={"verify_signature": False})
 
+    def get_access_token_expiry(self) -> Optional[float]:
+        """
+        Gets the expiry time of the current access token as a UNIX timestamp, or None if it cannot be parsed.
+        """
+        access_token = self._access_token
+        parsed_token, expiry = self._access_token_expiry
+        if access_token != parsed_token:
+            expiry = get_token_expiry(access_token)
+            self._access_token_expiry = (access_token, expiry)
+        return expiry
+
     def get_access_token(self) -> str:
         """
         Gets the current access token.
@@ -198,11 +424,29 @@ class IAMClient:
         """
         return self._organization_id
 
+    def get_session(self) -> requests.Session:
+        """
+        Gets the pooled session shared by the service clients.
+        """
+        return self._session
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+        Gets the retry policy shared by the service clients.
+        """
+        return self._retry_policy
+
+    def get_timeout(self) -> Timeout:
+        """
+        Gets the default request timeout shared by the service clients.
+        """
+        return self._timeout
+
     def get_custom_headers(self) -> dict:
         """
         Gets the custom headers for the IAM client.
         """
         return {
-            AUTHORIZATION_HEADER: f'Bearer {self._access_token}',
+            AUTHORIZATION_HEADER: f'Bearer {self._api_key or self._access_token}',
             CLIENT_ID_HEADER: self._client_id
         }
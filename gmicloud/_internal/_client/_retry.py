@@ -0,0 +1,101 @@
+import time
+import random
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable
+
+from .._constants import HTTP_METHOD_GET, HTTP_METHOD_PUT, HTTP_METHOD_DELETE
+
+# Methods that may be safely re-sent without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({HTTP_METHOD_GET, HTTP_METHOD_PUT, HTTP_METHOD_DELETE, "HEAD", "OPTIONS"})
+# Statuses that signal a transient condition on the server or a load balancer
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient HTTP failures: exponential backoff with full jitter, honoring `Retry-After`.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base_s: float = 0.5,
+                 backoff_max_s: float = 30.0,
+                 jitter: bool = True,
+                 retry_status_codes: Iterable[int] = RETRYABLE_STATUS_CODES,
+                 retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 respect_retry_after: bool = True,
+                 max_retry_after_s: float = 120.0):
+        """
+        Initialize the retry policy.
+
+        :param max_attempts: The total number of attempts per request, including the first one.
+        :param backoff_base_s: The delay before the first retry; it doubles with every further attempt.
+        :param backoff_max_s: The upper bound of the computed backoff delay.
+        :param jitter: Whether to draw the delay uniformly from [0, backoff] to de-synchronize clients.
+        :param retry_status_codes: The HTTP status codes that are retried.
+        :param retry_methods: The HTTP methods that are retried. Defaults to the idempotent methods.
+        :param respect_retry_after: Whether to wait for the duration given by a `Retry-After` header.
+        :param max_retry_after_s: The longest `Retry-After` delay that is honored.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after_s = max_retry_after_s
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Whether another attempt is allowed for the method after `attempt` attempts were made.
+
+        :param method: The HTTP method of the request.
+        :param attempt: The number of attempts made so far (starting at 1).
+        """
+        return attempt < self.max_attempts and method.upper() in self.retry_methods
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """
+        Whether a response with the given status should be retried.
+
+        :param method: The HTTP method of the request.
+        :param status_code: The HTTP status code of the response.
+        :param attempt: The number of attempts made so far (starting at 1).
+        """
+        return status_code in self.retry_status_codes and self.can_retry(method, attempt)
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the delay in seconds before the next attempt.
+
+        :param attempt: The number of attempts made so far (starting at 1).
+        :param retry_after: The value of the `Retry-After` response header (optional).
+        :return: The delay in seconds.
+        """
+        if self.respect_retry_after and retry_after:
+            retry_after_s = self._parse_retry_after(retry_after)
+            if retry_after_s is not None:
+                return min(retry_after_s, self.max_retry_after_s)
+
+        backoff = min(self.backoff_max_s, self.backoff_base_s * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> Optional[float]:
+        """
+        Parse a `Retry-After` header given either in seconds or as an HTTP date.
+
+        :param retry_after: The header value.
+        :return: The delay in seconds, or None if the value cannot be parsed.
+        """
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
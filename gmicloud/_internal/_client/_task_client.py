@@ -22,7 +22,8 @@ class TaskClient:
         """
         Initializes the TaskClient with the given base URL for the task service.
         """
-        self.client = HTTPClient(TASK_SERVICE_BASE_URL)
+        self.client = HTTPClient(TASK_SERVICE_BASE_URL, iam_client.get_session(),
+                                 iam_client.get_retry_policy(), iam_client.get_timeout())
         self.iam_client = iam_client
 
     @handle_refresh_token
@@ -0,0 +1,34 @@
+from .._upload_scheduler import UploadScheduler
+
+
+class ThrottledReader:
+    """
+    A read-only file-like request body that throttles reads to the bandwidth cap of an upload scheduler.
+
+    It reports its length, so `requests` sends it with a Content-Length header rather than chunked encoding.
+    """
+
+    def __init__(self, source, length: int, scheduler: UploadScheduler):
+        """
+        Initialize the reader.
+
+        :param source: A binary file-like object positioned at the start of the body.
+        :param length: The number of bytes of the body.
+        :param scheduler: The upload scheduler whose bandwidth cap applies.
+        """
+        self._source = source
+        self._remaining = length
+        self._length = length
+        self._scheduler = scheduler
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._source.read(size)
+        self._remaining -= len(data)
+        if data:
+            self._scheduler.throttle(len(data))
+        return data
@@ -24,7 +24,8 @@ class VideoClient:
         """
         Initializes the VideoClient with the given base URL for the video service.
         """
-        self.client = HTTPClient(IAM_SERVICE_BASE_URL+ "/ie/requestqueue")
+        self.client = HTTPClient(IAM_SERVICE_BASE_URL+ "/ie/requestqueue", iam_client.get_session(),
+                                 iam_client.get_retry_policy(), iam_client.get_timeout())
         self.iam_client = iam_client
 
 
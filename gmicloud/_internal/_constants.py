@@ -1,8 +1,14 @@
+import os
+
 ACCEPT_HEADER = 'Accept'
 AUTHORIZATION_HEADER = 'Authorization'
 CONTENT_TYPE_HEADER = 'Content-Type'
 CLIENT_ID_HEADER = 'CE-ClientId'
 ACCESS_TOKEN_HEADER = 'CE-AccessToken'
+RETRY_AFTER_HEADER = 'Retry-After'
+RANGE_HEADER = 'Range'
+# Hashes of the stored object, reported by Google Storage as e.g. 'crc32c=n03x6A==,md5=Ojk9c3dhfxgoKVVHYwFbHQ=='
+GOOG_HASH_HEADER = 'x-goog-hash'
 
 HTTP_METHOD_POST = 'POST'
 HTTP_METHOD_GET = 'GET'
@@ -12,3 +18,41 @@ HTTP_METHOD_PUT = 'PUT'
 
 JSON_CONTENT_TYPE = 'application/json'
 TEXT_CONTENT_TYPE = 'text/html'
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+DEFAULT_CONNECT_TIMEOUT_S = 10
+DEFAULT_READ_TIMEOUT_S = 60
+DEFAULT_UPLOAD_READ_TIMEOUT_S = 300
+
+# Matches the default worker count of a ThreadPoolExecutor
+DEFAULT_UPLOAD_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_UPLOAD_BUFFER_BUDGET_BYTES = 256 * 1024 * 1024
+# Longest burst allowed above the upload bandwidth cap
+UPLOAD_BANDWIDTH_BURST_S = 0.1
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+# Every chunk of a resumable upload but the last must be a multiple of 256 KiB
+RESUMABLE_CHUNK_ALIGNMENT = 256 * 1024
+MIN_ADAPTIVE_CHUNK_SIZE = 1024 * 1024
+MAX_ADAPTIVE_CHUNK_SIZE = 128 * 1024 * 1024
+# Uploads of a model file stored corrupted that are sent again with a new session
+MAX_CORRUPTED_UPLOAD_RETRIES = 2
+# Small model files may be uploaded together as one tar archive, listed by a manifest stored as its last member
+SMALL_FILES_BUNDLE_PREFIX = "gmicloud-small-files"
+SMALL_FILES_MANIFEST_NAME = "gmicloud-manifest.json"
+SMALL_FILES_MANIFEST_VERSION = 1
+# Model files can be uploaded straight from a Hugging Face Hub repository, read in blocks as they are sent
+DEFAULT_HUB_ENDPOINT = "https://huggingface.co"
+HUB_DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+# Bytes kept for the uploads of identical files reading one download
+HUB_DOWNLOAD_WINDOW_BYTES = 64 * 1024 * 1024
+# Artifact files are downloaded in parts fetched side by side with range requests, written a block at a time
+GCS_DOWNLOAD_BASE_URL = "https://storage.googleapis.com"
+DEFAULT_DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_PART_SIZE = 64 * 1024 * 1024
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+DEFAULT_TOKEN_REFRESH_MARGIN_S = 60
+TOKEN_RENEWAL_RETRY_INTERVAL_S = 30
+DEFAULT_PROFILE_CACHE_TTL_S = 24 * 3600
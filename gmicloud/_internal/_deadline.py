@@ -0,0 +1,120 @@
+import time
+import contextvars
+from typing import Optional, Tuple, Union
+
+from ._exceptions import DeadlineExceededError
+
+# A timeout as accepted by `requests`: a single number, or a (connect, read) tuple, in seconds
+Timeout = Union[float, Tuple[float, float]]
+
+_current_deadline = contextvars.ContextVar("gmicloud_deadline", default=None)
+# The tokens of the deadlines entered in the current context, innermost last. They are kept per context, not per
+# deadline, so that threads and asyncio tasks can enter the same deadline at the same time.
+_entered_tokens = contextvars.ContextVar("gmicloud_deadline_tokens", default=())
+
+
+class Deadline:
+    """
+    An absolute point in time by which an operation, and every call nested in it, must finish.
+
+    Entering a deadline with `with` makes it the current deadline of the calling context: every HTTP request
+    sent inside the block caps its timeout to the remaining budget and fails fast with `DeadlineExceededError`
+    once it has run out. Nested deadlines never extend an enclosing one.
+    """
+
+    def __init__(self, timeout_s: float, clock=time.monotonic):
+        """
+        Initialize a deadline `timeout_s` seconds from now.
+
+        :param timeout_s: The time budget in seconds.
+        :param clock: A monotonic clock returning seconds, injectable for tests.
+        """
+        self._clock = clock
+        self._expires_at = clock() + timeout_s
+
+    def remaining(self) -> float:
+        """
+        Gets the remaining time budget in seconds, never negative.
+        """
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        """
+        Whether the time budget has run out.
+        """
+        return self.remaining() <= 0
+
+    def check(self, operation: str = "operation") -> None:
+        """
+        Raise if the time budget has run out.
+
+        :param operation: A description of the operation, used in the error message.
+        :raises DeadlineExceededError: If the deadline has expired.
+        """
+        if self.expired():
+            raise DeadlineExceededError(f"Deadline exceeded before {operation} could complete.")
+
+    def cap(self, timeout: Optional[Timeout]) -> Timeout:
+        """
+        Cap a request timeout so that it does not outlive the deadline.
+
+        :param timeout: A timeout in seconds, a (connect, read) tuple, or None for no timeout.
+        :return: The capped timeout, of the same shape as `timeout`.
+        """
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining for t in timeout)
+        return min(timeout, remaining)
+
+    def __enter__(self):
+        current = _current_deadline.get()
+        # An inner deadline can only shorten the budget of the enclosing one
+        effective = current if current is not None and current.remaining() < self.remaining() else self
+        _entered_tokens.set(_entered_tokens.get() + (_current_deadline.set(effective),))
+        return effective
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        tokens = _entered_tokens.get()
+        _entered_tokens.set(tokens[:-1])
+        _current_deadline.reset(tokens[-1])
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """
+    Gets the deadline of the calling context, or None if no deadline is active.
+    """
+    return _current_deadline.get()
+
+
+def earliest_deadline(timeout_s: Optional[float], deadline: Optional[Deadline] = None) -> Deadline:
+    """
+    Combine a helper's own timeout with a caller's deadline and the current one, keeping the earliest.
+
+    :param timeout_s: The helper's own time budget in seconds (optional).
+    :param deadline: A deadline passed down by the caller (optional).
+    :return: The deadline that expires first.
+    """
+    candidates = [d for d in (deadline, get_current_deadline()) if d is not None]
+    if timeout_s is not None:
+        candidates.append(Deadline(timeout_s))
+    if not candidates:
+        raise ValueError("Either timeout_s or a deadline is required.")
+    return min(candidates, key=lambda d: d.remaining())
+
+
+def apply_current_deadline(timeout: Optional[Timeout], operation: str = "operation") -> Optional[Timeout]:
+    """
+    Check the current deadline, if any, and cap a request timeout to its remaining budget.
+
+    :param timeout: The request timeout to cap.
+    :param operation: A description of the operation, used in the error message.
+    :return: The capped timeout, or `timeout` unchanged if no deadline is active.
+    :raises DeadlineExceededError: If the current deadline has expired.
+    """
+    deadline = get_current_deadline()
+    if deadline is None:
+        return timeout
+    deadline.check(operation)
+    return deadline.cap(timeout)
@@ -53,4 +53,13 @@ class RequestStatus(Enum):
 class HostType(Enum):
     DEFAULT = ""
     INTERNAL = "internal"
-    EXTERNAL = "external"
\ No newline at end of file
+    EXTERNAL = "external"
+
+class UploadProgressEvent(str, Enum):
+    STARTED = "started"
+    PROGRESS = "progress"
+    RETRY = "retry"
+    COMPLETED = "completed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    FINISHED = "finished"
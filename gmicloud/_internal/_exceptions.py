@@ -12,6 +12,27 @@ class UploadFileError(Exception):
     pass
 
 
+class UploadIntegrityError(UploadFileError):
+    """
+    Exception for uploads whose stored object does not match the local file.
+    """
+    pass
+
+
+class DownloadFileError(Exception):
+    """
+    Exception for file download errors.
+    """
+    pass
+
+
+class DownloadIntegrityError(DownloadFileError):
+    """
+    Exception for downloads that do not match the stored object.
+    """
+    pass
+
+
 class UnauthorizedError(Exception):
     """
     Exception for unauthorized access errors.
@@ -19,6 +40,20 @@ class UnauthorizedError(Exception):
     pass
 
 
+class DeadlineExceededError(Exception):
+    """
+    Exception for operations that ran out of their time budget.
+    """
+    pass
+
+
+class ArtifactBuildError(Exception):
+    """
+    Exception for artifact builds that failed, timed out or were cancelled.
+    """
+    pass
+
+
 
 def formated_exception(error: Exception) -> dict:
     """
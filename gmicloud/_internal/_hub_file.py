@@ -0,0 +1,243 @@
+import io
+import time
+import bisect
+import logging
+import threading
+from collections import deque
+from typing import BinaryIO, List, Optional
+
+import requests
+
+from ._constants import HTTP_METHOD_GET, HUB_DOWNLOAD_BLOCK_SIZE, HUB_DOWNLOAD_WINDOW_BYTES
+from ._exceptions import UploadFileError
+
+logger = logging.getLogger(__name__)
+
+
+class HubFile:
+    """
+    A file of a Hugging Face Hub repository that is read from the hub as it is read here, so it can be uploaded like a
+    local file with `FileUploadClient.upload_large_file` without being staged on disk.
+
+    Files of a repository holding the same blob share one download: their readers are served from a window of the
+    latest bytes downloaded, so identical files uploaded side by side are fetched from the hub once. A reader that
+    falls behind the window, or goes back to send data again, reads its bytes with a range request of its own.
+    """
+
+    def __init__(self, client, repo_id: str, revision: str, path: str, size: int, blob_hash: str):
+        """
+        Initialize the hub file.
+
+        :param client: The `HubClient` to download the file with.
+        :param repo_id: The ID of the repository, e.g. `deepseek-ai/DeepSeek-R1-Distill-Qwen-1.5B`.
+        :param revision: The commit of the repository the file is read from.
+        :param path: The path of the file in the repository.
+        :param size: The size of the file in bytes.
+        :param blob_hash: The SHA-256 of the file for files stored with LFS, or its git blob ID.
+        """
+        self.repo_id = repo_id
+        self.revision = revision
+        self.path = path
+        self.size = size
+        self.blob_hash = blob_hash
+        self.url = client.get_file_url(repo_id, revision, path)
+        self._client = client
+        self._download = _BlobDownload(client, self.url, size)
+
+    @staticmethod
+    def share_downloads(hub_files: List["HubFile"], window_bytes: int = HUB_DOWNLOAD_WINDOW_BYTES) -> None:
+        """
+        Make the files holding the same blob read it from one download.
+
+        :param hub_files: The files of a repository.
+        :param window_bytes: The number of bytes kept for the readers of a blob following behind the latest block.
+        """
+        files_by_blob = {}
+        for hub_file in hub_files:
+            files_by_blob.setdefault(hub_file.blob_hash, []).append(hub_file)
+        for same_files in files_by_blob.values():
+            if len(same_files) > 1:
+                download = _BlobDownload(same_files[0]._client, same_files[0].url, same_files[0].size,
+                                         window_bytes=window_bytes)
+                for hub_file in same_files:
+                    hub_file._download = download
+
+    def open(self) -> BinaryIO:
+        """
+        Open the file for reading.
+
+        :return: A seekable binary file object, to be closed after use.
+        """
+        return io.BufferedReader(_HubFileReader(self), HUB_DOWNLOAD_BLOCK_SIZE)
+
+    def __str__(self):
+        return f"{self.repo_id}/{self.path}"
+
+
+class _BlobDownload:
+    """
+    Downloads a blob from the hub block by block for the readers of every file holding it, keeping a window of the
+    latest `window_bytes` downloaded. The download starts when first read, resumes with a range request when the
+    connection fails, and is closed once its last reader is.
+    """
+
+    def __init__(self, client, url: str, size: int, start: int = 0, window_bytes: int = 0):
+        """
+        Initialize the download.
+
+        :param client: The `HubClient` to download the blob with.
+        :param url: The URL of the blob.
+        :param size: The size of the blob in bytes.
+        :param start: The offset to download from.
+        :param window_bytes: The number of bytes kept for readers following behind the latest block.
+        """
+        self.url = url
+        self.size = size
+        self.window_bytes = window_bytes
+        self._client = client
+        self._lock = threading.Lock()
+        self._start = start
+        self._readers = 0
+        self._response = None
+        self._reset(start)
+
+    def attach(self) -> None:
+        """Count a new reader of the blob."""
+        with self._lock:
+            self._readers += 1
+
+    def detach(self) -> None:
+        """Count a reader as closed, ending the download after the last one."""
+        with self._lock:
+            self._readers -= 1
+            if self._readers <= 0:
+                self._reset(self._start)
+
+    def read(self, position: int, length: int) -> Optional[bytes]:
+        """
+        Read bytes of the blob, downloading the next block when the position is at the end of the window.
+
+        :param position: The offset of the bytes.
+        :param length: The maximum number of bytes to read.
+        :return: Up to `length` bytes, or None if the position is outside the window.
+        :raises UploadFileError: If the download fails.
+        """
+        # Readers wait for a block being downloaded, which is the one they need unless they fell behind
+        with self._lock:
+            if position < self._window_start or position > self._window_end:
+                return None
+            if position == self._window_end:
+                if position >= self.size:
+                    return b""
+                self._download_block()
+            index = bisect.bisect_right(self._block_offsets, position) - 1
+            start = position - self._block_offsets[index]
+            return self._blocks[index][start:start + length]
+
+    def _download_block(self) -> None:
+        """Append the next block to the window, dropping the blocks that no longer fit. Called with the lock held."""
+        retry_policy = self._client.retry_policy
+        attempt = 1
+        while True:
+            try:
+                if self._response is None:
+                    self._response = self._client.open_file(self.url, self._window_end)
+                    self._chunks = self._response.iter_content(HUB_DOWNLOAD_BLOCK_SIZE)
+                block = next(self._chunks, b"")
+                if not block:
+                    raise requests.exceptions.ConnectionError(f"the download ended at byte {self._window_end:,}")
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                self._close_response()
+                if not retry_policy.can_retry(HTTP_METHOD_GET, attempt):
+                    raise UploadFileError(f"Failed to download {self.url} after {attempt} attempts: {e}")
+                delay = retry_policy.get_delay(attempt)
+                logger.warning(f"Downloading {self.url} failed with {e!r}, resuming from byte {self._window_end:,} "
+                               f"in {delay:.2f}s (attempt {attempt}/{retry_policy.max_attempts})")
+                time.sleep(delay)
+                attempt += 1
+
+        self._blocks.append(block)
+        self._block_offsets.append(self._window_end)
+        self._window_end += len(block)
+        if self._window_end >= self.size:
+            self._close_response()
+        while len(self._blocks) > 1 and self._window_end - self._block_offsets[1] >= self.window_bytes:
+            self._blocks.popleft()
+            self._block_offsets.popleft()
+        self._window_start = self._block_offsets[0]
+
+    def _reset(self, start: int) -> None:
+        self._close_response()
+        self._blocks = deque()
+        self._block_offsets = deque()
+        self._window_start = self._window_end = start
+
+    def _close_response(self) -> None:
+        if self._response is not None:
+            self._response.close()
+        self._response = None
+        self._chunks = None
+
+
+class _HubFileReader(io.RawIOBase):
+    """
+    Reads a `HubFile` from the download shared by its blob, or from a download of its own when the bytes it needs
+    are no longer in the shared window.
+    """
+
+    def __init__(self, hub_file: HubFile):
+        super().__init__()
+        self._file = hub_file
+        self._position = 0
+        self._own_download = None
+        hub_file._download.attach()
+
+    @property
+    def name(self) -> str:
+        return str(self._file)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._file.size}[whence]
+        if base + offset < 0:
+            raise ValueError("Negative seek position")
+        self._position = base + offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._file.size:
+            return 0
+        length = min(len(buffer), self._file.size - self._position)
+        data = self._file._download.read(self._position, length)
+        if data is None and self._own_download is not None:
+            data = self._own_download.read(self._position, length)
+        if data is None:
+            self._close_own_download()
+            logger.debug(f"Reading {self._file} from byte {self._position:,} with a download of its own")
+            self._own_download = _BlobDownload(self._file._client, self._file.url, self._file.size, self._position)
+            self._own_download.attach()
+            data = self._own_download.read(self._position, length)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._close_own_download()
+            self._file._download.detach()
+        super().close()
+
+    def _close_own_download(self) -> None:
+        if self._own_download is not None:
+            self._own_download.detach()
+            self._own_download = None
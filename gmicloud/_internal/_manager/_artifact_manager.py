@@ -1,15 +1,30 @@
 import os
 import time
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
 import mimetypes
 import concurrent.futures
+import contextlib
+import contextvars
 import re
-from tqdm import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm
+from urllib.parse import quote
 
 from .._client._iam_client import IAMClient
 from .._client._artifact_client import ArtifactClient
 from .._client._file_upload_client import FileUploadClient
+from .._client._file_download_client import FileDownloadClient
+from .._client._hub_client import HubClient
+from .._constants import (DEFAULT_DOWNLOAD_CONNECTIONS, GCS_DOWNLOAD_BASE_URL, HASH_BLOCK_SIZE,
+                          MAX_CORRUPTED_UPLOAD_RETRIES, SMALL_FILES_BUNDLE_PREFIX)
+from .._deadline import Deadline, earliest_deadline
+from .._exceptions import ArtifactBuildError, DeadlineExceededError, UploadFileError, UploadIntegrityError
+from .._upload_journal import UploadJournal
+from .._upload_progress_tracker import UploadProgressTracker
+from .._upload_scheduler import UploadScheduler
+from .._hub_file import HubFile
+from .._poll_policy import PollPolicy
+from .._tar_bundle import TarBundle
+from .._zip_stream import ZipStream
 from .._models import *
 from .._manager.serve_command_utils import parse_server_command, extract_gpu_num_from_serve_command
 
@@ -22,15 +37,17 @@ class ArtifactManager:
     Artifact Manager handles creation, retrieval, and file upload associated with artifacts.
     """
 
-    def __init__(self, iam_client: IAMClient):
+    def __init__(self, iam_client: IAMClient, upload_scheduler: Optional[UploadScheduler] = None):
         """
         Initialize the ArtifactManager instance with the user ID and access token.
 
         :param iam_client: The IAMClient instance to use for authentication.
+        :param upload_scheduler: The limits shared by all uploads of this manager, defaults to `UploadScheduler()`.
         :raises ValueError: If the `user_id` is None or an empty string.
         """
         self.iam_client = iam_client
         self.artifact_client = ArtifactClient(iam_client)
+        self.upload_scheduler = upload_scheduler if upload_scheduler is not None else UploadScheduler()
 
     def get_artifact(self, artifact_id: str) -> Artifact:
         """
@@ -238,46 +255,69 @@ class ArtifactManager:
 
         return self.artifact_client.delete_artifact(artifact_id)
 
-    def upload_artifact_file(self, upload_link: str, artifact_file_path: str) -> None:
+    def upload_artifact_file(self, upload_link: str, artifact_file_path: Union[str, List[str]],
+                             compress_level: int = 6) -> None:
         """
         Upload a file associated with an artifact.
 
         :param upload_link: The URL to upload the artifact file.
-        :param artifact_file_path: The path to the artifact file.
+        :param artifact_file_path: The path to the artifact zip file, or a directory or a list of files to zip while
+                                   uploading them.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
         :raises ValueError: If `file_path` is None or empty.
         :raises FileNotFoundError: If the provided `file_path` does not exist.
         """
-        self._validate_artifact_file_path(artifact_file_path)
-        artifact_file_type = mimetypes.guess_type(artifact_file_path)[0]
+        zip_stream = self._artifact_zip_stream(artifact_file_path, compress_level)
+        self._upload_artifact_file(upload_link, artifact_file_path, zip_stream)
+
+    def _upload_artifact_file(self, upload_link: str, artifact_file_path: Union[str, List[str]],
+                              zip_stream: Optional[ZipStream]) -> None:
+        """
+        Upload an artifact zip file, or the zip archive of a directory or of files streamed as it is built.
 
-        FileUploadClient.upload_small_file(upload_link, artifact_file_path, artifact_file_type)
+        :param upload_link: The URL to upload the artifact file.
+        :param artifact_file_path: The path to the artifact zip file, or a directory or a list of files.
+        :param zip_stream: The zip stream of a directory or a list of files, or None for a zip file.
+        """
+        if zip_stream is not None:
+            FileUploadClient.upload_zip_stream(upload_link, zip_stream, scheduler=self.upload_scheduler)
+            return
+        artifact_file_type = mimetypes.guess_type(artifact_file_path)[0]
+        FileUploadClient.upload_small_file(upload_link, artifact_file_path, artifact_file_type,
+                                           scheduler=self.upload_scheduler)
 
     def create_artifact_with_file(
             self,
             artifact_name: str,
-            artifact_file_path: str,
+            artifact_file_path: Union[str, List[str]],
             description: Optional[str] = "",
-            tags: Optional[List[str]] = None
+            tags: Optional[List[str]] = None,
+            compress_level: int = 6
     ) -> str:
         """
         Create a new artifact for a user and upload a file associated with the artifact.
 
+        Given a directory or a list of files instead of a zip file, the zip archive is built while it is uploaded,
+        without writing it to disk. Files are compressed in parallel, and named by their path relative to the
+        directory, or by their base name.
+
         :param artifact_name: The name of the artifact.
-        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py).
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
         :param description: An optional description for the artifact.
         :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
         :return: The `artifact_id` of the created artifact.
         :rtype: str
         :raises FileNotFoundError: If the provided `file_path` does not exist.
         """
-        self._validate_artifact_file_path(artifact_file_path)
+        zip_stream = self._artifact_zip_stream(artifact_file_path, compress_level)
 
         # Create the artifact
         create_artifact_resp = self.create_artifact(artifact_name, description, tags)
         artifact_id = create_artifact_resp.artifact_id
 
-        artifact_file_type = mimetypes.guess_type(artifact_file_path)[0]
-        FileUploadClient.upload_small_file(create_artifact_resp.upload_link, artifact_file_path, artifact_file_type)
+        self._upload_artifact_file(create_artifact_resp.upload_link, artifact_file_path, zip_stream)
 
         return artifact_id
 
@@ -315,7 +355,8 @@ class ArtifactManager:
         self._validate_artifact_id(artifact_id)
         self._validate_file_name(file_name)
 
-        resp = self.artifact_client.delete_bigfile(artifact_id, file_name)
+        resp = self.artifact_client.delete_bigfile(DeleteBigfileRequest(artifact_id=artifact_id,
+                                                                        file_name=file_name))
         if not resp or not resp.status:
             raise ValueError("Failed to delete bigfile.")
 
@@ -337,15 +378,503 @@ class ArtifactManager:
         FileUploadClient.upload_large_file(upload_link, file_path)
 
 
-    def upload_model_files_to_artifact(self, artifact_id: str, model_directory: str) -> None:
+    def upload_model_files_to_artifact(self, artifact_id: str, model_directory: str,
+                                       max_concurrency: Optional[int] = None,
+                                       progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                       show_progress_bar: bool = True,
+                                       bundle_small_files_under: Optional[int] = None) -> None:
         """
         Upload model files to an existing artifact.
 
+        Every file takes a few round trips to set up its upload, which dominates the upload time of small files such
+        as configs and tokenizers. With `bundle_small_files_under`, the files smaller than that many bytes are uploaded
+        together as a single tar archive, named `gmicloud-small-files-<digest>.tar`, whose last member
+        `gmicloud-manifest.json` lists the path, size, SHA-256 and offset in the archive of every file. The archive is
+        assembled from the files as it is sent. Larger files are still uploaded on their own, in parallel.
+
         :param artifact_id: The ID of the artifact to upload the model files to.
         :param model_directory: The path to the model directory.
+        :param max_concurrency: The maximum number of files uploaded at the same time, defaults to the limit of
+                                the upload scheduler.
+        :param progress_callback: Called with an `UploadProgress` whenever a file starts, progresses, is retried,
+                                  completes or fails, and once all are done (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param bundle_small_files_under: The size in bytes under which files are uploaded in a single archive
+                                         (optional; by default every file is uploaded on its own).
+        """
+        model_file_paths = self._list_model_files(model_directory)
+
+        # Remembers upload sessions across runs, so a rerun skips completed files and resumes partial ones
+        journal = UploadJournal(model_directory, artifact_id)
+        self._upload_model_files(artifact_id, model_file_paths, journal, max_concurrency,
+                                 progress_callback=progress_callback, show_progress_bar=show_progress_bar,
+                                 bundle_small_files_under=bundle_small_files_under)
+
+    def upload_hub_model_to_artifact(self, artifact_id: str, repo_id: str, revision: str = "main",
+                                     allow_patterns: Optional[List[str]] = None,
+                                     ignore_patterns: Optional[List[str]] = None,
+                                     token: Optional[str] = None, endpoint: Optional[str] = None,
+                                     max_concurrency: Optional[int] = None,
+                                     progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                     show_progress_bar: bool = True) -> None:
+        """
+        Upload the files of a Hugging Face Hub model repository to an existing artifact, without staging them on disk.
+
+        Every file is downloaded in blocks as its chunks are uploaded, so downloads and uploads overlap and only the
+        chunks being uploaded or read ahead are held in memory, within the buffer budget of the upload scheduler.
+        Files holding the same blob (by SHA-256, or git blob ID for files not stored with LFS) are uploaded side by
+        side from a single download. Nothing is recorded on disk, so a rerun uploads every file again.
+
+        :param artifact_id: The ID of the artifact to upload the model files to.
+        :param repo_id: The ID of the repository, e.g. `deepseek-ai/DeepSeek-R1-Distill-Qwen-1.5B`.
+        :param revision: The branch, tag or commit to upload.
+        :param allow_patterns: Only files whose path matches one of these glob patterns are uploaded (optional).
+        :param ignore_patterns: Files whose path matches one of these glob patterns are not uploaded (optional).
+        :param token: The access token for private and gated repositories, defaults to the `HF_TOKEN` environment
+                      variable.
+        :param endpoint: The URL of the hub, defaults to the `HF_ENDPOINT` environment variable or the Hugging Face Hub.
+        :param max_concurrency: The maximum number of blobs uploaded at the same time, defaults to the limit of the
+                                upload scheduler.
+        :param progress_callback: Called with an `UploadProgress` whenever a file starts, progresses, is retried,
+                                  completes or fails, and once all are done (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :raises ValueError: If `artifact_id` is empty or the files of the repository cannot be listed.
+        """
+        self._validate_artifact_id(artifact_id)
+        hub_files = HubClient(endpoint, token).get_repo_files(repo_id, revision, allow_patterns, ignore_patterns)
+        if hub_files is None:
+            raise ValueError(f"Failed to list the files of {repo_id}.")
+        blobs = self._group_hub_files_by_blob(hub_files)
+        file_sizes = {hub_file.path: hub_file.size for hub_file in hub_files}
+
+        def upload_hub_file(hub_file):
+            def record_offset(offset):
+                progress.bytes_confirmed(hub_file.path, offset)
+
+            def record_retry():
+                progress.retry(hub_file.path)
+
+            corrupted_uploads = 0
+            with self.upload_scheduler.file_slot():
+                while True:
+                    upload_link = self.artifact_client.get_bigfile_upload_url(
+                        ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=os.path.basename(hub_file.path))
+                    ).upload_link
+                    progress.file_started(hub_file.path)
+                    try:
+                        FileUploadClient.upload_large_file(upload_link, hub_file, on_chunk_uploaded=record_offset,
+                                                           scheduler=self.upload_scheduler, on_retry=record_retry)
+                    except UploadIntegrityError as e:
+                        corrupted_uploads += 1
+                        if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                            raise
+                        logger.error(f"{e}, uploading it again")
+                        record_retry()
+                    else:
+                        progress.file_completed(hub_file.path)
+                        return
+
+        def upload_blob(same_files):
+            # Files holding the same blob are uploaded side by side, so that they read one download. Each takes an
+            # upload slot of its own; one left waiting for a slot reads the blob again once it falls behind the window
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(same_files)) as executor:
+                futures = {executor.submit(contextvars.copy_context().run, upload_hub_file, hub_file): hub_file
+                           for hub_file in same_files}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to upload file {futures[future]}, Error: {e}")
+                        progress.file_failed(futures[future].path)
+
+        with self._upload_progress_bar(show_progress_bar) as update_progress_bar:
+            progress = UploadProgressTracker(file_sizes, [update_progress_bar, progress_callback])
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_concurrency or self.upload_scheduler.max_concurrency) as executor:
+                # Run each upload in a copy of the caller's context so it sees the current deadline
+                for future in [executor.submit(contextvars.copy_context().run, upload_blob, same_files)
+                               for same_files in blobs]:
+                    future.result()
+            summary = progress.finish()
+        logger.info(f"Uploaded {summary.files_completed}/{summary.total_files} files of {repo_id} "
+                    f"({summary.bytes_uploaded:,}/{summary.total_bytes:,} bytes) in {summary.elapsed_seconds:.1f}s, "
+                    f"{summary.files_failed} failed, {summary.retries} retries")
+
+    @staticmethod
+    def _group_hub_files_by_blob(hub_files: List[HubFile]) -> List[List[HubFile]]:
+        """
+        Group the files of a repository holding the same blob, largest blob first.
+
+        :param hub_files: The files of the repository.
+        :return: The groups of files.
+        """
+        blobs = {}
+        for hub_file in sorted(hub_files, key=lambda hub_file: hub_file.size, reverse=True):
+            blobs.setdefault(hub_file.blob_hash, []).append(hub_file)
+        duplicates = sum(len(same_files) - 1 for same_files in blobs.values())
+        if duplicates:
+            logger.info(f"{duplicates} files hold the same content as another file and share its download")
+        return list(blobs.values())
+
+    def download_artifact_files(self, artifact_id: str, target_directory: str,
+                                file_names: Optional[List[str]] = None, headers: Optional[dict] = None,
+                                max_concurrency: int = 2,
+                                max_connections_per_file: int = DEFAULT_DOWNLOAD_CONNECTIONS,
+                                verify_checksums: bool = True, use_mmap: bool = False) -> List[str]:
+        """
+        Download the big files of an artifact to a local directory, each with parallel range requests.
+
+        Files are written in place as their parts arrive, so memory use stays at one block per connection whatever
+        their size. An interrupted download is resumed by calling this method again: the parts already downloaded are
+        kept in `<file>.part` next to the target file until it is complete.
+
+        :param artifact_id: The ID of the artifact to download the files of.
+        :param target_directory: The directory to save the files to, under their file name.
+        :param file_names: Only the files with these names are downloaded (optional, defaults to all files).
+        :param headers: Extra request headers for the storage service, e.g. for authorization (optional).
+        :param max_concurrency: The maximum number of files downloaded at the same time.
+        :param max_connections_per_file: The maximum number of range requests per file at the same time.
+        :param verify_checksums: Whether to check the downloaded files against the hashes reported by Google Storage.
+        :param use_mmap: Whether to write the files through a memory map instead of positioned writes.
+        :return: The paths of the files downloaded.
+        :raises ValueError: If `artifact_id` is empty, the artifact cannot be found or a requested file is not in it.
+        """
+        self._validate_artifact_id(artifact_id)
+        artifact = self.get_artifact(artifact_id)
+        if artifact is None:
+            raise ValueError(f"Failed to get artifact {artifact_id}.")
+        return self._download_big_files(artifact.big_files_metadata or [], target_directory, file_names, headers,
+                                        max_concurrency, max_connections_per_file, verify_checksums, use_mmap)
+
+    @staticmethod
+    def _download_big_files(big_files: List[BigFileMetadata], target_directory: str,
+                            file_names: Optional[List[str]], headers: Optional[dict], max_concurrency: int,
+                            max_connections_per_file: int, verify_checksums: bool, use_mmap: bool) -> List[str]:
+        """
+        Download big files of an artifact to a local directory, logging the files that fail.
+
+        :return: The paths of the files downloaded.
+        :raises ValueError: If a requested file is not in the artifact.
         """
+        if file_names is not None:
+            missing = set(file_names) - {big_file.file_name for big_file in big_files}
+            if missing:
+                raise ValueError(f"Files {sorted(missing)} are not in the artifact.")
+            big_files = [big_file for big_file in big_files if big_file.file_name in file_names]
+        client = FileDownloadClient()
+
+        def download(big_file):
+            file_path = os.path.join(target_directory, os.path.basename(big_file.file_name))
+            client.download_file(ArtifactManager._get_download_url(big_file), file_path, headers,
+                                 max_connections=max_connections_per_file, verify=verify_checksums,
+                                 use_mmap=use_mmap)
+            return file_path
+
+        file_paths = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {executor.submit(contextvars.copy_context().run, download, big_file): big_file
+                       for big_file in big_files}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    file_paths.append(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to download file {futures[future].file_name}, Error: {e}")
+        logger.info(f"Downloaded {len(file_paths)}/{len(big_files)} files to {target_directory}")
+        return sorted(file_paths)
 
-        # List all files in the model directory recursively
+    @staticmethod
+    def _get_download_url(big_file: BigFileMetadata) -> str:
+        """
+        Get the HTTP URL of a big file of an artifact.
+
+        :param big_file: The metadata of the file.
+        :return: The URL, from its `gcs_link` if it is one, or from its `gs://` link or bucket and object name.
+        """
+        link = big_file.gcs_link or ""
+        if link.startswith(("http://", "https://")):
+            return link
+        if link.startswith("gs://"):
+            bucket_name, _, object_name = link[len("gs://"):].partition("/")
+        else:
+            bucket_name, object_name = big_file.bucket_name, link or big_file.file_name
+        return f"{GCS_DOWNLOAD_BASE_URL}/{bucket_name}/{quote(object_name)}"
+
+    def plan_model_files_sync(self, artifact_id: str, model_directory: str, delete_missing: bool = False,
+                              max_concurrency: Optional[int] = None) -> ModelSyncPlan:
+        """
+        Work out which model files must be uploaded to bring an artifact in line with a local model directory,
+        without changing anything.
+
+        A file is skipped when the artifact holds a file of the same name and the upload journal of the directory
+        shows that the same content (by SHA-256) was uploaded to this artifact from it.
+
+        :param artifact_id: The ID of the artifact to sync.
+        :param model_directory: The path to the model directory.
+        :param delete_missing: Whether artifact files missing from the directory should be deleted.
+        :param max_concurrency: The maximum number of files hashed at the same time, defaults to the limit of
+                                the upload scheduler.
+        :return: The sync plan.
+        """
+        artifact = self.get_artifact(artifact_id)
+        journal = UploadJournal(model_directory, artifact_id)
+        model_file_paths = self._list_model_files(model_directory)
+        file_hashes = self._hash_model_files(journal, model_file_paths,
+                                              max_concurrency or self.upload_scheduler.max_concurrency)
+        return self._plan_model_files_sync(artifact, journal, file_hashes, delete_missing)
+
+    def sync_model_files_to_artifact(self, artifact_id: str, model_directory: str, delete_missing: bool = False,
+                                     dry_run: bool = False,
+                                     max_concurrency: Optional[int] = None,
+                                     progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                     show_progress_bar: bool = True) -> ModelSyncPlan:
+        """
+        Upload only the new or changed files of a model directory to an artifact, as planned by
+        `plan_model_files_sync`. The plan is logged before anything is transferred.
+
+        :param artifact_id: The ID of the artifact to sync.
+        :param model_directory: The path to the model directory.
+        :param delete_missing: Whether artifact files missing from the directory should be deleted.
+        :param dry_run: Whether to only log and return the plan.
+        :param max_concurrency: The maximum number of files hashed or uploaded at the same time, defaults to the
+                                limit of the upload scheduler.
+        :param progress_callback: Called with an `UploadProgress` as the files are uploaded, see
+                                  `upload_model_files_to_artifact` (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :return: The executed (or, with `dry_run`, planned) sync.
+        """
+        artifact = self.get_artifact(artifact_id)
+        journal = UploadJournal(model_directory, artifact_id)
+        model_file_paths = self._list_model_files(model_directory)
+        file_hashes = self._hash_model_files(journal, model_file_paths,
+                                              max_concurrency or self.upload_scheduler.max_concurrency)
+        plan = self._plan_model_files_sync(artifact, journal, file_hashes, delete_missing)
+        self._log_sync_plan(plan)
+        if dry_run:
+            return plan
+
+        for file_path in plan.files_to_upload:
+            entry = journal.lookup(file_path)
+            if entry and entry["completed"]:
+                # The journal says it was uploaded, but the artifact no longer holds it
+                journal.discard(file_path)
+        self._upload_model_files(artifact_id, plan.files_to_upload, journal, max_concurrency, file_hashes,
+                                 progress_callback, show_progress_bar)
+        for file_name in plan.files_to_delete:
+            self.delete_bigfile(artifact_id, file_name)
+            logger.info(f"Deleted {file_name} from artifact {artifact_id}")
+        return plan
+
+    def _upload_model_files(self, artifact_id: str, model_file_paths: List[str], journal: UploadJournal,
+                            max_concurrency: Optional[int], file_hashes: Optional[Dict[str, str]] = None,
+                            progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                            show_progress_bar: bool = True,
+                            bundle_small_files_under: Optional[int] = None,
+                            upload_links: Optional[Dict[str, concurrent.futures.Future]] = None) -> UploadProgress:
+        """
+        Upload model files to an artifact in parallel, skipping and resuming files as recorded in the journal.
+
+        :param artifact_id: The ID of the artifact to upload the model files to.
+        :param model_file_paths: The paths of the files to upload.
+        :param journal: The upload journal of the model directory.
+        :param max_concurrency: The maximum number of files uploaded at the same time by this call, defaults to the
+                                limit of the upload scheduler, which also bounds all the uploads of this manager.
+        :param file_hashes: The SHA-256 of the files, recorded in the journal once uploaded (optional).
+        :param progress_callback: Called with every `UploadProgress` report (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param bundle_small_files_under: The size in bytes under which files are uploaded in a single archive
+                                         (optional).
+        :param upload_links: The upload links already being requested for files without a saved session, by path
+                             (optional).
+        :return: The final progress report.
+        """
+        file_hashes = file_hashes or {}
+        upload_links = upload_links or {}
+        bundle = None
+        if bundle_small_files_under:
+            model_file_paths, bundle = self._bundle_small_files(journal, model_file_paths, bundle_small_files_under)
+        # Largest first, so that the longest upload does not start last
+        model_file_paths = self.upload_scheduler.order_largest_first(model_file_paths)
+        file_sizes = {path: os.path.getsize(path) for path in model_file_paths if os.path.isfile(path)}
+        if bundle is not None:
+            file_sizes[bundle.name] = bundle.size
+
+        def upload_file(model_file_path):
+            self._validate_file_path(model_file_path)
+            with self.upload_scheduler.file_slot():
+                upload_model_file(model_file_path)
+
+        def upload_model_file(model_file_path):
+            def record_offset(offset):
+                journal.record_offset(model_file_path, offset)
+                progress.bytes_confirmed(model_file_path, offset)
+
+            def record_retry():
+                progress.retry(model_file_path)
+
+            entry = journal.lookup(model_file_path)
+            if entry and entry["completed"]:
+                logger.info(f"File {model_file_path} was already uploaded, skipping")
+                progress.file_skipped(model_file_path)
+                return
+            if entry:
+                logger.info(f"Resuming upload of {model_file_path} from its saved session "
+                            f"({entry['offset']:,} bytes confirmed)")
+            upload_link = entry["upload_link"] if entry else None
+            if upload_link is None and model_file_path in upload_links:
+                upload_link = upload_links.pop(model_file_path).result().upload_link
+                journal.start(model_file_path, upload_link)
+            corrupted_uploads = 0
+            while True:
+                if upload_link is None:
+                    bigfile_upload_url_resp = self.artifact_client.get_bigfile_upload_url(
+                        ResumableUploadLinkRequest(artifact_id=artifact_id,
+                                                   file_name=os.path.basename(model_file_path))
+                    )
+                    upload_link = bigfile_upload_url_resp.upload_link
+                    journal.start(model_file_path, upload_link)
+                    entry = None
+                progress.file_started(model_file_path, entry["offset"] if entry else 0)
+                try:
+                    FileUploadClient.upload_large_file(upload_link, model_file_path,
+                                                       on_chunk_uploaded=record_offset,
+                                                       scheduler=self.upload_scheduler,
+                                                       on_retry=record_retry)
+                except UploadIntegrityError as e:
+                    corrupted_uploads += 1
+                    if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                        raise
+                    logger.error(f"{e}, uploading it again")
+                except UploadFileError as e:
+                    if entry is None:
+                        raise
+                    logger.warning(f"Saved upload session of {model_file_path} is no longer usable, "
+                                   f"starting over: {e}")
+                else:
+                    journal.complete(model_file_path, file_hashes.get(model_file_path))
+                    progress.file_completed(model_file_path)
+                    return
+                record_retry()
+                upload_link = None
+
+        def upload_bundle():
+            def record_offset(offset):
+                progress.bytes_confirmed(bundle.name, offset)
+
+            def record_retry():
+                progress.retry(bundle.name)
+
+            corrupted_uploads = 0
+            with self.upload_scheduler.file_slot():
+                while True:
+                    upload_link = self.artifact_client.get_bigfile_upload_url(
+                        ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=bundle.name)
+                    ).upload_link
+                    progress.file_started(bundle.name)
+                    try:
+                        FileUploadClient.upload_large_file(upload_link, bundle, on_chunk_uploaded=record_offset,
+                                                           scheduler=self.upload_scheduler, on_retry=record_retry)
+                    except UploadIntegrityError as e:
+                        corrupted_uploads += 1
+                        if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                            raise
+                        logger.error(f"{e}, uploading it again")
+                        record_retry()
+                    else:
+                        journal.complete_bundled({path: entry["sha256"] for path, entry in
+                                                  zip(bundle.file_paths, bundle.manifest["files"])},
+                                                 upload_link, bundle.name)
+                        progress.file_completed(bundle.name)
+                        return
+
+        # Upload files in parallel with progress bar
+        with self._upload_progress_bar(show_progress_bar) as update_progress_bar:
+            progress = UploadProgressTracker(file_sizes, [update_progress_bar, progress_callback])
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_concurrency or self.upload_scheduler.max_concurrency) as executor:
+                # Run each upload in a copy of the caller's context so it sees the current deadline
+                futures = {executor.submit(contextvars.copy_context().run, upload_file, path): path
+                           for path in model_file_paths}
+                if bundle is not None:
+                    futures[executor.submit(contextvars.copy_context().run, upload_bundle)] = bundle.name
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to upload file {futures[future]}, Error: {e}")
+                        progress.file_failed(futures[future])
+            summary = progress.finish()
+        logger.info(f"Uploaded {summary.files_completed}/{summary.total_files} model files "
+                    f"({summary.bytes_uploaded:,}/{summary.total_bytes:,} bytes) in {summary.elapsed_seconds:.1f}s, "
+                    f"{summary.files_failed} failed, {summary.retries} retries")
+        return summary
+
+    @staticmethod
+    def _bundle_small_files(journal: UploadJournal, model_file_paths: List[str],
+                            size_threshold: int) -> Tuple[List[str], Optional[TarBundle]]:
+        """
+        Lay out the files smaller than `size_threshold` that were not uploaded yet as one tar bundle.
+
+        :param journal: The upload journal of the model directory.
+        :param model_file_paths: The paths of the files to upload.
+        :param size_threshold: The size in bytes under which files are bundled.
+        :return: The paths of the files to upload on their own, and the bundle, or None if fewer than two files
+                 would go in it.
+        """
+        small_file_paths = []
+        for file_path in model_file_paths:
+            if os.path.getsize(file_path) < size_threshold:
+                entry = journal.lookup(file_path)
+                if not (entry and entry["completed"]):
+                    small_file_paths.append(file_path)
+        if len(small_file_paths) < 2:
+            return model_file_paths, None
+
+        bundle = TarBundle([(os.path.relpath(file_path, journal.model_directory).replace(os.path.sep, "/"), file_path)
+                            for file_path in small_file_paths], SMALL_FILES_BUNDLE_PREFIX)
+        logger.info(f"Bundling {len(small_file_paths)} files smaller than {size_threshold:,} bytes into "
+                    f"{bundle.name} ({bundle.size:,} bytes)")
+        bundled = set(small_file_paths)
+        return [file_path for file_path in model_file_paths if file_path not in bundled], bundle
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _upload_progress_bar(enabled: bool = True) -> Iterator[Optional[Callable[[UploadProgress], None]]]:
+        """
+        Show a progress bar of the bytes uploaded while the context is active, if enabled and `tqdm` is installed.
+
+        :param enabled: Whether to show the progress bar.
+        :return: A progress callback updating the bar, or None if no bar is shown.
+        """
+        if not enabled:
+            yield None
+            return
+        try:
+            # tqdm is only needed once files are uploaded; keep it off the import path
+            from tqdm import tqdm
+            from tqdm.contrib.logging import logging_redirect_tqdm
+        except ImportError:
+            logger.debug("tqdm is not installed, not showing a progress bar")
+            yield None
+            return
+
+        with tqdm(desc="Uploading model files", unit="B", unit_scale=True, unit_divisor=1024) as progress_bar, \
+                logging_redirect_tqdm():
+            def update_progress_bar(progress: UploadProgress):
+                progress_bar.total = progress.total_bytes
+                progress_bar.set_postfix_str(f"{progress.files_completed}/{progress.total_files} files",
+                                             refresh=False)
+                progress_bar.update(progress.bytes_uploaded - progress_bar.n)
+
+            yield update_progress_bar
+
+    @staticmethod
+    def _list_model_files(model_directory: str) -> List[str]:
+        """
+        List all files in the model directory recursively, skipping `.cache` folders.
+
+        :param model_directory: The path to the model directory.
+        :return: The paths of the model files.
+        """
         model_file_paths = []
         for root, _, files in os.walk(model_directory):
             # Skip .cache folder
@@ -353,72 +882,250 @@ class ArtifactManager:
                 continue
             for file in files:
                 model_file_paths.append(os.path.join(root, file))
+        return model_file_paths
 
-        def upload_file(model_file_path):
-            self._validate_file_path(model_file_path)
-            bigfile_upload_url_resp = self.artifact_client.get_bigfile_upload_url(
-                ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=os.path.basename(model_file_path))
-            )
-            FileUploadClient.upload_large_file(bigfile_upload_url_resp.upload_link, model_file_path)
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """
+        Compute the SHA-256 of a file.
 
-        # Upload files in parallel with progress bar
-        with tqdm(total=len(model_file_paths), desc="Uploading model files") as progress_bar:
-            with logging_redirect_tqdm():
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    futures = {executor.submit(upload_file, path): path for path in model_file_paths}
-                    for future in concurrent.futures.as_completed(futures):
-                        try:
-                            future.result()
-                        except Exception as e:
-                            logger.error(f"Failed to upload file {futures[future]}, Error: {e}")
-                        progress_bar.update(1)
+        :param file_path: The path of the file.
+        :return: The hex digest.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_model_files(journal: UploadJournal, model_file_paths: List[str],
+                          max_concurrency: int) -> Dict[str, str]:
+        """
+        Compute the SHA-256 of model files in parallel, reusing the hashes cached in the journal for unchanged files.
+
+        :param journal: The upload journal of the model directory.
+        :param model_file_paths: The paths of the files to hash.
+        :param max_concurrency: The maximum number of files hashed at the same time.
+        :return: The hex digests keyed by file path.
+        """
+        file_hashes = {}
+        for file_path in model_file_paths:
+            cached_hash = journal.cached_hash(file_path)
+            if cached_hash:
+                file_hashes[file_path] = cached_hash
+
+        paths_to_hash = [file_path for file_path in model_file_paths if file_path not in file_hashes]
+        if paths_to_hash:
+            # hashlib releases the GIL while digesting, so threads hash files in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                new_hashes = dict(zip(paths_to_hash, executor.map(ArtifactManager._hash_file, paths_to_hash)))
+            journal.record_hashes(new_hashes)
+            file_hashes.update(new_hashes)
+        return file_hashes
+
+    @staticmethod
+    def _plan_model_files_sync(artifact: Artifact, journal: UploadJournal, file_hashes: Dict[str, str],
+                               delete_missing: bool) -> ModelSyncPlan:
+        """
+        Compare hashed local model files with the files an artifact holds.
+
+        :param artifact: The artifact to sync.
+        :param journal: The upload journal of the model directory.
+        :param file_hashes: The SHA-256 of the local model files, keyed by file path.
+        :param delete_missing: Whether artifact files missing from the directory should be deleted.
+        :return: The sync plan.
+        """
+        remote_file_names = {metadata.file_name for metadata in artifact.big_files_metadata or []}
+        plan = ModelSyncPlan(artifact_id=artifact.artifact_id)
+        # Bundles still holding an unchanged local file
+        live_bundle_names = set()
+        for file_path in sorted(file_hashes):
+            file_size = os.path.getsize(file_path)
+            # A file uploaded in a bundle is held by the artifact under the name of the bundle
+            bundle_name = journal.uploaded_bundle(file_path)
+            if (bundle_name or os.path.basename(file_path)) in remote_file_names and \
+                    journal.uploaded_hash(file_path) == file_hashes[file_path]:
+                plan.files_to_skip.append(file_path)
+                plan.bytes_skipped += file_size
+                if bundle_name:
+                    live_bundle_names.add(bundle_name)
+            else:
+                plan.files_to_upload.append(file_path)
+                plan.bytes_to_upload += file_size
+        if delete_missing:
+            local_file_names = {os.path.basename(file_path) for file_path in file_hashes}
+            plan.files_to_delete = sorted(remote_file_names - local_file_names - live_bundle_names - {""})
+        return plan
+
+    @staticmethod
+    def _log_sync_plan(plan: ModelSyncPlan) -> None:
+        logger.info(f"Sync plan for artifact {plan.artifact_id}: upload {len(plan.files_to_upload)} files "
+                    f"({plan.bytes_to_upload:,} bytes), skip {len(plan.files_to_skip)} unchanged files "
+                    f"({plan.bytes_skipped:,} bytes), delete {len(plan.files_to_delete)} files")
+        for file_path in plan.files_to_upload:
+            logger.info(f"  upload {file_path}")
+        for file_name in plan.files_to_delete:
+            logger.info(f"  delete {file_name}")
 
     def create_artifact_with_model_files(
             self,
             artifact_name: str,
-            artifact_file_path: str,
+            artifact_file_path: Union[str, List[str]],
             model_directory: str,
             description: Optional[str] = "",
-            tags: Optional[str] = None
+            tags: Optional[str] = None,
+            deadline: Optional[Deadline] = None,
+            progress_callback: Optional[Callable[[UploadProgress], None]] = None
     ) -> str:
         """
         Create a new artifact for a user and upload model files associated with the artifact.
         :param artifact_name: The name of the artifact.
-        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py).
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
         :param model_directory: The path to the model directory.
         :param description: An optional description for the artifact.
         :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param deadline: An optional deadline shared by the creation and every upload request.
+        :param progress_callback: Called with an `UploadProgress` as the model files are uploaded (optional).
         :return: The `artifact_id` of the created artifact.
         """
-        artifact_id = self.create_artifact_with_file(artifact_name, artifact_file_path, description, tags)
-        logger.info(f"Artifact created: {artifact_id}")
+        with deadline if deadline is not None else contextlib.nullcontext():
+            artifact_id = self.create_artifact_with_file(artifact_name, artifact_file_path, description, tags)
+            logger.info(f"Artifact created: {artifact_id}")
 
-        self.upload_model_files_to_artifact(artifact_id, model_directory)
+            self.upload_model_files_to_artifact(artifact_id, model_directory,
+                                                progress_callback=progress_callback)
 
         return artifact_id
 
 
-    def wait_for_artifact_ready(self, artifact_id: str, timeout_s: int = 900) -> None:
+    def create_artifact_with_model_files_pipelined(
+            self,
+            artifact_name: str,
+            artifact_file_path: Union[str, List[str]],
+            model_directory: str,
+            description: Optional[str] = "",
+            tags: Optional[str] = None,
+            deadline: Optional[Deadline] = None,
+            progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+            show_progress_bar: bool = True,
+            compress_level: int = 6,
+            build_timeout_s: int = 900,
+            poll_policy: Optional[PollPolicy] = None
+    ) -> Tuple[str, concurrent.futures.Future]:
+        """
+        Create a new artifact and upload its files with the stages overlapped, returning as soon as the artifact
+        exists.
+
+        Once the artifact is created, the upload links of all the model files are requested at once, and the artifact
+        file and the model files are uploaded at the same time, each model file as soon as its link arrives. The build
+        is then waited for with `wait_for_artifact_ready`. All of it runs in a background thread, within `deadline`.
+
+        :param artifact_name: The name of the artifact.
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
+        :param model_directory: The path to the model directory.
+        :param description: An optional description for the artifact.
+        :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param deadline: An optional deadline shared by the creation, every upload request and the build wait.
+        :param progress_callback: Called with an `UploadProgress` as the model files are uploaded (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
+        :param build_timeout_s: The time to wait for the build once the files are uploaded, in seconds.
+        :param poll_policy: The schedule of the build status polls, see `wait_for_artifact_ready` (optional).
+        :return: The `artifact_id` of the created artifact, and a future of it resolved once the artifact is built.
+                 The future raises `UploadFileError` if a file could not be uploaded, `ArtifactBuildError` if the
+                 build failed, and `DeadlineExceededError` if the artifact is not ready in time.
+        :raises FileNotFoundError: If the artifact file does not exist.
+        """
+        with deadline if deadline is not None else contextlib.nullcontext():
+            zip_stream = self._artifact_zip_stream(artifact_file_path, compress_level)
+            model_file_paths = self._list_model_files(model_directory)
+            create_artifact_resp = self.create_artifact(artifact_name, description, tags)
+            artifact_id = create_artifact_resp.artifact_id
+            logger.info(f"Artifact created: {artifact_id}")
+            # The background thread runs in a copy of this context, so it keeps the deadline
+            context = contextvars.copy_context()
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        build = executor.submit(context.run, self._upload_artifact_files_and_wait, artifact_id,
+                                create_artifact_resp.upload_link, artifact_file_path, zip_stream, model_directory,
+                                model_file_paths, progress_callback, show_progress_bar, build_timeout_s,
+                                poll_policy)
+        executor.shutdown(wait=False)
+        return artifact_id, build
+
+    def _upload_artifact_files_and_wait(self, artifact_id: str, upload_link: str,
+                                        artifact_file_path: Union[str, List[str]], zip_stream: Optional[ZipStream],
+                                        model_directory: str, model_file_paths: List[str],
+                                        progress_callback: Optional[Callable[[UploadProgress], None]],
+                                        show_progress_bar: bool, build_timeout_s: int,
+                                        poll_policy: Optional[PollPolicy]) -> str:
+        """
+        Upload the artifact file and the model files of a new artifact at the same time, then wait for its build.
+
+        :return: The `artifact_id` of the artifact, once it is ready.
+        :raises UploadFileError: If a file could not be uploaded.
+        :raises DeadlineExceededError: If the artifact is not ready in time.
+        """
+        journal = UploadJournal(model_directory, artifact_id)
+        max_concurrency = self.upload_scheduler.max_concurrency
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency + 1) as executor:
+            artifact_upload = executor.submit(contextvars.copy_context().run, self._upload_artifact_file,
+                                              upload_link, artifact_file_path, zip_stream)
+            upload_links = {path: executor.submit(
+                contextvars.copy_context().run, self.artifact_client.get_bigfile_upload_url,
+                ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=os.path.basename(path)))
+                for path in model_file_paths if journal.lookup(path) is None}
+            summary = self._upload_model_files(artifact_id, model_file_paths, journal, max_concurrency,
+                                               progress_callback=progress_callback,
+                                               show_progress_bar=show_progress_bar, upload_links=upload_links)
+            try:
+                artifact_upload.result()
+            except Exception as e:
+                raise UploadFileError(f"Failed to upload the artifact file of {artifact_id}: {e}")
+        if summary.files_failed:
+            raise UploadFileError(f"Failed to upload {summary.files_failed} model files to {artifact_id}")
+
+        self.wait_for_artifact_ready(artifact_id, build_timeout_s, poll_policy=poll_policy)
+        return artifact_id
+
+    def wait_for_artifact_ready(self, artifact_id: str, timeout_s: int = 900,
+                                deadline: Optional[Deadline] = None,
+                                poll_policy: Optional[PollPolicy] = None) -> None:
         """
         Wait for an artifact to be ready.
 
         :param artifact_id: The ID of the artifact to wait for.
         :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the build statuses.
         :return: None
+        :raises ArtifactBuildError: If the build failed, timed out or was cancelled.
+        :raises DeadlineExceededError: If the artifact is not ready before the deadline.
         """
         start_time = time.time()
-        while True:
-            try:
-                artifact = self.get_artifact(artifact_id)
-                if artifact.build_status == BuildStatus.SUCCESS:
-                    return
-                elif artifact.build_status in [BuildStatus.FAILURE, BuildStatus.TIMEOUT, BuildStatus.CANCELLED]:
-                    raise Exception(f"Artifact build failed, status: {artifact.build_status}")
-            except Exception as e:
-                logger.error(f"Failed to get artifact, Error: {e}")
-            if time.time() - start_time > timeout_s:
-                raise Exception(f"Artifact build takes more than {timeout_s // 60} minutes. Testing aborted.")
-            time.sleep(10)
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            while True:
+                phase = None
+                try:
+                    artifact = self.get_artifact(artifact_id)
+                except Exception as e:
+                    logger.error(f"Failed to get artifact, Error: {e}")
+                else:
+                    if artifact.build_status == BuildStatus.SUCCESS:
+                        return
+                    if artifact.build_status in [BuildStatus.FAILURE, BuildStatus.TIMEOUT, BuildStatus.CANCELLED]:
+                        raise ArtifactBuildError(f"Artifact build failed, status: {artifact.build_status}")
+                    phase = artifact.build_status
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Artifact {artifact_id} is not ready after {time.time() - start_time:.0f} seconds. "
+                        f"Testing aborted.")
+                time.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
 
     
     def get_public_templates(self) -> List[Template]:
@@ -472,6 +1179,27 @@ class ArtifactManager:
         if not artifact_id or not artifact_id.strip():
             raise ValueError("Artifact ID is required and cannot be empty.")
 
+    @staticmethod
+    def _artifact_zip_stream(artifact_file_path: Union[str, List[str]], compress_level: int) -> Optional[ZipStream]:
+        """
+        Validate an artifact file, and get the zip stream to upload for a directory or a list of files.
+
+        :param artifact_file_path: The path to the artifact zip file, or a directory or a list of files.
+        :param compress_level: The deflate level (0-9) of the archive.
+        :return: The zip stream, or None for a zip file.
+        :raises ValueError: If the path is empty or not a zip file, the directory or list holds no file, or two
+                            listed files have the same name.
+        :raises FileNotFoundError: If a file or the directory does not exist.
+        """
+        if isinstance(artifact_file_path, (list, tuple)):
+            for file_path in artifact_file_path:
+                ArtifactManager._validate_file_path(file_path)
+            return ZipStream.from_files(list(artifact_file_path), compress_level)
+        if artifact_file_path and os.path.isdir(artifact_file_path):
+            return ZipStream.from_directory(artifact_file_path, compress_level)
+        ArtifactManager._validate_artifact_file_path(artifact_file_path)
+        return None
+
     @staticmethod
     def _validate_artifact_file_path(artifact_file_path: str) -> None:
         """
@@ -0,0 +1,901 @@
+import os
+import time
+import asyncio
+import contextlib
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
+import mimetypes
+
+from .._client._async_iam_client import AsyncIAMClient
+from .._client._async_artifact_client import AsyncArtifactClient
+from .._client._async_file_upload_client import AsyncFileUploadClient
+from .._client._hub_client import HubClient
+from .._constants import DEFAULT_DOWNLOAD_CONNECTIONS, MAX_CORRUPTED_UPLOAD_RETRIES
+from .._deadline import Deadline, earliest_deadline
+from .._exceptions import ArtifactBuildError, DeadlineExceededError, UploadFileError, UploadIntegrityError
+from .._poll_policy import PollPolicy
+from .._upload_journal import UploadJournal
+from .._upload_progress_tracker import UploadProgressTracker
+from .._upload_scheduler import UploadScheduler
+from .._zip_stream import ZipStream
+from .._models import *
+from .._manager._artifact_manager import ArtifactManager
+from .._manager.serve_command_utils import parse_server_command, extract_gpu_num_from_serve_command
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncArtifactManager:
+    """
+    Asyncio mirror of `ArtifactManager`, handling creation, retrieval, and file upload associated with artifacts.
+    """
+
+    def __init__(self, iam_client: AsyncIAMClient, upload_scheduler: Optional[UploadScheduler] = None):
+        """
+        Initialize the AsyncArtifactManager instance with the async IAM client.
+
+        :param iam_client: The AsyncIAMClient instance to use for authentication.
+        :param upload_scheduler: The limits shared by all uploads of this manager, defaults to `UploadScheduler()`.
+        """
+        self.iam_client = iam_client
+        self.artifact_client = AsyncArtifactClient(iam_client)
+        self.file_upload_client = AsyncFileUploadClient(iam_client.get_session())
+        self.upload_scheduler = upload_scheduler if upload_scheduler is not None else UploadScheduler()
+        # Bounds the files uploaded at the same time across all calls, like the scheduler's slots in ArtifactManager
+        self._upload_slots = asyncio.Semaphore(self.upload_scheduler.max_concurrency)
+
+    async def get_artifact(self, artifact_id: str) -> Artifact:
+        """
+        Retrieve an artifact by its ID.
+
+        :param artifact_id: The ID of the artifact to retrieve.
+        :return: The Artifact object associated with the ID.
+        :rtype: Artifact
+        :raises ValueError: If `artifact_id` is None or empty.
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+
+        return await self.artifact_client.get_artifact(artifact_id)
+
+    async def get_all_artifacts(self) -> List[Artifact]:
+        """
+        Retrieve all artifacts for a given user.
+
+        :return: A list of Artifact objects associated with the user.
+        :rtype: List[Artifact]
+        """
+        return await self.artifact_client.get_all_artifacts()
+
+    async def create_artifact(
+            self,
+            artifact_name: str,
+            description: Optional[str] = "",
+            tags: Optional[List[str]] = None,
+            deployment_type: Optional[str] = "",
+            template_id: Optional[str] = "",
+            env_parameters: Optional[List["EnvParameter"]] = None,
+            model_description: Optional[str] = "",
+            model_parameters: Optional[List["ModelParameter"]] = None,
+            artifact_volume_path: Optional[str] = "",
+    ) -> CreateArtifactResponse:
+        """
+        Create a new artifact for a user.
+
+        :param artifact_name: The name of the artifact.
+        :param description: An optional description for the artifact.
+        :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :return: A `CreateArtifactResponse` object containing information about the created artifact.
+        :rtype: CreateArtifactResponse
+        """
+        if not artifact_name or not artifact_name.strip():
+            raise ValueError("Artifact name is required and cannot be empty.")
+
+        req = CreateArtifactRequest(artifact_name=artifact_name,
+                                    artifact_description=description,
+                                    artifact_tags=tags,
+                                    deployment_type=deployment_type,
+                                    template_id=template_id,
+                                    env_parameters=env_parameters,
+                                    model_description=model_description,
+                                    model_parameters=model_parameters,
+                                    artifact_volume_path=artifact_volume_path)
+
+        return await self.artifact_client.create_artifact(req)
+
+    async def create_artifact_from_template(self, artifact_template_id: str, env_parameters: Optional[dict[str, str]] = None) -> str:
+        """
+        Create a new artifact for a user using a template.
+
+        :param artifact_template_id: The ID of the template to use for the artifact.
+        :return: The `artifact_id` of the created artifact.
+        :rtype: str
+        :raises ValueError: If `artifact_template_id` is None or empty.
+        """
+        if not artifact_template_id or not artifact_template_id.strip():
+            raise ValueError("Artifact template ID is required and cannot be empty.")
+
+    
+        resp = await self.artifact_client.create_artifact_from_template(artifact_template_id)
+        if not resp or not resp.artifact_id:
+            raise ValueError("Failed to create artifact from template.")
+
+        if env_parameters:
+            await self.artifact_client.add_env_parameters_to_artifact(resp.artifact_id, env_parameters)
+
+        return resp.artifact_id
+
+    
+    async def create_artifact_from_template_name(self, artifact_template_name: str) -> tuple[str, ReplicaResource]:
+        """
+        Create an artifact from a template.
+        :param artifact_template_name: The name of the template to use.
+        :return: A tuple containing the artifact ID and the recommended replica resources.
+        :rtype: tuple[str, ReplicaResource]
+        """
+
+        recommended_replica_resources = None
+        template_id = None
+        try:
+            templates = await self.get_public_templates()
+        except Exception as e:
+            logger.error(f"Failed to get artifact templates, Error: {e}")
+        for template in templates:
+            if template.template_data and template.template_data.name == artifact_template_name:
+                resources_template = template.template_data.resources
+                recommended_replica_resources = ReplicaResource(
+                    cpu=resources_template.cpu,
+                    ram_gb=resources_template.memory,
+                    gpu=resources_template.gpu,
+                    gpu_name=resources_template.gpu_name,
+                )
+                template_id = template.template_id
+                break
+        if not template_id:
+            raise ValueError(f"Template with name {artifact_template_name} not found.")
+        try: 
+            artifact_id = await self.create_artifact_from_template(template_id)
+            await self.wait_for_artifact_ready(artifact_id)
+            return artifact_id, recommended_replica_resources
+        except Exception as e:
+            logger.error(f"Failed to create artifact from template, Error: {e}")
+            raise e
+        
+    async def create_artifact_for_serve_command_and_custom_model(self, template_name: str, artifact_name: str, serve_command: str, gpu_type: str, artifact_description: str = "", pre_download_model: str = "", env_parameters: Optional[Dict[str, Any]] = None) -> tuple[str, ReplicaResource]:
+        """
+        Create an artifact from a template and support custom model.
+        :param artifact_template_name: The name of the template to use.
+        :return: A tuple containing the artifact ID and the recommended replica resources.
+        :rtype: tuple[str, ReplicaResource]
+        """
+
+        recommended_replica_resources = None
+        picked_template = None
+        try:
+            templates = await self.get_public_templates()
+        except Exception as e:
+            logger.error(f"Failed to get artifact templates, Error: {e}")
+        for template in templates:
+            if template.template_data and template.template_data.name == template_name:
+                picked_template = template
+                break
+        if not picked_template:
+            raise ValueError(f"Template with name {template_name} not found.")
+        
+        try:
+            if gpu_type not in ["H100", "H200"]:
+                raise ValueError("Only support H100 and H200 for now")
+            
+            type, env_vars, serve_args_dict = parse_server_command(serve_command)
+            if type.lower() not in template_name.lower():
+                raise ValueError(f"Template {template_name} does not support inference with {type}.")
+            num_gpus = extract_gpu_num_from_serve_command(serve_args_dict)
+            recommended_replica_resources = ReplicaResource(
+                cpu=num_gpus * 16,
+                ram_gb=num_gpus * 100,
+                gpu=num_gpus,
+                gpu_name=gpu_type,
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to parse serve command, Error: {e}")
+
+        try:
+            env_vars = []
+            if picked_template.template_data and picked_template.template_data.env_parameters:
+                env_vars = picked_template.template_data.env_parameters
+            env_vars_map = {param.key: param for param in env_vars}
+            if env_parameters:
+                for key, value in env_parameters.items():
+                    if key in ['GPU_TYPE', 'SERVE_COMMAND']:
+                        continue
+                    if key not in env_vars_map:
+                        new_param = EnvParameter(key=key, value=value)
+                        env_vars.append(new_param)
+                        env_vars_map[key] = new_param
+                    else:
+                        env_vars_map[key].value = value
+            env_vars.extend([
+                EnvParameter(key="SERVE_COMMAND", value=serve_command),
+                EnvParameter(key="GPU_TYPE", value=gpu_type),
+            ])
+            resp = await self.create_artifact(artifact_name, artifact_description, deployment_type="template", template_id=picked_template.template_id, env_parameters=env_vars, artifact_volume_path=f"models/{pre_download_model}")
+            # Assume Artifact is already with BuildStatus.SUCCESS status
+            return resp.artifact_id, recommended_replica_resources
+        except Exception as e:
+            logger.error(f"Failed to create artifact from template, Error: {e}")
+            raise e
+
+    async def rebuild_artifact(self, artifact_id: str) -> RebuildArtifactResponse:
+        """
+        Rebuild an existing artifact.
+
+        :param artifact_id: The ID of the artifact to rebuild.
+        :return: A `RebuildArtifactResponse` object containing information about the rebuilt artifact.
+        :rtype: RebuildArtifactResponse
+        :raises ValueError: If `artifact_id` is None or empty
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+
+        return await self.artifact_client.rebuild_artifact(artifact_id)
+
+    async def delete_artifact(self, artifact_id: str) -> DeleteArtifactResponse:
+        """
+        Delete an existing artifact.
+
+        :param artifact_id: The ID of the artifact to delete.
+        :return: A `DeleteArtifactResponse` object containing information about the deleted artifact.
+        :rtype: DeleteArtifactResponse
+        :raises ValueError: If `artifact_id` is None or empty
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+
+        return await self.artifact_client.delete_artifact(artifact_id)
+
+    async def upload_artifact_file(self, upload_link: str, artifact_file_path: Union[str, List[str]],
+                                   compress_level: int = 6) -> None:
+        """
+        Upload a file associated with an artifact.
+
+        :param upload_link: The URL to upload the artifact file.
+        :param artifact_file_path: The path to the artifact zip file, or a directory or a list of files to zip while
+                                   uploading them.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
+        :raises ValueError: If `file_path` is None or empty.
+        :raises FileNotFoundError: If the provided `file_path` does not exist.
+        """
+        zip_stream = await asyncio.to_thread(ArtifactManager._artifact_zip_stream, artifact_file_path, compress_level)
+        await self._upload_artifact_file(upload_link, artifact_file_path, zip_stream)
+
+    async def _upload_artifact_file(self, upload_link: str, artifact_file_path: Union[str, List[str]],
+                                    zip_stream: Optional[ZipStream]) -> None:
+        """
+        Upload an artifact zip file, or the zip archive of a directory or of files streamed as it is built.
+
+        :param upload_link: The URL to upload the artifact file.
+        :param artifact_file_path: The path to the artifact zip file, or a directory or a list of files.
+        :param zip_stream: The zip stream of a directory or a list of files, or None for a zip file.
+        """
+        if zip_stream is not None:
+            await self.file_upload_client.upload_zip_stream(upload_link, zip_stream, scheduler=self.upload_scheduler)
+            return
+        artifact_file_type = mimetypes.guess_type(artifact_file_path)[0]
+        await self.file_upload_client.upload_small_file(upload_link, artifact_file_path, artifact_file_type,
+                                                        scheduler=self.upload_scheduler)
+
+    async def create_artifact_with_file(
+            self,
+            artifact_name: str,
+            artifact_file_path: Union[str, List[str]],
+            description: Optional[str] = "",
+            tags: Optional[List[str]] = None,
+            compress_level: int = 6
+    ) -> str:
+        """
+        Create a new artifact for a user and upload a file associated with the artifact.
+
+        Given a directory or a list of files instead of a zip file, the zip archive is built while it is uploaded,
+        without writing it to disk. Files are compressed in parallel, and named by their path relative to the
+        directory, or by their base name.
+
+        :param artifact_name: The name of the artifact.
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
+        :param description: An optional description for the artifact.
+        :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
+        :return: The `artifact_id` of the created artifact.
+        :rtype: str
+        :raises FileNotFoundError: If the provided `file_path` does not exist.
+        """
+        zip_stream = await asyncio.to_thread(ArtifactManager._artifact_zip_stream, artifact_file_path, compress_level)
+
+        # Create the artifact
+        create_artifact_resp = await self.create_artifact(artifact_name, description, tags)
+        artifact_id = create_artifact_resp.artifact_id
+
+        await self._upload_artifact_file(create_artifact_resp.upload_link, artifact_file_path, zip_stream)
+
+        return artifact_id
+
+    async def get_bigfile_upload_url(self, artifact_id: str, model_file_path: str) -> str:
+        """
+        Generate a pre-signed URL for uploading a large file associated with an artifact.
+
+        :param artifact_id: The ID of the artifact for which the file is being uploaded.
+        :param model_file_path: The path to the model file.
+        :return: The pre-signed upload URL for the large file.
+        :rtype: str
+        :raises ValueError: If `artifact_id` is None or empty.
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+        ArtifactManager._validate_file_path(model_file_path)
+
+        model_file_name = os.path.basename(model_file_path)
+        model_file_type = mimetypes.guess_type(model_file_path)[0]
+
+        req = ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=model_file_name, file_type=model_file_type)
+
+        resp = await self.artifact_client.get_bigfile_upload_url(req)
+        if not resp or not resp.upload_link:
+            raise ValueError("Failed to get bigfile upload URL.")
+
+        return resp.upload_link
+
+    async def delete_bigfile(self, artifact_id: str, file_name: str) -> str:
+        """
+        Delete a large file associated with an artifact.
+
+        :param artifact_id: The ID of the artifact for which the file is being deleted.
+        :param file_name: The name of the file being deleted.
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+        ArtifactManager._validate_file_name(file_name)
+
+        resp = await self.artifact_client.delete_bigfile(DeleteBigfileRequest(artifact_id=artifact_id,
+                                                                              file_name=file_name))
+        if not resp or not resp.status:
+            raise ValueError("Failed to delete bigfile.")
+
+        return resp.status
+
+    async def upload_large_file(self, upload_link: str, file_path: str) -> None:
+        """
+        Upload a large file to the specified URL.
+
+        :param upload_link: The URL to upload the file.
+        :param file_path: The path to the file to upload.
+        :raises ValueError: If `file_path` is None or empty.
+        :raises ValueError: If `upload_link` is None or empty.
+        :raises FileNotFoundError: If the provided `file_path` does not exist.
+        """
+        ArtifactManager._validate_file_path(file_path)
+        ArtifactManager._validate_upload_url(upload_link)
+
+        await self.file_upload_client.upload_large_file(upload_link, file_path)
+
+
+    async def upload_model_files_to_artifact(self, artifact_id: str, model_directory: str,
+                                             max_concurrency: Optional[int] = None,
+                                             progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                             show_progress_bar: bool = True,
+                                             bundle_small_files_under: Optional[int] = None) -> None:
+        """
+        Upload model files to an existing artifact. See `ArtifactManager.upload_model_files_to_artifact` for how small
+        files are bundled.
+
+        :param artifact_id: The ID of the artifact to upload the model files to.
+        :param model_directory: The path to the model directory.
+        :param max_concurrency: The maximum number of files uploaded at the same time, defaults to the limit of
+                                the upload scheduler.
+        :param progress_callback: Called on the event loop with an `UploadProgress` whenever a file starts,
+                                  progresses, is retried, completes or fails, and once all are done (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param bundle_small_files_under: The size in bytes under which files are uploaded in a single archive
+                                         (optional; by default every file is uploaded on its own).
+        """
+        model_file_paths = ArtifactManager._list_model_files(model_directory)
+
+        # Remembers upload sessions across runs, so a rerun skips completed files and resumes partial ones
+        journal = UploadJournal(model_directory, artifact_id)
+        await self._upload_model_files(artifact_id, model_file_paths, journal, max_concurrency,
+                                       progress_callback=progress_callback, show_progress_bar=show_progress_bar,
+                                       bundle_small_files_under=bundle_small_files_under)
+
+    async def upload_hub_model_to_artifact(self, artifact_id: str, repo_id: str, revision: str = "main",
+                                           allow_patterns: Optional[List[str]] = None,
+                                           ignore_patterns: Optional[List[str]] = None,
+                                           token: Optional[str] = None, endpoint: Optional[str] = None,
+                                           max_concurrency: Optional[int] = None,
+                                           progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                           show_progress_bar: bool = True) -> None:
+        """
+        Upload the files of a Hugging Face Hub model repository to an existing artifact, without staging them on disk.
+        See `ArtifactManager.upload_hub_model_to_artifact`; the hub is read from worker threads.
+
+        :param artifact_id: The ID of the artifact to upload the model files to.
+        :param repo_id: The ID of the repository, e.g. `deepseek-ai/DeepSeek-R1-Distill-Qwen-1.5B`.
+        :param revision: The branch, tag or commit to upload.
+        :param allow_patterns: Only files whose path matches one of these glob patterns are uploaded (optional).
+        :param ignore_patterns: Files whose path matches one of these glob patterns are not uploaded (optional).
+        :param token: The access token for private and gated repositories, defaults to the `HF_TOKEN` environment
+                      variable.
+        :param endpoint: The URL of the hub, defaults to the `HF_ENDPOINT` environment variable or the Hugging Face Hub.
+        :param max_concurrency: The maximum number of blobs uploaded at the same time, defaults to the limit of the
+                                upload scheduler.
+        :param progress_callback: Called with an `UploadProgress` whenever a file starts, progresses, is retried,
+                                  completes or fails, and once all are done (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :raises ValueError: If `artifact_id` is empty or the files of the repository cannot be listed.
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+        hub_files = await asyncio.to_thread(HubClient(endpoint, token).get_repo_files, repo_id, revision,
+                                            allow_patterns, ignore_patterns)
+        if hub_files is None:
+            raise ValueError(f"Failed to list the files of {repo_id}.")
+        blobs = ArtifactManager._group_hub_files_by_blob(hub_files)
+        file_sizes = {hub_file.path: hub_file.size for hub_file in hub_files}
+        semaphore = asyncio.Semaphore(max_concurrency or self.upload_scheduler.max_concurrency)
+
+        async def upload_hub_file(hub_file):
+            def record_offset(offset):
+                progress.bytes_confirmed(hub_file.path, offset)
+
+            def record_retry():
+                progress.retry(hub_file.path)
+
+            corrupted_uploads = 0
+            async with self._upload_slots:
+                try:
+                    while True:
+                        upload_link = (await self.artifact_client.get_bigfile_upload_url(
+                            ResumableUploadLinkRequest(artifact_id=artifact_id,
+                                                       file_name=os.path.basename(hub_file.path))
+                        )).upload_link
+                        progress.file_started(hub_file.path)
+                        try:
+                            await self.file_upload_client.upload_large_file(upload_link, hub_file,
+                                                                            on_chunk_uploaded=record_offset,
+                                                                            scheduler=self.upload_scheduler,
+                                                                            on_retry=record_retry)
+                        except UploadIntegrityError as e:
+                            corrupted_uploads += 1
+                            if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                                raise
+                            logger.error(f"{e}, uploading it again")
+                            record_retry()
+                        else:
+                            progress.file_completed(hub_file.path)
+                            return
+                except Exception as e:
+                    logger.error(f"Failed to upload file {hub_file}, Error: {e}")
+                    progress.file_failed(hub_file.path)
+
+        async def upload_blob(same_files):
+            # Files holding the same blob are uploaded side by side, so that they read one download. Each takes an
+            # upload slot of its own; one left waiting for a slot reads the blob again once it falls behind the window
+            async with semaphore:
+                await asyncio.gather(*(upload_hub_file(hub_file) for hub_file in same_files))
+
+        with ArtifactManager._upload_progress_bar(show_progress_bar) as update_progress_bar:
+            progress = UploadProgressTracker(file_sizes, [update_progress_bar, progress_callback])
+            await asyncio.gather(*(upload_blob(same_files) for same_files in blobs))
+            summary = progress.finish()
+        logger.info(f"Uploaded {summary.files_completed}/{summary.total_files} files of {repo_id} "
+                    f"({summary.bytes_uploaded:,}/{summary.total_bytes:,} bytes) in {summary.elapsed_seconds:.1f}s, "
+                    f"{summary.files_failed} failed, {summary.retries} retries")
+
+    async def download_artifact_files(self, artifact_id: str, target_directory: str,
+                                      file_names: Optional[List[str]] = None, headers: Optional[dict] = None,
+                                      max_concurrency: int = 2,
+                                      max_connections_per_file: int = DEFAULT_DOWNLOAD_CONNECTIONS,
+                                      verify_checksums: bool = True, use_mmap: bool = False) -> List[str]:
+        """
+        Download the big files of an artifact to a local directory, each with parallel range requests, in a worker
+        thread. See `ArtifactManager.download_artifact_files`.
+
+        :param artifact_id: The ID of the artifact to download the files of.
+        :param target_directory: The directory to save the files to, under their file name.
+        :param file_names: Only the files with these names are downloaded (optional, defaults to all files).
+        :param headers: Extra request headers for the storage service, e.g. for authorization (optional).
+        :param max_concurrency: The maximum number of files downloaded at the same time.
+        :param max_connections_per_file: The maximum number of range requests per file at the same time.
+        :param verify_checksums: Whether to check the downloaded files against the hashes reported by Google Storage.
+        :param use_mmap: Whether to write the files through a memory map instead of positioned writes.
+        :return: The paths of the files downloaded.
+        :raises ValueError: If `artifact_id` is empty, the artifact cannot be found or a requested file is not in it.
+        """
+        ArtifactManager._validate_artifact_id(artifact_id)
+        artifact = await self.get_artifact(artifact_id)
+        if artifact is None:
+            raise ValueError(f"Failed to get artifact {artifact_id}.")
+        return await asyncio.to_thread(ArtifactManager._download_big_files, artifact.big_files_metadata or [],
+                                       target_directory, file_names, headers, max_concurrency,
+                                       max_connections_per_file, verify_checksums, use_mmap)
+
+    async def plan_model_files_sync(self, artifact_id: str, model_directory: str, delete_missing: bool = False,
+                                    max_concurrency: Optional[int] = None) -> ModelSyncPlan:
+        """
+        Work out which model files must be uploaded to bring an artifact in line with a local model directory,
+        without changing anything. See `ArtifactManager.plan_model_files_sync`.
+
+        :param artifact_id: The ID of the artifact to sync.
+        :param model_directory: The path to the model directory.
+        :param delete_missing: Whether artifact files missing from the directory should be deleted.
+        :param max_concurrency: The maximum number of files hashed at the same time, defaults to the limit of
+                                the upload scheduler.
+        :return: The sync plan.
+        """
+        artifact = await self.get_artifact(artifact_id)
+        journal = UploadJournal(model_directory, artifact_id)
+        model_file_paths = ArtifactManager._list_model_files(model_directory)
+        file_hashes = await asyncio.to_thread(ArtifactManager._hash_model_files, journal, model_file_paths,
+                                              max_concurrency or self.upload_scheduler.max_concurrency)
+        return ArtifactManager._plan_model_files_sync(artifact, journal, file_hashes, delete_missing)
+
+    async def sync_model_files_to_artifact(self, artifact_id: str, model_directory: str, delete_missing: bool = False,
+                                           dry_run: bool = False,
+                                           max_concurrency: Optional[int] = None,
+                                           progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                           show_progress_bar: bool = True) -> ModelSyncPlan:
+        """
+        Upload only the new or changed files of a model directory to an artifact, as planned by
+        `plan_model_files_sync`. The plan is logged before anything is transferred.
+
+        :param artifact_id: The ID of the artifact to sync.
+        :param model_directory: The path to the model directory.
+        :param delete_missing: Whether artifact files missing from the directory should be deleted.
+        :param dry_run: Whether to only log and return the plan.
+        :param max_concurrency: The maximum number of files hashed or uploaded at the same time, defaults to the
+                                limit of the upload scheduler.
+        :param progress_callback: Called with an `UploadProgress` as the files are uploaded, see
+                                  `upload_model_files_to_artifact` (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :return: The executed (or, with `dry_run`, planned) sync.
+        """
+        artifact = await self.get_artifact(artifact_id)
+        journal = UploadJournal(model_directory, artifact_id)
+        model_file_paths = ArtifactManager._list_model_files(model_directory)
+        file_hashes = await asyncio.to_thread(ArtifactManager._hash_model_files, journal, model_file_paths,
+                                              max_concurrency or self.upload_scheduler.max_concurrency)
+        plan = ArtifactManager._plan_model_files_sync(artifact, journal, file_hashes, delete_missing)
+        ArtifactManager._log_sync_plan(plan)
+        if dry_run:
+            return plan
+
+        for file_path in plan.files_to_upload:
+            entry = journal.lookup(file_path)
+            if entry and entry["completed"]:
+                # The journal says it was uploaded, but the artifact no longer holds it
+                journal.discard(file_path)
+        await self._upload_model_files(artifact_id, plan.files_to_upload, journal, max_concurrency, file_hashes,
+                                       progress_callback, show_progress_bar)
+        for file_name in plan.files_to_delete:
+            await self.delete_bigfile(artifact_id, file_name)
+            logger.info(f"Deleted {file_name} from artifact {artifact_id}")
+        return plan
+
+    async def _upload_model_files(self, artifact_id: str, model_file_paths: List[str], journal: UploadJournal,
+                                  max_concurrency: Optional[int], file_hashes: Optional[Dict[str, str]] = None,
+                                  progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+                                  show_progress_bar: bool = True,
+                                  bundle_small_files_under: Optional[int] = None,
+                                  upload_links: Optional[Dict[str, asyncio.Task]] = None) -> UploadProgress:
+        """
+        Upload model files to an artifact concurrently, skipping and resuming files as recorded in the journal.
+
+        :param artifact_id: The ID of the artifact to upload the model files to.
+        :param model_file_paths: The paths of the files to upload.
+        :param journal: The upload journal of the model directory.
+        :param max_concurrency: The maximum number of files uploaded at the same time by this call, defaults to the
+                                limit of the upload scheduler, which also bounds all the uploads of this manager.
+        :param file_hashes: The SHA-256 of the files, recorded in the journal once uploaded (optional).
+        :param progress_callback: Called with every `UploadProgress` report (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param bundle_small_files_under: The size in bytes under which files are uploaded in a single archive
+                                         (optional).
+        :param upload_links: The upload links already being requested for files without a saved session, by path
+                             (optional).
+        :return: The final progress report.
+        """
+        file_hashes = file_hashes or {}
+        upload_links = upload_links or {}
+        bundle = None
+        if bundle_small_files_under:
+            # Bundling hashes the small files
+            model_file_paths, bundle = await asyncio.to_thread(ArtifactManager._bundle_small_files, journal,
+                                                               model_file_paths, bundle_small_files_under)
+        # Largest first, so that the longest upload does not start last
+        model_file_paths = self.upload_scheduler.order_largest_first(model_file_paths)
+        file_sizes = {path: os.path.getsize(path) for path in model_file_paths if os.path.isfile(path)}
+        if bundle is not None:
+            file_sizes[bundle.name] = bundle.size
+        semaphore = asyncio.Semaphore(max_concurrency or self.upload_scheduler.max_concurrency)
+
+        async def upload_model_file(model_file_path):
+            def record_offset(offset):
+                journal.record_offset(model_file_path, offset)
+                progress.bytes_confirmed(model_file_path, offset)
+
+            def record_retry():
+                progress.retry(model_file_path)
+
+            entry = journal.lookup(model_file_path)
+            if entry and entry["completed"]:
+                logger.info(f"File {model_file_path} was already uploaded, skipping")
+                progress.file_skipped(model_file_path)
+                return
+            if entry:
+                logger.info(f"Resuming upload of {model_file_path} from its saved session "
+                            f"({entry['offset']:,} bytes confirmed)")
+            upload_link = entry["upload_link"] if entry else None
+            if upload_link is None and model_file_path in upload_links:
+                upload_link = (await upload_links.pop(model_file_path)).upload_link
+                journal.start(model_file_path, upload_link)
+            corrupted_uploads = 0
+            while True:
+                if upload_link is None:
+                    bigfile_upload_url_resp = await self.artifact_client.get_bigfile_upload_url(
+                        ResumableUploadLinkRequest(artifact_id=artifact_id,
+                                                   file_name=os.path.basename(model_file_path))
+                    )
+                    upload_link = bigfile_upload_url_resp.upload_link
+                    journal.start(model_file_path, upload_link)
+                    entry = None
+                progress.file_started(model_file_path, entry["offset"] if entry else 0)
+                try:
+                    await self.file_upload_client.upload_large_file(upload_link, model_file_path,
+                                                                    on_chunk_uploaded=record_offset,
+                                                                    scheduler=self.upload_scheduler,
+                                                                    on_retry=record_retry)
+                except UploadIntegrityError as e:
+                    corrupted_uploads += 1
+                    if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                        raise
+                    logger.error(f"{e}, uploading it again")
+                except UploadFileError as e:
+                    if entry is None:
+                        raise
+                    logger.warning(f"Saved upload session of {model_file_path} is no longer usable, "
+                                   f"starting over: {e}")
+                else:
+                    journal.complete(model_file_path, file_hashes.get(model_file_path))
+                    progress.file_completed(model_file_path)
+                    return
+                record_retry()
+                upload_link = None
+
+        async def upload_file(model_file_path):
+            async with semaphore, self._upload_slots:
+                try:
+                    ArtifactManager._validate_file_path(model_file_path)
+                    await upload_model_file(model_file_path)
+                except Exception as e:
+                    logger.error(f"Failed to upload file {model_file_path}, Error: {e}")
+                    progress.file_failed(model_file_path)
+
+        async def upload_bundle():
+            def record_offset(offset):
+                progress.bytes_confirmed(bundle.name, offset)
+
+            def record_retry():
+                progress.retry(bundle.name)
+
+            corrupted_uploads = 0
+            async with semaphore, self._upload_slots:
+                try:
+                    while True:
+                        upload_link = (await self.artifact_client.get_bigfile_upload_url(
+                            ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=bundle.name)
+                        )).upload_link
+                        progress.file_started(bundle.name)
+                        try:
+                            await self.file_upload_client.upload_large_file(upload_link, bundle,
+                                                                            on_chunk_uploaded=record_offset,
+                                                                            scheduler=self.upload_scheduler,
+                                                                            on_retry=record_retry)
+                        except UploadIntegrityError as e:
+                            corrupted_uploads += 1
+                            if corrupted_uploads > MAX_CORRUPTED_UPLOAD_RETRIES:
+                                raise
+                            logger.error(f"{e}, uploading it again")
+                            record_retry()
+                        else:
+                            journal.complete_bundled({path: entry["sha256"] for path, entry in
+                                                      zip(bundle.file_paths, bundle.manifest["files"])},
+                                                     upload_link, bundle.name)
+                            progress.file_completed(bundle.name)
+                            return
+                except Exception as e:
+                    logger.error(f"Failed to upload file {bundle.name}, Error: {e}")
+                    progress.file_failed(bundle.name)
+
+        # Upload files concurrently on the event loop with progress bar
+        with ArtifactManager._upload_progress_bar(show_progress_bar) as update_progress_bar:
+            progress = UploadProgressTracker(file_sizes, [update_progress_bar, progress_callback])
+            await asyncio.gather(*(upload_file(path) for path in model_file_paths),
+                                 *([upload_bundle()] if bundle is not None else []))
+            summary = progress.finish()
+        logger.info(f"Uploaded {summary.files_completed}/{summary.total_files} model files "
+                    f"({summary.bytes_uploaded:,}/{summary.total_bytes:,} bytes) in {summary.elapsed_seconds:.1f}s, "
+                    f"{summary.files_failed} failed, {summary.retries} retries")
+        return summary
+
+    async def create_artifact_with_model_files(
+            self,
+            artifact_name: str,
+            artifact_file_path: Union[str, List[str]],
+            model_directory: str,
+            description: Optional[str] = "",
+            tags: Optional[str] = None,
+            deadline: Optional[Deadline] = None,
+            progress_callback: Optional[Callable[[UploadProgress], None]] = None
+    ) -> str:
+        """
+        Create a new artifact for a user and upload model files associated with the artifact.
+        :param artifact_name: The name of the artifact.
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
+        :param model_directory: The path to the model directory.
+        :param description: An optional description for the artifact.
+        :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param deadline: An optional deadline shared by the creation and every upload request.
+        :param progress_callback: Called with an `UploadProgress` as the model files are uploaded (optional).
+        :return: The `artifact_id` of the created artifact.
+        """
+        with deadline if deadline is not None else contextlib.nullcontext():
+            artifact_id = await self.create_artifact_with_file(artifact_name, artifact_file_path, description, tags)
+            logger.info(f"Artifact created: {artifact_id}")
+
+            await self.upload_model_files_to_artifact(artifact_id, model_directory,
+                                                      progress_callback=progress_callback)
+
+        return artifact_id
+
+
+    async def create_artifact_with_model_files_pipelined(
+            self,
+            artifact_name: str,
+            artifact_file_path: Union[str, List[str]],
+            model_directory: str,
+            description: Optional[str] = "",
+            tags: Optional[str] = None,
+            deadline: Optional[Deadline] = None,
+            progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+            show_progress_bar: bool = True,
+            compress_level: int = 6,
+            build_timeout_s: int = 900,
+            poll_policy: Optional[PollPolicy] = None
+    ) -> Tuple[str, asyncio.Task]:
+        """
+        Create a new artifact and upload its files with the stages overlapped, returning as soon as the artifact
+        exists. See `ArtifactManager.create_artifact_with_model_files_pipelined`.
+
+        :param artifact_name: The name of the artifact.
+        :param artifact_file_path: The path to the artifact file(Dockerfile+serve.py), or a directory or a list of
+                                   files to zip while uploading them.
+        :param model_directory: The path to the model directory.
+        :param description: An optional description for the artifact.
+        :param tags: Optional tags associated with the artifact, as a comma-separated string.
+        :param deadline: An optional deadline shared by the creation, every upload request and the build wait.
+        :param progress_callback: Called with an `UploadProgress` as the model files are uploaded (optional).
+        :param show_progress_bar: Whether to show a progress bar of the bytes uploaded, if `tqdm` is installed.
+        :param compress_level: The deflate level (0-9) of the archive built from a directory or a list of files.
+        :param build_timeout_s: The time to wait for the build once the files are uploaded, in seconds.
+        :param poll_policy: The schedule of the build status polls, see `wait_for_artifact_ready` (optional).
+        :return: The `artifact_id` of the created artifact, and a task returning it once the artifact is built. The
+                 task raises `UploadFileError` if a file could not be uploaded, `ArtifactBuildError` if the build
+                 failed, and `DeadlineExceededError` if the artifact is not ready in time.
+        :raises FileNotFoundError: If the artifact file does not exist.
+        """
+        with deadline if deadline is not None else contextlib.nullcontext():
+            zip_stream = await asyncio.to_thread(ArtifactManager._artifact_zip_stream, artifact_file_path,
+                                                 compress_level)
+            model_file_paths = await asyncio.to_thread(ArtifactManager._list_model_files, model_directory)
+            create_artifact_resp = await self.create_artifact(artifact_name, description, tags)
+            artifact_id = create_artifact_resp.artifact_id
+            logger.info(f"Artifact created: {artifact_id}")
+            # Tasks run in a copy of the current context, so the build task keeps the deadline
+            build = asyncio.create_task(self._upload_artifact_files_and_wait(
+                artifact_id, create_artifact_resp.upload_link, artifact_file_path, zip_stream, model_directory,
+                model_file_paths, progress_callback, show_progress_bar, build_timeout_s, poll_policy))
+        return artifact_id, build
+
+    async def _upload_artifact_files_and_wait(self, artifact_id: str, upload_link: str,
+                                              artifact_file_path: Union[str, List[str]],
+                                              zip_stream: Optional[ZipStream], model_directory: str,
+                                              model_file_paths: List[str],
+                                              progress_callback: Optional[Callable[[UploadProgress], None]],
+                                              show_progress_bar: bool, build_timeout_s: int,
+                                              poll_policy: Optional[PollPolicy]) -> str:
+        """
+        Upload the artifact file and the model files of a new artifact at the same time, then wait for its build.
+
+        :return: The `artifact_id` of the artifact, once it is ready.
+        :raises UploadFileError: If a file could not be uploaded.
+        :raises DeadlineExceededError: If the artifact is not ready in time.
+        """
+        journal = UploadJournal(model_directory, artifact_id)
+        artifact_upload = asyncio.create_task(self._upload_artifact_file(upload_link, artifact_file_path, zip_stream))
+        upload_links = {path: asyncio.create_task(self.artifact_client.get_bigfile_upload_url(
+            ResumableUploadLinkRequest(artifact_id=artifact_id, file_name=os.path.basename(path))))
+            for path in model_file_paths if journal.lookup(path) is None}
+        try:
+            summary = await self._upload_model_files(artifact_id, model_file_paths, journal, None,
+                                                     progress_callback=progress_callback,
+                                                     show_progress_bar=show_progress_bar, upload_links=upload_links)
+        finally:
+            for task in upload_links.values():
+                task.cancel()
+        try:
+            await artifact_upload
+        except Exception as e:
+            raise UploadFileError(f"Failed to upload the artifact file of {artifact_id}: {e}")
+        if summary.files_failed:
+            raise UploadFileError(f"Failed to upload {summary.files_failed} model files to {artifact_id}")
+
+        await self.wait_for_artifact_ready(artifact_id, build_timeout_s, poll_policy=poll_policy)
+        return artifact_id
+
+    async def wait_for_artifact_ready(self, artifact_id: str, timeout_s: int = 900,
+                                      deadline: Optional[Deadline] = None,
+                                      poll_policy: Optional[PollPolicy] = None) -> None:
+        """
+        Wait for an artifact to be ready.
+
+        :param artifact_id: The ID of the artifact to wait for.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the build statuses.
+        :return: None
+        :raises ArtifactBuildError: If the build failed, timed out or was cancelled.
+        :raises DeadlineExceededError: If the artifact is not ready before the deadline.
+        """
+        start_time = time.time()
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            while True:
+                phase = None
+                try:
+                    artifact = await self.get_artifact(artifact_id)
+                except Exception as e:
+                    logger.error(f"Failed to get artifact, Error: {e}")
+                else:
+                    if artifact.build_status == BuildStatus.SUCCESS:
+                        return
+                    if artifact.build_status in [BuildStatus.FAILURE, BuildStatus.TIMEOUT, BuildStatus.CANCELLED]:
+                        raise ArtifactBuildError(f"Artifact build failed, status: {artifact.build_status}")
+                    phase = artifact.build_status
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Artifact {artifact_id} is not ready after {time.time() - start_time:.0f} seconds. "
+                        f"Testing aborted.")
+                await asyncio.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+
+    
+    async def get_public_templates(self) -> List[Template]:
+        """
+        Fetch all artifact templates.
+
+        :return: A list of Template objects.
+        :rtype: List[Template]
+        """
+        return await self.artifact_client.get_public_templates()
+        
+
+    async def list_public_template_names(self) -> list[str]:
+        """
+        List all public templates.
+
+        :return: A list of template names.
+        :rtype: list[str]
+        """
+        template_names = []
+        try: 
+            templates = await self.get_public_templates()
+            for template in templates:
+                if template.template_data and template.template_data.name:
+                    template_names.append(template.template_data.name)
+            return template_names
+        except Exception as e:
+            logger.error(f"Failed to get artifact templates, Error: {e}")
+            return []
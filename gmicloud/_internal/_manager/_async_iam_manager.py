@@ -0,0 +1,35 @@
+from datetime import datetime
+from .._client._async_iam_client import AsyncIAMClient
+from .._models import *
+
+
+class AsyncIAMManager:
+    """
+    Asyncio mirror of `IAMManager`, handling operations related to IAM.
+    """
+
+    def __init__(self, iam_client: AsyncIAMClient):
+        """
+        Initialize the AsyncIAMManager instance and the associated AsyncIAMClient.
+        """
+        self.iam_client = iam_client
+
+    async def create_org_api_key(self, name: str, expires_at: Optional[int] = None) -> str:
+        """
+        Creates a new API key for the current user.
+        """
+
+        if not name:
+            raise ValueError("API key name cannot be empty")
+        if not expires_at:
+            # Set the expiration date to 30 days from now
+            expires_at = int(datetime.now().timestamp()) + 30 * 24 * 60 * 60
+
+        return await self.iam_client.create_org_api_key(
+            CreateAPIKeyRequest(name=name, scope="ie_model", expiresAt=expires_at))
+
+    async def get_org_api_keys(self) -> List[APIKey]:
+        """
+        Fetches all API keys for the current user.
+        """
+        return (await self.iam_client.get_org_api_keys()).keys
@@ -0,0 +1,377 @@
+from .._client._async_iam_client import AsyncIAMClient
+from .._client._async_task_client import AsyncTaskClient
+from .._deadline import Deadline, earliest_deadline
+from .._exceptions import DeadlineExceededError
+from .._poll_policy import PollPolicy
+from .._models import *
+from .._manager._task_manager import TaskManager
+
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+class AsyncTaskManager:
+    """
+    Asyncio mirror of `TaskManager`, handling creation, scheduling, and stopping of tasks.
+    """
+
+    def __init__(self, iam_client: AsyncIAMClient):
+        """
+        Initialize the AsyncTaskManager instance and the associated AsyncTaskClient.
+
+        :param iam_client: The AsyncIAMClient instance used for authentication
+        """
+        self.iam_client = iam_client
+        self.task_client = AsyncTaskClient(iam_client)
+        # Holds the pollers of `wait_for_tasks` until they finish, as the event loop only keeps weak references
+        self._task_pollers = set()
+
+    async def get_task(self, task_id: str) -> Task:
+        """
+        Retrieve a task by its ID.
+
+        :param task_id: The ID of the task to retrieve.
+        :return: A `Task` object containing the details of the task.
+        :raises ValueError: If `task_id` is invalid (None or empty string).
+        """
+        TaskManager._validate_not_empty(task_id, "Task ID")
+
+        return await self.task_client.get_task(task_id)
+
+    async def get_all_tasks(self) -> List[Task]:
+        """
+        Retrieve a list of all tasks available in the system.
+
+        :return: A list of `Task` objects.
+        """
+        resp = await self.task_client.get_all_tasks()
+        if not resp or not resp.tasks:
+            return []
+
+        return resp.tasks
+
+    async def create_task(self, task: Task) -> Task:
+        """
+        Create a new task.
+
+        :param task: A `Task` object containing the details of the task to be created.
+        :return: A `Task` object containing the details of the created task.
+        :rtype: Task
+        :raises ValueError: If `task` is None or its owner cannot be resolved.
+        """
+        TaskManager._validate_task(task)
+        if not task.owner:
+            # A lazily created client only knows the user once logged in, and an API key once its profile is fetched
+            if not await self.iam_client.ensure_profile():
+                raise ValueError("Failed to resolve the user ID of the task owner.")
+            task.owner = TaskOwner(user_id=self.iam_client.get_user_id())
+        resp = await self.task_client.create_task(task)
+        if not resp or not resp.task:
+            raise ValueError("Failed to create task.")
+
+        logger.info(f"Task created: {resp.task.task_id}")
+        return resp.task
+    
+    async def create_task_from_artifact_id(self, artifact_id: str, replica_resource: ReplicaResource, task_scheduling: TaskScheduling) -> Task:
+        """
+        Create a new task using the configuration data from a file.
+        """
+        # Create Task based on Artifact
+        new_task = Task(
+            config=TaskConfig(
+                ray_task_config=RayTaskConfig(
+                    artifact_id=artifact_id,
+                    file_path="serve",
+                    deployment_name="app",
+                    replica_resource=replica_resource,
+                ),
+                task_scheduling = task_scheduling,
+            ),
+        )
+        return (await self.create_task(new_task)).task_id
+
+    async def create_task_from_file(self, artifact_id: str, config_file_path: str, trigger_timestamp: int = None) -> Task:
+        """
+        Create a new task using the configuration data from a file.
+
+        :param artifact_id: The ID of the artifact to be used in the task.
+        :param config_file_path: The path to the file containing the task configuration data.
+        :param trigger_timestamp: Optional, for one-off scheduling.
+        :return: A `Task` object containing the details of the created task.
+        :rtype: Task
+        :raises ValueError: If the `file_path` is invalid or the file cannot be read.
+        """
+        TaskManager._validate_not_empty(artifact_id, "Artifact ID")
+        TaskManager._validate_file_path(config_file_path)
+
+        task = TaskManager._read_file_and_parse_task(config_file_path)
+        task.config.ray_task_config.artifact_id = artifact_id
+
+        if trigger_timestamp:
+            task.config.task_scheduling.scheduling_oneoff.trigger_timestamp = trigger_timestamp
+
+        return await self.create_task(task)
+
+    async def update_task_schedule(self, task: Task) -> bool:
+        """
+        Update the schedule of an existing task.
+
+        :param task: A `Task` object containing the updated schedule details.
+        :return: None
+        :raises ValueError: If `task` is None.
+        """
+        TaskManager._validate_task(task)
+        TaskManager._validate_not_empty(task.task_id, "Task ID")
+
+        return await self.task_client.update_task_schedule(task)
+
+    async def update_task_schedule_from_file(self, artifact_id: str, task_id: str, config_file_path: str,
+                                       trigger_timestamp: int = None) -> bool:
+        """
+        Update the schedule of an existing task using data from a file. The file should contain a valid task definition.
+
+        :param artifact_id: The ID of the artifact to be used in the task.
+        :param task_id: The ID of the task to update.
+        :param config_file_path: The path to the file containing the task configuration data.
+        :param trigger_timestamp: Optional, for one-off scheduling.
+        :return: None
+        :raises ValueError: If the `file_path` is invalid or the file cannot be read.
+        """
+        TaskManager._validate_not_empty(artifact_id, "Artifact ID")
+        TaskManager._validate_not_empty(task_id, "Task ID")
+        TaskManager._validate_file_path(config_file_path)
+
+        task = TaskManager._read_file_and_parse_task(config_file_path)
+        task.task_id = task_id
+        task.config.ray_task_config.artifact_id = artifact_id
+
+        if trigger_timestamp:
+            task.config.task_scheduling.scheduling_oneoff.trigger_timestamp = trigger_timestamp
+
+        return await self.update_task_schedule(task)
+
+    async def start_task(self, task_id: str) -> bool:
+        """
+        Start a task by its ID.
+
+        :param task_id: The ID of the task to be started.
+        :return: None
+        :raises ValueError: If `task_id` is invalid (None or empty string).
+        """
+        TaskManager._validate_not_empty(task_id, "Task ID")
+
+        return await self.task_client.start_task(task_id)
+    
+
+    async def wait_for_task(self, task_id: str, timeout_s: int = 900, deadline: Optional[Deadline] = None,
+                            poll_policy: Optional[PollPolicy] = None) -> Task:
+        """
+        Wait for a task to reach the RUNNING state or raise an exception if it fails.
+
+        :param task_id: The ID of the task to wait for.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the task statuses,
+                            and `PollPolicy.ENDPOINT_PENDING` once the task runs but its endpoint is not ready yet.
+        :return: The task object.
+        :rtype: Task
+        :raises ValueError: If the task is stopping or archived.
+        :raises DeadlineExceededError: If the task is not running before the deadline.
+        """
+        start_time = time.time()
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            while True:
+                phase = None
+                try:
+                    task = await self.get_task(task_id)
+                except Exception as e:
+                    logger.error(f"Failed to get task, Error: {e}")
+                else:
+                    if TaskManager._is_task_ready(task):
+                        return task
+                    logger.info(f"Pending task starting. Task status: {task.task_status}")
+                    phase = PollPolicy.ENDPOINT_PENDING if task.task_status == TaskStatus.RUNNING else task.task_status
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Task {task_id} is not running after {time.time() - start_time:.0f} seconds. Testing aborted.")
+                await asyncio.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+
+    async def start_task_and_wait(self, task_id: str, timeout_s: int = 3600,
+                                  deadline: Optional[Deadline] = None,
+                                  poll_policy: Optional[PollPolicy] = None) -> Task:
+        """
+        Start a task and wait for it to be ready.
+
+        :param task_id: The ID of the task to start.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; starting and waiting share one time budget.
+        :param poll_policy: The schedule of the polls, see `wait_for_task` (optional).
+        :return: The task object.
+        :rtype: Task
+        """
+        deadline = earliest_deadline(timeout_s, deadline)
+        with deadline:
+            try:
+                await self.start_task(task_id)
+                logger.info(f"Started task ID: {task_id}")
+            except Exception as e:
+                logger.error(f"Failed to start task, Error: {e}")
+                raise e
+
+            return await self.wait_for_task(task_id, timeout_s, deadline, poll_policy)
+
+    async def stop_task(self, task_id: str) -> bool:
+        """
+        Stop a task by its ID.
+
+        :param task_id: The ID of the task to be stopped.
+        :return: None
+        :raises ValueError: If `task_id` is invalid (None or empty string).
+        """
+        TaskManager._validate_not_empty(task_id, "Task ID")
+        return await self.task_client.stop_task(task_id)
+
+        
+    async def stop_task_and_wait(self, task_id: str, timeout_s: int = 3600, deadline: Optional[Deadline] = None,
+                                 poll_policy: Optional[PollPolicy] = None):
+        """
+        Stop a task and wait for it to become idle.
+
+        :param task_id: The ID of the task to stop.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; stopping and waiting share one time budget.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the task statuses.
+        :raises DeadlineExceededError: If the task is not idle before the deadline.
+        """
+        start_time = time.time()
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            try:
+                await self.stop_task(task_id)
+                logger.info(f"Stopping task ID: {task_id}")
+            except Exception as e:
+                logger.error(f"Failed to stop task, Error: {e}")
+            while True:
+                phase = None
+                try:
+                    task = await self.get_task(task_id)
+                    if task.task_status == TaskStatus.IDLE:
+                        break
+                    phase = task.task_status
+                except Exception as e:
+                    logger.error(f"Failed to get task, Error: {e}")
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Task {task_id} is not idle after {time.time() - start_time:.0f} seconds. Testing aborted.")
+                await asyncio.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+
+    async def wait_for_tasks(self, task_ids: List[str], condition: Optional[Callable[[Task], bool]] = None,
+                             timeout_s: int = 900, deadline: Optional[Deadline] = None,
+                             poll_policy: Optional[PollPolicy] = None) -> Dict[str, asyncio.Future]:
+        """
+        Wait for many tasks at once, polling the task list once per interval instead of every task on its own. See
+        `TaskManager.wait_for_tasks`; use `asyncio.as_completed` on the futures to handle the tasks in the order they
+        complete. Cancelling a future stops watching its task.
+
+        :param task_ids: The IDs of the tasks to wait for.
+        :param condition: Whether a task is done; it may raise to fail the task. Defaults to the task running with its
+                          endpoint ready, failing tasks that stop, like `wait_for_task`.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`.
+        :return: A future per task ID, resolved with the task once it meets the condition, or failed with the error
+                 raised by the condition or `DeadlineExceededError`.
+        :raises ValueError: If a task ID is empty.
+        """
+        for task_id in task_ids:
+            TaskManager._validate_not_empty(task_id, "Task ID")
+        loop = asyncio.get_running_loop()
+        futures = {task_id: loop.create_future() for task_id in task_ids}
+        poller = asyncio.create_task(self._poll_tasks(futures, condition or TaskManager._is_task_ready,
+                                                      earliest_deadline(timeout_s, deadline), poll_policy))
+        self._task_pollers.add(poller)
+        poller.add_done_callback(self._task_pollers.discard)
+        return futures
+
+    async def _poll_tasks(self, futures: Dict[str, asyncio.Future], condition: Callable[[Task], bool],
+                          deadline: Deadline, poll_policy: Optional[PollPolicy]) -> None:
+        """
+        Poll the task list until the futures of all tasks are resolved or the deadline expires.
+
+        :param futures: The future of every task, by task ID.
+        :param condition: Whether a task is done.
+        :param deadline: The deadline of the wait.
+        :param poll_policy: The schedule of the polls (optional).
+        """
+        start_time = time.time()
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            try:
+                while True:
+                    phase = None
+                    try:
+                        phase = TaskManager._resolve_task_futures(await self.get_all_tasks(), futures, condition)
+                    except Exception as e:
+                        logger.error(f"Failed to get tasks, Error: {e}")
+                    pending = [task_id for task_id, future in futures.items() if not future.done()]
+                    if not pending:
+                        return
+                    if deadline.expired():
+                        for task_id in pending:
+                            futures[task_id].set_exception(DeadlineExceededError(
+                                f"Task {task_id} is not ready after {time.time() - start_time:.0f} seconds."))
+                        return
+                    logger.info(f"Waiting for {len(pending)}/{len(futures)} tasks")
+                    await asyncio.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+            except BaseException as e:
+                for future in futures.values():
+                    if future.done():
+                        continue
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                    else:
+                        future.cancel()
+                raise
+
+    async def get_task_endpoint_url(self, task_id: str) -> str:
+        task = await self.get_task(task_id)
+        if task.endpoint_info is not None and task.endpoint_info.endpoint_status == TaskEndpointStatus.RUNNING:
+            return task.endpoint_info.endpoint_url
+        else:
+            if task.cluster_endpoints:
+                for ce in task.cluster_endpoints:
+                    if ce.endpoint_status == TaskEndpointStatus.RUNNING:
+                        return ce.endpoint_url
+            return ""
+
+
+    async def get_usage_data(self, start_timestamp: str, end_timestamp: str) -> GetUsageDataResponse:
+        """
+        Retrieve the usage data of a task within a given time range.
+
+        :param start_timestamp: The start timestamp of the usage data.
+        :param end_timestamp: The end timestamp of the usage data.
+        :return: A `GetUsageDataResponse` object containing the usage data.
+        """
+        TaskManager._validate_not_empty(start_timestamp, "Start timestamp")
+        TaskManager._validate_not_empty(end_timestamp, "End timestamp")
+
+        return await self.task_client.get_usage_data(start_timestamp, end_timestamp)
+
+    async def archive_task(self, task_id: str) -> bool:
+        """
+        Archive a task by its ID.
+
+        :param task_id: The ID of the task to be archived.
+        :return: None
+        :raises ValueError: If `task_id` is invalid (None or empty string).
+        """
+        TaskManager._validate_not_empty(task_id, "Task ID")
+
+        return await self.task_client.archive_task(task_id)
@@ -0,0 +1,79 @@
+import logging
+
+from .._client._async_iam_client import AsyncIAMClient
+from .._client._async_video_client import AsyncVideoClient
+from .._models import *
+from .._manager._video_manager import VideoManager
+
+
+logger = logging.getLogger(__name__)
+
+class AsyncVideoManager:
+    """
+    Asyncio mirror of `VideoManager`, handling video requests and models.
+    """
+
+    def __init__(self, iam_client: AsyncIAMClient):
+        """
+        Initializes the AsyncVideoManager with the given async IAM client.
+        """
+        self.video_client = AsyncVideoClient(iam_client)
+        self.iam_client = iam_client
+
+    
+    async def get_request_detail(self, request_id: str) -> GetRequestResponse:
+        """
+        Retrieves detailed information about a specific request by its ID. This endpoint requires authentication with a bearer token and only returns requests belonging to the authenticated organization.
+
+        :param request_id: The ID of the request to be retrieved.
+        :return: Details of the request successfully retrieved
+        """
+        VideoManager._validate_not_empty(request_id, "request_id")
+        return await self.video_client.get_request_detail(request_id)
+
+
+    async def get_requests(self, model_id: str) -> List[GetRequestResponse]:
+        """
+        Retrieves a list of requests submitted by the authenticated user for a specific model. This endpoint requires authentication with a bearer token and filters results by the authenticated organization.
+
+        :param model_id: The ID of the model to be retrieved.
+        :return: List of user's requests successfully retrieved
+        """
+        VideoManager._validate_not_empty(model_id, "model_id")
+        return await self.video_client.get_requests(model_id)
+
+
+    async def create_request(self, request: SubmitRequestRequest) -> SubmitRequestResponse:
+        """
+        Submits a new asynchronous request to process a specified model with provided parameters. This endpoint requires authentication with a bearer token.
+
+        :param request: The request data to be created.
+        :return: The created request data.
+        """
+        if not request:
+            raise ValueError("Request data cannot be None.")
+        if not request.model:
+            raise ValueError("Model ID is required in the request data.")
+        if not request.payload:
+            raise ValueError("Payload is required in the request data.")
+        return await self.video_client.create_request(request)
+        
+    
+    async def get_model_detail(self, model_id: str) -> GetModelResponse:
+        """
+        Retrieves detailed information about a specific model by its ID.
+
+        :param model_id: The ID of the model to be retrieved.
+        :return: Details of the specified model.
+        """
+        VideoManager._validate_not_empty(model_id, "model_id")
+        return await self.video_client.get_model_detail(model_id)
+
+
+    async def get_models(self) -> List[GetModelResponse]:
+        """
+        Retrieves a list of available models for video processing.
+
+        :return: A list of available models.
+        """
+        return await self.video_client.get_models()
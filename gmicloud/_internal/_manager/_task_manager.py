@@ -1,7 +1,14 @@
 import os
+import threading
+import contextvars
+import concurrent.futures
+from typing import Any, Callable, Dict
 
 from .._client._iam_client import IAMClient
 from .._client._task_client import TaskClient
+from .._deadline import Deadline, earliest_deadline
+from .._exceptions import DeadlineExceededError
+from .._poll_policy import PollPolicy
 from .._models import *
 
 import time
@@ -54,10 +61,13 @@ class TaskManager:
         :param task: A `Task` object containing the details of the task to be created.
         :return: A `Task` object containing the details of the created task.
         :rtype: Task
-        :raises ValueError: If `task` is None.
+        :raises ValueError: If `task` is None or its owner cannot be resolved.
         """
         self._validate_task(task)
         if not task.owner:
+            # A lazily created client only knows the user once logged in, and an API key once its profile is fetched
+            if not self.iam_client.ensure_profile():
+                raise ValueError("Failed to resolve the user ID of the task owner.")
             task.owner = TaskOwner(user_id=self.iam_client.get_user_id())
         resp = self.task_client.create_task(task)
         if not resp or not resp.task:
@@ -157,54 +167,63 @@ class TaskManager:
         return self.task_client.start_task(task_id)
     
 
-    def wait_for_task(self, task_id: str, timeout_s: int = 900) -> Task:
+    def wait_for_task(self, task_id: str, timeout_s: int = 900, deadline: Optional[Deadline] = None,
+                      poll_policy: Optional[PollPolicy] = None) -> Task:
         """
         Wait for a task to reach the RUNNING state or raise an exception if it fails.
 
         :param task_id: The ID of the task to wait for.
         :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the task statuses,
+                            and `PollPolicy.ENDPOINT_PENDING` once the task runs but its endpoint is not ready yet.
         :return: The task object.
         :rtype: Task
+        :raises ValueError: If the task is stopping or archived.
+        :raises DeadlineExceededError: If the task is not running before the deadline.
         """
         start_time = time.time()
-        while True:
-            try:
-                task = self.get_task(task_id)
-                if task.task_status == TaskStatus.RUNNING:
-                    if task.endpoint_info is not None and task.endpoint_info.endpoint_status == TaskEndpointStatus.RUNNING:
-                        return task
-                    else:
-                        if task.cluster_endpoints:
-                            for ce in task.cluster_endpoints:
-                                if ce.endpoint_status == TaskEndpointStatus.RUNNING:
-                                    return task
-                if task.task_status in [TaskStatus.NEEDSTOP, TaskStatus.ARCHIVED]:
-                    raise Exception(f"Unexpected task status after starting: {task.task_status}")
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            while True:
+                phase = None
+                try:
+                    task = self.get_task(task_id)
+                except Exception as e:
+                    logger.error(f"Failed to get task, Error: {e}")
                 else:
+                    if self._is_task_ready(task):
+                        return task
                     logger.info(f"Pending task starting. Task status: {task.task_status}")
-            except Exception as e:
-                logger.error(f"Failed to get task, Error: {e}")
-            if time.time() - start_time > timeout_s:
-                raise Exception(f"Task creation takes more than {timeout_s // 60} minutes. Testing aborted.")
-            time.sleep(10)
+                    phase = PollPolicy.ENDPOINT_PENDING if task.task_status == TaskStatus.RUNNING else task.task_status
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Task {task_id} is not running after {time.time() - start_time:.0f} seconds. Testing aborted.")
+                time.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
 
-    def start_task_and_wait(self, task_id: str, timeout_s: int = 3600) -> Task:
+    def start_task_and_wait(self, task_id: str, timeout_s: int = 3600, deadline: Optional[Deadline] = None,
+                            poll_policy: Optional[PollPolicy] = None) -> Task:
         """
         Start a task and wait for it to be ready.
 
         :param task_id: The ID of the task to start.
         :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; starting and waiting share one time budget.
+        :param poll_policy: The schedule of the polls, see `wait_for_task` (optional).
         :return: The task object.
         :rtype: Task
         """
-        try:
-            self.start_task(task_id)
-            logger.info(f"Started task ID: {task_id}")
-        except Exception as e:
-            logger.error(f"Failed to start task, Error: {e}")
-            raise e
+        deadline = earliest_deadline(timeout_s, deadline)
+        with deadline:
+            try:
+                self.start_task(task_id)
+                logger.info(f"Started task ID: {task_id}")
+            except Exception as e:
+                logger.error(f"Failed to start task, Error: {e}")
+                raise e
 
-        return self.wait_for_task(task_id, timeout_s)
+            return self.wait_for_task(task_id, timeout_s, deadline, poll_policy)
 
     def stop_task(self, task_id: str) -> bool:
         """
@@ -218,23 +237,160 @@ class TaskManager:
         return self.task_client.stop_task(task_id)
 
         
-    def stop_task_and_wait(self, task_id: str, timeout_s: int = 3600):
-        try:
-            self.stop_task(task_id)
-            logger.info(f"Stopping task ID: {task_id}")
-        except Exception as e:
-            logger.error(f"Failed to stop task, Error: {e}")
+    def stop_task_and_wait(self, task_id: str, timeout_s: int = 3600, deadline: Optional[Deadline] = None,
+                           poll_policy: Optional[PollPolicy] = None):
+        """
+        Stop a task and wait for it to become idle.
+
+        :param task_id: The ID of the task to stop.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; stopping and waiting share one time budget.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. Its phases are the task statuses.
+        :raises DeadlineExceededError: If the task is not idle before the deadline.
+        """
         start_time = time.time()
-        while True:
+        deadline = earliest_deadline(timeout_s, deadline)
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
             try:
-                task = self.get_task(task_id)
-                if task.task_status == TaskStatus.IDLE:
-                    break
+                self.stop_task(task_id)
+                logger.info(f"Stopping task ID: {task_id}")
             except Exception as e:
-                logger.error(f"Failed to get task, Error: {e}")
-            if time.time() - start_time > timeout_s:
-                raise Exception(f"Task stopping takes more than {timeout_s // 60} minutes. Testing aborted.")
-            time.sleep(10)
+                logger.error(f"Failed to stop task, Error: {e}")
+            while True:
+                phase = None
+                try:
+                    task = self.get_task(task_id)
+                    if task.task_status == TaskStatus.IDLE:
+                        break
+                    phase = task.task_status
+                except Exception as e:
+                    logger.error(f"Failed to get task, Error: {e}")
+                if deadline.expired():
+                    raise DeadlineExceededError(
+                        f"Task {task_id} is not idle after {time.time() - start_time:.0f} seconds. Testing aborted.")
+                time.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+
+    def wait_for_tasks(self, task_ids: List[str], condition: Optional[Callable[[Task], bool]] = None,
+                       timeout_s: int = 900, deadline: Optional[Deadline] = None,
+                       poll_policy: Optional[PollPolicy] = None) -> Dict[str, concurrent.futures.Future]:
+        """
+        Wait for many tasks at once, polling the task list once per interval instead of every task on its own.
+
+        A background thread polls `get_all_tasks` and resolves the future of each task as soon as the task meets the
+        condition. Tasks are independent: a task whose condition raises, or that is not done by the deadline, fails
+        its own future without affecting the others. Use `concurrent.futures.as_completed` on the futures to handle
+        the tasks in the order they complete.
+
+        :param task_ids: The IDs of the tasks to wait for.
+        :param condition: Whether a task is done; it may raise to fail the task. Defaults to the task running with its
+                          endpoint ready, failing tasks that stop, like `wait_for_task`.
+        :param timeout_s: The timeout in seconds.
+        :param deadline: A deadline shared with the caller; the wait ends at whichever of it and `timeout_s` comes first.
+        :param poll_policy: The schedule of the polls, defaults to `PollPolicy()`. The backoff starts over whenever the
+                            status of a pending task changes.
+        :return: A future per task ID, resolved with the task once it meets the condition, or failed with the error
+                 raised by the condition or `DeadlineExceededError`. The futures cannot be cancelled.
+        :raises ValueError: If a task ID is empty.
+        """
+        for task_id in task_ids:
+            self._validate_not_empty(task_id, "Task ID")
+        futures = {task_id: concurrent.futures.Future() for task_id in task_ids}
+        for future in futures.values():
+            future.set_running_or_notify_cancel()
+        deadline = earliest_deadline(timeout_s, deadline)
+
+        # Run the polls in a copy of the caller's context, so their requests see the current deadline. The thread is a
+        # daemon so that an abandoned wait does not keep the interpreter alive until it times out
+        threading.Thread(target=contextvars.copy_context().run,
+                         args=(self._poll_tasks, futures, condition or self._is_task_ready, deadline, poll_policy),
+                         name="gmicloud-task-poller", daemon=True).start()
+        return futures
+
+    def _poll_tasks(self, futures: Dict[str, concurrent.futures.Future], condition: Callable[[Task], bool],
+                    deadline: Deadline, poll_policy: Optional[PollPolicy]) -> None:
+        """
+        Poll the task list until the futures of all tasks are resolved or the deadline expires.
+
+        :param futures: The future of every task, by task ID.
+        :param condition: Whether a task is done.
+        :param deadline: The deadline of the wait.
+        :param poll_policy: The schedule of the polls (optional).
+        """
+        start_time = time.time()
+        poll_schedule = (poll_policy if poll_policy is not None else PollPolicy()).start()
+        with deadline:
+            try:
+                while True:
+                    phase = None
+                    try:
+                        phase = self._resolve_task_futures(self.get_all_tasks(), futures, condition)
+                    except Exception as e:
+                        logger.error(f"Failed to get tasks, Error: {e}")
+                    pending = [task_id for task_id, future in futures.items() if not future.done()]
+                    if not pending:
+                        return
+                    if deadline.expired():
+                        for task_id in pending:
+                            futures[task_id].set_exception(DeadlineExceededError(
+                                f"Task {task_id} is not ready after {time.time() - start_time:.0f} seconds."))
+                        return
+                    logger.info(f"Waiting for {len(pending)}/{len(futures)} tasks")
+                    time.sleep(min(poll_schedule.next_delay(phase), deadline.remaining()))
+            except BaseException as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+
+    @staticmethod
+    def _resolve_task_futures(tasks: List[Task], futures: Dict[str, Any], condition: Callable[[Task], bool]) \
+            -> Optional[str]:
+        """
+        Resolve the futures of the listed tasks that meet the condition, or fail it by raising.
+
+        :param tasks: The tasks listed by a poll.
+        :param futures: The future of every task waited for, by task ID; futures already done are skipped.
+        :param condition: Whether a task is done.
+        :return: The phase of the tasks still pending, for the poll schedule, or None if none was listed.
+        """
+        tasks_by_id = {task.task_id: task for task in tasks}
+        phases = set()
+        for task_id, future in futures.items():
+            task = tasks_by_id.get(task_id)
+            if future.done() or task is None:
+                continue
+            try:
+                done = condition(task)
+            except Exception as e:
+                logger.error(f"Task {task_id} failed, Error: {e}")
+                future.set_exception(e)
+                continue
+            if done:
+                future.set_result(task)
+            else:
+                phases.add(PollPolicy.ENDPOINT_PENDING if task.task_status == TaskStatus.RUNNING
+                           else (task.task_status.value if task.task_status else ""))
+        return ",".join(sorted(phases)) if phases else None
+
+    @staticmethod
+    def _is_task_ready(task: Task) -> bool:
+        """
+        Whether a task is running with an endpoint ready.
+
+        :param task: The task.
+        :return: True if the task or one of its cluster endpoints is running.
+        :raises ValueError: If the task is stopping or archived.
+        """
+        if task.task_status == TaskStatus.RUNNING:
+            if task.endpoint_info is not None and task.endpoint_info.endpoint_status == TaskEndpointStatus.RUNNING:
+                return True
+            for ce in task.cluster_endpoints or []:
+                if ce.endpoint_status == TaskEndpointStatus.RUNNING:
+                    return True
+        if task.task_status in [TaskStatus.NEEDSTOP, TaskStatus.ARCHIVED]:
+            raise ValueError(f"Unexpected task status after starting: {task.task_status}")
+        return False
 
     def get_task_endpoint_url(self, task_id: str) -> str:
         task = self.get_task(task_id)
@@ -308,7 +464,8 @@ class TaskManager:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-    def _read_file_and_parse_task(self, file_path: str) -> Task:
+    @staticmethod
+    def _read_file_and_parse_task(file_path: str) -> Task:
         """
         Read a file and parse it into a Task object.
 
@@ -316,7 +473,7 @@ class TaskManager:
         :return: A `Task` object parsed from the file content.
         :raises ValueError: If the file is invalid or cannot be parsed.
         """
-        self._validate_file_path(file_path)
+        TaskManager._validate_file_path(file_path)
 
         with open(file_path, "rb") as file:
             file_data = file.read()
@@ -1,10 +1,17 @@
 from typing import Optional, List, Union
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict
 from gmicloud._internal._enums import *
 
 
+class BaseModel(PydanticBaseModel):
+    """
+    Base of every SDK model. Validators are built on first use rather than at import time, keeping imports fast.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
 class BigFileMetadata(BaseModel):
     """
     Metadata about a large file stored in a GCS bucket.
@@ -258,6 +265,39 @@ class DeleteBigfileResponse(BaseModel):
     status: Optional[str] = ""  # Status of the deletion process.
 
 
+class ModelSyncPlan(BaseModel):
+    """
+    The changes needed to bring the model files of an artifact in line with a local model directory.
+    """
+    artifact_id: str  # ID of the artifact being synced.
+    files_to_upload: List[str] = []  # Local paths of new or changed files.
+    files_to_skip: List[str] = []  # Local paths of files the artifact already holds.
+    files_to_delete: List[str] = []  # Names of artifact files missing locally; empty unless deletion was requested.
+    bytes_to_upload: int = 0  # Total size of the files to upload.
+    bytes_skipped: int = 0  # Total size of the files skipped.
+
+
+class UploadProgress(BaseModel):
+    """
+    A progress report of a model file upload, passed to upload progress callbacks.
+    """
+    event: UploadProgressEvent  # What happened: a file started, progressed, was retried, completed, etc.
+    file_path: Optional[str] = None  # Local path of the file concerned; None for the `finished` report.
+    file_size: int = 0  # Size of the file concerned.
+    file_bytes_uploaded: int = 0  # Bytes of the file confirmed by the storage service.
+    file_bytes_per_second: Optional[float] = None  # Average upload rate of the file; None before any byte is sent.
+    file_retries: int = 0  # Chunks of the file sent again and upload sessions started over.
+    bytes_uploaded: int = 0  # Bytes of all the files confirmed by the storage service, including resumed ones.
+    total_bytes: int = 0  # Total size of the files.
+    bytes_per_second: Optional[float] = None  # Recent aggregate upload rate; None before any byte is sent.
+    eta_seconds: Optional[float] = None  # Estimated time left at the recent rate; None while it is unknown.
+    files_completed: int = 0  # Files uploaded or skipped as already uploaded.
+    files_failed: int = 0  # Files whose upload failed.
+    total_files: int = 0  # Number of files.
+    retries: int = 0  # Retries of all the files.
+    elapsed_seconds: float = 0.0  # Time since the upload started.
+
+
 class TemplateMetadata(BaseModel):
     """
     Metadata for an artifact template.
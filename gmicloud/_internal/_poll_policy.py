@@ -0,0 +1,87 @@
+import random
+from typing import Dict, Optional
+
+
+class PollPolicy:
+    """
+    Polling schedule of the wait helpers: fast first polls backing off exponentially to a ceiling, with jitter so that
+    many waiters do not poll in lockstep.
+
+    Polls are counted per phase, a state of the polled resource reported by the waiter, e.g. a task status. Whenever
+    the phase changes the schedule starts over from `initial_interval_s`, so that the next transition is noticed
+    quickly, and a phase can have a lower ceiling of its own, e.g. `ENDPOINT_PENDING` once a task runs and only its
+    endpoint is not ready yet.
+    """
+
+    # A task that is running while its endpoint is not ready yet
+    ENDPOINT_PENDING = "endpoint_pending"
+
+    def __init__(self,
+                 initial_interval_s: float = 1.0,
+                 max_interval_s: float = 10.0,
+                 multiplier: float = 2.0,
+                 jitter: float = 0.2,
+                 phase_max_interval_s: Optional[Dict[str, float]] = None):
+        """
+        Initialize the polling policy.
+
+        :param initial_interval_s: The interval after the first poll of a phase.
+        :param max_interval_s: The upper bound of the interval.
+        :param multiplier: The factor applied to the interval after every poll of the same phase.
+        :param jitter: The fraction by which an interval is randomly lengthened or shortened, from 0 to 1.
+        :param phase_max_interval_s: The upper bound of the interval in particular phases, defaults to 3 seconds
+                                     while a task endpoint is pending.
+        """
+        if initial_interval_s <= 0 or max_interval_s < initial_interval_s or multiplier < 1:
+            raise ValueError("Poll intervals must be positive and the multiplier at least 1.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.initial_interval_s = initial_interval_s
+        self.max_interval_s = max_interval_s
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.phase_max_interval_s = phase_max_interval_s if phase_max_interval_s is not None else \
+            {self.ENDPOINT_PENDING: 3.0}
+
+    def get_delay(self, polls: int, phase: Optional[str] = None) -> float:
+        """
+        Compute the delay in seconds before the next poll.
+
+        :param polls: The number of polls made in the current phase so far (starting at 1).
+        :param phase: The current phase (optional).
+        :return: The delay in seconds.
+        """
+        max_interval_s = min(self.max_interval_s, self.phase_max_interval_s.get(phase, self.max_interval_s))
+        interval = min(max_interval_s, self.initial_interval_s * self.multiplier ** (polls - 1))
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else interval
+
+    def start(self) -> "_PollSchedule":
+        """
+        Start the schedule of one wait.
+
+        :return: The schedule, giving the delay after each poll.
+        """
+        return _PollSchedule(self)
+
+
+class _PollSchedule:
+    """
+    The polls of one wait, counted per phase.
+    """
+
+    def __init__(self, policy: PollPolicy):
+        self._policy = policy
+        self._phase = None
+        self._polls = 0
+
+    def next_delay(self, phase: Optional[str] = None) -> float:
+        """
+        Record a poll and compute the delay before the next one.
+
+        :param phase: The phase observed by the poll, or None to keep the current one, e.g. if the poll failed.
+        :return: The delay in seconds.
+        """
+        if phase is not None and phase != self._phase:
+            self._phase, self._polls = phase, 0
+        self._polls += 1
+        return self._policy.get_delay(self._polls, self._phase)
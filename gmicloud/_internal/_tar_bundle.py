@@ -0,0 +1,178 @@
+import io
+import os
+import json
+import bisect
+import hashlib
+import tarfile
+from typing import TYPE_CHECKING, BinaryIO, List, Tuple, Union
+
+from ._constants import HASH_BLOCK_SIZE, SMALL_FILES_MANIFEST_NAME, SMALL_FILES_MANIFEST_VERSION
+from ._exceptions import UploadFileError
+
+if TYPE_CHECKING:
+    from ._hub_file import HubFile
+
+
+class TarBundle:
+    """
+    An uncompressed tar archive of files that is assembled from the files as it is read, so it is never written to
+    disk or held in memory, and can be uploaded like a file with `FileUploadClient.upload_large_file`.
+
+    The files are followed by a JSON manifest named `SMALL_FILES_MANIFEST_NAME`, listing the path, size, SHA-256 and
+    offset in the archive of every file, so the archive can be unpacked by any tar reader or read file by file with
+    range requests. Files are hashed when the bundle is created and must not change until it is uploaded.
+    """
+
+    def __init__(self, files: List[Tuple[str, str]], name_prefix: str = "bundle"):
+        """
+        Lay out the archive of files.
+
+        :param files: The (name in the archive, local path) of every file, in order.
+        :param name_prefix: The start of the name of the archive, which ends with a digest of the manifest so that
+                            archives of different files get different names.
+        :raises ValueError: If there is no file or two files have the same name.
+        """
+        arcnames = [arcname for arcname, _ in files]
+        if not files:
+            raise ValueError("A bundle needs at least one file.")
+        if len(set(arcnames)) != len(arcnames) or SMALL_FILES_MANIFEST_NAME in arcnames:
+            raise ValueError("Files of a bundle must have distinct names.")
+        self.file_paths = [path for _, path in files]
+        self.size = 0
+        # (offset, length, data or local path) of every part of the archive, in order
+        self._segments = []
+
+        entries = []
+        latest_mtime = 0
+        for arcname, path in files:
+            stat = os.stat(path)
+            latest_mtime = max(latest_mtime, int(stat.st_mtime))
+            self._append(self._header(arcname, stat.st_size, int(stat.st_mtime)))
+            entries.append({"path": arcname, "size": stat.st_size, "sha256": self._hash(path), "offset": self.size})
+            self._append(path, stat.st_size)
+        self.manifest = {"version": SMALL_FILES_MANIFEST_VERSION, "files": entries}
+        manifest_data = json.dumps(self.manifest, indent=1).encode()
+        self.name = f"{name_prefix}-{hashlib.sha256(manifest_data).hexdigest()[:16]}.tar"
+        self._append(self._header(SMALL_FILES_MANIFEST_NAME, len(manifest_data), latest_mtime))
+        self._append(manifest_data)
+        # End of archive
+        self._append(bytes(2 * tarfile.BLOCKSIZE))
+        self._offsets = [offset for offset, _, _ in self._segments]
+
+    def open(self) -> BinaryIO:
+        """
+        Open the archive for reading.
+
+        :return: A seekable binary file object, to be closed after use.
+        """
+        return io.BufferedReader(_TarBundleReader(self))
+
+    def __str__(self):
+        return f"{self.name} ({len(self.file_paths)} files)"
+
+    def _append(self, source: Union[bytes, str], length: int = None) -> None:
+        length = len(source) if length is None else length
+        if length:
+            self._segments.append((self.size, length, source))
+            self.size += length
+        # Members are padded to whole blocks
+        padding = -length % tarfile.BLOCKSIZE
+        if padding:
+            self._segments.append((self.size, padding, bytes(padding)))
+            self.size += padding
+
+    @staticmethod
+    def _header(arcname: str, size: int, mtime: int) -> bytes:
+        info = tarfile.TarInfo(arcname)
+        info.size = size
+        info.mtime = mtime
+        info.mode = 0o644
+        # PAX headers keep long and non-ASCII names
+        return info.tobuf(format=tarfile.PAX_FORMAT)
+
+    @staticmethod
+    def _hash(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+class _TarBundleReader(io.RawIOBase):
+    """
+    Reads a `TarBundle`, opening the bundled files one at a time.
+    """
+
+    def __init__(self, bundle: TarBundle):
+        super().__init__()
+        self._bundle = bundle
+        self._position = 0
+        self._file = None
+        self._file_path = None
+
+    @property
+    def name(self) -> str:
+        return self._bundle.name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._bundle.size}[whence]
+        if base + offset < 0:
+            raise ValueError("Negative seek position")
+        self._position = base + offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._bundle.size:
+            return 0
+        index = bisect.bisect_right(self._bundle._offsets, self._position) - 1
+        offset, length, source = self._bundle._segments[index]
+        start = self._position - offset
+        count = min(len(buffer), length - start)
+        if isinstance(source, bytes):
+            buffer[:count] = source[start:start + count]
+        else:
+            if self._file_path != source:
+                if self._file is not None:
+                    self._file.close()
+                self._file, self._file_path = open(source, "rb"), source
+            self._file.seek(start)
+            if self._file.readinto(memoryview(buffer)[:count]) != count:
+                raise UploadFileError(f"File {source} was truncated after it was bundled")
+        self._position += count
+        return count
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+def open_upload_file(file_path: Union[str, TarBundle, "HubFile"]) -> BinaryIO:
+    """
+    Open a file, a bundle or a hub file to upload for reading.
+
+    :param file_path: The path of the file, or the bundle or hub file.
+    :return: A seekable binary file object.
+    """
+    return open(file_path, "rb") if isinstance(file_path, str) else file_path.open()
+
+
+def get_upload_file_size(file_path: Union[str, TarBundle, "HubFile"]) -> int:
+    """
+    Get the size of a file, a bundle or a hub file to upload.
+
+    :param file_path: The path of the file, or the bundle or hub file.
+    :return: The size in bytes.
+    """
+    return os.path.getsize(file_path) if isinstance(file_path, str) else file_path.size
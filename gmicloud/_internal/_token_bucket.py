@@ -0,0 +1,56 @@
+import time
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting the average rate of a resource, such as bytes sent per second.
+
+    Callers reserve tokens before using them and wait for the returned delay. Reservations may overdraw the bucket,
+    so a large reservation is never starved by small ones; the debt simply delays later callers.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock=time.monotonic):
+        """
+        Initialize a full token bucket.
+
+        :param rate: The number of tokens added per second.
+        :param capacity: The maximum number of tokens stored, i.e. the largest burst, defaults to one second's worth.
+        :param clock: A monotonic clock returning seconds, injectable for tests.
+        :raises ValueError: If `rate` or `capacity` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Token bucket capacity must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take tokens from the bucket.
+
+        :param amount: The number of tokens to take.
+        :return: The number of seconds to wait before using them, 0 if they are available now.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def consume(self, amount: float) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        :param amount: The number of tokens to take.
+        """
+        delay = self.reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,90 @@
+import base64
+import hashlib
+from typing import Dict, Optional, Union
+
+from ._constants import HASH_BLOCK_SIZE
+from ._exceptions import UploadFileError
+from ._hub_file import HubFile
+from ._tar_bundle import TarBundle, open_upload_file
+
+try:
+    # Optional: CRC32C has no implementation in the standard library fast enough for model weights
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+
+class UploadChecksum:
+    """
+    Computes the hashes Google Storage reports for a stored object in the `x-goog-hash` header, MD5 and, if the
+    optional `google-crc32c` package is installed, CRC32C, over the bytes of an upload in order.
+
+    `offset` is the number of bytes hashed so far. Bytes are added from the chunks acknowledged by the storage
+    service, and from the file itself for the part an earlier run uploaded.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def update(self, data) -> None:
+        """
+        Add the next bytes of the upload.
+
+        :param data: The bytes following the `offset` first ones.
+        """
+        self._md5.update(data)
+        if self._crc32c is not None:
+            self._crc32c.update(bytes(data))
+        self.offset += len(data)
+
+    def update_from_file(self, file_path: Union[str, TarBundle, HubFile], end: int) -> None:
+        """
+        Hash the file up to `end` bytes, reading what was not hashed yet. If more than `end` bytes were hashed,
+        start over from the beginning of the file.
+
+        :param file_path: The path of the file being uploaded, or the bundle or hub file.
+        :param end: The number of bytes of the file to hash.
+        """
+        if end < self.offset:
+            self._reset()
+        with open_upload_file(file_path) as file:
+            file.seek(self.offset)
+            while self.offset < end:
+                block = file.read(min(HASH_BLOCK_SIZE, end - self.offset))
+                if not block:
+                    raise UploadFileError(f"File {file_path} was truncated during upload")
+                self.update(block)
+
+    def digests(self) -> Dict[str, str]:
+        """
+        Get the base64 digests of the bytes hashed so far, in the format of the `x-goog-hash` header.
+
+        :return: The digests keyed by hash name (`md5` and, if available, `crc32c`).
+        """
+        digests = {"md5": base64.b64encode(self._md5.digest()).decode()}
+        if self._crc32c is not None:
+            digests["crc32c"] = base64.b64encode(self._crc32c.digest()).decode()
+        return digests
+
+    def verify(self, goog_hash: Optional[str]) -> Optional[bool]:
+        """
+        Compare the bytes hashed so far with the hashes reported by the storage service.
+
+        :param goog_hash: The value of the `x-goog-hash` response header.
+        :return: Whether every hash reported and computed matches, or None if there is no hash to compare.
+        """
+        reported = {}
+        for item in (goog_hash or "").split(","):
+            name, _, value = item.strip().partition("=")
+            if value:
+                reported[name.lower()] = value
+        digests = self.digests()
+        common = set(reported) & set(digests)
+        if not common:
+            return None
+        return all(reported[name] == digests[name] for name in common)
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self._md5 = hashlib.md5()
+        self._crc32c = google_crc32c.Checksum() if google_crc32c is not None else None
@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR_NAME = ".cache"
+JOURNAL_FILE_NAME = "gmicloud-upload-journal.json"
+JOURNAL_VERSION = 1
+
+
+class UploadJournal:
+    """
+    Records the upload session and confirmed offset of every model file uploaded to an artifact, in a JSON file under
+    the `.cache` folder of the model directory. A later run over the same directory skips completed files and resumes
+    partial ones with their saved session, even after the process was killed.
+
+    An entry only applies while the file keeps the size and modification time it had when its upload started.
+    The journal also keeps the SHA-256 of every file uploaded in full, and caches file hashes by size and modification
+    time so that unchanged files are not hashed again. Failing to write the journal is logged and never fails an upload.
+    """
+
+    # Offsets are saved at most this often; starting and completing a file are saved immediately
+    FLUSH_INTERVAL_S = 1.0
+
+    def __init__(self, model_directory: str, artifact_id: str):
+        """
+        Load the journal of an artifact's uploads from a model directory.
+
+        :param model_directory: The model directory being uploaded.
+        :param artifact_id: The ID of the artifact receiving the files.
+        """
+        self.model_directory = model_directory
+        self.artifact_id = artifact_id
+        self.journal_path = os.path.join(model_directory, JOURNAL_DIR_NAME, JOURNAL_FILE_NAME)
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        self._journal = self._load()
+        self._entries = self._journal["artifacts"].setdefault(artifact_id, {})
+        self._hashes = self._journal.setdefault("hashes", {})
+
+    def lookup(self, file_path: str) -> Optional[dict]:
+        """
+        Get the journal entry of a file, if the file is unchanged since its upload started.
+
+        :param file_path: The path of the file.
+        :return: A dict with `upload_link`, `offset` and `completed`, or None if the file must be uploaded afresh.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.get("size") != os.path.getsize(file_path) or \
+                    entry.get("mtime_ns") != os.stat(file_path).st_mtime_ns:
+                logger.info(f"File {file_path} changed since its last upload, discarding its upload session")
+                del self._entries[key]
+                return None
+            return {"upload_link": entry["upload_link"], "offset": entry.get("offset", 0),
+                    "completed": entry.get("completed", False)}
+
+    def start(self, file_path: str, upload_link: str) -> None:
+        """
+        Record a new upload session for a file.
+
+        :param file_path: The path of the file.
+        :param upload_link: The resumable upload URL of the file.
+        """
+        stat = os.stat(file_path)
+        with self._lock:
+            self._entries[self._key(file_path)] = {"upload_link": upload_link, "size": stat.st_size,
+                                                   "mtime_ns": stat.st_mtime_ns, "offset": 0, "completed": False}
+            self._flush()
+
+    def record_offset(self, file_path: str, offset: int) -> None:
+        """
+        Record the number of bytes of a file confirmed by the storage service.
+
+        :param file_path: The path of the file.
+        :param offset: The number of bytes confirmed.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+            if entry is None:
+                return
+            entry["offset"] = offset
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S:
+                self._flush()
+
+    def complete(self, file_path: str, sha256: Optional[str] = None) -> None:
+        """
+        Record that a file was uploaded completely.
+
+        :param file_path: The path of the file.
+        :param sha256: The SHA-256 of the uploaded content, if known.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+            if entry is None:
+                return
+            entry["offset"] = entry["size"]
+            entry["completed"] = True
+            if sha256:
+                entry["sha256"] = sha256
+            self._flush()
+
+    def complete_bundled(self, file_hashes: Dict[str, str], upload_link: str, bundle_name: str) -> None:
+        """
+        Record that files were uploaded completely as members of a bundle.
+
+        :param file_hashes: The SHA-256 of the bundled files, keyed by path.
+        :param upload_link: The resumable upload URL of the bundle.
+        :param bundle_name: The file name of the bundle on the artifact.
+        """
+        stats = {file_path: os.stat(file_path) for file_path in file_hashes}
+        with self._lock:
+            for file_path, sha256 in file_hashes.items():
+                self._entries[self._key(file_path)] = {"upload_link": upload_link, "size": stats[file_path].st_size,
+                                                       "mtime_ns": stats[file_path].st_mtime_ns,
+                                                       "offset": stats[file_path].st_size, "completed": True,
+                                                       "sha256": sha256, "bundle": bundle_name}
+            self._flush()
+
+    def discard(self, file_path: str) -> None:
+        """
+        Forget the upload session of a file, so that its next upload starts afresh.
+
+        :param file_path: The path of the file.
+        """
+        with self._lock:
+            if self._entries.pop(self._key(file_path), None) is not None:
+                self._flush()
+
+    def uploaded_hash(self, file_path: str) -> Optional[str]:
+        """
+        Get the SHA-256 of the content last uploaded in full from a path, even if the file was modified since.
+
+        :param file_path: The path of the file.
+        :return: The hex digest, or None if no complete upload with a known hash was recorded.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+            if entry is None or not entry.get("completed"):
+                return None
+            return entry.get("sha256")
+
+    def uploaded_bundle(self, file_path: str) -> Optional[str]:
+        """
+        Get the name of the bundle in which a path was last uploaded in full, even if the file was modified since.
+
+        :param file_path: The path of the file.
+        :return: The file name of the bundle on the artifact, or None if the file was not uploaded in a bundle.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+            if entry is None or not entry.get("completed"):
+                return None
+            return entry.get("bundle")
+
+    def cached_hash(self, file_path: str) -> Optional[str]:
+        """
+        Get the SHA-256 of a file computed earlier, if the file is unchanged since.
+
+        :param file_path: The path of the file.
+        :return: The hex digest, or None if the file must be hashed.
+        """
+        stat = os.stat(file_path)
+        with self._lock:
+            cached = self._hashes.get(self._key(file_path))
+            if cached is None or cached.get("size") != stat.st_size or cached.get("mtime_ns") != stat.st_mtime_ns:
+                return None
+            return cached.get("sha256")
+
+    def record_hashes(self, file_hashes: Dict[str, str]) -> None:
+        """
+        Cache the SHA-256 of files, valid while they keep their current size and modification time.
+
+        :param file_hashes: The hex digests keyed by file path.
+        """
+        stats = {file_path: os.stat(file_path) for file_path in file_hashes}
+        with self._lock:
+            for file_path, sha256 in file_hashes.items():
+                self._hashes[self._key(file_path)] = {"size": stats[file_path].st_size,
+                                                      "mtime_ns": stats[file_path].st_mtime_ns, "sha256": sha256}
+            self._flush()
+
+    def _key(self, file_path: str) -> str:
+        return os.path.relpath(file_path, self.model_directory).replace(os.path.sep, "/")
+
+    def _load(self) -> dict:
+        try:
+            with open(self.journal_path, "r") as f:
+                journal = json.load(f)
+            if journal.get("version") == JOURNAL_VERSION and isinstance(journal.get("artifacts"), dict):
+                return journal
+            logger.warning(f"Ignoring upload journal {self.journal_path} of an unknown version")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable upload journal {self.journal_path}: {e}")
+        return {"version": JOURNAL_VERSION, "artifacts": {}}
+
+    def _flush(self) -> None:
+        """Write the journal atomically. Must be called with the lock held."""
+        self._last_flush = time.monotonic()
+        journal_dir = os.path.dirname(self.journal_path)
+        try:
+            os.makedirs(journal_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=journal_dir, prefix=JOURNAL_FILE_NAME + ".")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._journal, f)
+                os.replace(temp_path, self.journal_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save upload journal {self.journal_path}: {e}")
@@ -0,0 +1,209 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+from ._enums import UploadProgressEvent
+from ._models import UploadProgress
+
+logger = logging.getLogger(__name__)
+
+
+class UploadProgressTracker:
+    """
+    A thread-safe tracker of the bytes confirmed, throughput and retries of a set of file uploads, reporting every
+    change to progress callbacks as an `UploadProgress`.
+
+    Bytes an earlier run uploaded count towards progress but not towards throughput, so the rates and the ETA reflect
+    what this run sends. The aggregate rate is measured over the last `RATE_WINDOW_S` seconds, so the ETA follows
+    changes in bandwidth; the rate of a file is its average since its upload session started.
+
+    Callbacks are called in order, one at a time, by the thread reporting the change, and should return quickly.
+    A callback raising an exception is logged and does not fail the upload.
+    """
+
+    RATE_WINDOW_S = 10.0
+
+    def __init__(self, file_sizes: Dict[str, int],
+                 callbacks: Iterable[Callable[[UploadProgress], None]] = (), clock=time.monotonic):
+        """
+        Initialize the progress tracker.
+
+        :param file_sizes: The size of every file to upload, keyed by path.
+        :param callbacks: The functions called with every progress report.
+        :param clock: A monotonic clock returning seconds, injectable for tests.
+        """
+        self._file_sizes = dict(file_sizes)
+        self._callbacks = [callback for callback in callbacks if callback is not None]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = clock()
+        self._offsets: Dict[str, int] = {}  # bytes confirmed per file
+        self._file_sent: Dict[str, int] = {}  # bytes sent per file by its current session
+        self._file_started_at: Dict[str, float] = {}
+        self._file_retries: Dict[str, int] = {}
+        self._done: Dict[str, bool] = {}  # files completed (True) or failed (False)
+        self._total_bytes = sum(self._file_sizes.values())
+        self._bytes_uploaded = 0
+        self._bytes_left = self._total_bytes  # bytes still to confirm of the files neither completed nor failed
+        self._files_completed = 0
+        self._files_failed = 0
+        self._sent = 0  # bytes sent by this run
+        self._retries = 0
+        # (time, bytes sent) samples of the last `RATE_WINDOW_S` seconds, plus the one before them
+        self._samples = deque([(self._started_at, 0)])
+
+    def file_started(self, file_path: str, offset: int = 0) -> None:
+        """
+        Record the start of an upload session of a file.
+
+        :param file_path: The path of the file.
+        :param offset: The number of bytes already confirmed by the session, when resuming it.
+        """
+        with self._lock:
+            self._set_offset(file_path, offset)
+            self._file_sent[file_path] = 0
+            self._file_started_at[file_path] = self._clock()
+            self._report(UploadProgressEvent.STARTED, file_path)
+
+    def file_skipped(self, file_path: str) -> None:
+        """
+        Record a file that does not need uploading, such as one uploaded by an earlier run.
+
+        :param file_path: The path of the file.
+        """
+        with self._lock:
+            self._set_offset(file_path, self._file_sizes.get(file_path, 0))
+            self._set_done(file_path, True)
+            self._report(UploadProgressEvent.SKIPPED, file_path)
+
+    def bytes_confirmed(self, file_path: str, offset: int) -> None:
+        """
+        Record the number of bytes of a file confirmed by the storage service.
+
+        :param file_path: The path of the file.
+        :param offset: The total number of bytes of the file confirmed so far.
+        """
+        with self._lock:
+            sent = max(offset - self._offsets.get(file_path, 0), 0)
+            self._set_offset(file_path, offset)
+            self._file_sent[file_path] = self._file_sent.get(file_path, 0) + sent
+            self._sent += sent
+            now = self._clock()
+            self._samples.append((now, self._sent))
+            while len(self._samples) > 2 and self._samples[1][0] <= now - self.RATE_WINDOW_S:
+                self._samples.popleft()
+            self._report(UploadProgressEvent.PROGRESS, file_path)
+
+    def retry(self, file_path: str) -> None:
+        """
+        Record a failed attempt of a file that is about to be retried.
+
+        :param file_path: The path of the file.
+        """
+        with self._lock:
+            self._file_retries[file_path] = self._file_retries.get(file_path, 0) + 1
+            self._retries += 1
+            self._report(UploadProgressEvent.RETRY, file_path)
+
+    def file_completed(self, file_path: str) -> None:
+        """
+        Record a file uploaded in full.
+
+        :param file_path: The path of the file.
+        """
+        with self._lock:
+            self._set_offset(file_path, self._file_sizes.get(file_path, 0))
+            self._set_done(file_path, True)
+            self._report(UploadProgressEvent.COMPLETED, file_path)
+
+    def file_failed(self, file_path: str) -> None:
+        """
+        Record a file whose upload failed.
+
+        :param file_path: The path of the file.
+        """
+        with self._lock:
+            self._set_done(file_path, False)
+            self._report(UploadProgressEvent.FAILED, file_path)
+
+    def finish(self) -> UploadProgress:
+        """
+        Report the end of the uploads.
+
+        :return: The final progress report.
+        """
+        with self._lock:
+            return self._report(UploadProgressEvent.FINISHED)
+
+    def snapshot(self, file_path: Optional[str] = None) -> UploadProgress:
+        """
+        Get the current progress without reporting it.
+
+        :param file_path: The path of the file to include the progress of (optional).
+        :return: The progress, as a `progress` report.
+        """
+        with self._lock:
+            return self._progress(UploadProgressEvent.PROGRESS, file_path)
+
+    def _set_offset(self, file_path: str, offset: int) -> None:
+        size = self._file_sizes.get(file_path, 0)
+        previous = min(self._offsets.get(file_path, 0), size)
+        self._offsets[file_path] = offset
+        self._bytes_uploaded += min(offset, size) - previous
+        if file_path not in self._done:
+            self._bytes_left -= min(offset, size) - previous
+
+    def _set_done(self, file_path: str, done: bool) -> None:
+        if file_path in self._done:
+            return
+        self._done[file_path] = done
+        # Failed files will not progress any further
+        self._bytes_left -= self._file_sizes.get(file_path, 0) - min(self._offsets.get(file_path, 0),
+                                                                     self._file_sizes.get(file_path, 0))
+        if done:
+            self._files_completed += 1
+        else:
+            self._files_failed += 1
+
+    def _report(self, event: UploadProgressEvent, file_path: Optional[str] = None) -> UploadProgress:
+        progress = self._progress(event, file_path)
+        for callback in self._callbacks:
+            try:
+                callback(progress)
+            except Exception as e:
+                logger.warning(f"Upload progress callback failed: {e!r}")
+        return progress
+
+    def _progress(self, event: UploadProgressEvent, file_path: Optional[str]) -> UploadProgress:
+        now = self._clock()
+        window_start, window_sent = self._samples[0]
+        bytes_per_second = (self._sent - window_sent) / (now - window_start) \
+            if self._sent > window_sent and now > window_start else None
+        if not self._bytes_left:
+            eta_seconds = 0.0
+        else:
+            eta_seconds = self._bytes_left / bytes_per_second if bytes_per_second else None
+
+        progress = UploadProgress(
+            event=event,
+            bytes_uploaded=self._bytes_uploaded,
+            total_bytes=self._total_bytes,
+            bytes_per_second=bytes_per_second,
+            eta_seconds=eta_seconds,
+            files_completed=self._files_completed,
+            files_failed=self._files_failed,
+            total_files=len(self._file_sizes),
+            retries=self._retries,
+            elapsed_seconds=now - self._started_at,
+        )
+        if file_path is not None:
+            file_elapsed = now - self._file_started_at.get(file_path, now)
+            file_sent = self._file_sent.get(file_path, 0)
+            progress.file_path = file_path
+            progress.file_size = self._file_sizes.get(file_path, 0)
+            progress.file_bytes_uploaded = self._offsets.get(file_path, 0)
+            progress.file_bytes_per_second = file_sent / file_elapsed if file_sent and file_elapsed > 0 else None
+            progress.file_retries = self._file_retries.get(file_path, 0)
+        return progress
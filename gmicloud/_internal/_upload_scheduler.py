@@ -0,0 +1,137 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from ._constants import DEFAULT_UPLOAD_CONCURRENCY, DEFAULT_UPLOAD_BUFFER_BUDGET_BYTES, UPLOAD_BANDWIDTH_BURST_S, \
+    RESUMABLE_CHUNK_ALIGNMENT
+from ._token_bucket import TokenBucket
+from ._aimd_concurrency_limiter import AimdConcurrencyLimiter
+
+
+class UploadScheduler:
+    """
+    Shares upload limits between all the uploads of a client:
+
+    - a global limit on the number of files uploaded at the same time,
+    - an optional cap on the aggregate upload bandwidth, enforced with a token bucket,
+    - a budget for the chunk data held in memory, including chunks read ahead from disk,
+    - optionally, adaptive uploads: chunk sizes follow the measured throughput and round-trip time of each file, and
+      the number of chunk requests in flight is tuned with an AIMD controller, up to `max_concurrency`.
+
+    Files are scheduled largest first, so that the longest upload starts early and does not finish last on its own.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY, max_bandwidth_bps: Optional[float] = None,
+                 buffer_budget_bytes: int = DEFAULT_UPLOAD_BUFFER_BUDGET_BYTES, adaptive: bool = False):
+        """
+        Initialize the upload scheduler.
+
+        :param max_concurrency: The maximum number of files uploaded at the same time.
+        :param max_bandwidth_bps: The maximum aggregate upload bandwidth in bytes per second, or None for no cap.
+        :param buffer_budget_bytes: The maximum number of bytes of chunk data held in memory by all uploads.
+        :param adaptive: Whether to adapt the chunk size and the number of chunk requests in flight to the network.
+        :raises ValueError: If a limit is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("Upload concurrency must be at least 1.")
+        if max_bandwidth_bps is not None and max_bandwidth_bps <= 0:
+            raise ValueError("Upload bandwidth must be positive.")
+        if buffer_budget_bytes <= 0:
+            raise ValueError("Upload buffer budget must be positive.")
+        self.max_concurrency = max_concurrency
+        self.max_bandwidth_bps = max_bandwidth_bps
+        self.buffer_budget_bytes = buffer_budget_bytes
+        self.adaptive = adaptive
+        self.concurrency_limiter = AimdConcurrencyLimiter(max_concurrency) if adaptive else None
+        self._file_slots = threading.BoundedSemaphore(max_concurrency)
+        self._bandwidth = TokenBucket(max_bandwidth_bps, max_bandwidth_bps * UPLOAD_BANDWIDTH_BURST_S) \
+            if max_bandwidth_bps else None
+        self._buffer_available = buffer_budget_bytes
+        self._buffer_condition = threading.Condition()
+        self._chunked_uploads = 0
+
+    @staticmethod
+    def order_largest_first(file_paths: List[str]) -> List[str]:
+        """
+        Order files by decreasing size.
+
+        :param file_paths: The paths of the files to upload.
+        :return: The paths, largest file first.
+        """
+        return sorted(file_paths, key=os.path.getsize, reverse=True)
+
+    @contextmanager
+    def file_slot(self):
+        """
+        Hold one of the `max_concurrency` upload slots while uploading a file, waiting for one if needed.
+        """
+        with self._file_slots:
+            yield
+
+    @contextmanager
+    def chunked_upload(self):
+        """
+        Count a resumable upload as in progress while its chunks are read and sent, see `chunk_size_limit`.
+        """
+        with self._buffer_condition:
+            self._chunked_uploads += 1
+        try:
+            yield
+        finally:
+            with self._buffer_condition:
+                self._chunked_uploads -= 1
+
+    def chunk_size_limit(self, read_ahead: int) -> int:
+        """
+        Get the largest chunk size that lets every resumable upload in progress hold its current chunk and `read_ahead`
+        more within the buffer budget, so that adaptive chunk sizes do not make uploads wait for each other's memory.
+
+        :param read_ahead: The number of chunks read ahead of the one being sent.
+        :return: The chunk size in bytes, a multiple of the resumable upload alignment.
+        """
+        with self._buffer_condition:
+            share = self.buffer_budget_bytes // ((read_ahead + 1) * max(self._chunked_uploads, 1))
+        return max(share // RESUMABLE_CHUNK_ALIGNMENT * RESUMABLE_CHUNK_ALIGNMENT, RESUMABLE_CHUNK_ALIGNMENT)
+
+    def acquire_buffer(self, nbytes: int) -> int:
+        """
+        Reserve memory for chunk data, waiting until enough of the budget is free.
+        A request larger than the whole budget waits for the whole budget.
+
+        :param nbytes: The number of bytes to reserve.
+        :return: The number of bytes reserved, to pass to `release_buffer`.
+        """
+        nbytes = min(nbytes, self.buffer_budget_bytes)
+        with self._buffer_condition:
+            self._buffer_condition.wait_for(lambda: self._buffer_available >= nbytes)
+            self._buffer_available -= nbytes
+        return nbytes
+
+    def release_buffer(self, nbytes: int) -> None:
+        """
+        Return memory reserved with `acquire_buffer` to the budget.
+
+        :param nbytes: The number of bytes returned by `acquire_buffer`.
+        """
+        with self._buffer_condition:
+            self._buffer_available += nbytes
+            self._buffer_condition.notify_all()
+
+    def reserve_bandwidth(self, nbytes: int) -> float:
+        """
+        Account for bytes about to be sent.
+
+        :param nbytes: The number of bytes.
+        :return: The number of seconds to wait before sending them, 0 if there is no bandwidth cap.
+        """
+        return self._bandwidth.reserve(nbytes) if self._bandwidth is not None else 0.0
+
+    def throttle(self, nbytes: int) -> None:
+        """
+        Account for bytes about to be sent, sleeping as long as the bandwidth cap requires.
+
+        :param nbytes: The number of bytes.
+        """
+        if self._bandwidth is not None:
+            self._bandwidth.consume(nbytes)
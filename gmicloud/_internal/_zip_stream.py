@@ -0,0 +1,235 @@
+import os
+import time
+import zlib
+import struct
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from ._exceptions import UploadFileError
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4s4H2LH")
+_ZIP64_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_EXTRA = 0x0001
+# Sizes and crc are written after the data; names are UTF-8
+_FLAGS = 0x08 | 0x800
+_MAX_UINT32 = 0xFFFFFFFF
+_MAX_UINT16 = 0xFFFF
+
+
+class ZipStream:
+    """
+    A zip archive of files, produced block by block as it is iterated, so it can be sent as a request body without
+    ever being written to disk or held in memory.
+
+    Files are read in blocks of `BLOCK_SIZE` bytes and the blocks are deflated in parallel by a thread pool, each
+    with its own compressor, ending on a byte boundary, so that the compressed blocks of a file concatenate into a
+    single deflate stream. At most twice as many blocks as there are workers are held in memory at a time. Sizes and
+    CRC-32 are written in a data descriptor after the data of every file, and ZIP64 records are used where sizes or
+    offsets need them.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, files: List[Tuple[str, str]], compress_level: int = 6, max_workers: Optional[int] = None):
+        """
+        Initialize the zip stream.
+
+        :param files: The (name in the archive, local path) of every file, in order.
+        :param compress_level: The deflate level from 0 (files are stored uncompressed) to 9.
+        :param max_workers: The number of threads compressing blocks, defaults to the number of CPUs.
+        :raises ValueError: If there is no file, two files have the same name or the level is out of range.
+        """
+        arcnames = [arcname for arcname, _ in files]
+        if not files:
+            raise ValueError("A zip archive needs at least one file.")
+        if len(set(arcnames)) != len(arcnames):
+            raise ValueError("Files of a zip archive must have distinct names.")
+        if not 0 <= compress_level <= 9:
+            raise ValueError("Compression level must be between 0 and 9.")
+        self.files = list(files)
+        self.compress_level = compress_level
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @classmethod
+    def from_directory(cls, directory: str, compress_level: int = 6,
+                       max_workers: Optional[int] = None) -> "ZipStream":
+        """
+        Create a zip stream of every file under a directory, named by their path relative to it.
+
+        :param directory: The path of the directory.
+        :param compress_level: The deflate level from 0 (files are stored uncompressed) to 9.
+        :param max_workers: The number of threads compressing blocks, defaults to the number of CPUs.
+        :return: The zip stream.
+        :raises ValueError: If the directory holds no file.
+        """
+        files = []
+        for root, dirs, names in os.walk(directory):
+            dirs.sort()
+            for name in sorted(names):
+                path = os.path.join(root, name)
+                files.append((os.path.relpath(path, directory).replace(os.path.sep, "/"), path))
+        return cls(files, compress_level, max_workers)
+
+    @classmethod
+    def from_files(cls, file_paths: List[str], compress_level: int = 6,
+                   max_workers: Optional[int] = None) -> "ZipStream":
+        """
+        Create a zip stream of files, named by their base name.
+
+        :param file_paths: The paths of the files.
+        :param compress_level: The deflate level from 0 (files are stored uncompressed) to 9.
+        :param max_workers: The number of threads compressing blocks, defaults to the number of CPUs.
+        :return: The zip stream.
+        :raises ValueError: If there is no file or two files have the same base name.
+        """
+        return cls([(os.path.basename(path), path) for path in file_paths], compress_level, max_workers)
+
+    def __str__(self):
+        return f"zip archive of {len(self.files)} files"
+
+    def __iter__(self) -> Iterator[bytes]:
+        offset = 0
+        central_directory = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            blocks = self._read_blocks()
+            pending = deque()
+            try:
+                entry = None
+                while True:
+                    while len(pending) < 2 * self.max_workers:
+                        block = next(blocks, None)
+                        if block is None:
+                            break
+                        index, data, crc, last = block
+                        pending.append((index, len(data), crc, last, pool.submit(self._compress, data, last)))
+                    if not pending:
+                        break
+
+                    index, size, crc, last, compressed = pending.popleft()
+                    if entry is None:
+                        entry = self._start_entry(index, offset)
+                        header = self._local_header(entry)
+                        offset += len(header)
+                        yield header
+                    data = compressed.result()
+                    entry["size"] += size
+                    entry["compressed_size"] += len(data)
+                    offset += len(data)
+                    yield data
+                    if last:
+                        entry["crc"] = crc
+                        descriptor = self._data_descriptor(entry)
+                        offset += len(descriptor)
+                        yield descriptor
+                        central_directory.append(entry)
+                        entry = None
+            finally:
+                for _, _, _, _, compressed in pending:
+                    compressed.cancel()
+                blocks.close()
+
+        yield self._central_directory(central_directory, offset)
+
+    def _read_blocks(self) -> Iterator[Tuple[int, bytes, int, bool]]:
+        """
+        Read the files in blocks, computing their CRC-32 on the way.
+
+        :return: An iterator of (file index, block, CRC-32 of the file so far, whether the block ends the file).
+        """
+        for index, (_, path) in enumerate(self.files):
+            crc = 0
+            with open(path, "rb") as file:
+                block = file.read(self.BLOCK_SIZE)
+                while True:
+                    next_block = file.read(self.BLOCK_SIZE) if len(block) == self.BLOCK_SIZE else b""
+                    crc = zlib.crc32(block, crc)
+                    yield index, block, crc, not next_block
+                    if not next_block:
+                        break
+                    block = next_block
+
+    def _compress(self, data: bytes, last: bool) -> bytes:
+        if not self.compress_level:
+            return data
+        # zlib releases the GIL, so blocks are compressed in parallel
+        compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+    def _start_entry(self, index: int, offset: int) -> dict:
+        arcname, path = self.files[index]
+        stat = os.stat(path)
+        year, month, day, hour, minute, second = time.localtime(stat.st_mtime)[:6]
+        if year < 1980:
+            year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+        return {
+            "name": arcname.encode("utf-8"),
+            "path": path,
+            "offset": offset,
+            "dos_time": hour << 11 | minute << 5 | second // 2,
+            "dos_date": (year - 1980) << 9 | month << 5 | day,
+            "mode": stat.st_mode,
+            # Like zipfile, allow for compressed data slightly larger than the file
+            "zip64": stat.st_size * 1.05 > zipfile.ZIP64_LIMIT,
+            "method": zipfile.ZIP_DEFLATED if self.compress_level else zipfile.ZIP_STORED,
+            "crc": 0,
+            "size": 0,
+            "compressed_size": 0,
+        }
+
+    @staticmethod
+    def _local_header(entry: dict) -> bytes:
+        extra = struct.pack("<2H2Q", _ZIP64_EXTRA, 16, 0, 0) if entry["zip64"] else b""
+        sizes = _MAX_UINT32 if entry["zip64"] else 0
+        return _LOCAL_HEADER.pack(b"PK\x03\x04", 45 if entry["zip64"] else 20, _FLAGS, entry["method"],
+                                  entry["dos_time"], entry["dos_date"], 0, sizes, sizes,
+                                  len(entry["name"]), len(extra)) + entry["name"] + extra
+
+    @staticmethod
+    def _data_descriptor(entry: dict) -> bytes:
+        if entry["zip64"]:
+            return struct.pack("<4sL2Q", b"PK\x07\x08", entry["crc"], entry["compressed_size"], entry["size"])
+        if max(entry["size"], entry["compressed_size"]) > zipfile.ZIP64_LIMIT:
+            raise UploadFileError(f"File {entry['path']} grew while being archived")
+        return struct.pack("<4s3L", b"PK\x07\x08", entry["crc"], entry["compressed_size"], entry["size"])
+
+    @staticmethod
+    def _central_directory(entries: List[dict], offset: int) -> bytes:
+        records = []
+        for entry in entries:
+            zip64_fields = []
+            size, compressed_size, header_offset = entry["size"], entry["compressed_size"], entry["offset"]
+            if entry["zip64"] or size > zipfile.ZIP64_LIMIT:
+                zip64_fields.append(size)
+                size = _MAX_UINT32
+            if entry["zip64"] or compressed_size > zipfile.ZIP64_LIMIT:
+                zip64_fields.append(compressed_size)
+                compressed_size = _MAX_UINT32
+            if header_offset > zipfile.ZIP64_LIMIT:
+                zip64_fields.append(header_offset)
+                header_offset = _MAX_UINT32
+            extra = struct.pack(f"<2H{len(zip64_fields)}Q", _ZIP64_EXTRA, 8 * len(zip64_fields),
+                                *zip64_fields) if zip64_fields else b""
+            version = 45 if zip64_fields else 20
+            records.append(_CENTRAL_HEADER.pack(
+                b"PK\x01\x02", 3 << 8 | version, version, _FLAGS, entry["method"], entry["dos_time"],
+                entry["dos_date"], entry["crc"], compressed_size, size, len(entry["name"]), len(extra), 0, 0, 0,
+                (entry["mode"] & 0xFFFF) << 16, header_offset) + entry["name"] + extra)
+
+        directory = b"".join(records)
+        count, directory_size, directory_offset = len(entries), len(directory), offset
+        if count > _MAX_UINT16 or directory_size > zipfile.ZIP64_LIMIT or directory_offset > zipfile.ZIP64_LIMIT:
+            zip64_end_offset = offset + directory_size
+            directory += _ZIP64_END_OF_CENTRAL_DIRECTORY.pack(
+                b"PK\x06\x06", _ZIP64_END_OF_CENTRAL_DIRECTORY.size - 12, 45, 45, 0, 0, count, count,
+                directory_size, directory_offset)
+            directory += _ZIP64_LOCATOR.pack(b"PK\x06\x07", 0, zip64_end_offset, 1)
+            count = min(count, _MAX_UINT16)
+            directory_size = min(directory_size, _MAX_UINT32)
+            directory_offset = min(directory_offset, _MAX_UINT32)
+        return directory + _END_OF_CENTRAL_DIRECTORY.pack(b"PK\x05\x06", 0, 0, count, count, directory_size,
+                                                          directory_offset, 0)
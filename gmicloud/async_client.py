@@ -0,0 +1,156 @@
+import os
+import logging
+
+from typing import Optional
+
+from ._internal._client._async_iam_client import AsyncIAMClient
+from ._internal._client._async_http_client import create_async_session
+from ._internal._client._retry import RetryPolicy
+from ._internal._upload_scheduler import UploadScheduler
+from ._internal._constants import (
+    DEFAULT_POOL_MAXSIZE, DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S, DEFAULT_TOKEN_REFRESH_MARGIN_S
+)
+from ._internal._deadline import Timeout
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient:
+    """
+    Asyncio mirror of `Client`. Every manager method is a coroutine sharing one pooled async session.
+
+    Usage::
+
+        async with AsyncClient() as client:
+            task = await client.task_manager.get_task(task_id)
+    """
+
+    def __init__(self, email: Optional[str] = "", password: Optional[str] = "",
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S),
+                 token_refresh_margin_s: Optional[float] = DEFAULT_TOKEN_REFRESH_MARGIN_S,
+                 background_token_renewal: bool = False,
+                 lazy_login: bool = False,
+                 api_key: Optional[str] = "",
+                 upload_scheduler: Optional[UploadScheduler] = None):
+        """
+        Initialize the AsyncClient. Log in with `await login()` or `async with`; otherwise the first API call does.
+
+        :param email: Email for login, defaults to the GMI_CLOUD_EMAIL environment variable.
+        :param password: Password for login, defaults to the GMI_CLOUD_PASSWORD environment variable.
+        :param pool_maxsize: The maximum number of keep-alive connections kept by the shared session.
+        :param retry_policy: The policy for retrying transient failures, defaults to `RetryPolicy()`.
+        :param timeout: The default timeout of every API request, in seconds or as a (connect, read) tuple.
+        :param token_refresh_margin_s: Refresh the access token this many seconds before it expires instead of
+                                       waiting for a 401. None disables proactive renewal.
+        :param background_token_renewal: Whether to renew the access token from a background task started by
+                                         `login()` rather than before the next request.
+        :param lazy_login: Whether `async with` skips the login, deferring it to the first API call.
+        :param api_key: An organization API key to authenticate with instead of email and password, defaults to
+                        the GMI_CLOUD_API_KEY environment variable when no email or password is given.
+        :param upload_scheduler: The concurrency, bandwidth and memory limits shared by all uploads, defaults to
+                                 `UploadScheduler()`.
+        """
+        if not api_key or not api_key.strip():
+            # The API key from the environment is only used when no login credentials are given
+            api_key = os.getenv("GMI_CLOUD_API_KEY") if not email and not password else None
+
+        # With an API key every request carries the key, so no login credentials are needed
+        if not api_key:
+            if not email or not email.strip():
+                email = os.getenv("GMI_CLOUD_EMAIL")
+            if not password or not password.strip():
+                password = os.getenv("GMI_CLOUD_PASSWORD")
+
+            if not email:
+                raise ValueError("Email must be provided.")
+            if not password:
+                raise ValueError("Password must be provided.")
+
+        client_id = "gmisdk"
+        self._session = create_async_session(pool_maxsize)
+        self.iam_client = AsyncIAMClient(client_id, email, password, session=self._session,
+                                         retry_policy=retry_policy, timeout=timeout,
+                                         token_refresh_margin_s=token_refresh_margin_s, api_key=api_key)
+        self._background_token_renewal = background_token_renewal
+        self._lazy_login = lazy_login
+
+        self._upload_scheduler = upload_scheduler
+
+        # Managers are lazily initialized through private attributes
+        self._artifact_manager = None
+        self._task_manager = None
+        self._iam_manager = None
+        self._video_manager = None
+
+    async def login(self) -> bool:
+        """
+        Log in with the configured credentials.
+
+        :return: True if login is successful, otherwise False.
+        """
+        logged_in = await self.iam_client.login()
+        if logged_in and self._background_token_renewal:
+            self.iam_client.start_token_renewal()
+        return logged_in
+
+    @property
+    def artifact_manager(self):
+        """
+        Lazy initialization for AsyncArtifactManager.
+        Ensures the AsyncClient instance controls its lifecycle.
+        """
+        if self._artifact_manager is None:
+            from ._internal._manager._async_artifact_manager import AsyncArtifactManager
+            self._artifact_manager = AsyncArtifactManager(self.iam_client, self._upload_scheduler)
+        return self._artifact_manager
+
+    @property
+    def task_manager(self):
+        """
+        Lazy initialization for AsyncTaskManager.
+        Ensures the AsyncClient instance controls its lifecycle.
+        """
+        if self._task_manager is None:
+            from ._internal._manager._async_task_manager import AsyncTaskManager
+            self._task_manager = AsyncTaskManager(self.iam_client)
+        return self._task_manager
+
+    @property
+    def video_manager(self):
+        """
+        Lazy initialization for AsyncVideoManager.
+        Ensures the AsyncClient instance controls its lifecycle.
+        """
+        if self._video_manager is None:
+            from ._internal._manager._async_video_manager import AsyncVideoManager
+            self._video_manager = AsyncVideoManager(self.iam_client)
+        return self._video_manager
+
+    @property
+    def iam_manager(self):
+        """
+        Lazy initialization for AsyncIAMManager.
+        Ensures the AsyncClient instance controls its lifecycle.
+        """
+        if self._iam_manager is None:
+            from ._internal._manager._async_iam_manager import AsyncIAMManager
+            self._iam_manager = AsyncIAMManager(self.iam_client)
+        return self._iam_manager
+
+    async def aclose(self) -> None:
+        """
+        Stop the background token renewal, if any, and close the pooled async session and its connections.
+        """
+        await self.iam_client.stop_token_renewal()
+        await self._session.aclose()
+
+    async def __aenter__(self):
+        if not self._lazy_login:
+            await self.login()
+        elif self._background_token_renewal:
+            self.iam_client.start_token_renewal()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
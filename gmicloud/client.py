@@ -5,10 +5,14 @@ import logging
 from typing import Optional
 
 from ._internal._client._iam_client import IAMClient
-from ._internal._manager._artifact_manager import ArtifactManager
-from ._internal._manager._task_manager import TaskManager
-from ._internal._manager._iam_manager import IAMManager
-from ._internal._manager._video_manager import VideoManager
+from ._internal._client._http_client import create_session
+from ._internal._client._retry import RetryPolicy
+from ._internal._upload_scheduler import UploadScheduler
+from ._internal._constants import (
+    DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S,
+    DEFAULT_TOKEN_REFRESH_MARGIN_S
+)
+from ._internal._deadline import Timeout
 from ._internal._enums import BuildStatus, TaskStatus, TaskEndpointStatus
 from ._internal._models import Task, TaskConfig, RayTaskConfig, TaskScheduling, ReplicaResource
 
@@ -16,20 +20,63 @@ logger = logging.getLogger(__name__)
 
 
 class Client:
-    def __init__(self, email: Optional[str] = "", password: Optional[str] = ""):
-        if not email or not email.strip():
-            email = os.getenv("GMI_CLOUD_EMAIL")
-        if not password or not password.strip():
-            password = os.getenv("GMI_CLOUD_PASSWORD")
-        
-        if not email:
-            raise ValueError("Email must be provided.")
-        if not password:
-            raise ValueError("Password must be provided.")
+    def __init__(self, email: Optional[str] = "", password: Optional[str] = "",
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT_S, DEFAULT_READ_TIMEOUT_S),
+                 token_refresh_margin_s: Optional[float] = DEFAULT_TOKEN_REFRESH_MARGIN_S,
+                 background_token_renewal: bool = False,
+                 lazy_login: bool = False,
+                 api_key: Optional[str] = "",
+                 upload_scheduler: Optional[UploadScheduler] = None):
+        """
+        Initialize the Client and log in.
+
+        :param email: Email for login, defaults to the GMI_CLOUD_EMAIL environment variable.
+        :param password: Password for login, defaults to the GMI_CLOUD_PASSWORD environment variable.
+        :param pool_connections: The number of per-host connection pools kept by the shared session.
+        :param pool_maxsize: The maximum number of keep-alive connections per host.
+        :param retry_policy: The policy for retrying transient failures, defaults to `RetryPolicy()`.
+        :param timeout: The default timeout of every API request, in seconds or as a (connect, read) tuple.
+        :param token_refresh_margin_s: Refresh the access token this many seconds before it expires instead of
+                                       waiting for a 401. None disables proactive renewal.
+        :param background_token_renewal: Whether to renew the access token from a background thread rather than
+                                         before the next request.
+        :param lazy_login: Whether to defer the login to the first API call, so that the constructor returns
+                           without any network round trip.
+        :param api_key: An organization API key to authenticate with instead of email and password, defaults to
+                        the GMI_CLOUD_API_KEY environment variable when no email or password is given.
+        :param upload_scheduler: The concurrency, bandwidth and memory limits shared by all uploads, defaults to
+                                 `UploadScheduler()`.
+        """
+        if not api_key or not api_key.strip():
+            # The API key from the environment is only used when no login credentials are given
+            api_key = os.getenv("GMI_CLOUD_API_KEY") if not email and not password else None
+
+        # With an API key every request carries the key, so no login credentials are needed
+        if not api_key:
+            if not email or not email.strip():
+                email = os.getenv("GMI_CLOUD_EMAIL")
+            if not password or not password.strip():
+                password = os.getenv("GMI_CLOUD_PASSWORD")
+
+            if not email:
+                raise ValueError("Email must be provided.")
+            if not password:
+                raise ValueError("Password must be provided.")
 
         client_id = "gmisdk"
-        self.iam_client = IAMClient(client_id, email, password)
-        self.iam_client.login()
+        # One pooled session is shared by the IAM, artifact, task and video clients
+        self._session = create_session(pool_connections, pool_maxsize)
+        self.iam_client = IAMClient(client_id, email, password, session=self._session, retry_policy=retry_policy,
+                                    timeout=timeout, token_refresh_margin_s=token_refresh_margin_s,
+                                    api_key=api_key)
+        if not lazy_login:
+            self.iam_client.login()
+        if background_token_renewal:
+            self.iam_client.start_token_renewal()
+
+        self._upload_scheduler = upload_scheduler
 
         # Managers are lazily initialized through private attributes
         self._artifact_manager = None
@@ -44,7 +91,8 @@ class Client:
         Ensures the Client instance controls its lifecycle.
         """
         if self._artifact_manager is None:
-            self._artifact_manager = ArtifactManager(self.iam_client)
+            from ._internal._manager._artifact_manager import ArtifactManager
+            self._artifact_manager = ArtifactManager(self.iam_client, self._upload_scheduler)
         return self._artifact_manager
 
     @property
@@ -54,6 +102,7 @@ class Client:
         Ensures the Client instance controls its lifecycle.
         """
         if self._task_manager is None:
+            from ._internal._manager._task_manager import TaskManager
             self._task_manager = TaskManager(self.iam_client)
         return self._task_manager
 
@@ -64,6 +113,7 @@ class Client:
         Ensures the Client instance controls its lifecycle.
         """
         if self._video_manager is None:
+            from ._internal._manager._video_manager import VideoManager
             self._video_manager = VideoManager(self.iam_client)
         return self._video_manager
 
@@ -74,9 +124,23 @@ class Client:
         Ensures the Client instance controls its lifecycle.
         """
         if self._iam_manager is None:
+            from ._internal._manager._iam_manager import IAMManager
             self._iam_manager = IAMManager(self.iam_client)
         return self._iam_manager
 
+    def close(self) -> None:
+        """
+        Stop the background token renewal, if any, and close the pooled session and its keep-alive connections.
+        """
+        self.iam_client.stop_token_renewal()
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     # def list_templates(self) -> list[str]:
     #     """
     #     List all public templates.
@@ -0,0 +1,153 @@
+import time
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from gmicloud._internal._adaptive_chunk_sizer import AdaptiveChunkSizer
+from gmicloud._internal._aimd_concurrency_limiter import AimdConcurrencyLimiter
+from gmicloud._internal._constants import RESUMABLE_CHUNK_ALIGNMENT
+from gmicloud._internal._upload_scheduler import UploadScheduler
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+from gmicloud.tests.test_file_upload import FakeResumableServer, UploadTestCase
+
+MiB = 1024 * 1024
+
+
+class TestAdaptiveChunkSizer(unittest.TestCase):
+
+    def test_sizes_are_aligned_and_bounded(self):
+        sizer = AdaptiveChunkSizer(10 * MiB + 12345, min_chunk_size=MiB + 1, max_chunk_size=64 * MiB + 1)
+        self.assertEqual((sizer.chunk_size, sizer.min_chunk_size, sizer.max_chunk_size),
+                         (10 * MiB, MiB + RESUMABLE_CHUNK_ALIGNMENT, 64 * MiB))
+        for _ in range(10):
+            sizer.record_chunk(sizer.chunk_size, 0.001)
+            self.assertEqual(sizer.chunk_size % RESUMABLE_CHUNK_ALIGNMENT, 0)
+        self.assertEqual(sizer.chunk_size, 64 * MiB)
+        for _ in range(40):
+            sizer.record_chunk(sizer.chunk_size, 1000)
+        self.assertEqual(sizer.chunk_size, MiB + RESUMABLE_CHUNK_ALIGNMENT)
+        with self.assertRaises(ValueError):
+            AdaptiveChunkSizer(MiB, min_chunk_size=2 * MiB, max_chunk_size=MiB)
+
+    def test_size_changes_at_most_twofold_per_chunk(self):
+        fast, slow = AdaptiveChunkSizer(8 * MiB), AdaptiveChunkSizer(8 * MiB)
+        fast.record_chunk(8 * MiB, 0.001)
+        slow.record_chunk(8 * MiB, 100)
+        self.assertEqual((fast.chunk_size, slow.chunk_size), (16 * MiB, 4 * MiB))
+
+    def test_chunks_span_many_round_trips_on_distant_links(self):
+        near, far = AdaptiveChunkSizer(8 * MiB), AdaptiveChunkSizer(8 * MiB)
+        near.record_rtt(0.005)
+        far.record_rtt(0.25)
+        for _ in range(5):
+            # 10 MiB/s
+            near.record_chunk(near.chunk_size, near.chunk_size / (10 * MiB))
+            far.record_chunk(far.chunk_size, far.chunk_size / (10 * MiB))
+        self.assertEqual(near.chunk_size, 20 * MiB)
+        self.assertEqual(far.chunk_size, 50 * MiB)
+
+
+class TestAimdConcurrencyLimiter(unittest.TestCase):
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        limiter = AimdConcurrencyLimiter(max_limit=8, initial_limit=2)
+        # 2, 2.5, 2.9, ... grows by one per round of `limit` chunks
+        for _ in range(6):
+            with limiter.slot():
+                limiter.record_success(MiB, 0.1)
+        self.assertEqual(limiter.limit, 4)
+
+        with limiter.slot():
+            limiter.record_failure()
+        self.assertEqual(limiter.limit, 2)
+        # Further failures within the same round do not decrease the limit again
+        with limiter.slot():
+            limiter.record_failure()
+        self.assertEqual(limiter.limit, 2)
+        with limiter.slot():
+            limiter.record_failure()
+        self.assertEqual(limiter.limit, 1)
+
+    def test_slow_chunks_count_as_congestion(self):
+        limiter = AimdConcurrencyLimiter(max_limit=8, initial_limit=4)
+        with limiter.slot():
+            limiter.record_success(MiB, 0.1)
+        with limiter.slot():
+            limiter.record_success(MiB, 0.15)
+        self.assertEqual(limiter.limit, 4)
+        with limiter.slot():
+            limiter.record_success(MiB, 1.0)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_slots_block_above_the_limit(self):
+        limiter = AimdConcurrencyLimiter(max_limit=2, initial_limit=2)
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def send_chunk():
+            with limiter.slot():
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+
+        threads = [threading.Thread(target=send_chunk) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state["peak"], 2)
+
+    def test_async_slots_block_above_the_limit(self):
+        limiter = AimdConcurrencyLimiter(max_limit=2, initial_limit=2)
+        state = {"active": 0, "peak": 0}
+
+        async def send_chunk():
+            async with limiter.async_slot():
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.02)
+                state["active"] -= 1
+
+        async def main():
+            await asyncio.gather(*(send_chunk() for _ in range(6)))
+
+        asyncio.run(main())
+        self.assertEqual(state["peak"], 2)
+
+
+class TestAdaptiveUpload(UploadTestCase):
+
+    def test_chunk_size_limit_shares_the_buffer_budget(self):
+        scheduler = UploadScheduler(buffer_budget_bytes=13 * MiB, adaptive=True)
+        self.assertEqual(scheduler.chunk_size_limit(read_ahead=0), 13 * MiB)
+        with scheduler.chunked_upload(), scheduler.chunked_upload():
+            # 13 MiB / (2 uploads * 3 chunks), rounded down to the alignment
+            self.assertEqual(scheduler.chunk_size_limit(read_ahead=2), 2 * MiB)
+
+    def test_chunks_grow_on_a_fast_link(self):
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(40 * MiB)
+        scheduler = UploadScheduler(adaptive=True)
+        chunk_sizes = []
+        session_put = requests.Session.put
+
+        def put(session, url, headers=None, **kwargs):
+            if not headers["Content-Range"].startswith("bytes */"):
+                chunk_sizes.append(int(headers["Content-Length"]))
+            return session_put(session, url, headers=headers, **kwargs)
+
+        with patch.object(requests.Session, "put", put):
+            FileUploadClient.upload_large_file(server.url, file_path, chunk_size=MiB, scheduler=scheduler)
+
+        with open(file_path, "rb") as f:
+            self.assertEqual(bytes(server.data), f.read())
+        self.assertEqual(chunk_sizes[0], MiB)
+        self.assertGreater(max(chunk_sizes), 4 * MiB)
+        self.assertTrue(all(size % RESUMABLE_CHUNK_ALIGNMENT == 0 for size in chunk_sizes[:-1]))
+        self.assertEqual(scheduler.concurrency_limiter._active, 0)
@@ -0,0 +1,83 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gmicloud.client import Client
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._exceptions import UnauthorizedError
+from gmicloud._internal._models import Task
+
+
+def _json_response(status_code=200, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json"}
+    response.json.return_value = body if body is not None else {}
+    response.text = ""
+    return response
+
+
+@patch('gmicloud._internal._client._iam_client.write_user_refresh_token_to_system_config')
+class TestAPIKeyAuth(unittest.TestCase):
+
+    def test_client_sends_key_without_login(self, mock_write_config):
+        client = Client(api_key="test-api-key")
+        with patch.object(client._session, "request", return_value=_json_response(body=[])) as mock_request:
+            self.assertEqual(client.task_manager.get_all_tasks(), [])
+
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Authorization"], "Bearer test-api-key")
+        mock_write_config.assert_not_called()
+        client.close()
+
+    def test_unauthorized_key_is_not_refreshed(self, mock_write_config):
+        client = Client(api_key="revoked-api-key")
+        with patch.object(client._session, "request", return_value=_json_response(401)) as mock_request, \
+                patch.object(IAMClient, "_send_refresh_token") as mock_refresh:
+            with self.assertRaises(UnauthorizedError):
+                client.artifact_manager.artifact_client.get_artifact("test_artifact_id")
+
+        mock_refresh.assert_not_called()
+        mock_write_config.assert_not_called()
+        mock_request.assert_called_once()
+        client.close()
+
+    def test_profile_of_the_key_is_fetched_once(self, mock_write_config):
+        client = Client(api_key="test-api-key")
+
+        def request(method, url, **kwargs):
+            if url.endswith("/me/profile"):
+                return _json_response(body={"user": {"id": "user-1"}, "organization": {"id": "org-1"}})
+            if url.endswith("/api-keys"):
+                return _json_response(body={"keys": []})
+            return _json_response(body={"task": {"task_id": "1"}, "upload_link": ""})
+
+        with patch.object(client._session, "request", side_effect=request) as mock_request:
+            client.task_manager.create_task(Task())
+            self.assertEqual(client.iam_client.get_org_api_keys().keys, [])
+
+        urls = [c.args[1] for c in mock_request.call_args_list]
+        self.assertEqual(sum(url.endswith("/me/profile") for url in urls), 1)
+        self.assertTrue(urls[-1].endswith("/organizations/org-1/api-keys"))
+        self.assertEqual(mock_request.call_args_list[1].kwargs["json"]["owner"]["user_id"], "user-1")
+        client.close()
+
+    def test_unresolved_profile_fails_before_requests_needing_it(self, mock_write_config):
+        client = Client(api_key="test-api-key")
+        with patch.object(client._session, "request", return_value=_json_response(403)) as mock_request:
+            with self.assertRaises(ValueError):
+                client.task_manager.create_task(Task())
+            self.assertIsNone(client.iam_client.get_org_api_keys())
+
+        self.assertTrue(all(c.args[1].endswith("/me/profile") for c in mock_request.call_args_list))
+        client.close()
+
+    @patch.dict(os.environ, {"GMI_CLOUD_API_KEY": "env-api-key"})
+    def test_api_key_from_environment(self, mock_write_config):
+        client = Client()
+        self.assertEqual(client.iam_client.get_custom_headers()["Authorization"], "Bearer env-api-key")
+
+        with patch.object(IAMClient, "login") as mock_login:
+            client = Client(email="test_email", password="test_password")
+        mock_login.assert_called_once()
+        self.assertEqual(client.iam_client.get_custom_headers()["Authorization"], "Bearer ")
@@ -1,9 +1,12 @@
+import shutil
+import threading
 import unittest
 from unittest.mock import patch
 from gmicloud._internal._manager._artifact_manager import ArtifactManager
 from gmicloud._internal._client._iam_client import IAMClient
 from gmicloud._internal._models import *
 from gmicloud._internal._enums import BuildStatus
+from gmicloud._internal._exceptions import UploadFileError
 
 
 class TestArtifactManager(unittest.TestCase):
@@ -87,7 +90,8 @@ class TestArtifactManager(unittest.TestCase):
             artifact_file_path=artifact_file_path,
         )
         self.assertEqual(artifact_id, "test_artifact_id")
-        mock_upload_small_file.assert_called_once_with(upload_link, artifact_file_path, "application/zip")
+        mock_upload_small_file.assert_called_once_with(upload_link, artifact_file_path, "application/zip",
+                                                       scheduler=self.artifact_manager.upload_scheduler)
 
     def test_create_artifact_with_file_raises_error_for_invalid_file_type(self):
         with self.assertRaises(ValueError) as context:
@@ -132,6 +136,8 @@ class TestArtifactManager(unittest.TestCase):
         bigfile_upload_link = "http://bigfile-upload-link"
         artifact_file_path = "./testdata/test.zip"
         model_directory= "./testdata"
+        # Drop the upload journal so that the next run uploads every file again
+        self.addCleanup(shutil.rmtree, "./testdata/.cache", True)
 
         mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link=upload_link)
         mock_get_bigfile_upload_url.return_value = ResumableUploadLinkResponse(artifact_id="1",
@@ -141,9 +147,56 @@ class TestArtifactManager(unittest.TestCase):
                                                                              artifact_file_path=artifact_file_path,
                                                                              model_directory=model_directory)
         self.assertEqual(artifact_id, "1")
-        mock_upload_small_file.assert_called_once_with(upload_link, artifact_file_path, "application/zip")
+        mock_upload_small_file.assert_called_once_with(upload_link, artifact_file_path, "application/zip",
+                                                       scheduler=self.artifact_manager.upload_scheduler)
         self.assertEqual(mock_upload_large_file.call_count, 6) # 6 files in testdata directory
 
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.create_artifact')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    @patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_small_file')
+    @patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_large_file')
+    def test_create_artifact_with_model_files_pipelined(self, mock_upload_large_file, mock_upload_small_file,
+                                                        mock_get_bigfile_upload_url, mock_create_artifact,
+                                                        mock_get_artifact):
+        self.addCleanup(shutil.rmtree, "./testdata/.cache", True)
+        model_file_uploading = threading.Event()
+        mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link="http://upload-link")
+        mock_get_bigfile_upload_url.return_value = ResumableUploadLinkResponse(artifact_id="1",
+                                                                               upload_link="http://bigfile")
+        # The artifact file upload only completes once a model file upload has started alongside it
+        mock_upload_small_file.side_effect = lambda *args, **kwargs: self.assertTrue(model_file_uploading.wait(5))
+        mock_upload_large_file.side_effect = lambda *args, **kwargs: model_file_uploading.set()
+        mock_get_artifact.return_value = Artifact(artifact_id="1", build_status=BuildStatus.SUCCESS)
+
+        artifact_id, build = self.artifact_manager.create_artifact_with_model_files_pipelined(
+            "artifact_name", "./testdata/test.zip", "./testdata", show_progress_bar=False)
+        self.assertEqual(artifact_id, "1")
+        self.assertEqual(build.result(timeout=10), "1")
+        self.assertEqual(mock_get_bigfile_upload_url.call_count, 6)
+        self.assertEqual(mock_upload_large_file.call_count, 6)
+        mock_upload_small_file.assert_called_once()
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.create_artifact')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    @patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_small_file')
+    @patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_large_file')
+    def test_create_artifact_with_model_files_pipelined_reports_failed_uploads(
+            self, mock_upload_large_file, mock_upload_small_file, mock_get_bigfile_upload_url, mock_create_artifact,
+            mock_get_artifact):
+        self.addCleanup(shutil.rmtree, "./testdata/.cache", True)
+        mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link="http://upload-link")
+        mock_get_bigfile_upload_url.return_value = ResumableUploadLinkResponse(artifact_id="1",
+                                                                               upload_link="http://bigfile")
+        mock_upload_large_file.side_effect = UploadFileError("Failed to upload file")
+
+        _, build = self.artifact_manager.create_artifact_with_model_files_pipelined(
+            "artifact_name", "./testdata/test.zip", "./testdata", show_progress_bar=False)
+        with self.assertRaises(UploadFileError):
+            build.result(timeout=10)
+        mock_get_artifact.assert_not_called()
+
     @patch('gmicloud._internal._client._artifact_client.ArtifactClient.rebuild_artifact')
     def test_rebuild_artifact_rebuilds_successfully(self, mock_rebuild_artifact):
         mock_rebuild_artifact.return_value = RebuildArtifactResponse(artifact_id="1", build_status=BuildStatus.SUCCESS)
@@ -215,6 +268,7 @@ class TestArtifactManager(unittest.TestCase):
                                                                  status="success")
         response = self.artifact_manager.delete_bigfile("1", "file.txt")
         self.assertEqual(response, "success")
+        mock_delete_bigfile.assert_called_once_with(DeleteBigfileRequest(artifact_id="1", file_name="file.txt"))
 
     @patch('gmicloud._internal._client._artifact_client.ArtifactClient.delete_bigfile')
     def test_delete_bigfile_raises_error_for_invalid_artifact_id(self, mock_delete_bigfile):
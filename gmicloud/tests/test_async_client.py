@@ -0,0 +1,134 @@
+import shutil
+import asyncio
+import unittest
+from unittest.mock import ANY, patch
+import httpx
+from gmicloud._internal._client._async_http_client import AsyncHTTPClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._manager._async_task_manager import AsyncTaskManager
+from gmicloud._internal._exceptions import APIError, UnauthorizedError
+from gmicloud._internal._models import *
+from gmicloud._internal._enums import BuildStatus
+
+
+class TestAsyncHTTPClient(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_returns_json(self):
+        def handler(request):
+            return httpx.Response(200, json={"task_id": request.url.params["task_id"]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            client = AsyncHTTPClient("https://example.com/ie/task", session)
+            self.assertEqual(await client.get("/get_task", params={"task_id": "1"}), {"task_id": "1"})
+
+    @patch('gmicloud._internal._client._async_http_client.asyncio.sleep')
+    async def test_get_retries_transient_status(self, mock_sleep):
+        responses = iter([httpx.Response(503, json={"error": "unavailable"}), httpx.Response(200, json={"ok": True})])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses))) as session:
+            client = AsyncHTTPClient("https://example.com", session)
+            self.assertEqual(await client.get("/items"), {"ok": True})
+        mock_sleep.assert_called_once()
+
+    async def test_unauthorized_raises(self):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(401))) as session:
+            client = AsyncHTTPClient("https://example.com", session)
+            with self.assertRaises(UnauthorizedError):
+                await client.get("/me/profile")
+
+    async def test_error_message_raises_api_error(self):
+        def handler(request):
+            return httpx.Response(500, json={"error": "boom"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            client = AsyncHTTPClient("https://example.com/ie/artifact", session)
+            with self.assertRaises(APIError) as context:
+                await client.post("/create_artifact", data={})
+            self.assertTrue("500 - boom" in str(context.exception))
+
+
+class TestAsyncManagers(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        self.iam_client._user_id = "test_user_id"
+        self.iam_client._access_token = "test_token"
+
+    async def asyncTearDown(self):
+        await self.iam_client.get_session().aclose()
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_artifact')
+    async def test_get_artifact_returns_artifact(self, mock_get_artifact):
+        mock_get_artifact.return_value = Artifact(artifact_id="1")
+        artifact = await AsyncArtifactManager(self.iam_client).get_artifact("1")
+        self.assertEqual(artifact.artifact_id, "1")
+
+    async def test_get_artifact_raises_error_for_invalid_artifact_id(self):
+        with self.assertRaises(ValueError) as context:
+            await AsyncArtifactManager(self.iam_client).get_artifact("")
+        self.assertTrue("Artifact ID is required and cannot be empty." in str(context.exception))
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.create_artifact')
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url')
+    @patch('gmicloud._internal._client._async_file_upload_client.AsyncFileUploadClient.upload_small_file')
+    @patch('gmicloud._internal._client._async_file_upload_client.AsyncFileUploadClient.upload_large_file')
+    async def test_create_artifact_with_model_files(self, mock_upload_large_file, mock_upload_small_file,
+                                                    mock_get_bigfile_upload_url, mock_create_artifact):
+        upload_link = "http://upload-link"
+        mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link=upload_link)
+        mock_get_bigfile_upload_url.return_value = ResumableUploadLinkResponse(artifact_id="1",
+                                                                               upload_link="http://bigfile")
+        # Drop the upload journal so that the next run uploads every file again
+        self.addCleanup(shutil.rmtree, "./testdata/.cache", True)
+
+        artifact_id = await AsyncArtifactManager(self.iam_client).create_artifact_with_model_files(
+            artifact_name="artifact_name", artifact_file_path="./testdata/test.zip", model_directory="./testdata")
+        self.assertEqual(artifact_id, "1")
+        mock_upload_small_file.assert_called_once_with(upload_link, "./testdata/test.zip", "application/zip",
+                                                       scheduler=ANY)
+        self.assertEqual(mock_upload_large_file.call_count, 6)
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_artifact')
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.create_artifact')
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url')
+    @patch('gmicloud._internal._client._async_file_upload_client.AsyncFileUploadClient.upload_small_file')
+    @patch('gmicloud._internal._client._async_file_upload_client.AsyncFileUploadClient.upload_large_file')
+    async def test_create_artifact_with_model_files_pipelined(self, mock_upload_large_file, mock_upload_small_file,
+                                                              mock_get_bigfile_upload_url, mock_create_artifact,
+                                                              mock_get_artifact):
+        self.addCleanup(shutil.rmtree, "./testdata/.cache", True)
+        model_file_uploading = asyncio.Event()
+
+        async def upload_small_file(*args, **kwargs):
+            await asyncio.wait_for(model_file_uploading.wait(), 5)
+
+        async def upload_large_file(*args, **kwargs):
+            model_file_uploading.set()
+
+        mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link="http://upload-link")
+        mock_get_bigfile_upload_url.return_value = ResumableUploadLinkResponse(artifact_id="1",
+                                                                               upload_link="http://bigfile")
+        # The artifact file upload only completes once a model file upload has started alongside it
+        mock_upload_small_file.side_effect = upload_small_file
+        mock_upload_large_file.side_effect = upload_large_file
+        mock_get_artifact.return_value = Artifact(artifact_id="1", build_status=BuildStatus.SUCCESS)
+
+        artifact_id, build = await AsyncArtifactManager(self.iam_client).create_artifact_with_model_files_pipelined(
+            "artifact_name", "./testdata/test.zip", "./testdata", show_progress_bar=False)
+        self.assertEqual(artifact_id, "1")
+        self.assertEqual(await build, "1")
+        self.assertEqual(mock_upload_large_file.call_count, 6)
+
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_task')
+    async def test_wait_for_task_returns_running_task(self, mock_get_task):
+        mock_get_task.return_value = Task(task_id="1", task_status=TaskStatus.RUNNING,
+                                          endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.RUNNING))
+        task = await AsyncTaskManager(self.iam_client).wait_for_task("1")
+        self.assertEqual(task.task_id, "1")
+
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.create_task')
+    async def test_create_task_from_file(self, mock_create_task):
+        mock_create_task.return_value = CreateTaskResponse(task=Task(task_id="1"), upload_link="")
+        task = await AsyncTaskManager(self.iam_client).create_task_from_file("artifact", "./testdata/one-off_task.json")
+        self.assertEqual(task.task_id, "1")
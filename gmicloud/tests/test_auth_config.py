@@ -0,0 +1,219 @@
+import os
+import jwt
+import asyncio
+import json
+import time
+import threading
+import tempfile
+import unittest
+import multiprocessing
+from unittest.mock import patch
+
+from gmicloud._internal._client import _auth_config
+from gmicloud._internal._client._auth_config import (
+    CONFIG_FILE_NAME,
+    write_user_refresh_token_to_system_config,
+    clear_user_refresh_token_from_system_config,
+    get_user_refresh_token_from_system_config,
+    write_user_profile_to_system_config,
+    get_user_profile_from_system_config,
+)
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._async_task_manager import AsyncTaskManager
+from gmicloud._internal._models import CreateTaskResponse, Task
+from gmicloud._internal._exceptions import APIError
+from gmicloud.client import Client
+
+
+def _jwt(claims):
+    return jwt.encode(dict(claims, exp=int(time.time() + 3600)), "test-signing-key-of-at-least-32-bytes",
+                      algorithm="HS256")
+
+
+def _write_tokens(email, count):
+    for i in range(count):
+        write_user_refresh_token_to_system_config(email, f"{email}-refresh-{i}")
+
+
+class TestAuthConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.addCleanup(self.home.cleanup)
+        home_patcher = patch.dict(os.environ, {"HOME": self.home.name})
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        _auth_config._config_cache = None
+        self.config_file_path = os.path.join(self.home.name, CONFIG_FILE_NAME)
+
+    def test_write_is_atomic_and_private(self):
+        self.assertIsNone(get_user_refresh_token_from_system_config("a@example.com"))
+        self.assertTrue(write_user_refresh_token_to_system_config("a@example.com", "refresh-a"))
+        self.assertTrue(write_user_refresh_token_to_system_config("b@example.com", "refresh-b"))
+
+        with open(self.config_file_path) as f:
+            self.assertEqual(json.load(f), {"a@example.com": {"refresh_token": "refresh-a"},
+                                            "b@example.com": {"refresh_token": "refresh-b"}})
+        self.assertEqual(os.stat(self.config_file_path).st_mode & 0o777, 0o600)
+        self.assertEqual(sorted(os.listdir(self.home.name)), [CONFIG_FILE_NAME, CONFIG_FILE_NAME + ".lock"])
+
+    def test_reads_are_cached_until_file_changes(self):
+        write_user_refresh_token_to_system_config("a@example.com", "refresh-a")
+        with patch("gmicloud._internal._client._auth_config.json.loads", wraps=json.loads) as mock_loads:
+            self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "refresh-a")
+            self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "refresh-a")
+            mock_loads.assert_not_called()
+
+            # Another process replaces the file
+            with open(self.config_file_path, "w") as f:
+                f.write(json.dumps({"a@example.com": {"refresh_token": "refresh-from-other-process"}}))
+            self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"),
+                             "refresh-from-other-process")
+            mock_loads.assert_called_once()
+
+    def test_corrupted_file_is_ignored(self):
+        with open(self.config_file_path, "w") as f:
+            f.write('{"a@example.com": {"refresh_')
+        self.assertIsNone(get_user_refresh_token_from_system_config("a@example.com"))
+        self.assertTrue(write_user_refresh_token_to_system_config("a@example.com", "refresh-a"))
+        self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "refresh-a")
+
+    def test_clear_keeps_token_rotated_by_another_process(self):
+        write_user_refresh_token_to_system_config("a@example.com", "refresh-new")
+        clear_user_refresh_token_from_system_config("a@example.com", "refresh-old")
+        self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "refresh-new")
+        clear_user_refresh_token_from_system_config("a@example.com", "refresh-new")
+        self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "")
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_concurrent_writers_in_several_processes_lose_no_update(self):
+        context = multiprocessing.get_context("fork")
+        emails = [f"user{i}@example.com" for i in range(8)]
+        processes = [context.Process(target=_write_tokens, args=(email, 25)) for email in emails]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        with open(self.config_file_path) as f:
+            config = json.load(f)
+        self.assertEqual(config, {email: {"refresh_token": f"{email}-refresh-24"} for email in emails})
+
+    def test_refresh_adopts_token_rotated_by_another_process(self):
+        iam_client = IAMClient(client_id="test_client_id", email="a@example.com", password="test_password")
+        iam_client._refresh_token = "refresh-stale"
+        write_user_refresh_token_to_system_config("a@example.com", "refresh-shared")
+
+        def patch_sessions(endpoint, custom_headers, data):
+            if data["refreshToken"] != "refresh-shared":
+                raise APIError("HTTP Request failed: 401 - refresh token revoked")
+            return {"accessToken": "access-new", "refreshToken": "refresh-rotated"}
+
+        with patch.object(iam_client.client, "patch", side_effect=patch_sessions):
+            self.assertTrue(iam_client.refresh_token())
+
+        self.assertEqual(iam_client.get_access_token(), "access-new")
+        self.assertEqual(get_user_refresh_token_from_system_config("a@example.com"), "refresh-rotated")
+
+
+class TestStartupSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.addCleanup(self.home.cleanup)
+        home_patcher = patch.dict(os.environ, {"HOME": self.home.name})
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        _auth_config._config_cache = None
+        write_user_refresh_token_to_system_config("a@example.com", _jwt({"sub": "refresh"}))
+
+    def _login(self, get_response=None):
+        iam_client = IAMClient(client_id="test_client_id", email="a@example.com", password="test_password")
+        session = {"accessToken": _jwt({"userId": "user-1"}), "refreshToken": _jwt({"sub": "rotated"})}
+        with patch.object(iam_client.client, "patch", return_value=session), \
+                patch.object(iam_client.client, "get", return_value=get_response) as mock_get:
+            self.assertTrue(iam_client.login())
+        return iam_client, mock_get
+
+    def test_login_caches_profile_and_reuses_it(self):
+        profile = {"user": {"id": "user-1"}, "organization": {"id": "org-1"}}
+        iam_client, mock_get = self._login(profile)
+        mock_get.assert_called_once()
+        self.assertEqual(iam_client.get_organization_id(), "org-1")
+        self.assertEqual(get_user_profile_from_system_config("a@example.com"),
+                         {"user_id": "user-1", "organization_id": "org-1"})
+
+        iam_client, mock_get = self._login()
+        mock_get.assert_not_called()
+        self.assertEqual(iam_client.get_user_id(), "user-1")
+        self.assertEqual(iam_client.get_organization_id(), "org-1")
+
+    def test_expired_profile_is_fetched_again(self):
+        write_user_profile_to_system_config("a@example.com", "user-1", "org-stale", ttl_s=-1)
+        self.assertIsNone(get_user_profile_from_system_config("a@example.com"))
+        iam_client, mock_get = self._login({"user": {"id": "user-1"}, "organization": {"id": "org-1"}})
+        mock_get.assert_called_once()
+        self.assertEqual(iam_client.get_organization_id(), "org-1")
+
+    def test_profile_survives_token_rotation(self):
+        write_user_profile_to_system_config("a@example.com", "user-1", "org-1", ttl_s=60)
+        write_user_refresh_token_to_system_config("a@example.com", "refresh-new")
+        self.assertEqual(get_user_profile_from_system_config("a@example.com"),
+                         {"user_id": "user-1", "organization_id": "org-1"})
+
+    @patch.object(IAMClient, "login")
+    def test_lazy_login_defers_to_first_call(self, mock_login):
+        client = Client(email="a@example.com", password="test_password", lazy_login=True)
+        mock_login.assert_not_called()
+
+        def login():
+            time.sleep(0.05)
+            client.iam_client._access_token = "access-token"
+            return True
+        mock_login.side_effect = login
+
+        threads = [threading.Thread(target=client.iam_client.ensure_logged_in) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        mock_login.assert_called_once()
+        client.close()
+
+    @patch('gmicloud._internal._client._task_client.TaskClient.create_task')
+    @patch.object(IAMClient, "login")
+    def test_lazy_login_happens_before_task_owner_is_read(self, mock_login, mock_create_task):
+        client = Client(email="a@example.com", password="test_password", lazy_login=True)
+
+        def login():
+            client.iam_client._access_token = "access-token"
+            client.iam_client._user_id = "user-1"
+            return True
+        mock_login.side_effect = login
+        mock_create_task.return_value = CreateTaskResponse(task=Task(task_id="1"), upload_link="")
+
+        client.task_manager.create_task(Task())
+        mock_login.assert_called_once()
+        self.assertEqual(mock_create_task.call_args.args[0].owner.user_id, "user-1")
+        client.close()
+
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.create_task')
+    @patch.object(AsyncIAMClient, "login")
+    def test_async_lazy_login_happens_before_task_owner_is_read(self, mock_login, mock_create_task):
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="a@example.com", password="test_password")
+
+        async def login():
+            iam_client._access_token = "access-token"
+            iam_client._user_id = "user-1"
+            return True
+
+        async def create_task(task):
+            return CreateTaskResponse(task=Task(task_id="1"), upload_link="")
+        mock_login.side_effect = login
+        mock_create_task.side_effect = create_task
+
+        asyncio.run(AsyncTaskManager(iam_client).create_task(Task()))
+        mock_login.assert_called_once()
+        self.assertEqual(mock_create_task.call_args.args[0].owner.user_id, "user-1")
@@ -0,0 +1,170 @@
+import time
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from gmicloud._internal._deadline import Deadline, earliest_deadline, get_current_deadline, apply_current_deadline
+from gmicloud._internal._exceptions import DeadlineExceededError
+from gmicloud._internal._client._http_client import HTTPClient
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._task_manager import TaskManager
+from gmicloud._internal._manager._async_task_manager import AsyncTaskManager
+from gmicloud._internal._poll_policy import PollPolicy
+from gmicloud._internal._models import *
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline(unittest.TestCase):
+
+    def test_remaining_and_expired_follow_clock(self):
+        clock = FakeClock()
+        deadline = Deadline(30, clock=clock)
+        self.assertEqual(deadline.remaining(), 30)
+        clock.now += 25
+        self.assertEqual(deadline.remaining(), 5)
+        self.assertFalse(deadline.expired())
+        clock.now += 10
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertTrue(deadline.expired())
+        with self.assertRaises(DeadlineExceededError):
+            deadline.check("listing tasks")
+
+    def test_cap_keeps_timeout_shape(self):
+        deadline = Deadline(5, clock=FakeClock())
+        self.assertEqual(deadline.cap((10, 60)), (5, 5))
+        self.assertEqual(deadline.cap((2, 60)), (2, 5))
+        self.assertEqual(deadline.cap(3), 3)
+        self.assertEqual(deadline.cap(None), 5)
+
+    def test_nested_deadline_never_extends_outer(self):
+        clock = FakeClock()
+        outer = Deadline(10, clock=clock)
+        with outer:
+            with Deadline(100, clock=clock) as effective:
+                self.assertIs(effective, outer)
+                self.assertIs(get_current_deadline(), outer)
+            inner = Deadline(1, clock=clock)
+            with inner:
+                self.assertIs(get_current_deadline(), inner)
+            self.assertIs(get_current_deadline(), outer)
+        self.assertIsNone(get_current_deadline())
+
+    def test_deadline_is_shared_by_threads(self):
+        deadline = Deadline(30)
+        both_entered = threading.Barrier(2, timeout=5)
+        seen, errors = [], []
+
+        def enter(delay):
+            try:
+                with deadline:
+                    both_entered.wait()
+                    time.sleep(delay)
+                    seen.append(get_current_deadline())
+                seen.append(get_current_deadline())
+            except Exception as e:
+                errors.append(e)
+
+        # The first thread to enter exits first
+        threads = [threading.Thread(target=enter, args=(delay,)) for delay in (0, 0.05)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(seen, [deadline, None, deadline, None])
+
+    def test_deadline_is_shared_by_asyncio_tasks(self):
+        deadline = Deadline(30)
+
+        async def enter(delay):
+            with deadline:
+                await asyncio.sleep(delay)
+                self.assertIs(get_current_deadline(), deadline)
+            self.assertIsNone(get_current_deadline())
+
+        async def main():
+            await asyncio.gather(enter(0), enter(0.05))
+
+        asyncio.run(main())
+
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_task')
+    def test_async_waits_share_a_deadline(self, mock_get_task):
+        async def get_task(task_id):
+            # The first wait to enter the deadline exits first
+            await asyncio.sleep(0.05 if task_id == "b" else 0)
+            return Task(task_id=task_id, task_status=TaskStatus.RUNNING,
+                        endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.RUNNING))
+
+        mock_get_task.side_effect = get_task
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        task_manager = AsyncTaskManager(iam_client)
+        deadline = Deadline(30)
+
+        async def main():
+            return await asyncio.gather(task_manager.wait_for_task("a", deadline=deadline),
+                                        task_manager.wait_for_task("b", deadline=deadline))
+
+        self.assertEqual([task.task_id for task in asyncio.run(main())], ["a", "b"])
+
+    def test_earliest_deadline_picks_shortest_budget(self):
+        clock = FakeClock()
+        caller = Deadline(5, clock=clock)
+        self.assertIs(earliest_deadline(600, caller), caller)
+        self.assertEqual(round(earliest_deadline(1, caller).remaining()), 1)
+        with self.assertRaises(ValueError):
+            earliest_deadline(None)
+
+    def test_apply_current_deadline_without_deadline_is_noop(self):
+        self.assertEqual(apply_current_deadline((10, 60)), (10, 60))
+
+
+class TestDeadlinePropagation(unittest.TestCase):
+
+    def test_http_request_timeout_is_capped_by_deadline(self):
+        session = MagicMock()
+        response = MagicMock(status_code=200, headers={"Content-Type": "application/json"})
+        response.json.return_value = {"ok": True}
+        session.request.return_value = response
+        client = HTTPClient("https://example.com", session, timeout=(10, 60))
+
+        with Deadline(3, clock=FakeClock()):
+            client.get("/items")
+        self.assertEqual(session.request.call_args.kwargs["timeout"], (3, 3))
+
+        client.get("/items", timeout=(1, 2))
+        self.assertEqual(session.request.call_args.kwargs["timeout"], (1, 2))
+
+    def test_http_request_fails_fast_once_deadline_expired(self):
+        session = MagicMock()
+        client = HTTPClient("https://example.com", session)
+        clock = FakeClock()
+        deadline = Deadline(1, clock=clock)
+        clock.now += 2
+
+        with deadline:
+            with self.assertRaises(DeadlineExceededError):
+                client.get("/items")
+        session.request.assert_not_called()
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_task')
+    def test_wait_for_task_stops_at_caller_deadline(self, mock_get_task, mock_sleep):
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        task_manager = TaskManager(iam_client)
+        mock_get_task.return_value = Task(task_id="test_task_id", task_status=TaskStatus.STARTING)
+        clock = FakeClock()
+        mock_sleep.side_effect = lambda seconds: setattr(clock, "now", clock.now + seconds)
+
+        with self.assertRaises(DeadlineExceededError):
+            task_manager.wait_for_task("test_task_id", timeout_s=900, deadline=Deadline(25, clock=clock),
+                                       poll_policy=PollPolicy(initial_interval_s=10, jitter=0))
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [10, 10, 5])
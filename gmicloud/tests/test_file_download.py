@@ -0,0 +1,206 @@
+import os
+import base64
+import asyncio
+import hashlib
+import threading
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._client._file_download_client import FileDownloadClient
+from gmicloud._internal._exceptions import DownloadFileError, DownloadIntegrityError
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import Artifact, BigFileMetadata
+from gmicloud.tests.test_file_upload import RETRY_NOW, UploadTestCase
+
+MiB = 1024 * 1024
+
+
+class FakeObjectServer(ThreadingHTTPServer):
+    """
+    A local stand-in for Google Storage serving objects with range requests and their MD5 in `x-goog-hash`. It can
+    drop downloads partway, fail every request after a number of them, or serve corrupted bytes.
+    """
+    daemon_threads = True
+
+    def __init__(self, objects, drop_downloads_after=None, fail_after_requests=None, corrupt=False):
+        super().__init__(("127.0.0.1", 0), FakeObjectHandler)
+        self.objects = objects
+        self.drop_downloads_after = drop_downloads_after
+        self.fail_after_requests = fail_after_requests
+        self.corrupt = corrupt
+        self.ranges = []  # (object, start, end) of every download
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeObjectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        data = self._get_object()
+        if data is None:
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"1"')
+        self.send_header("x-goog-hash", "md5=" + base64.b64encode(hashlib.md5(data).digest()).decode())
+        self.end_headers()
+
+    def do_GET(self):
+        data = self._get_object()
+        if data is None:
+            return
+        start, end = 0, len(data) - 1
+        if self.headers.get("Range"):
+            start, end = (int(value) for value in self.headers["Range"][len("bytes="):].split("-"))
+        with self.server.lock:
+            self.server.ranges.append((self.path, start, end))
+            drop_after = self.server.drop_downloads_after
+            self.server.drop_downloads_after = None
+            if self.server.fail_after_requests is not None:
+                self.server.fail_after_requests -= 1
+                if self.server.fail_after_requests < 0:
+                    self._reply_status(503)
+                    return
+        body = data[start:end + 1]
+        if self.server.corrupt:
+            body = bytes(len(body))
+        self.send_response(206 if self.headers.get("Range") else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for offset in range(0, len(body), 64 * 1024):
+            if drop_after is not None and offset >= drop_after:
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            self.wfile.write(body[offset:offset + 64 * 1024])
+
+    def _get_object(self):
+        data = self.server.objects.get(self.path)
+        if data is None:
+            self._reply_status(404)
+        return data
+
+    def _reply_status(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DownloadTestCase(UploadTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = os.urandom(5 * MiB + 100)
+        self.client = FileDownloadClient(retry_policy=RETRY_NOW)
+        self.target = os.path.join(self.tmp_dir.name, "out", "model.safetensors")
+
+    def _start_object_server(self, **kwargs):
+        return self._start_server(FakeObjectServer, objects={"/bucket/model.safetensors": self.data}, **kwargs)
+
+    def _read_target(self):
+        with open(self.target, "rb") as f:
+            return f.read()
+
+
+class TestFileDownloadClient(DownloadTestCase):
+
+    def test_file_is_downloaded_in_parallel_parts(self):
+        server = self._start_object_server()
+        reports = []
+        self.client.download_file(server.url + "/bucket/model.safetensors", self.target, max_connections=4,
+                                  part_size=MiB, on_bytes_downloaded=reports.append)
+        self.assertEqual(self._read_target(), self.data)
+        self.assertEqual(sorted(start for _, start, _ in server.ranges), [offset * MiB for offset in range(6)])
+        self.assertEqual(reports[-1], len(self.data))
+        self.assertEqual(os.listdir(os.path.dirname(self.target)), ["model.safetensors"])
+
+    def test_file_is_written_through_a_memory_map(self):
+        server = self._start_object_server()
+        self.client.download_file(server.url + "/bucket/model.safetensors", self.target, part_size=MiB,
+                                  use_mmap=True)
+        self.assertEqual(self._read_target(), self.data)
+
+    def test_dropped_part_resumes_where_it_stopped(self):
+        server = self._start_object_server(drop_downloads_after=MiB + 256 * 1024)
+        self.client.download_file(server.url + "/bucket/model.safetensors", self.target, max_connections=1,
+                                  part_size=2 * MiB)
+        self.assertEqual(self._read_target(), self.data)
+        self.assertEqual(server.ranges[:2], [("/bucket/model.safetensors", 0, 2 * MiB - 1),
+                                             ("/bucket/model.safetensors", MiB, 2 * MiB - 1)])
+
+    def test_failed_download_resumes_missing_parts(self):
+        server = self._start_object_server(fail_after_requests=2)
+        url = server.url + "/bucket/model.safetensors"
+        with self.assertRaises(DownloadFileError):
+            self.client.download_file(url, self.target, max_connections=1, part_size=MiB)
+        self.assertFalse(os.path.exists(self.target))
+
+        server.fail_after_requests = None
+        server.ranges.clear()
+        self.client.download_file(url, self.target, max_connections=1, part_size=MiB)
+        self.assertEqual(self._read_target(), self.data)
+        self.assertEqual([start for _, start, _ in server.ranges], [offset * MiB for offset in range(2, 6)])
+
+    def test_empty_file_is_downloaded(self):
+        server = self._start_server(FakeObjectServer, objects={"/bucket/empty.json": b""})
+        self.client.download_file(server.url + "/bucket/empty.json", self.target, part_size=MiB)
+        self.assertEqual(self._read_target(), b"")
+        self.assertEqual(os.listdir(os.path.dirname(self.target)), ["model.safetensors"])
+
+    def test_corrupted_download_is_discarded(self):
+        server = self._start_object_server(corrupt=True)
+        with self.assertRaises(DownloadIntegrityError):
+            self.client.download_file(server.url + "/bucket/model.safetensors", self.target, part_size=MiB)
+        self.assertEqual(os.listdir(os.path.dirname(self.target)), [])
+
+
+class TestDownloadArtifactFiles(DownloadTestCase):
+
+    def _artifact(self, server):
+        return Artifact(artifact_id="1", big_files_metadata=[
+            BigFileMetadata(gcs_link=server.url + "/bucket/model.safetensors", file_name="model.safetensors",
+                            bucket_name="bucket", upload_time=None),
+            BigFileMetadata(gcs_link=server.url + "/bucket/missing.bin", file_name="missing.bin",
+                            bucket_name="bucket", upload_time=None)])
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    def test_artifact_files_are_downloaded(self, mock_get_artifact):
+        server = self._start_object_server()
+        mock_get_artifact.return_value = self._artifact(server)
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        file_paths = ArtifactManager(iam_client).download_artifact_files("1", os.path.dirname(self.target))
+        self.assertEqual(file_paths, [self.target])
+        self.assertEqual(self._read_target(), self.data)
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_artifact')
+    def test_async_artifact_files_are_downloaded(self, mock_get_artifact):
+        server = self._start_object_server()
+
+        async def get_artifact(artifact_id):
+            return self._artifact(server)
+
+        mock_get_artifact.side_effect = get_artifact
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        file_paths = asyncio.run(AsyncArtifactManager(iam_client).download_artifact_files(
+            "1", os.path.dirname(self.target), file_names=["model.safetensors"]))
+        self.assertEqual(file_paths, [self.target])
+        self.assertEqual(self._read_target(), self.data)
+
+    def test_gs_links_are_read_from_google_storage(self):
+        big_file = BigFileMetadata(gcs_link="gs://bucket/models/model 1.bin", file_name="model 1.bin",
+                                   upload_time=None)
+        self.assertEqual(ArtifactManager._get_download_url(big_file),
+                         "https://storage.googleapis.com/bucket/models/model%201.bin")
@@ -0,0 +1,338 @@
+import os
+import base64
+import asyncio
+import hashlib
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import requests
+
+from gmicloud._internal._client._retry import RetryPolicy
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+from gmicloud._internal._client._async_file_upload_client import AsyncFileUploadClient
+from gmicloud._internal._exceptions import UploadFileError, UploadIntegrityError
+from gmicloud._internal._upload_checksum import UploadChecksum
+
+RETRY_NOW = RetryPolicy(backoff_base_s=0, jitter=False)
+
+
+class FakeStorageServer(ThreadingHTTPServer):
+    """
+    A local stand-in for a signed upload URL. It hashes PUT bodies without keeping them in memory and can drop
+    the connection partway through the first few uploads.
+    """
+    daemon_threads = True
+
+    def __init__(self, drop_first_uploads=0):
+        super().__init__(("127.0.0.1", 0), FakeStorageHandler)
+        self.drop_first_uploads = drop_first_uploads
+        self.attempts = 0
+        self.received = []  # (size, sha256) of every completed upload
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/upload"
+
+
+class FakeStorageHandler(BaseHTTPRequestHandler):
+
+    def do_PUT(self):
+        self.server.attempts += 1
+        blocks = self._read_body()
+        if self.server.attempts <= self.server.drop_first_uploads:
+            next(blocks, None)
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        size, digest = 0, hashlib.sha256()
+        for block in blocks:
+            digest.update(block)
+            size += len(block)
+        self.server.received.append((size, digest.hexdigest()))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            while True:
+                chunk_size = int(self.rfile.readline().split(b";")[0], 16)
+                if not chunk_size:
+                    self.rfile.readline()
+                    return
+                yield self.rfile.read(chunk_size)
+                self.rfile.readline()
+        remaining = int(self.headers["Content-Length"])
+        while remaining:
+            block = self.rfile.read(min(remaining, 256 * 1024))
+            yield block
+            remaining -= len(block)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeResumableServer(ThreadingHTTPServer):
+    """
+    A local stand-in for a Google Storage resumable upload session, accepting chunks in order only.
+
+    `faults` applies to the chunk requests in turn: "drop" stores the first half of the chunk and drops the
+    connection without a response, a status code is replied without storing anything. With `report_hash`, the final
+    response carries the MD5 of the stored object, which `corrupt` makes differ from the file.
+    """
+    daemon_threads = True
+
+    def __init__(self, faults=(), report_hash=False, corrupt=False):
+        super().__init__(("127.0.0.1", 0), FakeResumableHandler)
+        self.data = bytearray()
+        self.complete = False
+        self.client_ports = set()
+        self.faults = list(faults)
+        self.report_hash = report_hash
+        self.corrupt = corrupt
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/session"
+
+
+class FakeResumableHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        self.server.client_ports.add(self.client_address[1])
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content_range = self.headers["Content-Range"][len("bytes "):]
+        byte_range, total = content_range.split("/")
+        if byte_range != "*":
+            start, end = (int(b) for b in byte_range.split("-"))
+            if start != len(self.server.data) or end - start + 1 != len(body):
+                self._reply(400)
+                return
+            fault = self.server.faults.pop(0) if self.server.faults else None
+            if fault == "drop":
+                self.server.data += body[:len(body) // 2]
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            if fault is not None:
+                self._reply(fault)
+                return
+            self.server.data += body
+        if len(self.server.data) == int(total):
+            self.server.complete = True
+            stored = bytes([self.server.data[0] ^ 1]) + self.server.data[1:] if self.server.corrupt else self.server.data
+            md5 = base64.b64encode(hashlib.md5(stored).digest()).decode()
+            self._reply(200, {"x-goog-hash": f"md5={md5}"} if self.server.report_hash else None)
+        elif self.server.data:
+            self._reply(308, {"Range": f"bytes=0-{len(self.server.data) - 1}"})
+        else:
+            self._reply(308)
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UploadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _start_server(self, server_class=None, **kwargs):
+        server = (server_class or FakeStorageServer)(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _write_file(self, size):
+        file_path = os.path.join(self.tmp_dir.name, f"bundle-{size}.zip")
+        digest = hashlib.sha256()
+        with open(file_path, "wb") as f:
+            block = os.urandom(1024 * 1024)
+            for offset in range(0, size, len(block)):
+                data = block[:size - offset]
+                f.write(data)
+                digest.update(data)
+        return file_path, (size, digest.hexdigest())
+
+
+class TestUploadSmallFile(UploadTestCase):
+
+    def test_memory_stays_flat_for_large_bundles(self):
+        server = self._start_server()
+        file_path, expected = self._write_file(64 * 1024 * 1024)
+
+        tracemalloc.start()
+        try:
+            FileUploadClient.upload_small_file(server.url, file_path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(server.received, [expected])
+        self.assertLess(peak, 8 * 1024 * 1024)
+
+    def test_empty_file(self):
+        server = self._start_server()
+        file_path, expected = self._write_file(0)
+        FileUploadClient.upload_small_file(server.url, file_path)
+        self.assertEqual(server.received, [expected])
+
+    def test_upload_dropped_partway_is_sent_again(self):
+        server = self._start_server(drop_first_uploads=1)
+        file_path, expected = self._write_file(8 * 1024 * 1024)
+        FileUploadClient.upload_small_file(server.url, file_path, retry_policy=RETRY_NOW)
+        self.assertEqual(server.attempts, 2)
+        self.assertEqual(server.received, [expected])
+
+    def test_gives_up_after_max_attempts(self):
+        server = self._start_server(drop_first_uploads=3)
+        file_path, _ = self._write_file(8 * 1024 * 1024)
+        with self.assertRaises(UploadFileError):
+            FileUploadClient.upload_small_file(server.url, file_path, retry_policy=RETRY_NOW)
+        self.assertEqual(server.attempts, 3)
+        self.assertEqual(server.received, [])
+
+    def test_async_upload_dropped_partway_is_sent_again(self):
+        server = self._start_server(drop_first_uploads=1)
+        file_path, expected = self._write_file(8 * 1024 * 1024)
+
+        async def upload():
+            async with httpx.AsyncClient() as session:
+                await AsyncFileUploadClient(session).upload_small_file(server.url, file_path, retry_policy=RETRY_NOW)
+
+        asyncio.run(upload())
+        self.assertEqual(server.attempts, 2)
+        self.assertEqual(server.received, [expected])
+
+
+class TestUploadLargeFile(UploadTestCase):
+
+    def _read(self, file_path):
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    def test_chunks_share_one_connection(self):
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(5 * 1024 * 1024 + 123)
+        FileUploadClient.upload_large_file(server.url, file_path, chunk_size=256 * 1024, read_ahead=4)
+        self.assertTrue(server.complete)
+        self.assertEqual(bytes(server.data), self._read(file_path))
+        self.assertEqual(len(server.client_ports), 1)
+
+    def test_resumes_from_acknowledged_offset(self):
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(3 * 1024 * 1024)
+        server.data += self._read(file_path)[:1024 * 1024]
+        with patch("gmicloud._internal._client._file_upload_client.requests.Session.put",
+                   autospec=True, side_effect=requests.Session.put) as mock_put:
+            FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024)
+        self.assertEqual(bytes(server.data), self._read(file_path))
+        # One status check and the two remaining chunks
+        self.assertEqual(mock_put.call_count, 3)
+
+    def test_async_read_ahead_keeps_chunks_in_order(self):
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(5 * 1024 * 1024 + 123)
+
+        async def upload():
+            async with httpx.AsyncClient() as session:
+                await AsyncFileUploadClient(session).upload_large_file(server.url, file_path,
+                                                                       chunk_size=256 * 1024, read_ahead=4)
+
+        asyncio.run(upload())
+        self.assertTrue(server.complete)
+        self.assertEqual(bytes(server.data), self._read(file_path))
+
+
+class TestUploadChecksum(UploadTestCase):
+
+    def test_digests_match_the_goog_hash_format(self):
+        checksum = UploadChecksum()
+        checksum.update(b"hello ")
+        checksum.update(memoryview(b"world"))
+        md5 = base64.b64encode(hashlib.md5(b"hello world").digest()).decode()
+        self.assertEqual(checksum.digests()["md5"], md5)
+        self.assertTrue(checksum.verify(f"md5={md5}"))
+        self.assertFalse(checksum.verify("md5=AAAAAAAAAAAAAAAAAAAAAA=="))
+        self.assertIsNone(checksum.verify(None))
+        self.assertIsNone(checksum.verify("sha1=abc"))
+
+    def test_update_from_file_starts_over_when_behind(self):
+        file_path, _ = self._write_file(3000)
+        checksum = UploadChecksum()
+        checksum.update_from_file(file_path, 2000)
+        checksum.update_from_file(file_path, 1000)
+        with open(file_path, "rb") as f:
+            expected = hashlib.md5(f.read(1000)).digest()
+        self.assertEqual((checksum.offset, checksum.digests()["md5"]), (1000, base64.b64encode(expected).decode()))
+
+
+class TestChunkRetryAndVerification(UploadTestCase):
+    RETRY_NOW = RetryPolicy(max_attempts=3, backoff_base_s=0, jitter=False,
+                            retry_status_codes=FileUploadClient.CHUNK_RETRY_POLICY.retry_status_codes)
+
+    def _read(self, file_path):
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    def test_failed_chunks_resume_from_the_stored_offset(self):
+        server = self._start_server(FakeResumableServer, faults=["drop", 503, None, "drop"], report_hash=True)
+        file_path, _ = self._write_file(3 * 1024 * 1024 + 5)
+        FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024, read_ahead=2,
+                                           retry_policy=self.RETRY_NOW)
+        self.assertEqual(bytes(server.data), self._read(file_path))
+
+    def test_gives_up_after_consecutive_failures(self):
+        server = self._start_server(FakeResumableServer, faults=[None, 503, 500, 503])
+        file_path, _ = self._write_file(3 * 1024 * 1024)
+        with self.assertRaises(UploadFileError):
+            FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024,
+                                               retry_policy=self.RETRY_NOW)
+        self.assertEqual(len(server.data), 1024 * 1024)
+
+    def test_corrupted_object_is_detected(self):
+        server = self._start_server(FakeResumableServer, report_hash=True, corrupt=True)
+        file_path, _ = self._write_file(2 * 1024 * 1024)
+        with self.assertRaises(UploadIntegrityError):
+            FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024)
+
+    def test_resumed_upload_is_verified_over_the_whole_file(self):
+        server = self._start_server(FakeResumableServer, report_hash=True)
+        file_path, _ = self._write_file(2 * 1024 * 1024)
+        server.data += self._read(file_path)[:1024 * 1024]
+        FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024)
+
+        server.corrupt = True
+        with self.assertRaises(UploadIntegrityError):
+            # Already complete: only the status check is sent, and its response is verified
+            FileUploadClient.upload_large_file(server.url, file_path, chunk_size=1024 * 1024)
+
+    def test_async_failed_chunks_and_corruption(self):
+        server = self._start_server(FakeResumableServer, faults=[502, "drop"], report_hash=True)
+        file_path, _ = self._write_file(3 * 1024 * 1024)
+
+        async def upload():
+            async with httpx.AsyncClient() as session:
+                await AsyncFileUploadClient(session).upload_large_file(server.url, file_path, chunk_size=1024 * 1024,
+                                                                       retry_policy=self.RETRY_NOW)
+
+        asyncio.run(upload())
+        self.assertEqual(bytes(server.data), self._read(file_path))
+        server.corrupt = True
+        with self.assertRaises(UploadIntegrityError):
+            asyncio.run(upload())
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from gmicloud._internal._client._http_client import HTTPClient, create_session
+from gmicloud._internal._client._retry import RetryPolicy
+from gmicloud._internal._exceptions import APIError
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._artifact_client import ArtifactClient
+from gmicloud._internal._client._task_client import TaskClient
+from gmicloud._internal._client._video_client import VideoClient
+
+
+def _json_response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json", **(headers or {})}
+    response.json.return_value = body if body is not None else {}
+    response.text = ""
+    return response
+
+
+class TestHTTPClient(unittest.TestCase):
+
+    def test_create_session_mounts_pooled_adapter(self):
+        session = create_session(pool_connections=3, pool_maxsize=7)
+        adapter = session.get_adapter("https://console.gmicloud.ai")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        session.close()
+
+    def test_service_clients_share_iam_client_session(self):
+        session = create_session()
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password",
+                               session=session)
+
+        self.assertIs(iam_client.client.session, session)
+        self.assertIs(ArtifactClient(iam_client).client.session, session)
+        self.assertIs(TaskClient(iam_client).client.session, session)
+        self.assertIs(VideoClient(iam_client).client.session, session)
+        session.close()
+
+    def test_send_request_uses_session(self):
+        session = MagicMock()
+        session.request.return_value = _json_response(body={"ok": True})
+        client = HTTPClient("https://example.com/api/", session)
+
+        self.assertEqual(client.get("/items", params={"a": "b"}), {"ok": True})
+        session.request.assert_called_once()
+        self.assertEqual(session.request.call_args.args[:2], ("GET", "https://example.com/api/items"))
+
+
+    @patch('gmicloud._internal._client._http_client.time.sleep')
+    def test_get_retries_transient_status(self, mock_sleep):
+        session = MagicMock()
+        session.request.side_effect = [_json_response(503, {"error": "unavailable"}),
+                                       _json_response(502, {"error": "bad gateway"}),
+                                       _json_response(body={"ok": True})]
+        client = HTTPClient("https://example.com", session, RetryPolicy(max_attempts=3))
+
+        self.assertEqual(client.get("/items"), {"ok": True})
+        self.assertEqual(session.request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('gmicloud._internal._client._http_client.time.sleep')
+    def test_retry_after_header_is_honored(self, mock_sleep):
+        session = MagicMock()
+        session.request.side_effect = [_json_response(429, {"error": "slow down"}, {"Retry-After": "7"}),
+                                       _json_response(body={"ok": True})]
+        client = HTTPClient("https://example.com", session)
+
+        self.assertEqual(client.get("/items"), {"ok": True})
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('gmicloud._internal._client._http_client.time.sleep')
+    def test_post_is_not_retried_by_default(self, mock_sleep):
+        session = MagicMock()
+        session.request.return_value = _json_response(503, {"message": "unavailable"})
+        client = HTTPClient("https://example.com", session)
+
+        with self.assertRaises(APIError) as context:
+            client.post("/items", data={})
+        self.assertTrue("503 - unavailable" in str(context.exception))
+        self.assertEqual(session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('gmicloud._internal._client._http_client.time.sleep')
+    def test_connection_error_is_retried_then_raised(self, mock_sleep):
+        session = MagicMock()
+        session.request.side_effect = requests.exceptions.ConnectionError("connection reset")
+        client = HTTPClient("https://example.com", session, RetryPolicy(max_attempts=4))
+
+        with self.assertRaises(APIError) as context:
+            client.delete("/items")
+        self.assertTrue("connection reset" in str(context.exception))
+        self.assertEqual(session.request.call_count, 4)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_grows_exponentially_and_is_capped(self):
+        policy = RetryPolicy(backoff_base_s=1, backoff_max_s=5, jitter=False)
+        self.assertEqual([policy.get_delay(attempt) for attempt in range(1, 6)], [1, 2, 4, 5, 5])
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_base_s=1, backoff_max_s=5)
+        for attempt in range(1, 6):
+            self.assertTrue(0 <= policy.get_delay(attempt) <= min(5, 2 ** (attempt - 1)))
+
+    def test_retry_after_http_date(self):
+        policy = RetryPolicy(max_retry_after_s=60)
+        self.assertEqual(policy.get_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertEqual(policy.get_delay(1, "3600"), 60)
+
+    def test_only_idempotent_methods_are_retried(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry_status("GET", 503, 1))
+        self.assertFalse(policy.should_retry_status("POST", 503, 1))
+        self.assertFalse(policy.should_retry_status("PATCH", 429, 1))
+        self.assertFalse(policy.should_retry_status("GET", 404, 1))
+        self.assertFalse(policy.should_retry_status("GET", 503, 3))
@@ -0,0 +1,235 @@
+import os
+import json
+import asyncio
+import hashlib
+import threading
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._client._hub_client import HubClient
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+from gmicloud._internal._client._retry import RetryPolicy
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import ResumableUploadLinkResponse
+from gmicloud._internal._upload_scheduler import UploadScheduler
+from gmicloud.tests.test_file_upload import FakeResumableServer, UploadTestCase
+
+MiB = 1024 * 1024
+
+
+class FakeHubServer(ThreadingHTTPServer):
+    """
+    A local stand-in for the Hugging Face Hub, serving the file listing and the downloads of one repository, with
+    range requests. It counts the bytes sent for every file and can drop the first download of a file partway.
+    """
+    daemon_threads = True
+
+    def __init__(self, files, drop_first_download_after=None):
+        super().__init__(("127.0.0.1", 0), FakeHubHandler)
+        self.files = files
+        self.drop_first_download_after = drop_first_download_after
+        self.bytes_sent = {path: 0 for path in files}
+        self.ranges = []  # (path, start) of every download
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeHubHandler(BaseHTTPRequestHandler):
+    REPO = "org/model"
+    COMMIT = "0123abcd"
+
+    def do_GET(self):
+        if self.path == f"/api/models/{self.REPO}/revision/main?blobs=true":
+            siblings = []
+            for path, data in self.server.files.items():
+                sibling = {"rfilename": path, "size": len(data),
+                           "blobId": hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()}
+                if len(data) >= MiB:
+                    sibling["lfs"] = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data)}
+                siblings.append(sibling)
+            self._reply(200, json.dumps({"sha": self.COMMIT, "siblings": siblings}).encode(),
+                        {"Content-Type": "application/json"})
+            return
+
+        prefix = f"/{self.REPO}/resolve/{self.COMMIT}/"
+        path = self.path[len(prefix):]
+        if not self.path.startswith(prefix) or path not in self.server.files:
+            self._reply(404, b"")
+            return
+        data = self.server.files[path]
+        start = int(self.headers["Range"][len("bytes="):-1]) if self.headers.get("Range") else 0
+        with self.server.lock:
+            self.server.ranges.append((path, start))
+            drop_after = self.server.drop_first_download_after
+            self.server.drop_first_download_after = None
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Length", str(len(data) - start))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        for offset in range(start, len(data), 64 * 1024):
+            if drop_after is not None and offset - start >= drop_after:
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            block = data[offset:offset + 64 * 1024]
+            self.wfile.write(block)
+            with self.server.lock:
+                self.server.bytes_sent[path] += len(block)
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HubTestCase(UploadTestCase):
+
+    def setUp(self):
+        super().setUp()
+        weights = os.urandom(3 * MiB + 100)
+        self.files = {"config.json": b'{"hidden_size": 4096}', "model.safetensors": weights,
+                      "original/consolidated.safetensors": weights, "README.md": b"# Model"}
+        self.upload_servers = {}
+
+    def _start_hub(self, **kwargs):
+        return self._start_server(FakeHubServer, files=self.files, **kwargs)
+
+    def _hub_client(self, hub):
+        return HubClient(hub.url, retry_policy=RetryPolicy(backoff_base_s=0, jitter=False))
+
+    def _get_upload_url(self, request):
+        self.assertNotIn(request.file_name, self.upload_servers)
+        self.upload_servers[request.file_name] = self._start_server(FakeResumableServer, report_hash=True)
+        return ResumableUploadLinkResponse(artifact_id=request.artifact_id,
+                                           upload_link=self.upload_servers[request.file_name].url)
+
+    def _assert_uploaded(self, paths):
+        self.assertEqual(sorted(self.upload_servers), sorted(os.path.basename(path) for path in paths))
+        for path in paths:
+            self.assertEqual(bytes(self.upload_servers[os.path.basename(path)].data), self.files[path])
+
+
+class TestHubFile(HubTestCase):
+
+    def test_files_are_listed_with_their_blob(self):
+        hub = self._start_hub()
+        hub_files = {hub_file.path: hub_file for hub_file in
+                     self._hub_client(hub).get_repo_files("org/model", ignore_patterns=["*.md"])}
+        self.assertEqual(sorted(hub_files), ["config.json", "model.safetensors", "original/consolidated.safetensors"])
+        self.assertEqual(hub_files["model.safetensors"].revision, FakeHubHandler.COMMIT)
+        self.assertEqual(hub_files["model.safetensors"].blob_hash,
+                         hashlib.sha256(self.files["model.safetensors"]).hexdigest())
+        self.assertEqual(hub_files["model.safetensors"].size, len(self.files["model.safetensors"]))
+
+    def test_identical_files_read_one_download(self):
+        hub = self._start_hub()
+        hub_files = self._hub_client(hub).get_repo_files("org/model", allow_patterns=["*.safetensors"])
+        with hub_files[0].open() as first, hub_files[1].open() as second:
+            while True:
+                block = first.read(MiB)
+                self.assertEqual(second.read(MiB), block)
+                if not block:
+                    break
+        self.assertEqual(sum(hub.bytes_sent.values()), len(self.files["model.safetensors"]))
+
+    def test_reading_back_downloads_a_range(self):
+        hub = self._start_hub()
+        hub_file = self._hub_client(hub).get_repo_files("org/model", allow_patterns=["model.*"])[0]
+        data = self.files["model.safetensors"]
+        with hub_file.open() as f:
+            self.assertEqual(f.read(2 * MiB), data[:2 * MiB])
+            f.seek(100)
+            self.assertEqual(f.read(), data[100:])
+        self.assertEqual(hub.ranges, [("model.safetensors", 0), ("model.safetensors", 100)])
+
+    def test_dropped_download_resumes_where_it_stopped(self):
+        hub = self._start_hub(drop_first_download_after=MiB)
+        hub_file = self._hub_client(hub).get_repo_files("org/model", allow_patterns=["model.*"])[0]
+        with hub_file.open() as f:
+            self.assertEqual(f.read(), self.files["model.safetensors"])
+        self.assertEqual(len(hub.ranges), 2)
+        self.assertGreaterEqual(hub.ranges[1][1], MiB)
+
+    def test_listing_failure_returns_none(self):
+        hub = self._start_hub()
+        self.assertIsNone(self._hub_client(hub).get_repo_files("org/missing"))
+
+
+class TestHubTransfer(HubTestCase):
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    def test_repo_is_uploaded_without_staging(self, mock_get_url):
+        mock_get_url.side_effect = self._get_upload_url
+        hub = self._start_hub(drop_first_download_after=MiB)
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        reports = []
+
+        with patch.dict(os.environ, {"HF_ENDPOINT": hub.url}):
+            ArtifactManager(iam_client).upload_hub_model_to_artifact(
+                "1", "org/model", ignore_patterns=["*.md"], progress_callback=reports.append,
+                show_progress_bar=False)
+        self._assert_uploaded(["config.json", "model.safetensors", "original/consolidated.safetensors"])
+        self.assertEqual((reports[-1].files_completed, reports[-1].files_failed), (3, 0))
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    def test_files_of_one_blob_each_take_an_upload_slot(self, mock_get_url):
+        mock_get_url.side_effect = self._get_upload_url
+        hub = self._start_hub()
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        upload_large_file = FileUploadClient.upload_large_file
+        lock = threading.Lock()
+        uploads = [0, 0]  # in progress, most at the same time
+
+        def upload(*args, **kwargs):
+            with lock:
+                uploads[0] += 1
+                uploads[1] = max(uploads)
+            try:
+                return upload_large_file(*args, **kwargs)
+            finally:
+                with lock:
+                    uploads[0] -= 1
+
+        with patch.object(FileUploadClient, "upload_large_file", side_effect=upload):
+            ArtifactManager(iam_client, UploadScheduler(max_concurrency=1)).upload_hub_model_to_artifact(
+                "1", "org/model", allow_patterns=["*.safetensors"], endpoint=hub.url, show_progress_bar=False)
+        self._assert_uploaded(["model.safetensors", "original/consolidated.safetensors"])
+        self.assertEqual(uploads[1], 1)
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url')
+    def test_async_repo_is_uploaded_without_staging(self, mock_get_url):
+        async def get_upload_url(request):
+            return self._get_upload_url(request)
+
+        mock_get_url.side_effect = get_upload_url
+        hub = self._start_hub()
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+
+        asyncio.run(AsyncArtifactManager(iam_client).upload_hub_model_to_artifact(
+            "1", "org/model", allow_patterns=["*.json", "*.safetensors"], endpoint=hub.url,
+            show_progress_bar=False))
+        self._assert_uploaded(["config.json", "model.safetensors", "original/consolidated.safetensors"])
+
+    def test_listing_failure_raises(self):
+        hub = self._start_hub()
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        with self.assertRaises(ValueError):
+            ArtifactManager(iam_client).upload_hub_model_to_artifact("1", "org/missing", endpoint=hub.url)
+
@@ -0,0 +1,48 @@
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+# `import gmicloud` must stay cheap for CLI wrappers and serverless cold starts
+IMPORT_TIME_BUDGET_US = 50_000
+# Heavy dependencies that must only load once a client is used
+LAZY_MODULES = ["requests", "httpx", "pydantic", "jwt", "tqdm", "concurrent.futures", "mimetypes",
+                "gmicloud._internal._models"]
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True)
+
+
+def _measure_import_us() -> int:
+    """
+    Cumulative import time of the gmicloud package in microseconds, as reported by `python -X importtime`.
+    """
+    stderr = _run_python("-X", "importtime", "-c", "import gmicloud").stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == "gmicloud":
+            return int(cumulative)
+    raise AssertionError(f"gmicloud missing from importtime output:\n{stderr}")
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        code = f"import gmicloud, json, sys; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+        self.assertEqual(json.loads(_run_python("-c", code).stdout), [])
+
+    def test_import_time_within_budget(self):
+        # Take the best of a few runs to filter out scheduling noise
+        best_us = min(_measure_import_us() for _ in range(3))
+        self.assertLess(best_us, IMPORT_TIME_BUDGET_US,
+                        f"import gmicloud took {best_us / 1000:.1f} ms, budget is {IMPORT_TIME_BUDGET_US / 1000:.0f} ms")
+
+    def test_public_names_resolve_lazily(self):
+        code = "import gmicloud; print(gmicloud.Client.__name__, gmicloud.TaskStatus.RUNNING.value)"
+        self.assertEqual(_run_python("-c", code).stdout.split(), ["Client", "running"])
+        code = "from gmicloud import *; print(AsyncClient.__name__, Deadline.__name__)"
+        self.assertEqual(_run_python("-c", code).stdout.split(), ["AsyncClient", "Deadline"])
@@ -0,0 +1,134 @@
+import os
+import asyncio
+import hashlib
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import *
+
+
+def _remote_files(*file_names):
+    return Artifact(artifact_id="artifact-1", big_files_metadata=[
+        BigFileMetadata(file_name=file_name, upload_time=datetime.now()) for file_name in file_names])
+
+
+@patch('gmicloud._internal._client._artifact_client.ArtifactClient.delete_bigfile')
+@patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+@patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_large_file')
+@patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+class TestModelSync(unittest.TestCase):
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+        self._write("model-00001.safetensors", b"a" * 3000)
+        self._write("model-00002.safetensors", b"b" * 2000)
+        self._write("config.json", b"{}")
+
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        self.artifact_manager = ArtifactManager(iam_client)
+
+    def _write(self, name, data):
+        with open(os.path.join(self.model_dir.name, name), "wb") as f:
+            f.write(data)
+
+    def _names(self, paths):
+        return sorted(os.path.basename(path) for path in paths)
+
+    def _setup_mocks(self, mock_get_url, mock_get_artifact, mock_delete, remote_file_names):
+        mock_get_url.side_effect = lambda request: ResumableUploadLinkResponse(
+            artifact_id=request.artifact_id, upload_link=f"http://session/{request.file_name}")
+        mock_get_artifact.return_value = _remote_files(*remote_file_names)
+        mock_delete.return_value = DeleteBigfileResponse(artifact_id="artifact-1", file_name="", status="deleted")
+
+    def test_first_sync_uploads_everything(self, mock_get_url, mock_upload, mock_get_artifact, mock_delete):
+        self._setup_mocks(mock_get_url, mock_get_artifact, mock_delete, ["model-00001.safetensors"])
+        plan = self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name)
+        # Remote files uploaded from elsewhere cannot be compared, so they are uploaded again
+        self.assertEqual(self._names(plan.files_to_upload),
+                         ["config.json", "model-00001.safetensors", "model-00002.safetensors"])
+        self.assertEqual(plan.bytes_to_upload, 5002)
+        self.assertEqual(mock_upload.call_count, 3)
+        mock_delete.assert_not_called()
+
+    def test_second_sync_uploads_only_changed_files(self, mock_get_url, mock_upload, mock_get_artifact, mock_delete):
+        all_files = ["config.json", "model-00001.safetensors", "model-00002.safetensors"]
+        self._setup_mocks(mock_get_url, mock_get_artifact, mock_delete, all_files)
+        self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name)
+
+        self._write("model-00002.safetensors", b"c" * 2500)
+        # Rewritten with the same content: skipped by hash even though its modification time changed
+        self._write("config.json", b"{}")
+        mock_upload.reset_mock()
+        plan = self.artifact_manager.plan_model_files_sync("artifact-1", self.model_dir.name)
+        self.assertEqual(self._names(plan.files_to_upload), ["model-00002.safetensors"])
+        self.assertEqual(self._names(plan.files_to_skip), ["config.json", "model-00001.safetensors"])
+        self.assertEqual((plan.bytes_to_upload, plan.bytes_skipped), (2500, 3002))
+        mock_upload.assert_not_called()
+
+        self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name)
+        self.assertEqual([os.path.basename(c.args[1]) for c in mock_upload.call_args_list],
+                         ["model-00002.safetensors"])
+
+    def test_removed_remote_file_is_uploaded_again(self, mock_get_url, mock_upload, mock_get_artifact, mock_delete):
+        self._setup_mocks(mock_get_url, mock_get_artifact, mock_delete, [])
+        self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name)
+        mock_upload.reset_mock()
+        mock_get_artifact.return_value = _remote_files("config.json", "model-00001.safetensors")
+        self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name)
+        self.assertEqual([os.path.basename(c.args[1]) for c in mock_upload.call_args_list],
+                         ["model-00002.safetensors"])
+
+    def test_delete_missing_and_dry_run(self, mock_get_url, mock_upload, mock_get_artifact, mock_delete):
+        self._setup_mocks(mock_get_url, mock_get_artifact, mock_delete, ["config.json", "old.safetensors"])
+        plan = self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name,
+                                                                  delete_missing=True, dry_run=True)
+        self.assertEqual(plan.files_to_delete, ["old.safetensors"])
+        mock_upload.assert_not_called()
+        mock_delete.assert_not_called()
+
+        self.artifact_manager.sync_model_files_to_artifact("artifact-1", self.model_dir.name, delete_missing=True)
+        mock_delete.assert_called_once_with(DeleteBigfileRequest(artifact_id="artifact-1",
+                                                                 file_name="old.safetensors"))
+
+    def test_unchanged_files_are_not_hashed_again(self, mock_get_url, mock_upload, mock_get_artifact, mock_delete):
+        self._setup_mocks(mock_get_url, mock_get_artifact, mock_delete, [])
+        self.artifact_manager.plan_model_files_sync("artifact-1", self.model_dir.name)
+        with patch.object(ArtifactManager, "_hash_file", wraps=ArtifactManager._hash_file) as mock_hash:
+            self._write("config.json", b'{"changed": true}')
+            self.artifact_manager.plan_model_files_sync("artifact-1", self.model_dir.name)
+        mock_hash.assert_called_once_with(os.path.join(self.model_dir.name, "config.json"))
+        self.assertEqual(ArtifactManager._hash_file(os.path.join(self.model_dir.name, "config.json")),
+                         hashlib.sha256(b'{"changed": true}').hexdigest())
+
+
+@patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_artifact')
+@patch('gmicloud._internal._client._async_file_upload_client.AsyncFileUploadClient.upload_large_file')
+@patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url')
+class TestAsyncModelSync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_second_sync_uploads_only_changed_files(self, mock_get_url, mock_upload, mock_get_artifact):
+        model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(model_dir.cleanup)
+        for name in ["a.safetensors", "b.safetensors"]:
+            with open(os.path.join(model_dir.name, name), "wb") as f:
+                f.write(name.encode())
+        mock_get_url.return_value = ResumableUploadLinkResponse(artifact_id="artifact-1", upload_link="http://s")
+        mock_get_artifact.return_value = _remote_files("a.safetensors", "b.safetensors")
+        manager = AsyncArtifactManager(AsyncIAMClient(client_id="test_client_id", email="test_email",
+                                                      password="test_password"))
+
+        await manager.sync_model_files_to_artifact("artifact-1", model_dir.name)
+        self.assertEqual(mock_upload.call_count, 2)
+        with open(os.path.join(model_dir.name, "b.safetensors"), "ab") as f:
+            f.write(b"changed")
+        plan = await manager.sync_model_files_to_artifact("artifact-1", model_dir.name)
+        self.assertEqual([os.path.basename(path) for path in plan.files_to_upload], ["b.safetensors"])
+        self.assertEqual(mock_upload.call_count, 3)
@@ -0,0 +1,165 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from gmicloud._internal._deadline import Deadline
+from gmicloud._internal._exceptions import ArtifactBuildError, DeadlineExceededError
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._manager._task_manager import TaskManager
+from gmicloud._internal._manager._async_task_manager import AsyncTaskManager
+from gmicloud._internal._poll_policy import PollPolicy
+from gmicloud._internal._models import *
+from gmicloud._internal._enums import BuildStatus
+from gmicloud.tests.test_deadline import FakeClock
+
+NO_JITTER = PollPolicy(jitter=0)
+
+
+class TestPollPolicy(unittest.TestCase):
+
+    def test_delays_back_off_to_the_ceiling(self):
+        schedule = NO_JITTER.start()
+        self.assertEqual([schedule.next_delay("starting") for _ in range(6)], [1, 2, 4, 8, 10, 10])
+
+    def test_phase_change_starts_over_with_its_own_ceiling(self):
+        schedule = NO_JITTER.start()
+        for _ in range(4):
+            schedule.next_delay("starting")
+        self.assertEqual([schedule.next_delay(PollPolicy.ENDPOINT_PENDING) for _ in range(4)], [1, 2, 3, 3])
+
+    def test_failed_poll_keeps_the_phase(self):
+        schedule = NO_JITTER.start()
+        schedule.next_delay("starting")
+        self.assertEqual(schedule.next_delay(None), 2)
+
+    def test_jitter_spreads_delays_around_the_interval(self):
+        policy = PollPolicy(jitter=0.5)
+        delays = {policy.get_delay(3) for _ in range(50)}
+        self.assertTrue(all(2 <= delay <= 6 for delay in delays))
+        self.assertGreater(len(delays), 1)
+
+    def test_invalid_settings_raise(self):
+        with self.assertRaises(ValueError):
+            PollPolicy(initial_interval_s=0)
+        with self.assertRaises(ValueError):
+            PollPolicy(jitter=2)
+
+
+class TestWaitHelpersPolling(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+    def _advance_clock(self, seconds):
+        self.clock.now += seconds
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_task')
+    def test_wait_for_task_polls_faster_once_only_the_endpoint_is_pending(self, mock_get_task, mock_sleep):
+        pending_endpoint = Task(task_id="1", task_status=TaskStatus.RUNNING,
+                                endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.PENDING))
+        mock_get_task.side_effect = [Task(task_id="1", task_status=TaskStatus.STARTING)] * 5 + \
+                                    [pending_endpoint] * 4 + \
+                                    [Task(task_id="1", task_status=TaskStatus.RUNNING,
+                                          endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.RUNNING))]
+        mock_sleep.side_effect = self._advance_clock
+
+        task = TaskManager(self.iam_client).wait_for_task("1", deadline=Deadline(900, clock=self.clock),
+                                                          poll_policy=NO_JITTER)
+        self.assertEqual(task.task_id, "1")
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2, 4, 8, 10, 1, 2, 3, 3])
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_task')
+    def test_wait_for_task_fails_as_soon_as_the_task_stops(self, mock_get_task, mock_sleep):
+        mock_get_task.return_value = Task(task_id="1", task_status=TaskStatus.NEEDSTOP)
+
+        with self.assertRaises(ValueError):
+            TaskManager(self.iam_client).wait_for_task("1", deadline=Deadline(120, clock=self.clock),
+                                                       poll_policy=NO_JITTER)
+        mock_get_task.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('gmicloud._internal._manager._async_task_manager.asyncio.sleep')
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_task')
+    def test_async_wait_for_task_fails_as_soon_as_the_task_stops(self, mock_get_task, mock_sleep):
+        async def get_task(task_id):
+            return Task(task_id=task_id, task_status=TaskStatus.ARCHIVED)
+
+        mock_get_task.side_effect = get_task
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncTaskManager(iam_client).wait_for_task("1", deadline=Deadline(120, clock=self.clock),
+                                                                   poll_policy=NO_JITTER))
+        mock_get_task.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.stop_task')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_task')
+    def test_stop_task_and_wait_stops_at_deadline(self, mock_get_task, mock_stop_task, mock_sleep):
+        mock_get_task.return_value = Task(task_id="1", task_status=TaskStatus.NEEDSTOP)
+        mock_sleep.side_effect = self._advance_clock
+
+        with self.assertRaises(DeadlineExceededError):
+            TaskManager(self.iam_client).stop_task_and_wait("1", deadline=Deadline(20, clock=self.clock),
+                                                            poll_policy=NO_JITTER)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2, 4, 8, 5])
+
+    @patch('gmicloud._internal._manager._artifact_manager.time.sleep')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    def test_wait_for_artifact_ready_restarts_backoff_on_status_change(self, mock_get_artifact, mock_sleep):
+        mock_get_artifact.side_effect = [Artifact(artifact_id="1", build_status=BuildStatus.QUEUED)] * 3 + \
+                                        [Artifact(artifact_id="1", build_status=BuildStatus.BUILDING)] * 2 + \
+                                        [Artifact(artifact_id="1", build_status=BuildStatus.SUCCESS)]
+        mock_sleep.side_effect = self._advance_clock
+
+        ArtifactManager(self.iam_client).wait_for_artifact_ready("1", deadline=Deadline(900, clock=self.clock),
+                                                                 poll_policy=NO_JITTER)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2, 4, 1, 2])
+
+    @patch('gmicloud._internal._manager._artifact_manager.time.sleep')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    def test_wait_for_artifact_ready_fails_as_soon_as_the_build_fails(self, mock_get_artifact, mock_sleep):
+        mock_get_artifact.side_effect = [Artifact(artifact_id="1", build_status=BuildStatus.BUILDING),
+                                         Artifact(artifact_id="1", build_status=BuildStatus.FAILURE)]
+        mock_sleep.side_effect = self._advance_clock
+
+        with self.assertRaises(ArtifactBuildError):
+            ArtifactManager(self.iam_client).wait_for_artifact_ready("1", deadline=Deadline(900, clock=self.clock),
+                                                                     poll_policy=NO_JITTER)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch('gmicloud._internal._manager._async_artifact_manager.asyncio.sleep')
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_artifact')
+    def test_async_wait_for_artifact_ready_fails_as_soon_as_the_build_fails(self, mock_get_artifact, mock_sleep):
+        async def get_artifact(artifact_id):
+            return Artifact(artifact_id=artifact_id, build_status=BuildStatus.CANCELLED)
+
+        mock_get_artifact.side_effect = get_artifact
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        with self.assertRaises(ArtifactBuildError):
+            asyncio.run(AsyncArtifactManager(iam_client).wait_for_artifact_ready(
+                "1", deadline=Deadline(900, clock=self.clock), poll_policy=NO_JITTER))
+        mock_sleep.assert_not_called()
+
+    @patch('gmicloud._internal._manager._async_task_manager.asyncio.sleep')
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_task')
+    def test_async_wait_for_task_uses_the_policy(self, mock_get_task, mock_sleep):
+        async def sleep(seconds):
+            self._advance_clock(seconds)
+
+        mock_get_task.side_effect = [Task(task_id="1", task_status=TaskStatus.IN_QUEUE)] * 3 + \
+                                    [Task(task_id="1", task_status=TaskStatus.RUNNING,
+                                          endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.RUNNING))]
+        mock_sleep.side_effect = sleep
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        asyncio.run(AsyncTaskManager(iam_client).wait_for_task("1", deadline=Deadline(900, clock=self.clock),
+                                                               poll_policy=NO_JITTER))
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2, 4])
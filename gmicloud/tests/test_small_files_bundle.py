@@ -0,0 +1,152 @@
+import io
+import os
+import json
+import asyncio
+import tarfile
+import unittest
+from unittest.mock import patch
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._constants import SMALL_FILES_MANIFEST_NAME
+from gmicloud._internal._exceptions import UploadFileError
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import Artifact, BigFileMetadata, ResumableUploadLinkResponse
+from gmicloud._internal._tar_bundle import TarBundle
+from gmicloud._internal._upload_journal import UploadJournal
+from gmicloud.tests.test_file_upload import FakeResumableServer, UploadTestCase
+
+MiB = 1024 * 1024
+
+
+class TestTarBundle(UploadTestCase):
+
+    def _write(self, name, data):
+        file_path = os.path.join(self.tmp_dir.name, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as f:
+            f.write(data)
+        return file_path
+
+    def test_bundle_is_a_tar_with_a_manifest(self):
+        files = {"config.json": b'{"a": 1}', "tokenizer/vocab.txt": os.urandom(5000), "empty": b"",
+                 "d/" + "x" * 150: b"long name"}
+        bundle = TarBundle([(name, self._write(name.replace("/", "_"), data)) for name, data in files.items()])
+        with bundle.open() as f:
+            data = f.read()
+        self.assertEqual(len(data), bundle.size)
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+            self.assertEqual(archive.getnames(), list(files) + [SMALL_FILES_MANIFEST_NAME])
+            for name, content in files.items():
+                self.assertEqual(archive.extractfile(name).read(), content)
+            manifest = json.loads(archive.extractfile(SMALL_FILES_MANIFEST_NAME).read())
+        self.assertEqual(manifest, bundle.manifest)
+        for entry in manifest["files"]:
+            self.assertEqual(data[entry["offset"]:entry["offset"] + entry["size"]], files[entry["path"]])
+
+    def test_reads_from_any_offset(self):
+        bundle = TarBundle([("a", self._write("a", os.urandom(3000))), ("b", self._write("b", os.urandom(700)))])
+        with bundle.open() as f:
+            data = f.read()
+            f.seek(1000)
+            self.assertEqual(f.read(3000), data[1000:4000])
+            self.assertEqual(f.seek(0, io.SEEK_END), bundle.size)
+            self.assertEqual(f.read(), b"")
+
+    def test_file_truncated_after_bundling_fails_the_read(self):
+        file_path = self._write("a", os.urandom(3000))
+        bundle = TarBundle([("a", file_path), ("b", self._write("b", b"b"))])
+        with open(file_path, "wb") as f:
+            f.write(b"short")
+        with bundle.open() as f, self.assertRaises(UploadFileError):
+            f.read()
+
+    def test_names_must_be_distinct(self):
+        file_path = self._write("a", b"a")
+        with self.assertRaises(ValueError):
+            TarBundle([("a", file_path), ("a", file_path)])
+        with self.assertRaises(ValueError):
+            TarBundle([])
+
+
+class TestSmallFilesBundleUpload(UploadTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.model_dir = os.path.join(self.tmp_dir.name, "model")
+        self.small_files = {"config.json": b'{"hidden_size": 4096}', "tokenizer.json": os.urandom(20000),
+                            "nested/generation_config.json": b"{}"}
+        for name, data in list(self.small_files.items()) + [("model.safetensors", os.urandom(3 * MiB))]:
+            file_path = os.path.join(self.model_dir, name)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as f:
+                f.write(data)
+        self.servers = {}
+
+    def _get_upload_url(self, request):
+        name = "bundle" if request.file_name.startswith("gmicloud-small-files-") else request.file_name
+        self.assertNotIn(name, self.servers)
+        self.servers[name] = self._start_server(FakeResumableServer)
+        return ResumableUploadLinkResponse(artifact_id=request.artifact_id, upload_link=self.servers[name].url)
+
+    def _assert_bundle_uploaded(self):
+        self.assertEqual(sorted(self.servers), ["bundle", "model.safetensors"])
+        with tarfile.open(fileobj=io.BytesIO(bytes(self.servers["bundle"].data))) as archive:
+            for name, data in self.small_files.items():
+                self.assertEqual(archive.extractfile(name).read(), data)
+        journal = UploadJournal(self.model_dir, "1")
+        for name in self.small_files:
+            self.assertTrue(journal.lookup(os.path.join(self.model_dir, name))["completed"])
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    def test_small_files_are_uploaded_as_one_archive(self, mock_get_url):
+        mock_get_url.side_effect = self._get_upload_url
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        manager = ArtifactManager(iam_client)
+        reports = []
+
+        manager.upload_model_files_to_artifact("1", self.model_dir, bundle_small_files_under=MiB,
+                                               progress_callback=reports.append, show_progress_bar=False)
+        self._assert_bundle_uploaded()
+        self.assertEqual((reports[-1].files_completed, reports[-1].total_files), (2, 2))
+
+        # A rerun finds every file uploaded
+        mock_get_url.reset_mock()
+        manager.upload_model_files_to_artifact("1", self.model_dir, bundle_small_files_under=MiB,
+                                               show_progress_bar=False)
+        mock_get_url.assert_not_called()
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_artifact')
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+    def test_sync_finds_bundled_files_uploaded(self, mock_get_url, mock_get_artifact):
+        mock_get_url.side_effect = self._get_upload_url
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        manager = ArtifactManager(iam_client)
+        manager.upload_model_files_to_artifact("1", self.model_dir, bundle_small_files_under=MiB,
+                                               show_progress_bar=False)
+
+        bundle_name = UploadJournal(self.model_dir, "1").uploaded_bundle(os.path.join(self.model_dir, "config.json"))
+        mock_get_artifact.return_value = Artifact(artifact_id="1", big_files_metadata=[
+            BigFileMetadata(file_name=file_name, upload_time=None)
+            for file_name in [bundle_name, "model.safetensors", "old.safetensors"]])
+        plan = manager.plan_model_files_sync("1", self.model_dir, delete_missing=True)
+        # Files uploaded outside a sync have no recorded hash, so only the bundled files can be skipped
+        self.assertEqual(sorted(os.path.relpath(path, self.model_dir) for path in plan.files_to_skip),
+                         sorted(self.small_files))
+        self.assertEqual(plan.files_to_delete, ["old.safetensors"])
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url')
+    def test_async_small_files_are_uploaded_as_one_archive(self, mock_get_url):
+        async def get_upload_url(request):
+            return self._get_upload_url(request)
+
+        mock_get_url.side_effect = get_upload_url
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        asyncio.run(AsyncArtifactManager(iam_client).upload_model_files_to_artifact(
+            "1", self.model_dir, bundle_small_files_under=MiB, show_progress_bar=False))
+        self._assert_bundle_uploaded()
@@ -0,0 +1,209 @@
+import jwt
+import json
+import time
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from gmicloud._internal._client._decorator import handle_refresh_token, handle_refresh_token_async
+from gmicloud._internal._client._http_client import HTTPClient
+from gmicloud._internal._client._async_http_client import AsyncHTTPClient
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+
+
+class FakeIAMServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the IAM service: rotates tokens on PATCH /me/sessions and rejects stale access tokens.
+    """
+    daemon_threads = True
+
+    def __init__(self, refresh_delay_s=0.2):
+        super().__init__(("127.0.0.1", 0), FakeIAMHandler)
+        self.refresh_delay_s = refresh_delay_s
+        self.generation = 0
+        self.refresh_count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def expire_tokens(self):
+        with self.lock:
+            self.generation += 1
+
+
+class FakeIAMHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_PATCH(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.refresh_count += 1
+            generation = server.generation
+            valid = body["refreshToken"] == f"refresh-{generation - 1}"
+        # Hold the refresh open long enough for every other worker to hit 401 meanwhile
+        time.sleep(server.refresh_delay_s)
+        if not valid:
+            self._reply(401, {"message": "refresh token revoked"})
+            return
+        self._reply(200, {"accessToken": f"access-{generation}", "refreshToken": f"refresh-{generation}"})
+
+    def do_GET(self):
+        with self.server.lock:
+            current = f"Bearer access-{self.server.generation}"
+        if self.headers.get("Authorization") != current:
+            self._reply(401, {"message": "token expired"})
+            return
+        self._reply(200, {"ok": True})
+
+
+class FakeServiceClient:
+
+    def __init__(self, iam_client, base_url):
+        self.iam_client = iam_client
+        self.client = HTTPClient(base_url, iam_client.get_session())
+
+    @handle_refresh_token
+    def get_items(self):
+        return self.client.get("/items", self.iam_client.get_custom_headers())
+
+
+class FakeAsyncServiceClient:
+
+    def __init__(self, iam_client, base_url):
+        self.iam_client = iam_client
+        self.client = AsyncHTTPClient(base_url, iam_client.get_session())
+
+    @handle_refresh_token_async
+    async def get_items(self):
+        return await self.client.get("/items", self.iam_client.get_custom_headers())
+
+
+@patch('gmicloud._internal._client._async_iam_client.write_user_refresh_token_to_system_config')
+@patch('gmicloud._internal._client._iam_client.write_user_refresh_token_to_system_config')
+class TestSingleFlightTokenRefresh(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeIAMServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.server.expire_tokens()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_concurrent_401s_trigger_one_refresh(self, mock_write_config, mock_write_config_async):
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client.client = HTTPClient(self.server.url, iam_client.get_session())
+        iam_client._access_token = "access-0"
+        iam_client._refresh_token = "refresh-0"
+        service_client = FakeServiceClient(iam_client, self.server.url)
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(lambda _: service_client.get_items(), range(64)))
+
+        self.assertEqual(results, [{"ok": True}] * 64)
+        self.assertEqual(self.server.refresh_count, 1)
+        self.assertEqual(iam_client.get_access_token(), "access-1")
+        mock_write_config.assert_called_once_with("test_email", "refresh-1")
+
+    def test_refresh_after_another_thread_refreshed_is_skipped(self, mock_write_config, mock_write_config_async):
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client.client = HTTPClient(self.server.url, iam_client.get_session())
+        iam_client._access_token = "access-0"
+        iam_client._refresh_token = "refresh-0"
+
+        self.assertTrue(iam_client.refresh_token("access-0"))
+        self.assertTrue(iam_client.refresh_token("access-0"))
+        self.assertEqual(self.server.refresh_count, 1)
+
+    def test_concurrent_async_401s_trigger_one_refresh(self, mock_write_config, mock_write_config_async):
+        async def run():
+            iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+            iam_client.client = AsyncHTTPClient(self.server.url, iam_client.get_session())
+            iam_client._access_token = "access-0"
+            iam_client._refresh_token = "refresh-0"
+            service_client = FakeAsyncServiceClient(iam_client, self.server.url)
+            try:
+                return await asyncio.gather(*(service_client.get_items() for _ in range(64)))
+            finally:
+                await iam_client.get_session().aclose()
+
+        self.assertEqual(asyncio.run(run()), [{"ok": True}] * 64)
+        self.assertEqual(self.server.refresh_count, 1)
+        mock_write_config_async.assert_called_once_with("test_email", "refresh-1")
+
+
+def _jwt_expiring_in(seconds):
+    return jwt.encode({"userId": "test_user_id", "exp": int(time.time() + seconds)}, "test-signing-key-of-at-least-32-bytes", algorithm="HS256")
+
+
+class TestProactiveTokenRenewal(unittest.TestCase):
+
+    def setUp(self):
+        self.iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password",
+                                    token_refresh_margin_s=60)
+        self.iam_client._refresh_token = "refresh-0"
+        self.renewed = threading.Event()
+
+    def _rotate_tokens(self):
+        self.iam_client._access_token = _jwt_expiring_in(3600)
+        self.renewed.set()
+        return True
+
+    def test_token_far_from_expiry_is_not_renewed(self):
+        self.iam_client._access_token = _jwt_expiring_in(600)
+        with patch.object(IAMClient, "_send_refresh_token") as mock_refresh:
+            self.assertEqual(self.iam_client.renew_token_if_expiring(), self.iam_client.get_access_token())
+        mock_refresh.assert_not_called()
+
+    def test_expiring_token_is_renewed_before_request(self):
+        self.iam_client._access_token = _jwt_expiring_in(30)
+        with patch.object(IAMClient, "_send_refresh_token", side_effect=self._rotate_tokens):
+            access_token = self.iam_client.renew_token_if_expiring()
+        self.assertTrue(self.renewed.is_set())
+        self.assertEqual(access_token, self.iam_client.get_access_token())
+        self.assertGreater(self.iam_client.get_access_token_expiry(), time.time() + 3000)
+
+    def test_failed_renewal_is_not_retried_on_every_request(self):
+        self.iam_client._access_token = _jwt_expiring_in(30)
+        with patch.object(IAMClient, "_send_refresh_token", return_value=False) as mock_refresh:
+            self.iam_client.renew_token_if_expiring()
+            self.iam_client.renew_token_if_expiring()
+        mock_refresh.assert_called_once()
+
+    def test_renewal_disabled_without_margin(self):
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password",
+                               token_refresh_margin_s=None)
+        iam_client._access_token = _jwt_expiring_in(1)
+        iam_client._refresh_token = "refresh-0"
+        with patch.object(IAMClient, "_send_refresh_token") as mock_refresh:
+            iam_client.renew_token_if_expiring()
+        mock_refresh.assert_not_called()
+
+    def test_background_thread_renews_before_expiry(self):
+        self.iam_client._token_refresh_margin_s = 0.2
+        self.iam_client._access_token = _jwt_expiring_in(1)
+        with patch.object(IAMClient, "_send_refresh_token", side_effect=self._rotate_tokens):
+            self.iam_client.start_token_renewal()
+            try:
+                self.assertTrue(self.renewed.wait(timeout=5))
+            finally:
+                self.iam_client.stop_token_renewal()
+        self.assertIsNone(self.iam_client._renewal_thread)
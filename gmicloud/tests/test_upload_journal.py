@@ -0,0 +1,103 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._exceptions import UploadFileError, UploadIntegrityError
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._models import ResumableUploadLinkResponse
+from gmicloud._internal._upload_journal import UploadJournal, JOURNAL_DIR_NAME, JOURNAL_FILE_NAME
+
+
+@patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_large_file')
+@patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+class TestUploadJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+        for name in ["a.safetensors", "b.safetensors", "config.json"]:
+            with open(os.path.join(self.model_dir.name, name), "wb") as f:
+                f.write(name.encode() * 100)
+
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        self.artifact_manager = ArtifactManager(iam_client)
+        self.links = iter(f"http://session-{i}" for i in range(100))
+
+    def _path(self, name):
+        return os.path.join(self.model_dir.name, name)
+
+    def _new_link(self, request):
+        return ResumableUploadLinkResponse(artifact_id=request.artifact_id, upload_link=next(self.links))
+
+    def _upload(self, mock_get_url, mock_upload, fail_file=None):
+        def upload_large_file(upload_link, file_path, on_chunk_uploaded=None, scheduler=None, on_retry=None):
+            on_chunk_uploaded(100)
+            if file_path == fail_file:
+                raise UploadFileError("connection lost")
+
+        mock_get_url.reset_mock()
+        mock_upload.reset_mock()
+        mock_get_url.side_effect = self._new_link
+        mock_upload.side_effect = upload_large_file
+        self.artifact_manager.upload_model_files_to_artifact("artifact-1", self.model_dir.name, max_concurrency=1)
+        return {os.path.basename(c.args[1]): c.args[0] for c in mock_upload.call_args_list}
+
+    def test_rerun_skips_completed_and_resumes_partial_files(self, mock_get_url, mock_upload):
+        self._upload(mock_get_url, mock_upload, fail_file=self._path("b.safetensors"))
+        self.assertEqual(mock_get_url.call_count, 3)
+        journal_path = os.path.join(self.model_dir.name, JOURNAL_DIR_NAME, JOURNAL_FILE_NAME)
+        with open(journal_path) as f:
+            entries = json.load(f)["artifacts"]["artifact-1"]
+        self.assertTrue(entries["a.safetensors"]["completed"])
+        self.assertFalse(entries["b.safetensors"]["completed"])
+        self.assertEqual(entries["b.safetensors"]["offset"], 100)
+
+        uploads = self._upload(mock_get_url, mock_upload)
+        mock_get_url.assert_not_called()
+        self.assertEqual(uploads, {"b.safetensors": entries["b.safetensors"]["upload_link"]})
+        self.assertEqual(self._upload(mock_get_url, mock_upload), {})
+
+    def test_changed_file_is_uploaded_afresh(self, mock_get_url, mock_upload):
+        self._upload(mock_get_url, mock_upload)
+        with open(self._path("config.json"), "ab") as f:
+            f.write(b"changed")
+        uploads = self._upload(mock_get_url, mock_upload)
+        self.assertEqual(list(uploads), ["config.json"])
+        mock_get_url.assert_called_once()
+
+    def test_expired_session_is_replaced(self, mock_get_url, mock_upload):
+        self._upload(mock_get_url, mock_upload, fail_file=self._path("a.safetensors"))
+        stale_link = UploadJournal(self.model_dir.name, "artifact-1").lookup(self._path("a.safetensors"))["upload_link"]
+
+        def upload_large_file(upload_link, file_path, on_chunk_uploaded=None, scheduler=None, on_retry=None):
+            if upload_link == stale_link:
+                raise UploadFileError("Failed to check file status: 404 Not Found")
+        mock_get_url.reset_mock()
+        mock_upload.side_effect = upload_large_file
+        self.artifact_manager.upload_model_files_to_artifact("artifact-1", self.model_dir.name)
+
+        mock_get_url.assert_called_once()
+        self.assertTrue(UploadJournal(self.model_dir.name, "artifact-1").lookup(self._path("a.safetensors"))["completed"])
+
+    def test_corrupted_upload_is_sent_again_with_a_new_session(self, mock_get_url, mock_upload):
+        def upload_large_file(upload_link, file_path, on_chunk_uploaded=None, scheduler=None, on_retry=None):
+            if file_path == self._path("a.safetensors") and mock_get_url.call_count < 2:
+                raise UploadIntegrityError(f"File {file_path} was stored corrupted")
+
+        mock_get_url.side_effect = self._new_link
+        mock_upload.side_effect = upload_large_file
+        self.artifact_manager.upload_model_files_to_artifact("artifact-1", self.model_dir.name, max_concurrency=1)
+        # The corrupted file is sent again with a new session
+        self.assertEqual([os.path.basename(c.args[1]) for c in mock_upload.call_args_list],
+                         ["a.safetensors", "a.safetensors", "b.safetensors", "config.json"])
+        self.assertTrue(UploadJournal(self.model_dir.name, "artifact-1").lookup(self._path("a.safetensors"))["completed"])
+
+    def test_unreadable_journal_is_ignored(self, mock_get_url, mock_upload):
+        os.makedirs(os.path.join(self.model_dir.name, JOURNAL_DIR_NAME))
+        with open(os.path.join(self.model_dir.name, JOURNAL_DIR_NAME, JOURNAL_FILE_NAME), "w") as f:
+            f.write('{"version": 1, "artif')
+        self.assertEqual(len(self._upload(mock_get_url, mock_upload)), 3)
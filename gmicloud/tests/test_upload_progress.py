@@ -0,0 +1,136 @@
+import os
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._enums import UploadProgressEvent
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import ResumableUploadLinkResponse
+from gmicloud._internal._upload_progress_tracker import UploadProgressTracker
+from gmicloud.tests.test_file_upload import FakeResumableServer, UploadTestCase
+from gmicloud.tests.test_deadline import FakeClock
+
+MiB = 1024 * 1024
+
+
+class TestUploadProgressTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.reports = []
+        self.tracker = UploadProgressTracker({"a": 100 * MiB, "b": 50 * MiB, "c": 10 * MiB},
+                                             [self.reports.append], clock=self.clock)
+
+    def test_reports_bytes_throughput_and_eta(self):
+        self.tracker.file_started("a")
+        self.clock.now += 2
+        self.tracker.bytes_confirmed("a", 20 * MiB)
+
+        progress = self.reports[-1]
+        self.assertEqual(progress.event, UploadProgressEvent.PROGRESS)
+        self.assertEqual((progress.file_bytes_uploaded, progress.bytes_uploaded, progress.total_bytes),
+                         (20 * MiB, 20 * MiB, 160 * MiB))
+        self.assertEqual(progress.file_bytes_per_second, 10 * MiB)
+        self.assertEqual(progress.bytes_per_second, 10 * MiB)
+        self.assertEqual(progress.eta_seconds, 14)
+
+    def test_resumed_and_skipped_bytes_do_not_count_as_throughput(self):
+        self.tracker.file_skipped("c")
+        self.tracker.file_started("a", offset=60 * MiB)
+        self.assertIsNone(self.reports[-1].bytes_per_second)
+        self.assertIsNone(self.reports[-1].eta_seconds)
+        self.clock.now += 4
+        self.tracker.bytes_confirmed("a", 80 * MiB)
+
+        progress = self.reports[-1]
+        self.assertEqual((progress.bytes_uploaded, progress.files_completed), (90 * MiB, 1))
+        self.assertEqual(progress.bytes_per_second, 5 * MiB)
+        # 20 MiB of a and 50 MiB of b left
+        self.assertEqual(progress.eta_seconds, 14)
+
+    def test_rate_follows_recent_bandwidth(self):
+        self.tracker.file_started("a")
+        for second in range(1, 21):
+            self.clock.now += 1
+            # 4 MiB/s for 10 seconds, then 1 MiB/s
+            sent = 4 * min(second, 10) + max(second - 10, 0)
+            self.tracker.bytes_confirmed("a", sent * MiB)
+        self.assertAlmostEqual(self.reports[-1].bytes_per_second, MiB)
+        self.assertAlmostEqual(self.reports[-1].file_bytes_per_second, 2.5 * MiB)
+
+    def test_retries_failures_and_finish(self):
+        self.tracker.file_started("a")
+        self.tracker.retry("a")
+        self.tracker.retry("a")
+        self.tracker.file_started("b")
+        self.tracker.bytes_confirmed("b", 10 * MiB)
+        self.tracker.file_failed("b")
+        self.tracker.file_completed("a")
+        self.tracker.file_completed("c")
+
+        self.assertEqual(self.reports[1].event, UploadProgressEvent.RETRY)
+        self.assertEqual((self.reports[2].file_retries, self.reports[2].retries), (2, 2))
+        summary = self.tracker.finish()
+        self.assertEqual(summary.event, UploadProgressEvent.FINISHED)
+        self.assertIsNone(summary.file_path)
+        self.assertEqual((summary.files_completed, summary.files_failed, summary.total_files), (2, 1, 3))
+        self.assertEqual(summary.bytes_uploaded, 120 * MiB)
+        self.assertEqual(summary.eta_seconds, 0)
+
+    def test_failing_callback_does_not_stop_reporting(self):
+        def fail(progress):
+            raise RuntimeError("exporter down")
+
+        tracker = UploadProgressTracker({"a": MiB}, [fail, self.reports.append])
+        tracker.file_started("a")
+        tracker.bytes_confirmed("a", MiB)
+        self.assertEqual(len(self.reports), 2)
+
+
+class TestModelUploadProgress(UploadTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.model_dir = os.path.join(self.tmp_dir.name, "model")
+        os.mkdir(self.model_dir)
+        with open(os.path.join(self.model_dir, "model.safetensors"), "wb") as f:
+            f.write(os.urandom(3 * MiB))
+
+    def test_progress_callback_reports_bytes_and_retries(self):
+        server = self._start_server(FakeResumableServer, faults=[503])
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        reports = []
+
+        with patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url',
+                   return_value=ResumableUploadLinkResponse(artifact_id="1", upload_link=server.url)):
+            ArtifactManager(iam_client).upload_model_files_to_artifact(
+                "1", self.model_dir, progress_callback=reports.append, show_progress_bar=False)
+
+        self.assertEqual([report.event for report in reports],
+                         [UploadProgressEvent.STARTED, UploadProgressEvent.RETRY, UploadProgressEvent.PROGRESS,
+                          UploadProgressEvent.COMPLETED, UploadProgressEvent.FINISHED])
+        self.assertEqual(reports[2].file_bytes_uploaded, 3 * MiB)
+        self.assertIsNotNone(reports[2].bytes_per_second)
+        self.assertEqual((reports[-1].bytes_uploaded, reports[-1].files_completed, reports[-1].retries),
+                         (3 * MiB, 1, 1))
+
+    def test_async_progress_callback(self):
+        server = self._start_server(FakeResumableServer)
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        reports = []
+
+        async def get_bigfile_upload_url(request):
+            return ResumableUploadLinkResponse(artifact_id="1", upload_link=server.url)
+
+        with patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.get_bigfile_upload_url',
+                   side_effect=get_bigfile_upload_url):
+            asyncio.run(AsyncArtifactManager(iam_client).upload_model_files_to_artifact(
+                "1", self.model_dir, progress_callback=reports.append, show_progress_bar=False))
+
+        self.assertEqual(reports[-1].event, UploadProgressEvent.FINISHED)
+        self.assertEqual((reports[-1].bytes_uploaded, reports[-1].files_completed), (3 * MiB, 1))
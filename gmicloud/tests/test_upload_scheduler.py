@@ -0,0 +1,186 @@
+import os
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from gmicloud._internal._token_bucket import TokenBucket
+from gmicloud._internal._upload_scheduler import UploadScheduler
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+from gmicloud._internal._client._async_file_upload_client import AsyncFileUploadClient
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._exceptions import UploadFileError
+from gmicloud._internal._models import ResumableUploadLinkResponse
+from gmicloud.tests.test_file_upload import FakeResumableServer, UploadTestCase
+from gmicloud.tests.test_deadline import FakeClock
+
+MiB = 1024 * 1024
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_reservations_wait_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, capacity=50, clock=clock)
+        self.assertEqual(bucket.reserve(50), 0)
+        self.assertAlmostEqual(bucket.reserve(100), 1.0)
+        # The debt also delays the next caller
+        self.assertAlmostEqual(bucket.reserve(10), 1.1)
+        clock.now += 2.0
+        self.assertAlmostEqual(bucket.reserve(10), 0)
+
+    def test_idle_time_refills_up_to_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, capacity=50, clock=clock)
+        clock.now += 60.0
+        self.assertEqual(bucket.reserve(50), 0)
+        self.assertAlmostEqual(bucket.reserve(50), 0.5)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            UploadScheduler(max_concurrency=0)
+        with self.assertRaises(ValueError):
+            UploadScheduler(max_bandwidth_bps=-1)
+
+
+class TestUploadScheduler(UploadTestCase):
+
+    def _track_buffer(self, scheduler):
+        usage = {"in_use": 0, "peak": 0}
+        lock = threading.Lock()
+        acquire, release = scheduler.acquire_buffer, scheduler.release_buffer
+
+        def tracked_acquire(nbytes):
+            reserved = acquire(nbytes)
+            with lock:
+                usage["in_use"] += reserved
+                usage["peak"] = max(usage["peak"], usage["in_use"])
+            return reserved
+
+        def tracked_release(nbytes):
+            with lock:
+                usage["in_use"] -= nbytes
+            release(nbytes)
+
+        scheduler.acquire_buffer, scheduler.release_buffer = tracked_acquire, tracked_release
+        return usage
+
+    def test_order_largest_first(self):
+        paths = [self._write_file(size)[0] for size in (10, 3000, 0, 200)]
+        self.assertEqual([os.path.getsize(p) for p in UploadScheduler.order_largest_first(paths)], [3000, 200, 10, 0])
+
+    def test_buffer_budget_bounds_read_ahead(self):
+        scheduler = UploadScheduler(buffer_budget_bytes=2 * 256 * 1024)
+        usage = self._track_buffer(scheduler)
+        servers = [self._start_server(FakeResumableServer) for _ in range(3)]
+        files = [self._write_file(3 * MiB + i)[0] for i in range(3)]
+
+        threads = [threading.Thread(target=FileUploadClient.upload_large_file,
+                                    kwargs=dict(upload_url=server.url, file_path=file_path, chunk_size=256 * 1024,
+                                                read_ahead=8, scheduler=scheduler))
+                   for server, file_path in zip(servers, files)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for server, file_path in zip(servers, files):
+            with open(file_path, "rb") as f:
+                self.assertEqual(bytes(server.data), f.read())
+        self.assertLessEqual(usage["peak"], scheduler.buffer_budget_bytes)
+        self.assertEqual(usage["in_use"], 0)
+
+    def test_failed_upload_returns_its_buffer(self):
+        scheduler = UploadScheduler(buffer_budget_bytes=MiB)
+        usage = self._track_buffer(scheduler)
+        file_path, _ = self._write_file(4 * MiB)
+        responses = [MagicMock(status_code=308, headers={}),
+                     MagicMock(status_code=308, headers={"Range": "bytes=0-262143"}),
+                     MagicMock(status_code=403, text="Forbidden")]
+        with patch("requests.Session.put", side_effect=responses):
+            with self.assertRaises(UploadFileError):
+                FileUploadClient.upload_large_file("http://session", file_path, chunk_size=256 * 1024, read_ahead=4,
+                                                   scheduler=scheduler)
+        self.assertEqual(usage["in_use"], 0)
+
+    def test_bandwidth_cap(self):
+        scheduler = UploadScheduler(max_bandwidth_bps=16 * MiB)
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(8 * MiB)
+        started = time.monotonic()
+        FileUploadClient.upload_large_file(server.url, file_path, chunk_size=MiB, scheduler=scheduler)
+        # 8 MiB at 16 MiB/s, less the 0.1 s burst allowance
+        self.assertGreaterEqual(time.monotonic() - started, 0.35)
+        self.assertTrue(server.complete)
+
+    def test_async_bandwidth_cap(self):
+        scheduler = UploadScheduler(max_bandwidth_bps=16 * MiB)
+        server = self._start_server(FakeResumableServer)
+        file_path, _ = self._write_file(8 * MiB)
+
+        async def upload():
+            async with httpx.AsyncClient() as session:
+                await AsyncFileUploadClient(session).upload_large_file(server.url, file_path, chunk_size=MiB,
+                                                                       scheduler=scheduler)
+
+        started = time.monotonic()
+        asyncio.run(upload())
+        self.assertGreaterEqual(time.monotonic() - started, 0.35)
+        with open(file_path, "rb") as f:
+            self.assertEqual(bytes(server.data), f.read())
+
+
+@patch('gmicloud._internal._client._file_upload_client.FileUploadClient.upload_large_file')
+@patch('gmicloud._internal._client._artifact_client.ArtifactClient.get_bigfile_upload_url')
+class TestManagerScheduling(unittest.TestCase):
+
+    def setUp(self):
+        self.model_dirs = []
+        for _ in range(2):
+            model_dir = tempfile.TemporaryDirectory()
+            self.addCleanup(model_dir.cleanup)
+            for size in (1, 300, 20):
+                with open(os.path.join(model_dir.name, f"shard-{size}.bin"), "wb") as f:
+                    f.write(b"x" * size)
+            self.model_dirs.append(model_dir.name)
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+        self.artifact_manager = ArtifactManager(iam_client, UploadScheduler(max_concurrency=2))
+
+    def test_concurrency_limit_is_global_and_largest_files_go_first(self, mock_get_url, mock_upload):
+        mock_get_url.return_value = ResumableUploadLinkResponse(artifact_id="1", upload_link="http://session")
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def upload_large_file(upload_link, file_path, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+
+        mock_upload.side_effect = upload_large_file
+        threads = [threading.Thread(target=self.artifact_manager.upload_model_files_to_artifact,
+                                    args=(f"artifact-{i}", model_dir))
+                   for i, model_dir in enumerate(self.model_dirs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_upload.call_count, 6)
+        self.assertEqual(state["peak"], 2)
+
+        mock_upload.reset_mock()
+        mock_upload.side_effect = None
+        self.artifact_manager.upload_model_files_to_artifact("artifact-new", self.model_dirs[0], max_concurrency=1)
+        self.assertEqual([os.path.basename(c.args[1]) for c in mock_upload.call_args_list],
+                         ["shard-300.bin", "shard-20.bin", "shard-1.bin"])
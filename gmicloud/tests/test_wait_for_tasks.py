@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+import threading
+import concurrent.futures
+from unittest.mock import patch
+from gmicloud._internal._deadline import Deadline, get_current_deadline
+from gmicloud._internal._exceptions import DeadlineExceededError
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._manager._task_manager import TaskManager
+from gmicloud._internal._manager._async_task_manager import AsyncTaskManager
+from gmicloud._internal._poll_policy import PollPolicy
+from gmicloud._internal._models import *
+from gmicloud.tests.test_deadline import FakeClock
+
+NO_JITTER = PollPolicy(jitter=0)
+
+
+def running(task_id):
+    return Task(task_id=task_id, task_status=TaskStatus.RUNNING,
+                endpoint_info=EndpointInfo(endpoint_status=TaskEndpointStatus.RUNNING))
+
+
+def starting(task_id):
+    return Task(task_id=task_id, task_status=TaskStatus.STARTING)
+
+
+class TestWaitForTasks(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        self.task_manager = TaskManager(iam_client)
+
+    def _advance_clock(self, seconds):
+        self.clock.now += seconds
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_all_tasks')
+    def test_tasks_resolve_as_they_complete_with_one_poll_per_interval(self, mock_get_all_tasks, mock_sleep):
+        mock_get_all_tasks.side_effect = [
+            GetAllTasksResponse(tasks=[running("1"), starting("2"), starting("3")]),
+            GetAllTasksResponse(tasks=[running("1"), starting("2"),
+                                       Task(task_id="3", task_status=TaskStatus.NEEDSTOP)]),
+            GetAllTasksResponse(tasks=[running("1"), running("2")]),
+        ]
+        mock_sleep.side_effect = self._advance_clock
+
+        futures = self.task_manager.wait_for_tasks(["1", "2", "3"], deadline=Deadline(900, clock=self.clock),
+                                                   poll_policy=NO_JITTER)
+        completed = list(concurrent.futures.as_completed(futures.values(), timeout=5))
+        self.assertEqual(completed[0], futures["1"])
+        self.assertEqual(futures["2"].result().task_id, "2")
+        with self.assertRaises(ValueError):
+            futures["3"].result()
+        self.assertEqual(mock_get_all_tasks.call_count, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2])
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_all_tasks')
+    def test_deadline_fails_only_pending_tasks(self, mock_get_all_tasks, mock_sleep):
+        mock_get_all_tasks.side_effect = [GetAllTasksResponse(tasks=[starting("1"), running("2")])] + \
+                                         [GetAllTasksResponse(tasks=[starting("1")])] * 10
+        mock_sleep.side_effect = self._advance_clock
+
+        futures = self.task_manager.wait_for_tasks(["1", "2"], deadline=Deadline(10, clock=self.clock),
+                                                   poll_policy=NO_JITTER)
+        concurrent.futures.wait(futures.values(), timeout=5)
+        self.assertEqual(futures["2"].result().task_id, "2")
+        with self.assertRaises(DeadlineExceededError):
+            futures["1"].result()
+
+    @patch('gmicloud._internal._manager._task_manager.time.sleep')
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_all_tasks')
+    def test_custom_condition(self, mock_get_all_tasks, mock_sleep):
+        mock_get_all_tasks.side_effect = [GetAllTasksResponse(tasks=[starting("1")]),
+                                          GetAllTasksResponse(tasks=[Task(task_id="1", task_status=TaskStatus.IDLE)])]
+        mock_sleep.side_effect = self._advance_clock
+
+        futures = self.task_manager.wait_for_tasks(["1"], lambda task: task.task_status == TaskStatus.IDLE,
+                                                   deadline=Deadline(900, clock=self.clock), poll_policy=NO_JITTER)
+        self.assertEqual(futures["1"].result(timeout=5).task_status, TaskStatus.IDLE)
+
+    @patch('gmicloud._internal._client._task_client.TaskClient.get_all_tasks')
+    def test_polls_run_within_the_deadline_on_a_daemon_thread(self, mock_get_all_tasks):
+        polls = []
+
+        def get_all_tasks():
+            polls.append((get_current_deadline(), threading.current_thread().daemon))
+            return GetAllTasksResponse(tasks=[running("1")])
+
+        mock_get_all_tasks.side_effect = get_all_tasks
+        deadline = Deadline(60, clock=self.clock)
+        self.task_manager.wait_for_tasks(["1"], deadline=deadline)["1"].result(timeout=5)
+        self.assertEqual(polls, [(deadline, True)])
+
+    def test_empty_task_id_raises(self):
+        with self.assertRaises(ValueError):
+            self.task_manager.wait_for_tasks(["1", ""])
+
+
+class TestAsyncWaitForTasks(unittest.IsolatedAsyncioTestCase):
+
+    @patch('gmicloud._internal._manager._async_task_manager.asyncio.sleep')
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_all_tasks')
+    async def test_tasks_resolve_as_they_complete(self, mock_get_all_tasks, mock_sleep):
+        clock = FakeClock()
+
+        async def sleep(seconds):
+            clock.now += seconds
+
+        mock_get_all_tasks.side_effect = [
+            GetAllTasksResponse(tasks=[starting("1"), running("2")]),
+            GetAllTasksResponse(tasks=[Task(task_id="1", task_status=TaskStatus.ARCHIVED)]),
+        ]
+        mock_sleep.side_effect = sleep
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+
+        futures = await AsyncTaskManager(iam_client).wait_for_tasks(["1", "2"], deadline=Deadline(900, clock=clock),
+                                                                    poll_policy=NO_JITTER)
+        self.assertEqual((await futures["2"]).task_id, "2")
+        with self.assertRaises(ValueError):
+            await futures["1"]
+        self.assertEqual(mock_get_all_tasks.call_count, 2)
+
+    @patch('gmicloud._internal._client._async_task_client.AsyncTaskClient.get_all_tasks')
+    async def test_polls_run_within_the_deadline(self, mock_get_all_tasks):
+        polls = []
+
+        async def get_all_tasks():
+            polls.append(get_current_deadline())
+            return GetAllTasksResponse(tasks=[running("1")])
+
+        mock_get_all_tasks.side_effect = get_all_tasks
+        deadline = Deadline(60, clock=FakeClock())
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        futures = await AsyncTaskManager(iam_client).wait_for_tasks(["1"], deadline=deadline)
+        await futures["1"]
+        self.assertEqual(polls, [deadline])
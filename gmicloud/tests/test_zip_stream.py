@@ -0,0 +1,131 @@
+import io
+import os
+import asyncio
+import hashlib
+import zipfile
+from unittest.mock import patch
+
+import httpx
+
+from gmicloud._internal._client._iam_client import IAMClient
+from gmicloud._internal._client._async_iam_client import AsyncIAMClient
+from gmicloud._internal._client._file_upload_client import FileUploadClient
+from gmicloud._internal._client._async_file_upload_client import AsyncFileUploadClient
+from gmicloud._internal._exceptions import UploadFileError
+from gmicloud._internal._manager._artifact_manager import ArtifactManager
+from gmicloud._internal._manager._async_artifact_manager import AsyncArtifactManager
+from gmicloud._internal._models import CreateArtifactResponse
+from gmicloud._internal._zip_stream import ZipStream
+from gmicloud.tests.test_file_upload import RETRY_NOW, UploadTestCase
+
+
+class ZipTestCase(UploadTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.source_dir = os.path.join(self.tmp_dir.name, "artifact")
+        # Text compresses, random data does not, and the weights span several blocks
+        self.files = {"Dockerfile": b"FROM python:3.11\n" * 100, "serve.py": b"print('serving')\n",
+                      "empty.txt": b"", "model/weights.bin": os.urandom(2 * ZipStream.BLOCK_SIZE + 1234)}
+        for name, data in self.files.items():
+            file_path = os.path.join(self.source_dir, name)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as f:
+                f.write(data)
+
+    def _assert_archive(self, data):
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(sorted(archive.namelist()), sorted(self.files))
+            for name, content in self.files.items():
+                self.assertEqual(archive.read(name), content)
+
+
+class TestZipStream(ZipTestCase):
+
+    def test_directory_archive_is_readable(self):
+        for compress_level in (0, 1, 9):
+            with self.subTest(compress_level=compress_level):
+                data = b"".join(ZipStream.from_directory(self.source_dir, compress_level, max_workers=2))
+                self._assert_archive(data)
+
+    def test_archive_is_deterministic_and_compressed(self):
+        stream = ZipStream.from_directory(self.source_dir)
+        data = b"".join(stream)
+        self.assertEqual(data, b"".join(stream))
+        self.assertLess(len(data), len(b"".join(ZipStream.from_directory(self.source_dir, 0))))
+
+    def test_large_files_use_zip64(self):
+        with patch.object(zipfile, "ZIP64_LIMIT", 1000):
+            data = b"".join(ZipStream.from_directory(self.source_dir))
+        self._assert_archive(data)
+
+    def test_invalid_archives_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ZipStream([])
+        with self.assertRaises(ValueError):
+            ZipStream.from_directory(os.path.join(self.source_dir, "model"), compress_level=10)
+        with self.assertRaises(ValueError):
+            ZipStream.from_files([os.path.join(self.source_dir, "serve.py")] * 2)
+
+
+class TestUploadZipStream(ZipTestCase):
+
+    def _expected(self, stream):
+        data = b"".join(stream)
+        return [(len(data), hashlib.sha256(data).hexdigest())]
+
+    def test_archive_is_built_again_after_a_dropped_upload(self):
+        server = self._start_server(drop_first_uploads=1)
+        stream = ZipStream.from_directory(self.source_dir)
+        FileUploadClient.upload_zip_stream(server.url, stream, retry_policy=RETRY_NOW)
+        self.assertEqual(server.attempts, 2)
+        self.assertEqual(server.received, self._expected(stream))
+
+    def test_failure_raises_after_last_attempt(self):
+        server = self._start_server(drop_first_uploads=3)
+        with self.assertRaises(UploadFileError):
+            FileUploadClient.upload_zip_stream(server.url, ZipStream.from_directory(self.source_dir),
+                                               retry_policy=RETRY_NOW)
+
+    def test_async_archive_is_built_again_after_a_dropped_upload(self):
+        server = self._start_server(drop_first_uploads=1)
+        stream = ZipStream.from_directory(self.source_dir)
+
+        async def upload():
+            async with httpx.AsyncClient() as session:
+                await AsyncFileUploadClient(session).upload_zip_stream(server.url, stream, retry_policy=RETRY_NOW)
+
+        asyncio.run(upload())
+        self.assertEqual(server.received, self._expected(stream))
+
+    @patch('gmicloud._internal._client._artifact_client.ArtifactClient.create_artifact')
+    def test_create_artifact_with_directory(self, mock_create_artifact):
+        server = self._start_server()
+        mock_create_artifact.return_value = CreateArtifactResponse(artifact_id="1", upload_link=server.url)
+        iam_client = IAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+
+        artifact_id = ArtifactManager(iam_client).create_artifact_with_file("artifact", self.source_dir,
+                                                                            compress_level=1)
+        self.assertEqual(artifact_id, "1")
+        self.assertEqual(server.received, self._expected(ZipStream.from_directory(self.source_dir, 1)))
+
+    @patch('gmicloud._internal._client._async_artifact_client.AsyncArtifactClient.create_artifact')
+    def test_async_create_artifact_with_files(self, mock_create_artifact):
+        server = self._start_server()
+        file_paths = [os.path.join(self.source_dir, name) for name in ("Dockerfile", "serve.py")]
+
+        async def create_artifact(*args, **kwargs):
+            return CreateArtifactResponse(artifact_id="1", upload_link=server.url)
+
+        mock_create_artifact.side_effect = create_artifact
+        iam_client = AsyncIAMClient(client_id="test_client_id", email="test_email", password="test_password")
+        iam_client._access_token = "test_token"
+
+        asyncio.run(AsyncArtifactManager(iam_client).create_artifact_with_file("artifact", file_paths))
+        self.assertEqual(server.received, self._expected(ZipStream.from_files(file_paths)))
+
+    def test_missing_listed_file_is_rejected_before_creating_the_artifact(self):
+        with self.assertRaises(FileNotFoundError):
+            ArtifactManager._artifact_zip_stream([os.path.join(self.source_dir, "missing.py")], 6)